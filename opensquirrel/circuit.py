@@ -1,20 +1,19 @@
 from __future__ import annotations
 
 from collections import Counter, defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from itertools import combinations
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, SupportsFloat
 
-from opensquirrel.ir import Instruction
+from opensquirrel.ir import Gate, Instruction
 from opensquirrel.ir.non_unitary import Measure
 from opensquirrel.ir.statement import AsmDeclaration
 from opensquirrel.passes.mapper import IdentityMapper
 
 if TYPE_CHECKING:
     from opensquirrel.ir.ir import IR
-    from opensquirrel.ir.unitary import Gate
     from opensquirrel.passes.analyzer.general_analyzer import Analyzer
-    from opensquirrel.passes.decomposer.general_decomposer import Decomposer
+    from opensquirrel.passes.decomposer.general_decomposer import Decomposer, DecompositionVerifier
     from opensquirrel.passes.exporter.general_exporter import Exporter
     from opensquirrel.passes.mapper.general_mapper import Mapper
     from opensquirrel.passes.merger.general_merger import Merger
@@ -103,7 +102,7 @@ class Circuit:
         counter: Counter[str] = Counter()
         counter.update(
             getattr(statement, "name", "unknown")
-            for statement in self.ir.statements
+            for statement in self.ir.statements_view
             if not isinstance(statement, AsmDeclaration)
         )
         return dict(counter)
@@ -112,7 +111,7 @@ class Circuit:
     def measurement_to_bit_map(self) -> MeasurementToBitMap:
         """Determines and returns the measurement to bit register index mapping."""
         m2b_map: MeasurementToBitMap = defaultdict(list[int])
-        for statement in self.ir.statements:
+        for statement in self.ir.statements_view:
             if isinstance(statement, Measure):
                 qubit_index, bit_index = statement.qubit.index, statement.bit.index
                 m2b_map[str(qubit_index)].append(bit_index)
@@ -122,7 +121,7 @@ class Circuit:
     def interaction_graph(self) -> InteractionGraph:
         """Interaction graph of the circuit."""
         graph = {}
-        for statement in self.ir.statements:
+        for statement in self.ir.statements_view:
             if not isinstance(statement, Instruction):
                 continue
             qubit_indices = statement.qubit_indices
@@ -132,6 +131,18 @@ class Circuit:
                     graph[edge] = graph.get(edge, 0) + 1
         return graph
 
+    @property
+    def parameters(self) -> tuple[str, ...]:
+        """The names of the symbolic parameters of the circuit, in order of appearance."""
+        return tuple(
+            dict.fromkeys(
+                parameter
+                for statement in self.ir.statements_view
+                if isinstance(statement, Gate)
+                for parameter in statement.parameters
+            )
+        )
+
     def asm_filter(self, backend_name: str) -> None:
         """Filter the assembly declarations in the circuit for a specific backend.
 
@@ -144,7 +155,7 @@ class Circuit:
         """
         self.ir.statements = [
             statement
-            for statement in self.ir.statements
+            for statement in self.ir.statements_view
             if not isinstance(statement, AsmDeclaration)
             or (isinstance(statement, AsmDeclaration) and backend_name in str(statement.backend_name))
         ]
@@ -161,16 +172,57 @@ class Circuit:
         """
         return analyzer.analyze(self)
 
-    def decompose(self, decomposer: Decomposer) -> None:
+    def bind(self, values: Mapping[str, SupportsFloat]) -> Circuit:
+        """Binds the symbolic parameters of the circuit to values.
+
+        The circuit itself is left unchanged, so that a (compiled) parametric circuit can be bound to new values
+        repeatedly without being compiled again. Statements without symbolic parameters are shared between the
+        parametric and the bound circuit.
+
+        Args:
+            values (Mapping[str, SupportsFloat]): The values of the parameters, keyed by the name of the parameter.
+
+        Returns:
+            The circuit with numeric gate arguments.
+
+        """
+        from opensquirrel.ir import IR
+
+        ir = IR()
+        ir.statements = [
+            statement.bind(values) if isinstance(statement, Gate) and statement.is_parametric else statement
+            for statement in self.ir.statements_view
+        ]
+        circuit = Circuit(self.register_manager, ir)
+        circuit.mapping = self.mapping
+        return circuit
+
+    def copy(self) -> Circuit:
+        """Copies the circuit, _e.g._, to try alternative pass pipelines on it.
+
+        The copy takes a snapshot of the IR (see `IR.snapshot`), which shares the statements with this circuit, such
+        that copying takes O(1) time instead of copying every statement.
+
+        Returns:
+            The copy of the circuit.
+
+        """
+        circuit = Circuit(self.register_manager, self.ir.snapshot())
+        circuit.mapping = self.mapping
+        return circuit
+
+    def decompose(self, decomposer: Decomposer, verifier: DecompositionVerifier | None = None) -> None:
         """Decomposes the circuit using to the specified decomposer.
 
         Args:
             decomposer (Decomposer): The decomposer to apply.
+            verifier (DecompositionVerifier | None): Decides which decompositions are checked, a verifier with the
+                default verification mode if not given.
 
         """
         from opensquirrel.passes.decomposer.general_decomposer import decompose
 
-        decompose(self.ir, decomposer)
+        decompose(self.ir, decomposer, verifier)
 
     def export(self, exporter: Exporter) -> Any:
         """Exports the circuit using the specified exporter.
@@ -225,6 +277,27 @@ class Circuit:
 
         replace(self.ir, gate, replacement_gates_function)
 
+    def sample(self, shots: int, seed: int | None = None) -> dict[str, int]:
+        """Samples the values of the bit register at the end of the circuit, using a statevector simulation.
+
+        Stabilizer circuits, _i.e._, circuits of Clifford gates only, are simulated with a stabilizer tableau instead,
+        which takes polynomial time in the number of qubits.
+
+        Args:
+            shots (int): The number of shots.
+            seed (int | None): Seed for the random number generator. Default is `None`.
+
+        Returns:
+            The number of occurrences of the sampled bit register values, keyed by the bit string of the bit
+            register, where bit #0 is the rightmost character.
+
+        """
+        from opensquirrel.simulator import is_clifford_circuit, sample, sample_stabilizer
+
+        if is_clifford_circuit(self):
+            return sample_stabilizer(self, shots, seed)
+        return sample(self, shots, seed)
+
     def validate(self, validator: Validator) -> None:
         """Validates the circuit using the specified validator.
 
@@ -219,4 +219,4 @@ class CircuitBuilder:
             Circuit: The built circuit.
 
         """
-        return Circuit(deepcopy(self.register_manager), deepcopy(self.ir))
+        return Circuit(deepcopy(self.register_manager), self.ir.snapshot())
@@ -1,41 +1,395 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Any, Literal, overload
 
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import DTypeLike, NDArray
+from scipy.sparse import eye_array
 
 from opensquirrel.ir import Gate, IRVisitor
-from opensquirrel.utils.matrix_expander import get_matrix
+from opensquirrel.utils.gate_fusion import FusedGate, accept_fused, fuse_gates
+from opensquirrel.utils.matrix_expander import get_sparse_matrix
+from opensquirrel.utils.tensor_contraction import apply_matrix_to_tensor
 
 if TYPE_CHECKING:
+    from scipy.sparse import sparray
+
     from opensquirrel.circuit import Circuit
+    from opensquirrel.ir.single_qubit_gate import SingleQubitGate
+    from opensquirrel.ir.two_qubit_gate import TwoQubitGate
 
 
 class _CircuitMatrixCalculator(IRVisitor):
-    def __init__(self, qubit_register_size: int) -> None:
+    """Accumulates the unitary matrix of a circuit as a tensor with $n + 1$ axes.
+
+    The first $n$ axes, of dimension 2, correspond to the rows (output qubits) of the matrix, and the last axis to its
+    columns (input states), flattened into a single axis of dimension $2^n$. Each gate is applied by contracting its
+    small matrix with the row axes of the qubits it acts on only, which costs $O(4^n)$ per gate instead of the
+    $O(8^n)$ of a product with the expanded gate matrix.
+
+    Optionally, only a block of consecutive columns of the matrix is accumulated, in which case the column axis has
+    the dimension of the block. This is what allows the matrix to be computed in blocks of columns, also in parallel.
+    """
+
+    def __init__(
+        self, qubit_register_size: int, dtype: DTypeLike = np.complex128, columns: range | None = None
+    ) -> None:
+        self.qubit_register_size = qubit_register_size
+        columns = range(1 << self.qubit_register_size) if columns is None else columns
+        identity_columns = np.zeros((1 << self.qubit_register_size, len(columns)), dtype=dtype)
+        identity_columns[columns, range(len(columns))] = 1
+        self.tensor = identity_columns.reshape((2,) * self.qubit_register_size + (len(columns),))
+
+    @property
+    def matrix(self) -> NDArray[np.complexfloating[Any]]:
+        return self.tensor.reshape(1 << self.qubit_register_size, -1)
+
+    def visit_single_qubit_gate(self, gate: SingleQubitGate) -> None:
+        self.tensor = apply_matrix_to_tensor(self.tensor, gate.matrix, gate.qubit_indices, self.qubit_register_size)
+
+    def visit_two_qubit_gate(self, gate: TwoQubitGate) -> None:
+        self.tensor = apply_matrix_to_tensor(self.tensor, gate.matrix, gate.qubit_indices, self.qubit_register_size)
+
+    def visit_fused_gate(self, fused_gate: FusedGate) -> None:
+        self.tensor = apply_matrix_to_tensor(
+            self.tensor, fused_gate.matrix, fused_gate.qubit_indices, self.qubit_register_size
+        )
+
+
+class _SparseCircuitMatrixCalculator(IRVisitor):
+    """Accumulates the unitary matrix of a circuit as a sparse matrix, by (sparse) multiplication with the sparse
+    expanded matrix of each gate.
+    """
+
+    def __init__(self, qubit_register_size: int, dtype: DTypeLike = np.complex128) -> None:
         self.qubit_register_size = qubit_register_size
-        self.matrix = np.eye(1 << self.qubit_register_size, dtype=np.complex128)
+        self.dtype = dtype
+        self.matrix: sparray = eye_array(1 << self.qubit_register_size, dtype=dtype, format="csr")
 
     def visit_gate(self, gate: Gate) -> None:
-        big_matrix = get_matrix(gate, qubit_register_size=self.qubit_register_size)
-        self.matrix = np.asarray(big_matrix @ self.matrix, dtype=np.complex128)
+        self.matrix = get_sparse_matrix(gate, self.qubit_register_size).astype(self.dtype, copy=False) @ self.matrix
+
+
+SparseFormat = Literal["csr", "csc", "coo"]
+SPARSE_FORMATS = ("csr", "csc", "coo")
+
+
+DEFAULT_COLUMN_BLOCK_ELEMENTS = 1 << 24
 
 
-def get_circuit_matrix(circuit: Circuit) -> NDArray[np.complex128]:
+@overload
+def get_circuit_matrix(
+    circuit: Circuit,
+    *,
+    fusion_size: int | None = None,
+    dtype: DTypeLike = None,
+    out: NDArray[Any] | None = None,
+    column_block_size: int | None = None,
+    workers: int | None = None,
+) -> NDArray[np.complexfloating[Any]]: ...
+
+
+@overload
+def get_circuit_matrix(
+    circuit: Circuit,
+    *,
+    format: None,
+    fusion_size: int | None = None,
+    dtype: DTypeLike = None,
+    out: NDArray[Any] | None = None,
+    column_block_size: int | None = None,
+    workers: int | None = None,
+) -> NDArray[np.complexfloating[Any]]: ...
+
+
+@overload
+def get_circuit_matrix(circuit: Circuit, *, format: SparseFormat, dtype: DTypeLike = None) -> sparray: ...
+
+
+def get_circuit_matrix(
+    circuit: Circuit,
+    *,
+    format: SparseFormat | None = None,  # noqa: A002
+    fusion_size: int | None = None,
+    dtype: DTypeLike = None,
+    out: NDArray[Any] | None = None,
+    column_block_size: int | None = None,
+    workers: int | None = None,
+) -> NDArray[np.complexfloating[Any]] | sparray:
     """Compute the (large) unitary matrix corresponding to the circuit.
 
     This matrix has $4^n$ elements, where $n$ is the number of qubits.
+    Each gate is applied by a tensor contraction over the qubits it acts on, i.e., without expanding the gate
+    matrix to the full register.
+
+    If a sparse format is given, the matrix is instead accumulated as a sparse matrix. This is useful for circuits
+    whose unitary stays sparse, _e.g._, diagonal or permutation-heavy circuits (CZ/CNOT/SWAP networks), for which a
+    dense matrix does not fit in memory.
+
+    If a fusion size is given, consecutive gates are first fused into dense blocks acting on at most that many qubits
+    (see `opensquirrel.utils.gate_fusion.fuse_gates`), such that the dense matrix is updated once per block instead of
+    once per gate.
+
+    The matrix can be computed in reduced precision, _e.g._, with `dtype=np.complex64`, which halves the memory and
+    bandwidth, at an accuracy of about $10^{-6}$. For matrices that do not fit in memory, an output array can be given,
+    _e.g._, a `np.memmap` backed by a file, into which the matrix is computed block of columns by block of columns. Only
+    one block of columns is kept in memory at a time.
+
+    Since every column of the matrix is the circuit applied to a computational basis state, the blocks of columns can
+    be computed in parallel, by a pool of worker processes. The workers write their blocks directly into shared memory,
+    or into the output array if it is a `np.memmap`. Without an output array, the returned matrix is backed by the
+    shared memory, which is released when the matrix (and any view of it) is garbage collected.
+
+    Example:
+        ```python
+        >>> out = np.memmap("unitary.dat", dtype=np.complex64, mode="w+", shape=(1 << 15, 1 << 15))
+        >>> get_circuit_matrix(circuit, out=out, column_block_size=1024, workers=64)
+        ```
 
     Args:
         circuit (Circuit): The circuit for which to compute the matrix.
+        format (SparseFormat | None): The sparse matrix format to return, one of `"csr"`, `"csc"` or `"coo"`.
+            Default is `None`, which returns a dense matrix.
+        fusion_size (int | None): The maximum number of qubits of a fused gate, _e.g._, 3 to 5. Default is `None`,
+            which applies the gates one by one. Gate fusion does not apply to sparse matrices.
+        dtype (DTypeLike): The complex data type of the matrix. Default is `None`, which is the data type of the
+            output array if given, and `np.complex128` otherwise.
+        out (NDArray[Any] | None): The $2^n\\times 2^n$ output array, _e.g._, a `np.memmap`. Default is `None`.
+        column_block_size (int | None): The number of columns that are computed at once. Default is `None`, which
+            computes all columns at once if no output array is given, and blocks of about
+            `DEFAULT_COLUMN_BLOCK_ELEMENTS` elements otherwise. Does not apply to sparse matrices.
+        workers (int | None): The number of worker processes that compute the blocks of columns. Default is `None`,
+            which computes all blocks in the current process. Does not apply to sparse matrices.
 
     Returns:
-        Matrix representation of the circuit.
+        Matrix representation of the circuit, which is the output array if given.
 
     """
-    impl = _CircuitMatrixCalculator(circuit.qubit_register_size)
+    dtype = _get_dtype(dtype, out)
+    if format is not None:
+        if any(option is not None for option in (fusion_size, out, column_block_size, workers)):
+            msg = "gate fusion, output arrays, column blocks and workers are not supported for sparse matrices"
+            raise ValueError(msg)
+        return _get_sparse_circuit_matrix(circuit, format, dtype)
+
+    if workers is not None and workers < 1:
+        msg = f"number of workers must be positive, got {workers!r}"
+        raise ValueError(msg)
+    workers = 1 if workers is None else workers
+    if out is None and column_block_size is None and workers == 1:
+        impl = _CircuitMatrixCalculator(circuit.qubit_register_size, dtype)
+        if fusion_size is None:
+            circuit.ir.accept(impl)
+        else:
+            accept_fused(circuit.ir, impl, fusion_size)
+        return impl.matrix
+
+    return _get_column_blocks(
+        circuit.qubit_register_size, _get_gates(circuit, fusion_size), dtype, out, column_block_size, workers
+    )
 
+
+def _get_sparse_circuit_matrix(circuit: Circuit, sparse_format: SparseFormat, dtype: np.dtype[Any]) -> sparray:
+    if sparse_format not in SPARSE_FORMATS:
+        msg = f"unsupported sparse format {sparse_format!r}: expected one of {SPARSE_FORMATS!r}"
+        raise ValueError(msg)
+    impl = _SparseCircuitMatrixCalculator(circuit.qubit_register_size, dtype)
     circuit.ir.accept(impl)
+    return impl.matrix.asformat(sparse_format)
+
+
+def _get_dtype(dtype: DTypeLike, out: NDArray[Any] | None) -> np.dtype[Any]:
+    if out is None:
+        resolved_dtype = np.dtype(np.complex128 if dtype is None else dtype)
+    elif dtype is None or np.dtype(dtype) == out.dtype:
+        resolved_dtype = out.dtype
+    else:
+        msg = f"data type {np.dtype(dtype)!r} does not match the data type of the output array {out.dtype!r}"
+        raise ValueError(msg)
+
+    if resolved_dtype.kind != "c":
+        msg = f"data type must be complex, got {resolved_dtype!r}"
+        raise ValueError(msg)
+    return resolved_dtype
 
+
+class _GateCollector(IRVisitor):
+    """Collects the matrices and qubit operands of the gates of a circuit, as (unfused) blocks of a single gate."""
+
+    def __init__(self) -> None:
+        self.gates: list[FusedGate] = []
+
+    def visit_single_qubit_gate(self, gate: SingleQubitGate) -> None:
+        self.gates.append(FusedGate(np.asarray(gate.matrix, dtype=np.complex128), gate.qubit_indices, 1))
+
+    def visit_two_qubit_gate(self, gate: TwoQubitGate) -> None:
+        self.gates.append(FusedGate(np.asarray(gate.matrix, dtype=np.complex128), gate.qubit_indices, 1))
+
+
+def _get_gates(circuit: Circuit, fusion_size: int | None) -> list[FusedGate]:
+    if fusion_size is not None:
+        statements, _ = fuse_gates(circuit.ir, fusion_size)
+        return [statement for statement in statements if isinstance(statement, FusedGate)]
+    collector = _GateCollector()
+    circuit.ir.accept(collector)
+    return collector.gates
+
+
+def _get_columns(
+    qubit_register_size: int, gates: list[FusedGate], dtype: np.dtype[Any], columns: range
+) -> NDArray[np.complexfloating[Any]]:
+    impl = _CircuitMatrixCalculator(qubit_register_size, dtype, columns)
+    for gate in gates:
+        impl.visit_fused_gate(gate)
     return impl.matrix
+
+
+def _get_column_blocks(
+    qubit_register_size: int,
+    gates: list[FusedGate],
+    dtype: np.dtype[Any],
+    out: NDArray[Any] | None,
+    column_block_size: int | None,
+    workers: int,
+) -> NDArray[np.complexfloating[Any]]:
+    size = 1 << qubit_register_size
+    if out is not None and out.shape != (size, size):
+        msg = f"output array has incorrect shape {out.shape!r}: expected shape {(size, size)!r}"
+        raise ValueError(msg)
+    if column_block_size is None:
+        # Bounded in memory, and enough blocks to balance the load over the workers.
+        column_block_size = max(1, min(DEFAULT_COLUMN_BLOCK_ELEMENTS // size, -(-size // (4 * workers))))
+    elif column_block_size < 1:
+        msg = f"column block size must be positive, got {column_block_size!r}"
+        raise ValueError(msg)
+    blocks = [range(start, min(start + column_block_size, size)) for start in range(0, size, column_block_size)]
+
+    if workers > 1 and len(blocks) > 1:
+        return _get_column_blocks_in_parallel(qubit_register_size, gates, dtype, out, blocks, workers)
+
+    if out is None:
+        out = np.empty((size, size), dtype=dtype)
+    for columns in blocks:
+        out[:, columns.start : columns.stop] = _get_columns(qubit_register_size, gates, dtype, columns)
+    if isinstance(out, np.memmap):
+        out.flush()
+    return out
+
+
+# The output of a worker: either a memory-mapped file and the offset of the matrix in it, or a shared memory block.
+_WorkerOutput = tuple[Literal["memmap"], str, int] | tuple[Literal["shared_memory"], str, int]
+
+
+def _get_column_blocks_in_parallel(
+    qubit_register_size: int,
+    gates: list[FusedGate],
+    dtype: np.dtype[Any],
+    out: NDArray[Any] | None,
+    blocks: list[range],
+    workers: int,
+) -> NDArray[np.complexfloating[Any]]:
+    """Compute the blocks of columns in a process pool. The workers write their blocks directly into the output
+    (a memory-mapped file or a shared memory block), such that no large arrays are sent between processes.
+    """
+    size = 1 << qubit_register_size
+    if isinstance(out, np.memmap) and out.filename is not None and out.flags.c_contiguous:
+        out.flush()
+        _run_workers(("memmap", str(out.filename), out.offset), qubit_register_size, gates, dtype, blocks, workers)
+        return out
+
+    shared_memory = SharedMemory(create=True, size=size * size * dtype.itemsize)
+    try:
+        _run_workers(("shared_memory", shared_memory.name, 0), qubit_register_size, gates, dtype, blocks, workers)
+    except BaseException:
+        shared_memory.close()
+        shared_memory.unlink()
+        raise
+
+    if out is None:
+        # The matrix is returned in the shared memory block, instead of as a copy, which would double the peak memory
+        return np.asarray(_SharedMemoryOwner(shared_memory, (size, size), dtype))
+    try:
+        matrix = np.ndarray((size, size), dtype=dtype, buffer=shared_memory.buf)
+        out[...] = matrix
+        del matrix
+    finally:
+        shared_memory.close()
+        shared_memory.unlink()
+    return out
+
+
+class _SharedMemoryOwner:
+    """Exposes a shared memory block as an array, through the array interface.
+
+    Arrays that are created from the owner (and their views) keep it alive as their base. The shared memory block is
+    closed and unlinked when the owner is garbage collected, _i.e._, when the last of these arrays is.
+    """
+
+    def __init__(self, shared_memory: SharedMemory, shape: tuple[int, ...], dtype: np.dtype[Any]) -> None:
+        matrix = np.ndarray(shape, dtype=dtype, buffer=shared_memory.buf)
+        self.__array_interface__ = matrix.__array_interface__
+        del matrix
+        weakref.finalize(self, _release_shared_memory, shared_memory)
+
+
+def _release_shared_memory(shared_memory: SharedMemory) -> None:
+    shared_memory.close()
+    shared_memory.unlink()
+
+
+def _run_workers(
+    output: _WorkerOutput,
+    qubit_register_size: int,
+    gates: list[FusedGate],
+    dtype: np.dtype[Any],
+    blocks: list[range],
+    workers: int,
+) -> None:
+    """Compute the blocks of columns in a process pool, of which the workers receive the gates once, when they start,
+    instead of with every block."""
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(blocks)),
+        initializer=_initialize_worker,
+        initargs=(output, qubit_register_size, gates, dtype),
+    ) as executor:
+        futures = [executor.submit(_compute_column_block, columns) for columns in blocks]
+        for future in futures:
+            future.result()
+
+
+# The output, qubit register size, gates and data type of the column blocks that a worker process computes
+_worker_arguments: tuple[_WorkerOutput, int, list[FusedGate], np.dtype[Any]] | None = None
+
+
+def _initialize_worker(
+    output: _WorkerOutput, qubit_register_size: int, gates: list[FusedGate], dtype: np.dtype[Any]
+) -> None:
+    global _worker_arguments
+    _worker_arguments = (output, qubit_register_size, gates, dtype)
+
+
+def _compute_column_block(columns: range) -> None:
+    if _worker_arguments is None:
+        msg = "worker process is not initialized"
+        raise RuntimeError(msg)
+    output, qubit_register_size, gates, dtype = _worker_arguments
+    size = 1 << qubit_register_size
+    kind, name, offset = output
+    block = _get_columns(qubit_register_size, gates, dtype, columns)
+    if kind == "memmap":
+        matrix = np.memmap(name, dtype=dtype, mode="r+", offset=offset, shape=(size, size))
+        matrix[:, columns.start : columns.stop] = block
+        matrix.flush()
+        del matrix
+        return
+
+    shared_memory = SharedMemory(name=name)
+    try:
+        matrix = np.ndarray((size, size), dtype=dtype, buffer=shared_memory.buf)
+        matrix[:, columns.start : columns.stop] = block
+        del matrix
+    finally:
+        shared_memory.close()
@@ -33,6 +33,20 @@ def normalize_angle(x: SupportsFloat) -> float:
     return t
 
 
+def normalize_angles(x: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Normalize the angles to be in between the range of $(-\\pi, \\pi]$, element-wise, as `normalize_angle`.
+
+    Args:
+        x (NDArray[np.float64]): values to normalize.
+
+    Returns:
+        The normalized angles.
+
+    """
+    t = x - tau * (x // tau + 1)
+    return np.where(t < -tau / 2 + ATOL, t + tau, np.where(t > tau / 2, t - tau, t))
+
+
 def are_matrices_equivalent_up_to_global_phase(
     matrix_a: NDArray[np.complex128], matrix_b: NDArray[np.complex128]
 ) -> bool:
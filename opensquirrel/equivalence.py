@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+from numpy.typing import NDArray
+
+from opensquirrel.common import ATOL
+from opensquirrel.ir import IRVisitor
+from opensquirrel.simulator.stabilizer_simulator import get_clifford_tableau, is_clifford_circuit
+from opensquirrel.utils.gate_fusion import accept_fused
+from opensquirrel.utils.tensor_contraction import apply_matrix_to_tensor_in_place
+
+if TYPE_CHECKING:
+    from opensquirrel.circuit import Circuit
+    from opensquirrel.ir.single_qubit_gate import SingleQubitGate
+    from opensquirrel.ir.two_qubit_gate import TwoQubitGate
+    from opensquirrel.passes.mapper.mapping import Mapping
+    from opensquirrel.simulator.clifford_tableau import CliffordTableau
+    from opensquirrel.utils.gate_fusion import FusedGate
+
+EquivalenceMethod = Literal["random_states", "matrix", "tableau"]
+EQUIVALENCE_METHODS = ("random_states", "matrix", "tableau")
+DEFAULT_TRIALS = 4
+
+
+class _StatesPropagator(IRVisitor):
+    """Applies the gates of a circuit, in place, to a batch of states stored as a tensor with $n$ qubit axes of
+    dimension 2 and a trailing batch axis.
+    """
+
+    def __init__(self, qubit_register_size: int, states: NDArray[np.complex128]) -> None:
+        self.qubit_register_size = qubit_register_size
+        self.states = states
+
+    def visit_single_qubit_gate(self, gate: SingleQubitGate) -> None:
+        apply_matrix_to_tensor_in_place(self.states, gate.matrix, gate.qubit_indices, self.qubit_register_size)
+
+    def visit_two_qubit_gate(self, gate: TwoQubitGate) -> None:
+        apply_matrix_to_tensor_in_place(self.states, gate.matrix, gate.qubit_indices, self.qubit_register_size)
+
+    def visit_fused_gate(self, fused_gate: FusedGate) -> None:
+        apply_matrix_to_tensor_in_place(
+            self.states, fused_gate.matrix, fused_gate.qubit_indices, self.qubit_register_size
+        )
+
+
+def _get_physical_axes(mapping: Mapping, qubit_register_size: int) -> list[int]:
+    """Get, for every qubit axis of a tensor in the virtual frame, the corresponding qubit axis in the physical frame
+    of the mapping.
+    """
+    return [qubit_register_size - 1 - mapping[qubit_register_size - 1 - axis] for axis in range(qubit_register_size)]
+
+
+def _propagate(
+    circuit: Circuit, states: NDArray[np.complex128], output_mapping: Mapping | None, fusion_size: int | None
+) -> NDArray[np.complex128]:
+    """Propagates a batch of states, given in the virtual frame, through the circuit, taking into account the mapping
+    of the virtual qubits to the physical qubits of the circuit at its start and end.
+    """
+    qubit_register_size = circuit.qubit_register_size
+    input_axes = _get_physical_axes(circuit.mapping, qubit_register_size)
+    output_axes = _get_physical_axes(circuit.mapping if output_mapping is None else output_mapping, qubit_register_size)
+    batch_axis = [qubit_register_size]
+
+    physical_states = np.moveaxis(states, list(range(qubit_register_size)), input_axes).copy()
+    propagator = _StatesPropagator(qubit_register_size, physical_states)
+    if fusion_size is None:
+        circuit.ir.accept(propagator)
+    else:
+        accept_fused(circuit.ir, propagator, fusion_size)
+    return propagator.states.transpose(output_axes + batch_axis)
+
+
+def _get_virtual_tableau(circuit: Circuit, output_mapping: Mapping | None) -> CliffordTableau:
+    """Get the Clifford tableau of the circuit in the virtual frame, _i.e._, with the rows of the generators of the
+    virtual qubits, expressed in terms of the virtual qubits at the end of the circuit.
+    """
+    qubit_register_size = circuit.qubit_register_size
+    input_mapping = circuit.mapping
+    output_mapping = input_mapping if output_mapping is None else output_mapping
+    physical_qubits = [input_mapping[qubit] for qubit in range(qubit_register_size)]
+    rows = physical_qubits + [qubit_register_size + physical_qubit for physical_qubit in physical_qubits]
+    columns = [output_mapping[qubit] for qubit in range(qubit_register_size)]
+
+    tableau = get_clifford_tableau(circuit)
+    tableau.x = tableau.x[np.ix_(rows, columns)]
+    tableau.z = tableau.z[np.ix_(rows, columns)]
+    tableau.r = tableau.r[rows]
+    return tableau
+
+
+def _get_random_states(qubit_register_size: int, trials: int, seed: int | None) -> NDArray[np.complex128]:
+    rng = np.random.default_rng(seed)
+    shape = (1 << qubit_register_size, trials)
+    states = rng.standard_normal(shape) + 1j * rng.standard_normal(shape)
+    return np.asarray(states / np.linalg.norm(states, axis=0), dtype=np.complex128)
+
+
+def check(
+    circuit_a: Circuit,
+    circuit_b: Circuit,
+    method: EquivalenceMethod = "random_states",
+    trials: int = DEFAULT_TRIALS,
+    seed: int | None = None,
+    output_mapping_b: Mapping | None = None,
+    fusion_size: int | None = None,
+) -> bool:
+    """Checks whether two circuits are equivalent up to a global phase, _e.g._, a circuit and its compiled version.
+
+    The gates of both circuits are applied to the same batch of states, after which the overlaps of the resulting
+    states are compared. With the `"random_states"` method, $k$ random states are used, which requires $O(k 2^n)$
+    memory instead of the $O(4^n)$ memory needed for the unitary matrices of the circuits. Since two inequivalent
+    circuits only give the same overlaps for a set of states of measure zero, the check is probabilistic but fails
+    with negligible probability. With the `"matrix"` method, the computational basis states are used, which amounts
+    to comparing the unitary matrices of the circuits.
+
+    With the `"tableau"` method, which only applies to stabilizer circuits, _i.e._, circuits of Clifford gates only,
+    the Clifford tableaux of the circuits are compared, which is exact and takes polynomial time in the number of
+    qubits. The `"random_states"` method falls back to this method if both circuits are stabilizer circuits.
+
+    The qubit mapping of a circuit, _i.e._, the `Circuit.mapping` set by `Circuit.map`, is taken into account: the
+    states are permuted from the virtual qubits to the physical qubits before applying the gates, and back afterwards.
+    A permutation of the qubits at the end of the second circuit, _e.g._, caused by the SWAP gates inserted by a router,
+    can be provided as its output mapping.
+
+    Note:
+        Non-unitary instructions (measure, reset, init) and control instructions are ignored.
+
+    Args:
+        circuit_a (Circuit): The first circuit.
+        circuit_b (Circuit): The second circuit.
+        method (EquivalenceMethod): The method, either `"random_states"` (default), `"matrix"`, or `"tableau"`.
+        trials (int): The number of random states, for the `"random_states"` method. Default is `DEFAULT_TRIALS`.
+        seed (int | None): Seed for the random number generator of the random states. Default is `None`.
+        output_mapping_b (Mapping | None): Mapping of the virtual qubits to the physical qubits at the end of the
+            second circuit. Default is `None`, in which case the mapping of the second circuit is used.
+        fusion_size (int | None): If given, consecutive gates are fused into dense blocks acting on at most this many
+            qubits before they are applied to the states (see `opensquirrel.utils.gate_fusion.fuse_gates`).
+            Default is `None`.
+
+    Returns:
+        True if the circuits are equivalent up to a global phase, False otherwise.
+
+    Raises:
+        ValueError: If the `"tableau"` method is used for a circuit that is not a stabilizer circuit.
+
+    """
+    if method not in EQUIVALENCE_METHODS:
+        msg = f"unknown equivalence method {method!r}: expected one of {EQUIVALENCE_METHODS!r}"
+        raise ValueError(msg)
+    if trials < 1:
+        msg = f"number of trials must be positive, got {trials!r}"
+        raise ValueError(msg)
+
+    if circuit_a.qubit_register_size != circuit_b.qubit_register_size:
+        return False
+    qubit_register_size = circuit_a.qubit_register_size
+
+    if method == "tableau" or (
+        method == "random_states" and is_clifford_circuit(circuit_a) and is_clifford_circuit(circuit_b)
+    ):
+        return _get_virtual_tableau(circuit_a, None) == _get_virtual_tableau(circuit_b, output_mapping_b)
+
+    if method == "matrix":
+        states = np.eye(1 << qubit_register_size, dtype=np.complex128)
+    else:
+        states = _get_random_states(qubit_register_size, trials, seed)
+    states = states.reshape((2,) * qubit_register_size + (-1,))
+
+    final_states_a = _propagate(circuit_a, states, None, fusion_size).reshape(1 << qubit_register_size, -1)
+    final_states_b = _propagate(circuit_b, states, output_mapping_b, fusion_size).reshape(1 << qubit_register_size, -1)
+
+    overlaps = np.einsum("ij,ij->j", final_states_a.conj(), final_states_b)
+    return bool(np.isclose(abs(overlaps[0]), 1, atol=ATOL) and np.allclose(overlaps, overlaps[0], atol=ATOL))
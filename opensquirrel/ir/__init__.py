@@ -1,5 +1,18 @@
 from opensquirrel.ir.control_instruction import Barrier, ControlInstruction, Wait
-from opensquirrel.ir.expression import Axis, AxisLike, Bit, BitLike, Float, Int, Qubit, QubitLike, String, SupportsStr
+from opensquirrel.ir.expression import (
+    Axis,
+    AxisLike,
+    Bit,
+    BitLike,
+    Float,
+    Int,
+    Parameter,
+    ParameterExpression,
+    Qubit,
+    QubitLike,
+    String,
+    SupportsStr,
+)
 from opensquirrel.ir.ir import IR, IRNode, IRVisitor
 from opensquirrel.ir.non_unitary import Init, Measure, NonUnitary, Reset
 from opensquirrel.ir.semantics.gate_semantic import GateSemantic
@@ -25,6 +38,8 @@ __all__ = [
     "Int",
     "Measure",
     "NonUnitary",
+    "Parameter",
+    "ParameterExpression",
     "Qubit",
     "QubitLike",
     "Reset",
@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable, Iterator
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from opensquirrel.ir.control_instruction import Barrier, Wait
+from opensquirrel.ir.expression import Float, Int
+from opensquirrel.ir.ir import IR
+from opensquirrel.ir.non_unitary import Init, Measure, Reset
+from opensquirrel.ir.semantics import BsrAngleParam, BsrFullParams, BsrUnitaryParams
+from opensquirrel.ir.semantics.semantic_table import semantic_key
+from opensquirrel.ir.single_qubit_gate import SingleQubitGate
+from opensquirrel.ir.statement import AsmDeclaration
+from opensquirrel.ir.two_qubit_gate import TwoQubitGate
+
+if TYPE_CHECKING:
+    from opensquirrel.ir import Expression, GateSemantic, IRVisitor, Statement
+
+# Value of the operand and index columns of a row that has no such operand or index
+NO_INDEX = -1
+
+OPCODE_DTYPE = np.int16
+INDEX_DTYPE = np.int32
+
+Parameters = tuple[Any, ...]
+
+
+def _plain_value(argument: Expression | Any) -> Any:
+    if isinstance(argument, (Float, Int)):
+        return argument.value
+    return argument
+
+
+class CompactIR:
+    """Columnar (struct-of-arrays) representation of an IR, which stores a statement per row of five NumPy arrays,
+    instead of as a Python object. The columns index into three deduplicated tables:
+
+    - `opcode`: the index of the instruction type and name of the statement in `opcode_table`;
+    - `operand0`, `operand1`: the qubit operand(s) of the statement, or the qubit and bit operand of a measure;
+    - `parameter_index`: the index of the (constructor) arguments of the statement in `parameter_table`;
+    - `semantic_id`: the index of the gate semantic of a gate in `semantic_table`.
+
+    Rows that do not have an operand or index hold `NO_INDEX`. Statements without a columnar encoding, _i.e._,
+    gates of custom (non-default) types, are kept as objects in `object_table`, indexed by their parameter index.
+
+    The conversion from and to the object IR is lossless: `CompactIR.from_ir(ir).to_ir() == ir`.
+    """
+
+    def __init__(self) -> None:
+        self.opcode: NDArray[np.int16] = np.empty(0, dtype=OPCODE_DTYPE)
+        self.operand0: NDArray[np.int32] = np.empty(0, dtype=INDEX_DTYPE)
+        self.operand1: NDArray[np.int32] = np.empty(0, dtype=INDEX_DTYPE)
+        self.parameter_index: NDArray[np.int32] = np.empty(0, dtype=INDEX_DTYPE)
+        self.semantic_id: NDArray[np.int32] = np.empty(0, dtype=INDEX_DTYPE)
+
+        self.opcode_table: list[tuple[type[Statement], str]] = []
+        self.parameter_table: list[Parameters] = []
+        self.semantic_table: list[GateSemantic] = []
+        self.object_table: list[Statement] = []
+
+    @classmethod
+    def from_ir(cls, ir: IR) -> CompactIR:
+        """Creates the columnar representation of an IR.
+
+        Args:
+            ir: The IR to convert.
+
+        Returns:
+            The columnar representation of the IR.
+
+        """
+        return _CompactIRBuilder().build(ir.statements_view)
+
+    def to_ir(self) -> IR:
+        """Converts the columnar representation back to an IR.
+
+        Returns:
+            The IR, with a statement object per row.
+
+        """
+        ir = IR()
+        ir.statements = list(self)
+        return ir
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes of the columns, i.e., excluding the tables."""
+        return sum(
+            column.nbytes
+            for column in (self.opcode, self.operand0, self.operand1, self.parameter_index, self.semantic_id)
+        )
+
+    def indices_on_qubit(self, qubit: int) -> NDArray[np.intp]:
+        """The indices of the rows that act on a qubit, in order.
+
+        Args:
+            qubit: The index of the qubit.
+
+        Returns:
+            The row indices of the statements with the qubit as (one of their) qubit operand(s).
+
+        """
+        is_two_qubit_gate = np.array(
+            [issubclass(statement_type, TwoQubitGate) for statement_type, _ in self.opcode_table], dtype=bool
+        )
+        return np.flatnonzero((self.operand0 == qubit) | ((self.operand1 == qubit) & is_two_qubit_gate[self.opcode]))
+
+    def accept(self, visitor: IRVisitor) -> None:
+        """Accepts visitor and processes the IR nodes, which are created one row at a time."""
+        for statement in self:
+            statement.accept(visitor)
+
+    def __len__(self) -> int:
+        return len(self.opcode)
+
+    def __iter__(self) -> Iterator[Statement]:
+        for row in range(len(self)):
+            yield self[row]
+
+    def __getitem__(self, row: int) -> Statement:
+        from opensquirrel.default_instructions import default_gate_set
+
+        statement_type, name = self.opcode_table[self.opcode[row]]
+        operand0, operand1 = int(self.operand0[row]), int(self.operand1[row])
+        parameter_index, semantic_id = int(self.parameter_index[row]), int(self.semantic_id[row])
+        parameters = self.parameter_table[parameter_index] if parameter_index != NO_INDEX else ()
+
+        if statement_type is SingleQubitGate:
+            return SingleQubitGate(operand0, self.semantic_table[semantic_id], name)
+        if statement_type is TwoQubitGate:
+            return TwoQubitGate(operand0, operand1, self.semantic_table[semantic_id], name)
+        if issubclass(statement_type, SingleQubitGate) and statement_type in default_gate_set.values():
+            return statement_type(operand0, *parameters)
+        if issubclass(statement_type, TwoQubitGate) and statement_type in default_gate_set.values():
+            return statement_type(operand0, operand1, *parameters)  # ty: ignore[too-many-positional-arguments]
+        if statement_type is Measure:
+            return Measure(operand0, operand1, parameters)
+        if statement_type is Wait:
+            return Wait(operand0, *parameters)
+        if statement_type in (Init, Reset, Barrier):
+            return statement_type(operand0)  # ty: ignore[missing-argument]
+        if statement_type is AsmDeclaration:
+            return AsmDeclaration(*parameters)
+        return self.object_table[parameter_index]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactIR):
+            return False
+        return self.to_ir() == other.to_ir()
+
+    def __repr__(self) -> str:
+        return f"CompactIR(rows={len(self)}, opcodes={len(self.opcode_table)}, semantics={len(self.semantic_table)})"
+
+
+class _CompactIRBuilder:
+    """Builds the columns of a compact IR, while deduplicating the entries of its tables."""
+
+    def __init__(self) -> None:
+        self.compact_ir = CompactIR()
+        self.rows: list[tuple[int, int, int, int, int]] = []
+
+        self._opcodes: dict[tuple[type[Statement], str], int] = {}
+        self._parameters: dict[Parameters, int] = {}
+        self._semantics: dict[Hashable, int] = {}
+
+    def build(self, statements: Iterable[Statement]) -> CompactIR:
+        for statement in statements:
+            self.rows.append(self._encode(statement))
+
+        columns = np.array(self.rows, dtype=INDEX_DTYPE).reshape(-1, 5)
+        opcode, operand0, operand1, parameter_index, semantic_id = columns.T
+        self.compact_ir.opcode = opcode.astype(OPCODE_DTYPE)
+        self.compact_ir.operand0 = np.ascontiguousarray(operand0)
+        self.compact_ir.operand1 = np.ascontiguousarray(operand1)
+        self.compact_ir.parameter_index = np.ascontiguousarray(parameter_index)
+        self.compact_ir.semantic_id = np.ascontiguousarray(semantic_id)
+        return self.compact_ir
+
+    def _encode(self, statement: Statement) -> tuple[int, int, int, int, int]:
+        from opensquirrel.default_instructions import default_gate_set
+
+        statement_type = type(statement)
+        operand0 = operand1 = semantic_id = NO_INDEX
+        parameters: Parameters = ()
+
+        if statement_type in (SingleQubitGate, TwoQubitGate) or statement_type in default_gate_set.values():
+            gate: Any = statement
+            operand0, *other_operands = gate.qubit_indices
+            operand1 = other_operands[0] if other_operands else NO_INDEX
+            if statement_type not in (SingleQubitGate, TwoQubitGate):
+                parameters = _gate_parameters(gate)
+            semantic_id = self._semantic_id(_gate_semantic(gate))
+        elif isinstance(statement, Measure):
+            operand0, operand1 = statement.qubit.index, statement.bit.index
+            parameters = tuple(statement.axis.value.tolist())
+        elif isinstance(statement, Wait):
+            operand0, parameters = statement.qubit.index, (statement.time.value,)
+        elif isinstance(statement, (Init, Reset, Barrier)):
+            operand0 = statement.qubit.index
+        elif isinstance(statement, AsmDeclaration):
+            parameters = (statement.backend_name.value, statement.backend_code.value)
+        else:
+            self.compact_ir.object_table.append(statement)
+            opcode = self._opcode(statement_type, statement_type.__name__)
+            return opcode, NO_INDEX, NO_INDEX, len(self.compact_ir.object_table) - 1, NO_INDEX
+
+        name = getattr(statement, "name", statement_type.__name__)
+        return self._opcode(statement_type, name), operand0, operand1, self._parameter_index(parameters), semantic_id
+
+    def _opcode(self, statement_type: type[Statement], name: str) -> int:
+        key = (statement_type, name)
+        if key not in self._opcodes:
+            self._opcodes[key] = len(self.compact_ir.opcode_table)
+            self.compact_ir.opcode_table.append(key)
+        return self._opcodes[key]
+
+    def _parameter_index(self, parameters: Parameters) -> int:
+        if not parameters:
+            return NO_INDEX
+        if parameters not in self._parameters:
+            self._parameters[parameters] = len(self.compact_ir.parameter_table)
+            self.compact_ir.parameter_table.append(parameters)
+        return self._parameters[parameters]
+
+    def _semantic_id(self, semantic: GateSemantic) -> int:
+        key = semantic_key(semantic)
+        if key not in self._semantics:
+            self._semantics[key] = len(self.compact_ir.semantic_table)
+            self.compact_ir.semantic_table.append(semantic)
+        return self._semantics[key]
+
+
+def _gate_semantic(gate: SingleQubitGate | TwoQubitGate) -> GateSemantic:
+    if isinstance(gate, TwoQubitGate):
+        return gate.gate_semantic
+    for semantic in (gate.parametric, gate._bsr, gate._matrix):  # noqa: SLF001
+        if semantic is not None:
+            return semantic
+    return gate.bsr
+
+
+def _gate_parameters(gate: SingleQubitGate | TwoQubitGate) -> Parameters:
+    """The arguments to construct a default gate with, besides its qubit operands."""
+    if gate.parametric is not None:
+        arguments = gate.parametric.arguments
+    elif isinstance(gate, TwoQubitGate):
+        arguments = gate.arguments
+    elif isinstance(gate.bsr, (BsrFullParams, BsrAngleParam, BsrUnitaryParams)):
+        arguments = gate.bsr.arguments
+    else:
+        arguments = ()
+    return tuple(_plain_value(argument) for argument in arguments)
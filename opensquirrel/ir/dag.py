@@ -0,0 +1,371 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+
+from opensquirrel.ir.statement import AsmDeclaration, Instruction
+
+if TYPE_CHECKING:
+    from opensquirrel.ir.ir import IR
+    from opensquirrel.ir.statement import Statement
+
+# Value of a link to a node that does not exist, e.g., the predecessor of the first node on a qubit
+NO_NODE = -1
+
+
+class DAG:
+    """Dependency DAG of the statements of an IR, where a statement depends on the previous statements that act on
+    (one of) its qubit operands. Assembly declarations act on all qubits of the register.
+
+    Nodes are integers that index arrays of links: per node and per qubit it acts on (its _wires_), the previous and
+    next node on that qubit. Besides the dependencies, the nodes are kept in program order, _i.e._, the order of the
+    statements in the IR. Adding a node after all others, replacing a node and removing a node cost O(1) per wire, and
+    so does inserting a node next to a node on the same wire. Otherwise, inserting a node searches the previous nodes
+    in program order for the previous node on each of its wires (see `insert_after`). Node indices stay valid while
+    other nodes are added or removed.
+
+    Args:
+        qubit_register_size: The size of the qubit register.
+
+    """
+
+    def __init__(self, qubit_register_size: int) -> None:
+        self.qubit_register_size = qubit_register_size
+
+        self._statements: list[Statement | None] = []
+        self._wires: list[tuple[int, ...]] = []
+        self._predecessors: list[list[int]] = []
+        self._successors: list[list[int]] = []
+        self._first_on_qubit = [NO_NODE] * qubit_register_size
+        self._last_on_qubit = [NO_NODE] * qubit_register_size
+        self._nodes_without_wires: dict[int, None] = {}
+
+        # Program order, as a doubly linked list of nodes
+        self._previous_node: list[int] = []
+        self._next_node: list[int] = []
+        self._head = NO_NODE
+        self._tail = NO_NODE
+        self._number_of_nodes = 0
+        self._version = 0
+
+    @classmethod
+    def from_statements(cls, statements: Iterable[Statement], qubit_register_size: int) -> DAG:
+        """Creates the DAG of a sequence of statements.
+
+        Args:
+            statements: The statements, in program order.
+            qubit_register_size: The size of the qubit register.
+
+        Returns:
+            The DAG, with node `i` for the `i`-th statement.
+
+        """
+        dag = cls(qubit_register_size)
+        for statement in statements:
+            dag.add_statement(statement)
+        return dag
+
+    @classmethod
+    def from_ir(cls, ir: IR, qubit_register_size: int) -> DAG:
+        """Creates the DAG of an IR.
+
+        Args:
+            ir: The IR.
+            qubit_register_size: The size of the qubit register.
+
+        Returns:
+            The DAG, with node `i` for the `i`-th statement of the IR.
+
+        """
+        return cls.from_statements(ir.statements_view, qubit_register_size)
+
+    def to_ir(self) -> IR:
+        """Converts the DAG back to an IR.
+
+        Returns:
+            The IR, with the statements of the nodes in program order.
+
+        """
+        from opensquirrel.ir.ir import IR
+
+        ir = IR()
+        ir.statements = [self[node] for node in self]
+        return ir
+
+    def add_statement(self, statement: Statement) -> int:
+        """Adds a statement after all other statements.
+
+        Args:
+            statement: The statement to add.
+
+        Returns:
+            The node of the statement.
+
+        """
+        return self.insert_after(self._tail, statement)
+
+    def insert_before(self, node: int, statement: Statement) -> int:
+        """Inserts a statement right before a node, in program order.
+
+        Args:
+            node: The node to insert the statement before.
+            statement: The statement to insert.
+
+        Returns:
+            The node of the statement.
+
+        """
+        return self.insert_after(self._previous_node[node], statement)
+
+    def insert_after(self, node: int, statement: Statement) -> int:
+        """Inserts a statement right after a node, in program order.
+
+        The links of a wire of the statement are found in O(1) if `node` or the next node (in program order) acts on
+        that qubit. Otherwise, the nodes before `node` are searched for the previous node on the qubit.
+
+        Args:
+            node: The node to insert the statement after, `NO_NODE` to insert the statement before all others.
+            statement: The statement to insert.
+
+        Returns:
+            The node of the statement.
+
+        """
+        new_node = len(self._statements)
+        wires = self._get_wires(statement)
+        predecessors = [self._last_node_on_qubit_up_to(node, qubit) for qubit in wires]
+        successors = [
+            self._first_on_qubit[qubit] if predecessor == NO_NODE else self.successor(predecessor, qubit)
+            for qubit, predecessor in zip(wires, predecessors, strict=True)
+        ]
+
+        self._statements.append(statement)
+        self._wires.append(wires)
+        self._predecessors.append(predecessors)
+        self._successors.append(successors)
+        for qubit, predecessor, successor in zip(wires, predecessors, successors, strict=True):
+            self._set_successor(predecessor, qubit, new_node)
+            self._set_predecessor(successor, qubit, new_node)
+        if not wires:
+            self._nodes_without_wires[new_node] = None
+
+        next_node = self._head if node == NO_NODE else self._next_node[node]
+        self._previous_node.append(node)
+        self._next_node.append(next_node)
+        if node == NO_NODE:
+            self._head = new_node
+        else:
+            self._next_node[node] = new_node
+        if next_node == NO_NODE:
+            self._tail = new_node
+        else:
+            self._previous_node[next_node] = new_node
+        self._number_of_nodes += 1
+        self._version += 1
+        return new_node
+
+    def remove(self, node: int) -> Statement:
+        """Removes a node, and links its predecessor and successor on each of its wires.
+
+        Args:
+            node: The node to remove.
+
+        Returns:
+            The statement of the removed node.
+
+        """
+        statement = self[node]
+        for qubit, predecessor, successor in zip(
+            self._wires[node], self._predecessors[node], self._successors[node], strict=True
+        ):
+            self._set_successor(predecessor, qubit, successor)
+            self._set_predecessor(successor, qubit, predecessor)
+        self._nodes_without_wires.pop(node, None)
+
+        previous_node, next_node = self._previous_node[node], self._next_node[node]
+        if previous_node == NO_NODE:
+            self._head = next_node
+        else:
+            self._next_node[previous_node] = next_node
+        if next_node == NO_NODE:
+            self._tail = previous_node
+        else:
+            self._previous_node[next_node] = previous_node
+
+        self._statements[node] = None
+        self._wires[node] = ()
+        self._predecessors[node] = []
+        self._successors[node] = []
+        self._number_of_nodes -= 1
+        self._version += 1
+        return statement
+
+    def replace(self, node: int, statement: Statement) -> int:
+        """Replaces the statement of a node. If the new statement acts on the same qubits, the node is kept and only
+        its statement changes, otherwise the new statement is inserted in its place.
+
+        Args:
+            node: The node to replace.
+            statement: The new statement.
+
+        Returns:
+            The node of the new statement.
+
+        """
+        wires = self._get_wires(statement)
+        if sorted(wires) != sorted(self._wires[node]):
+            new_node = self.insert_before(node, statement)
+            self.remove(node)
+            return new_node
+
+        order = [self._wires[node].index(qubit) for qubit in wires]
+        self._statements[node] = statement
+        self._wires[node] = wires
+        self._predecessors[node] = [self._predecessors[node][i] for i in order]
+        self._successors[node] = [self._successors[node][i] for i in order]
+        self._version += 1
+        return node
+
+    @property
+    def version(self) -> int:
+        """The number of changes made to the DAG, _i.e._, of nodes that are added, replaced or removed."""
+        return self._version
+
+    def wires(self, node: int) -> tuple[int, ...]:
+        """The qubit indices a node acts on."""
+        return self._wires[node]
+
+    def predecessor(self, node: int, qubit: int) -> int:
+        """The previous node on a qubit of a node, `NO_NODE` if it is the first node on that qubit."""
+        return self._predecessors[node][self._wires[node].index(qubit)]
+
+    def successor(self, node: int, qubit: int) -> int:
+        """The next node on a qubit of a node, `NO_NODE` if it is the last node on that qubit."""
+        return self._successors[node][self._wires[node].index(qubit)]
+
+    def predecessors(self, node: int) -> list[int]:
+        """The nodes a node depends on, _i.e._, the (distinct) previous nodes on its wires."""
+        return list(dict.fromkeys(predecessor for predecessor in self._predecessors[node] if predecessor != NO_NODE))
+
+    def successors(self, node: int) -> list[int]:
+        """The nodes that depend on a node, _i.e._, the (distinct) next nodes on its wires."""
+        return list(dict.fromkeys(successor for successor in self._successors[node] if successor != NO_NODE))
+
+    def first(self, qubit: int) -> int:
+        """The first node on a qubit, `NO_NODE` if there is none."""
+        return self._first_on_qubit[qubit]
+
+    def last(self, qubit: int) -> int:
+        """The last node on a qubit, `NO_NODE` if there is none."""
+        return self._last_on_qubit[qubit]
+
+    def nodes_on_qubit(self, qubit: int) -> Iterator[int]:
+        """The nodes that act on a qubit, in program order."""
+        node = self._first_on_qubit[qubit]
+        while node != NO_NODE:
+            yield node
+            node = self.successor(node, qubit)
+
+    def front_layer(self) -> list[int]:
+        """The nodes without predecessors, _i.e._, the statements that can be executed first, ordered by (the first)
+        qubit they act on. Statements without wires come last.
+
+        Taking the front layer costs O(qubit register size). Removing the nodes of the front layer, and taking the
+        front layer again, iterates over the DAG layer by layer.
+        """
+        front_nodes = {
+            node: None
+            for node in self._first_on_qubit
+            if node != NO_NODE and all(predecessor == NO_NODE for predecessor in self._predecessors[node])
+        }
+        return [*front_nodes, *self._nodes_without_wires]
+
+    def layer_indices(self) -> dict[int, int]:
+        """The ASAP layer of each node, _i.e._, the length of the longest path (in edges) that ends at the node."""
+        layer_indices: dict[int, int] = {}
+        for node in self:
+            layer_indices[node] = max(
+                (layer_indices[predecessor] + 1 for predecessor in self.predecessors(node)), default=0
+            )
+        return layer_indices
+
+    def layers(self) -> list[list[int]]:
+        """The topological (ASAP) layers of the DAG: a node is in the layer after the last layer of its predecessors.
+
+        Returns:
+            The nodes per layer, in program order.
+
+        """
+        layers: list[list[int]] = []
+        for node, layer_index in self.layer_indices().items():
+            if layer_index == len(layers):
+                layers.append([])
+            layers[layer_index].append(node)
+        return layers
+
+    @property
+    def depth(self) -> int:
+        """The number of layers of the DAG."""
+        return max(self.layer_indices().values(), default=-1) + 1
+
+    def __len__(self) -> int:
+        return self._number_of_nodes
+
+    def __iter__(self) -> Iterator[int]:
+        node = self._head
+        while node != NO_NODE:
+            yield node
+            node = self._next_node[node]
+
+    def __reversed__(self) -> Iterator[int]:
+        node = self._tail
+        while node != NO_NODE:
+            yield node
+            node = self._previous_node[node]
+
+    def __contains__(self, node: object) -> bool:
+        return isinstance(node, int) and 0 <= node < len(self._statements) and self._statements[node] is not None
+
+    def __getitem__(self, node: int) -> Statement:
+        statement = self._statements[node]
+        if statement is None:
+            msg = f"node {node!r} has been removed"
+            raise KeyError(msg)
+        return statement
+
+    def __repr__(self) -> str:
+        return f"DAG(nodes={len(self)}, depth={self.depth})"
+
+    def _get_wires(self, statement: Statement) -> tuple[int, ...]:
+        if isinstance(statement, AsmDeclaration):
+            return tuple(range(self.qubit_register_size))
+        if isinstance(statement, Instruction):
+            return tuple(dict.fromkeys(statement.qubit_indices))
+        return ()
+
+    def _last_node_on_qubit_up_to(self, node: int, qubit: int) -> int:
+        """The last node on a qubit, in program order, up to and including a node."""
+        if node == NO_NODE:
+            return NO_NODE
+        if qubit in self._wires[node]:
+            return node
+        next_node = self._next_node[node]
+        if next_node == NO_NODE:
+            return self._last_on_qubit[qubit]
+        if qubit in self._wires[next_node]:
+            return self.predecessor(next_node, qubit)
+        while node != NO_NODE and qubit not in self._wires[node]:
+            node = self._previous_node[node]
+        return node
+
+    def _set_successor(self, node: int, qubit: int, successor: int) -> None:
+        if node == NO_NODE:
+            self._first_on_qubit[qubit] = successor
+        else:
+            self._successors[node][self._wires[node].index(qubit)] = successor
+
+    def _set_predecessor(self, node: int, qubit: int, predecessor: int) -> None:
+        if node == NO_NODE:
+            self._last_on_qubit[qubit] = predecessor
+        else:
+            self._predecessors[node][self._wires[node].index(qubit)] = predecessor
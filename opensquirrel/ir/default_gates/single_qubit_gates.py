@@ -5,8 +5,16 @@ from typing import SupportsFloat
 
 import numpy as np
 
-from opensquirrel.ir import Axis, AxisLike, QubitLike
-from opensquirrel.ir.semantics import BsrAngleParam, BsrFullParams, BsrNoParams, BsrUnitaryParams
+from opensquirrel.ir import Axis, AxisLike, ParameterExpression, QubitLike
+from opensquirrel.ir.expression import is_parametric
+from opensquirrel.ir.semantics import (
+    BsrAngleParam,
+    BsrFullParams,
+    BsrNoParams,
+    BsrUnitaryParams,
+    ParametricGateSemantic,
+)
+from opensquirrel.ir.semantics.semantic_table import shared_semantic
 from opensquirrel.ir.single_qubit_gate import SingleQubitGate
 
 
@@ -25,102 +33,167 @@ class Rn(SingleQubitGate):
 
 
 class Rx(SingleQubitGate):
-    def __init__(self, qubit: QubitLike, theta: SupportsFloat) -> None:
-        super().__init__(qubit=qubit, gate_semantic=BsrAngleParam(axis=(1, 0, 0), angle=theta, phase=0.0), name="Rx")
+    def __init__(self, qubit: QubitLike, theta: SupportsFloat | ParameterExpression) -> None:
+        gate_semantic = (
+            ParametricGateSemantic(theta)
+            if is_parametric(theta)
+            else BsrAngleParam(axis=(1, 0, 0), angle=theta, phase=0.0)  # ty: ignore[invalid-argument-type]
+        )
+        super().__init__(qubit=qubit, gate_semantic=gate_semantic, name="Rx")
 
 
 class Ry(SingleQubitGate):
-    def __init__(self, qubit: QubitLike, theta: SupportsFloat) -> None:
-        super().__init__(qubit=qubit, gate_semantic=BsrAngleParam(axis=(0, 1, 0), angle=theta, phase=0.0), name="Ry")
+    def __init__(self, qubit: QubitLike, theta: SupportsFloat | ParameterExpression) -> None:
+        gate_semantic = (
+            ParametricGateSemantic(theta)
+            if is_parametric(theta)
+            else BsrAngleParam(axis=(0, 1, 0), angle=theta, phase=0.0)  # ty: ignore[invalid-argument-type]
+        )
+        super().__init__(qubit=qubit, gate_semantic=gate_semantic, name="Ry")
 
 
 class Rz(SingleQubitGate):
-    def __init__(self, qubit: QubitLike, theta: SupportsFloat) -> None:
-        super().__init__(qubit=qubit, gate_semantic=BsrAngleParam(axis=(0, 0, 1), angle=theta, phase=0.0), name="Rz")
+    def __init__(self, qubit: QubitLike, theta: SupportsFloat | ParameterExpression) -> None:
+        gate_semantic = (
+            ParametricGateSemantic(theta)
+            if is_parametric(theta)
+            else BsrAngleParam(axis=(0, 0, 1), angle=theta, phase=0.0)  # ty: ignore[invalid-argument-type]
+        )
+        super().__init__(qubit=qubit, gate_semantic=gate_semantic, name="Rz")
 
 
 class I(SingleQubitGate):  # noqa: E742
     def __init__(self, qubit: QubitLike) -> None:
-        super().__init__(qubit=qubit, gate_semantic=BsrNoParams(axis=(0, 0, 1), angle=0, phase=0), name="I")
+        super().__init__(
+            qubit=qubit,
+            gate_semantic=shared_semantic("I", lambda: BsrNoParams(axis=(0, 0, 1), angle=0, phase=0)),
+            name="I",
+        )
 
 
 class H(SingleQubitGate):
     def __init__(self, qubit: QubitLike) -> None:
-        super().__init__(qubit=qubit, gate_semantic=BsrNoParams(axis=(1, 0, 1), angle=pi, phase=pi / 2), name="H")
+        super().__init__(
+            qubit=qubit,
+            gate_semantic=shared_semantic("H", lambda: BsrNoParams(axis=(1, 0, 1), angle=pi, phase=pi / 2)),
+            name="H",
+        )
 
 
 class X(SingleQubitGate):
     def __init__(self, qubit: QubitLike) -> None:
-        super().__init__(qubit=qubit, gate_semantic=BsrNoParams(axis=(1, 0, 0), angle=pi, phase=pi / 2), name="X")
+        super().__init__(
+            qubit=qubit,
+            gate_semantic=shared_semantic("X", lambda: BsrNoParams(axis=(1, 0, 0), angle=pi, phase=pi / 2)),
+            name="X",
+        )
 
 
 class X90(SingleQubitGate):
     def __init__(self, qubit: QubitLike) -> None:
-        super().__init__(qubit=qubit, gate_semantic=BsrNoParams(axis=(1, 0, 0), angle=pi / 2, phase=pi / 4), name="X90")
+        super().__init__(
+            qubit=qubit,
+            gate_semantic=shared_semantic("X90", lambda: BsrNoParams(axis=(1, 0, 0), angle=pi / 2, phase=pi / 4)),
+            name="X90",
+        )
 
 
 class MinusX90(SingleQubitGate):
     def __init__(self, qubit: QubitLike) -> None:
         super().__init__(
-            qubit=qubit, gate_semantic=BsrNoParams(axis=(1, 0, 0), angle=-pi / 2, phase=-pi / 4), name="mX90"
+            qubit=qubit,
+            gate_semantic=shared_semantic("mX90", lambda: BsrNoParams(axis=(1, 0, 0), angle=-pi / 2, phase=-pi / 4)),
+            name="mX90",
         )
 
 
 class Y(SingleQubitGate):
     def __init__(self, qubit: QubitLike) -> None:
-        super().__init__(qubit=qubit, gate_semantic=BsrNoParams(axis=(0, 1, 0), angle=pi, phase=pi / 2), name="Y")
+        super().__init__(
+            qubit=qubit,
+            gate_semantic=shared_semantic("Y", lambda: BsrNoParams(axis=(0, 1, 0), angle=pi, phase=pi / 2)),
+            name="Y",
+        )
 
 
 class Y90(SingleQubitGate):
     def __init__(self, qubit: QubitLike) -> None:
-        super().__init__(qubit=qubit, gate_semantic=BsrNoParams(axis=(0, 1, 0), angle=pi / 2, phase=pi / 4), name="Y90")
+        super().__init__(
+            qubit=qubit,
+            gate_semantic=shared_semantic("Y90", lambda: BsrNoParams(axis=(0, 1, 0), angle=pi / 2, phase=pi / 4)),
+            name="Y90",
+        )
 
 
 class MinusY90(SingleQubitGate):
     def __init__(self, qubit: QubitLike) -> None:
         super().__init__(
-            qubit=qubit, gate_semantic=BsrNoParams(axis=(0, 1, 0), angle=-pi / 2, phase=-pi / 4), name="mY90"
+            qubit=qubit,
+            gate_semantic=shared_semantic("mY90", lambda: BsrNoParams(axis=(0, 1, 0), angle=-pi / 2, phase=-pi / 4)),
+            name="mY90",
         )
 
 
 class Z(SingleQubitGate):
     def __init__(self, qubit: QubitLike) -> None:
-        super().__init__(qubit=qubit, gate_semantic=BsrNoParams(axis=(0, 0, 1), angle=pi, phase=pi / 2), name="Z")
+        super().__init__(
+            qubit=qubit,
+            gate_semantic=shared_semantic("Z", lambda: BsrNoParams(axis=(0, 0, 1), angle=pi, phase=pi / 2)),
+            name="Z",
+        )
 
 
 class Z90(SingleQubitGate):
     def __init__(self, qubit: QubitLike) -> None:
-        super().__init__(qubit=qubit, gate_semantic=BsrNoParams(axis=(0, 0, 1), angle=pi / 2, phase=pi / 4), name="Z90")
+        super().__init__(
+            qubit=qubit,
+            gate_semantic=shared_semantic("Z90", lambda: BsrNoParams(axis=(0, 0, 1), angle=pi / 2, phase=pi / 4)),
+            name="Z90",
+        )
 
 
 class MinusZ90(SingleQubitGate):
     def __init__(self, qubit: QubitLike) -> None:
         super().__init__(
-            qubit=qubit, gate_semantic=BsrNoParams(axis=(0, 0, 1), angle=-pi / 2, phase=-pi / 4), name="mZ90"
+            qubit=qubit,
+            gate_semantic=shared_semantic("mZ90", lambda: BsrNoParams(axis=(0, 0, 1), angle=-pi / 2, phase=-pi / 4)),
+            name="mZ90",
         )
 
 
 class S(SingleQubitGate):
     def __init__(self, qubit: QubitLike) -> None:
-        super().__init__(qubit=qubit, gate_semantic=BsrNoParams(axis=(0, 0, 1), angle=pi / 2, phase=pi / 4), name="S")
+        super().__init__(
+            qubit=qubit,
+            gate_semantic=shared_semantic("S", lambda: BsrNoParams(axis=(0, 0, 1), angle=pi / 2, phase=pi / 4)),
+            name="S",
+        )
 
 
 class SDagger(SingleQubitGate):
     def __init__(self, qubit: QubitLike) -> None:
         super().__init__(
-            qubit=qubit, gate_semantic=BsrNoParams(axis=(0, 0, 1), angle=-pi / 2, phase=-pi / 4), name="Sdag"
+            qubit=qubit,
+            gate_semantic=shared_semantic("Sdag", lambda: BsrNoParams(axis=(0, 0, 1), angle=-pi / 2, phase=-pi / 4)),
+            name="Sdag",
         )
 
 
 class T(SingleQubitGate):
     def __init__(self, qubit: QubitLike) -> None:
-        super().__init__(qubit=qubit, gate_semantic=BsrNoParams(axis=(0, 0, 1), angle=pi / 4, phase=pi / 8), name="T")
+        super().__init__(
+            qubit=qubit,
+            gate_semantic=shared_semantic("T", lambda: BsrNoParams(axis=(0, 0, 1), angle=pi / 4, phase=pi / 8)),
+            name="T",
+        )
 
 
 class TDagger(SingleQubitGate):
     def __init__(self, qubit: QubitLike) -> None:
         super().__init__(
-            qubit=qubit, gate_semantic=BsrNoParams(axis=(0, 0, 1), angle=-pi / 4, phase=-pi / 8), name="Tdag"
+            qubit=qubit,
+            gate_semantic=shared_semantic("Tdag", lambda: BsrNoParams(axis=(0, 0, 1), angle=-pi / 4, phase=-pi / 8)),
+            name="Tdag",
         )
 
 
@@ -128,8 +201,13 @@ class U(SingleQubitGate):
     def __init__(
         self,
         qubit: QubitLike,
-        theta: SupportsFloat,
-        phi: SupportsFloat,
-        lmbda: SupportsFloat,
+        theta: SupportsFloat | ParameterExpression,
+        phi: SupportsFloat | ParameterExpression,
+        lmbda: SupportsFloat | ParameterExpression,
     ) -> None:
-        super().__init__(qubit=qubit, gate_semantic=BsrUnitaryParams(theta=theta, phi=phi, lmbda=lmbda), name="U")
+        gate_semantic = (
+            ParametricGateSemantic(theta, phi, lmbda)
+            if is_parametric(theta, phi, lmbda)
+            else BsrUnitaryParams(theta=theta, phi=phi, lmbda=lmbda)  # ty: ignore[invalid-argument-type]
+        )
+        super().__init__(qubit=qubit, gate_semantic=gate_semantic, name="U")
@@ -1,13 +1,15 @@
 import warnings
+from collections.abc import Mapping
 from math import pi, sqrt
 from typing import SupportsFloat, SupportsInt
 
 import numpy as np
 
 from opensquirrel.common import normalize_angle
-from opensquirrel.ir.expression import Expression, Float, Int, Qubit, QubitLike
-from opensquirrel.ir.semantics import ControlledGateSemantic, MatrixGateSemantic
+from opensquirrel.ir.expression import Expression, Float, Int, ParameterExpression, Qubit, QubitLike
+from opensquirrel.ir.semantics import ControlledGateSemantic, MatrixGateSemantic, ParametricGateSemantic
 from opensquirrel.ir.semantics.bsr import BsrAngleParam, BsrNoParams
+from opensquirrel.ir.semantics.semantic_table import shared_semantic
 from opensquirrel.ir.single_qubit_gate import SingleQubitGate
 from opensquirrel.ir.two_qubit_gate import TwoQubitGate
 
@@ -25,7 +27,9 @@ class CNOT(TwoQubitGate):
         super().__init__(
             qubit0=control_qubit,
             qubit1=target_qubit,
-            gate_semantic=ControlledGateSemantic(BsrNoParams(axis=(1, 0, 0), angle=pi, phase=pi / 2)),
+            gate_semantic=shared_semantic(
+                "CNOT", lambda: ControlledGateSemantic(BsrNoParams(axis=(1, 0, 0), angle=pi, phase=pi / 2))
+            ),
             name="CNOT",
         )
         self.control_qubit = Qubit(control_qubit)
@@ -33,21 +37,51 @@ class CNOT(TwoQubitGate):
 
 
 class CR(TwoQubitGate):
-    def __init__(self, control_qubit: QubitLike, target_qubit: QubitLike, theta: SupportsFloat) -> None:
-        super().__init__(
-            qubit0=control_qubit,
-            qubit1=target_qubit,
-            gate_semantic=ControlledGateSemantic(BsrAngleParam(axis=(0, 0, 1), angle=theta, phase=float(theta) / 2)),
-            name="CR",
-        )
+    def __init__(
+        self, control_qubit: QubitLike, target_qubit: QubitLike, theta: SupportsFloat | ParameterExpression
+    ) -> None:
+        if isinstance(theta, ParameterExpression):
+            super().__init__(
+                qubit0=control_qubit, qubit1=target_qubit, gate_semantic=ParametricGateSemantic(theta), name="CR"
+            )
+            self.theta: Expression = theta
+        else:
+            # The angle and phase are normalized together, such that the gate is diag(1, 1, 1, e^{i theta}).
+            theta = normalize_angle(theta)
+            super().__init__(
+                qubit0=control_qubit,
+                qubit1=target_qubit,
+                gate_semantic=ControlledGateSemantic(BsrAngleParam(axis=(0, 0, 1), angle=theta, phase=theta / 2)),
+                name="CR",
+            )
+            self.theta = Float(theta)
         self.control_qubit = Qubit(control_qubit)
         self.target_qubit = Qubit(target_qubit)
-        self.theta = Float(normalize_angle(theta))
 
     @property
     def arguments(self) -> tuple[Expression, ...]:
         return (*super().arguments, self.theta)
 
+    def bind(self, values: Mapping[str, SupportsFloat]) -> "CR":
+        """Bind the symbolic parameters of the gate to values.
+
+        The bound gate is the numeric CR gate with the bound angle, _i.e._, the controlled phase gate
+        $\\text{diag}(1, 1, 1, e^{i\\theta})$, which is the gate that a parametric CR gate is decomposed to (see the
+        `ParametricDecomposer`).
+
+        Args:
+            values (Mapping[str, SupportsFloat]): The values of (at least) the parameters of the gate, keyed by the
+                name of the parameter.
+
+        Returns:
+            The gate with a numeric angle, or the gate itself if it has no symbolic parameters.
+
+        """
+        if self.parametric is None:
+            return self
+        (theta,) = self.parametric.bind(values)
+        return CR(self.control_qubit, self.target_qubit, theta)
+
 
 class CRk(TwoQubitGate):
     def __init__(self, control_qubit: QubitLike, target_qubit: QubitLike, k: SupportsInt) -> None:
@@ -59,7 +93,10 @@ class CRk(TwoQubitGate):
         super().__init__(
             qubit0=control_qubit,
             qubit1=target_qubit,
-            gate_semantic=ControlledGateSemantic(BsrAngleParam(axis=(0, 0, 1), angle=theta, phase=float(theta) / 2)),
+            gate_semantic=shared_semantic(
+                ("CRk", int(k)),
+                lambda: ControlledGateSemantic(BsrAngleParam(axis=(0, 0, 1), angle=theta, phase=float(theta) / 2)),
+            ),
             name="CRk",
         )
         self.control_qubit = Qubit(control_qubit)
@@ -76,7 +113,9 @@ class CV(TwoQubitGate):
         super().__init__(
             qubit0=control_qubit,
             qubit1=target_qubit,
-            gate_semantic=ControlledGateSemantic(BsrNoParams(axis=(1, 0, 0), angle=pi / 2, phase=pi / 4)),
+            gate_semantic=shared_semantic(
+                "CV", lambda: ControlledGateSemantic(BsrNoParams(axis=(1, 0, 0), angle=pi / 2, phase=pi / 4))
+            ),
             name="CV",
         )
         self.control_qubit = Qubit(control_qubit)
@@ -88,7 +127,9 @@ class CY(TwoQubitGate):
         super().__init__(
             qubit0=control_qubit,
             qubit1=target_qubit,
-            gate_semantic=ControlledGateSemantic(BsrNoParams(axis=(0, 1, 0), angle=pi, phase=pi / 2)),
+            gate_semantic=shared_semantic(
+                "CY", lambda: ControlledGateSemantic(BsrNoParams(axis=(0, 1, 0), angle=pi, phase=pi / 2))
+            ),
             name="CY",
         )
         self.control_qubit = Qubit(control_qubit)
@@ -100,7 +141,9 @@ class CZ(TwoQubitGate):
         super().__init__(
             qubit0=control_qubit,
             qubit1=target_qubit,
-            gate_semantic=ControlledGateSemantic(BsrNoParams(axis=(0, 0, 1), angle=pi, phase=pi / 2)),
+            gate_semantic=shared_semantic(
+                "CZ", lambda: ControlledGateSemantic(BsrNoParams(axis=(0, 0, 1), angle=pi, phase=pi / 2))
+            ),
             name="CZ",
         )
         self.control_qubit = Qubit(control_qubit)
@@ -112,14 +155,17 @@ class DCNOT(TwoQubitGate):
         super().__init__(
             qubit0=qubit_0,
             qubit1=qubit_1,
-            gate_semantic=MatrixGateSemantic(
-                matrix=np.array(
-                    [
-                        [1, 0, 0, 0],
-                        [0, 0, 1, 0],
-                        [0, 0, 0, 1],
-                        [0, 1, 0, 0],
-                    ],
+            gate_semantic=shared_semantic(
+                "DCNOT",
+                lambda: MatrixGateSemantic(
+                    matrix=np.array(
+                        [
+                            [1, 0, 0, 0],
+                            [0, 0, 1, 0],
+                            [0, 0, 0, 1],
+                            [0, 1, 0, 0],
+                        ],
+                    ),
                 ),
             ),
             name="DCNOT",
@@ -133,16 +179,19 @@ class ECR(TwoQubitGate):
         super().__init__(
             qubit0=qubit_0,
             qubit1=qubit_1,
-            gate_semantic=MatrixGateSemantic(
-                matrix=1
-                / np.sqrt(2)
-                * np.array(
-                    [
-                        [0, 0, 1, 1j],
-                        [0, 0, 1j, 1],
-                        [1, -1j, 0, 0],
-                        [-1j, 1, 0, 0],
-                    ],
+            gate_semantic=shared_semantic(
+                "ECR",
+                lambda: MatrixGateSemantic(
+                    matrix=1
+                    / np.sqrt(2)
+                    * np.array(
+                        [
+                            [0, 0, 1, 1j],
+                            [0, 0, 1j, 1],
+                            [1, -1j, 0, 0],
+                            [-1j, 1, 0, 0],
+                        ],
+                    ),
                 ),
             ),
             name="ECR",
@@ -156,14 +205,17 @@ class InvSqrtSWAP(TwoQubitGate):
         super().__init__(
             qubit0=qubit_0,
             qubit1=qubit_1,
-            gate_semantic=MatrixGateSemantic(
-                matrix=np.array(
-                    [
-                        [1, 0, 0, 0],
-                        [0, (1 - 1j) / 2, (1 + 1j) / 2, 0],
-                        [0, (1 + 1j) / 2, (1 - 1j) / 2, 0],
-                        [0, 0, 0, 1],
-                    ],
+            gate_semantic=shared_semantic(
+                "InvSqrtSWAP",
+                lambda: MatrixGateSemantic(
+                    matrix=np.array(
+                        [
+                            [1, 0, 0, 0],
+                            [0, (1 - 1j) / 2, (1 + 1j) / 2, 0],
+                            [0, (1 + 1j) / 2, (1 - 1j) / 2, 0],
+                            [0, 0, 0, 1],
+                        ],
+                    ),
                 ),
             ),
             name="InvSqrtSWAP",
@@ -177,14 +229,17 @@ class ISWAP(TwoQubitGate):
         super().__init__(
             qubit0=qubit_0,
             qubit1=qubit_1,
-            gate_semantic=MatrixGateSemantic(
-                matrix=np.array(
-                    [
-                        [1, 0, 0, 0],
-                        [0, 0, 1j, 0],
-                        [0, 1j, 0, 0],
-                        [0, 0, 0, 1],
-                    ],
+            gate_semantic=shared_semantic(
+                "ISWAP",
+                lambda: MatrixGateSemantic(
+                    matrix=np.array(
+                        [
+                            [1, 0, 0, 0],
+                            [0, 0, 1j, 0],
+                            [0, 1j, 0, 0],
+                            [0, 0, 0, 1],
+                        ],
+                    ),
                 ),
             ),
             name="ISWAP",
@@ -198,16 +253,19 @@ class M(TwoQubitGate):
         super().__init__(
             qubit0=qubit_0,
             qubit1=qubit_1,
-            gate_semantic=MatrixGateSemantic(
-                matrix=1
-                / np.sqrt(2)
-                * np.array(
-                    [
-                        [1, 1j, 0, 0],
-                        [0, 0, 1j, 1],
-                        [0, 0, 1j, -1],
-                        [1, -1j, 0, 0],
-                    ],
+            gate_semantic=shared_semantic(
+                "M",
+                lambda: MatrixGateSemantic(
+                    matrix=1
+                    / np.sqrt(2)
+                    * np.array(
+                        [
+                            [1, 1j, 0, 0],
+                            [0, 0, 1j, 1],
+                            [0, 0, 1j, -1],
+                            [1, -1j, 0, 0],
+                        ],
+                    ),
                 ),
             ),
             name="M",
@@ -221,16 +279,19 @@ class MS(TwoQubitGate):
         super().__init__(
             qubit0=qubit_0,
             qubit1=qubit_1,
-            gate_semantic=MatrixGateSemantic(
-                matrix=1
-                / np.sqrt(2)
-                * np.array(
-                    [
-                        [1, 0, 0, 1j],
-                        [0, 1, 1j, 0],
-                        [0, 1j, 1, 0],
-                        [1j, 0, 0, 1],
-                    ],
+            gate_semantic=shared_semantic(
+                "MS",
+                lambda: MatrixGateSemantic(
+                    matrix=1
+                    / np.sqrt(2)
+                    * np.array(
+                        [
+                            [1, 0, 0, 1j],
+                            [0, 1, 1j, 0],
+                            [0, 1j, 1, 0],
+                            [1j, 0, 0, 1],
+                        ],
+                    ),
                 ),
             ),
             name="MS",
@@ -244,14 +305,17 @@ class SqrtISWAP(TwoQubitGate):
         super().__init__(
             qubit0=qubit_0,
             qubit1=qubit_1,
-            gate_semantic=MatrixGateSemantic(
-                matrix=np.array(
-                    [
-                        [1, 0, 0, 0],
-                        [0, 1 / sqrt(2), 1j / sqrt(2), 0],
-                        [0, 1j / sqrt(2), 1 / sqrt(2), 0],
-                        [0, 0, 0, 1],
-                    ],
+            gate_semantic=shared_semantic(
+                "SqrtISWAP",
+                lambda: MatrixGateSemantic(
+                    matrix=np.array(
+                        [
+                            [1, 0, 0, 0],
+                            [0, 1 / sqrt(2), 1j / sqrt(2), 0],
+                            [0, 1j / sqrt(2), 1 / sqrt(2), 0],
+                            [0, 0, 0, 1],
+                        ],
+                    ),
                 ),
             ),
             name="SqrtISWAP",
@@ -265,14 +329,17 @@ class SqrtSWAP(TwoQubitGate):
         super().__init__(
             qubit0=qubit_0,
             qubit1=qubit_1,
-            gate_semantic=MatrixGateSemantic(
-                matrix=np.array(
-                    [
-                        [1, 0, 0, 0],
-                        [0, (1j + 1) / 2, (1j - 1) / 2, 0],
-                        [0, (1j - 1) / 2, (1j + 1) / 2, 0],
-                        [0, 0, 0, 1],
-                    ],
+            gate_semantic=shared_semantic(
+                "SqrtSWAP",
+                lambda: MatrixGateSemantic(
+                    matrix=np.array(
+                        [
+                            [1, 0, 0, 0],
+                            [0, (1j + 1) / 2, (1j - 1) / 2, 0],
+                            [0, (1j - 1) / 2, (1j + 1) / 2, 0],
+                            [0, 0, 0, 1],
+                        ],
+                    ),
                 ),
             ),
             name="SqrtSWAP",
@@ -286,14 +353,17 @@ class SWAP(TwoQubitGate):
         super().__init__(
             qubit0=qubit_0,
             qubit1=qubit_1,
-            gate_semantic=MatrixGateSemantic(
-                matrix=np.array(
-                    [
-                        [1, 0, 0, 0],
-                        [0, 0, 1, 0],
-                        [0, 1, 0, 0],
-                        [0, 0, 0, 1],
-                    ],
+            gate_semantic=shared_semantic(
+                "SWAP",
+                lambda: MatrixGateSemantic(
+                    matrix=np.array(
+                        [
+                            [1, 0, 0, 0],
+                            [0, 0, 1, 0],
+                            [0, 1, 0, 0],
+                            [0, 0, 0, 1],
+                        ],
+                    ),
                 ),
             ),
             name="SWAP",
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import Any, Protocol, SupportsFloat, SupportsInt, cast, overload, runtime_checkable
+from typing import Any, ClassVar, Protocol, SupportsFloat, SupportsInt, TypeVar, cast, overload, runtime_checkable
 
 import numpy as np
 from numpy.typing import ArrayLike, DTypeLike, NDArray
@@ -11,7 +12,8 @@ from opensquirrel.common import ATOL
 from opensquirrel.ir.ir import IRNode, IRVisitor
 
 
-class Expression(IRNode, ABC): ...
+class Expression(IRNode, ABC):
+    __slots__ = ()
 
 
 @runtime_checkable
@@ -55,7 +57,7 @@ class String(Expression):
         return self.value
 
 
-@dataclass(init=False)
+@dataclass(init=False, frozen=True, slots=True)
 class Float(Expression):
     """Floats used for intermediate representation of ``Statement`` arguments.
 
@@ -73,7 +75,7 @@ class Float(Expression):
             value: value of the ``Float`` object.
         """
         if isinstance(value, SupportsFloat):
-            self.value = float(value)
+            object.__setattr__(self, "value", float(value))
             return
 
         msg = f"value {value!r} must be a float"
@@ -92,7 +94,7 @@ class Float(Expression):
         return self.value
 
 
-@dataclass(init=False)
+@dataclass(init=False, frozen=True, slots=True)
 class Int(Expression):
     """Integers used for intermediate representation of ``Statement`` arguments.
 
@@ -109,7 +111,7 @@ class Int(Expression):
             value: value of the ``Int`` object.
         """
         if isinstance(value, SupportsInt):
-            self.value = int(value)
+            object.__setattr__(self, "value", int(value))
             return
 
         msg = f"value {value!r} must be an int"
@@ -128,61 +130,231 @@ class Int(Expression):
         return self.value
 
 
-@dataclass(init=False)
-class Bit(Expression):
-    index: int
+class ParameterExpression(Expression):
+    """Affine expressions of symbolic parameters, $c_0 + \\sum_i c_i p_i$, used as the (unbound) arguments of
+    parametric gates. Parameter expressions can be added and subtracted, and multiplied and divided by numbers.
 
-    def __init__(self, index: BitLike) -> None:
-        if isinstance(index, SupportsInt):
-            self.index = int(index)
-        elif isinstance(index, Bit):
-            self.index = index.index
-        else:
-            msg = f"index {index!r} must be a BitLike"
-            raise TypeError(msg)
+    Attributes:
+        coefficients: the coefficients $c_i$ of the parameters $p_i$, keyed by the name of the parameter.
+        constant: the constant term $c_0$.
+    """
+
+    def __init__(self, coefficients: Mapping[str, SupportsFloat], constant: SupportsFloat = 0.0) -> None:
+        """Init of the ``ParameterExpression`` object.
+
+        Args:
+            coefficients: the coefficients of the parameters, keyed by the name of the parameter.
+            constant: the constant term.
+        """
+        self.coefficients = {name: float(coefficient) for name, coefficient in coefficients.items() if coefficient}
+        self.constant = float(constant)
+
+    @property
+    def parameters(self) -> tuple[str, ...]:
+        """The names of the parameters of the expression."""
+        return tuple(self.coefficients)
+
+    def evaluate(self, values: Mapping[str, SupportsFloat]) -> float:
+        """Evaluate the expression for the given parameter values.
+
+        Args:
+            values: the values of (at least) the parameters of the expression, keyed by the name of the parameter.
+
+        Returns:
+            The value of the expression.
+        """
+        try:
+            return self.constant + sum(
+                coefficient * float(values[name]) for name, coefficient in self.coefficients.items()
+            )
+        except KeyError as e:
+            msg = f"no value for parameter {e.args[0]!r}"
+            raise ValueError(msg) from None
 
     def accept(self, visitor: IRVisitor) -> Any:
         """Accepts visitor and processes this IR node."""
-        return visitor.visit_bit(self)
+        return visitor.visit_parameter_expression(self)
+
+    def __add__(self, other: ParameterExpression | SupportsFloat) -> ParameterExpression:
+        if isinstance(other, ParameterExpression):
+            coefficients = dict(self.coefficients)
+            for name, coefficient in other.coefficients.items():
+                coefficients[name] = coefficients.get(name, 0.0) + coefficient
+            return ParameterExpression(coefficients, self.constant + other.constant)
+        if isinstance(other, SupportsFloat):
+            return ParameterExpression(self.coefficients, self.constant + float(other))
+        return NotImplemented
+
+    def __radd__(self, other: SupportsFloat) -> ParameterExpression:
+        return self + other
+
+    def __neg__(self) -> ParameterExpression:
+        return self * -1
+
+    def __sub__(self, other: ParameterExpression | SupportsFloat) -> ParameterExpression:
+        if isinstance(other, ParameterExpression):
+            return self + other * -1
+        if isinstance(other, SupportsFloat):
+            return self + -float(other)
+        return NotImplemented
+
+    def __rsub__(self, other: SupportsFloat) -> ParameterExpression:
+        return -self + other
+
+    def __mul__(self, other: SupportsFloat) -> ParameterExpression:
+        if isinstance(other, ParameterExpression) or not isinstance(other, SupportsFloat):
+            return NotImplemented
+        factor = float(other)
+        return ParameterExpression(
+            {name: factor * coefficient for name, coefficient in self.coefficients.items()}, factor * self.constant
+        )
+
+    def __rmul__(self, other: SupportsFloat) -> ParameterExpression:
+        return self * other
+
+    def __truediv__(self, other: SupportsFloat) -> ParameterExpression:
+        if isinstance(other, ParameterExpression) or not isinstance(other, SupportsFloat):
+            return NotImplemented
+        return self * (1 / float(other))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ParameterExpression):
+            return False
+        return self.coefficients == other.coefficients and abs(self.constant - other.constant) < ATOL
 
     def __hash__(self) -> int:
-        return hash(str(self.__class__) + str(self.index))
+        # The constant is left out, since constants within ATOL of each other are equal.
+        return hash(tuple(sorted(self.coefficients.items())))
+
+    def __repr__(self) -> str:
+        terms = [
+            name if coefficient == 1 else f"-{name}" if coefficient == -1 else f"{coefficient!r}*{name}"
+            for name, coefficient in self.coefficients.items()
+        ]
+        if self.constant or not terms:
+            terms.append(repr(self.constant))
+        return " + ".join(terms).replace("+ -", "- ")
+
+
+class Parameter(ParameterExpression):
+    """Symbolic parameters, _e.g._, the angle of a rotation gate, that are bound to a value later on.
+
+    Attributes:
+        name: name of the ``Parameter`` object.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Init of the ``Parameter`` object.
+
+        Args:
+            name: name of the ``Parameter`` object.
+        """
+        ParameterExpression.__init__(self, {name: 1.0})
+        self.name = name
+
+
+def is_parametric(*arguments: Any) -> bool:
+    """Checks whether any of the (gate) arguments is a parameter expression.
+
+    Args:
+        arguments: the arguments to check.
+
+    Returns:
+        True if any of the arguments is a parameter expression, False otherwise.
+    """
+    return any(isinstance(argument, ParameterExpression) for argument in arguments)
+
+
+IndexType = TypeVar("IndexType", bound="BaseIndex")
+
+
+class BaseIndex(Expression, ABC):
+    """Immutable indices, _e.g._, of (qubit and bit) registers, of which a single instance is shared per index:
+    creating an index that already exists returns the existing instance.
+
+    Attributes:
+        index: the index.
+    """
+
+    __slots__ = ("_hash", "index")
+    _instances: ClassVar[dict[int, Any]]
+    index: int
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._instances = {}
+
+    def __new__(cls: type[IndexType], index: SupportsInt | IndexType) -> IndexType:
+        if isinstance(index, cls):
+            return index
+        if not isinstance(index, int):
+            if not isinstance(index, SupportsInt):
+                msg = f"index {index!r} must be a {cls.__name__}Like"
+                raise TypeError(msg)
+            index = int(index)
+
+        instance = cls._instances.get(index)
+        if instance is None:
+            instance = object.__new__(cls)
+            object.__setattr__(instance, "index", index)
+            object.__setattr__(instance, "_hash", hash((cls.__name__, index)))
+            instance = cls._instances.setdefault(index, instance)
+        return instance
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        msg = f"cannot assign to {name!r}: {self.__class__.__name__} is immutable"
+        raise AttributeError(msg)
+
+    def __delattr__(self, name: str) -> None:
+        msg = f"cannot delete {name!r}: {self.__class__.__name__} is immutable"
+        raise AttributeError(msg)
+
+    def __reduce__(self) -> tuple[type[BaseIndex], tuple[int]]:
+        return self.__class__, (self.index,)
+
+    def __eq__(self, other: object) -> bool:
+        return self is other or (other.__class__ is self.__class__ and self.index == other.index)  # ty: ignore[unresolved-attribute]
+
+    def __hash__(self) -> int:
+        return self._hash
+
+
+class Bit(BaseIndex):
+    """``Bit`` is used for intermediate representation of ``Statement`` arguments.
+
+    Attributes:
+        index: index of the ``Bit`` object.
+    """
+
+    __slots__ = ()
+
+    def accept(self, visitor: IRVisitor) -> Any:
+        """Accepts visitor and processes this IR node."""
+        return visitor.visit_bit(self)
 
     def __repr__(self) -> str:
         return f"Bit[{self.index}]"
 
 
-@dataclass(init=False)
-class Qubit(Expression):
+class Qubit(BaseIndex):
     """``Qubit`` is used for intermediate representation of ``Statement`` arguments.
 
     Attributes:
         index: index of the ``Qubit`` object.
     """
 
-    index: int
-
-    def __init__(self, index: QubitLike) -> None:
-        if isinstance(index, SupportsInt):
-            self.index = int(index)
-        elif isinstance(index, Qubit):
-            self.index = index.index
-        else:
-            msg = f"index {index!r} must be a QubitLike"
-            raise TypeError(msg)
+    __slots__ = ()
 
     def accept(self, visitor: IRVisitor) -> Any:
         """Accepts visitor and processes this IR node."""
         return visitor.visit_qubit(self)
 
-    def __hash__(self) -> int:
-        return hash(str(self.__class__) + str(self.index))
-
     def __repr__(self) -> str:
         return f"Qubit[{self.index}]"
 
 
 class BaseAxis(Expression, ABC):
+    __slots__ = ("_value",)
     _len = 3
 
     def __init__(self, *axis: AxisLike) -> None:
@@ -248,6 +420,8 @@ class Axis(BaseAxis):
     The input vector is always normalized before it is stored.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def parse(axis: AxisLike) -> NDArray[np.float64]:
         """Parse and validate an ``AxisLike``.
@@ -4,6 +4,8 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from opensquirrel.ir import (
         AsmDeclaration,
         Axis,
@@ -14,6 +16,7 @@ if TYPE_CHECKING:
         Init,
         Int,
         Measure,
+        ParameterExpression,
         Qubit,
         Reset,
         String,
@@ -21,6 +24,7 @@ if TYPE_CHECKING:
         Wait,
     )
     from opensquirrel.ir.control_instruction import ControlInstruction
+    from opensquirrel.ir.dag import DAG
     from opensquirrel.ir.non_unitary import NonUnitary
     from opensquirrel.ir.semantics import (
         BlochSphereRotation,
@@ -31,6 +35,7 @@ if TYPE_CHECKING:
         CanonicalGateSemantic,
         ControlledGateSemantic,
         MatrixGateSemantic,
+        ParametricGateSemantic,
     )
     from opensquirrel.ir.semantics.canonical_gate import CanonicalAxis
     from opensquirrel.ir.single_qubit_gate import SingleQubitGate
@@ -45,6 +50,8 @@ class IRVisitor:
 
     def visit_float(self, f: Float) -> Any: ...
 
+    def visit_parameter_expression(self, expression: ParameterExpression) -> Any: ...
+
     def visit_bit(self, bit: Bit) -> Any: ...
 
     def visit_qubit(self, qubit: Qubit) -> Any: ...
@@ -97,19 +104,107 @@ class IRVisitor:
 
     def visit_matrix_gate_semantic(self, matrix: MatrixGateSemantic) -> Any: ...
 
+    def visit_parametric_gate_semantic(self, parametric: ParametricGateSemantic) -> Any: ...
+
 
 class IRNode(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def accept(self, visitor: IRVisitor) -> Any: ...
 
 
 class IR:
     def __init__(self) -> None:
-        self.statements: list[Statement] = []
+        self._statements: list[Statement] = []
+        self._is_shared = False
+
+        # The dependency DAG of the statements, with the list of statements and the version of the DAG it reflects
+        self._dag: DAG | None = None
+        self._dag_statements: list[Statement] | None = None
+        self._dag_version = 0
+
+    @property
+    def statements(self) -> list[Statement]:
+        """The statements of the IR.
+
+        If the statements are shared with a snapshot, the list of statements is copied first (copy-on-write), such
+        that changes to the list do not affect the snapshot. Use `statements_view` to only read the statements.
+        """
+        if self._is_shared:
+            statements = list(self._statements)
+            if self._dag_statements is self._statements:
+                self._dag_statements = statements
+            self._statements = statements
+            self._is_shared = False
+        return self._statements
+
+    @statements.setter
+    def statements(self, statements: list[Statement]) -> None:
+        self._statements = statements
+        self._is_shared = False
+
+    @property
+    def statements_view(self) -> Sequence[Statement]:
+        """A read-only view of the statements of the IR, which never copies the list of statements, in O(1).
+
+        The view reflects the statements at the time it is taken: the list is only changed in place through
+        `statements`, which copies it first if it is shared with a snapshot.
+        """
+        return self._statements
+
+    def snapshot(self) -> IR:
+        """Takes a snapshot of the IR, which shares the list of statements with the IR until either of them accesses
+        its `statements`, which then copies the list (but not the statements).
+
+        The statements themselves are shared: passes replace statements instead of changing them in place.
+
+        Returns:
+            The snapshot of the IR, in O(1).
+
+        """
+        snapshot = IR()
+        snapshot._statements = self._statements
+        snapshot._is_shared = self._is_shared = True
+        return snapshot
+
+    def dag(self, qubit_register_size: int) -> DAG:
+        """The dependency DAG of the statements, which is maintained alongside the statements: statements that are
+        appended to the IR, _e.g._, through `add_gate`, are added to the DAG in O(1) per qubit operand, when the DAG
+        is requested next. The DAG is only rebuilt if the list of statements is replaced, _e.g._, by a pass, if
+        statements are removed, or if the DAG itself was changed.
+
+        Passes replace the list of statements instead of changing the statements in the list in place, which keeps
+        the DAG in sync. To edit the circuit through the DAG, edit a copy, _e.g._, `DAG.from_ir(ir, n)`, and assign
+        the statements of `DAG.to_ir()` back to the IR.
+
+        Args:
+            qubit_register_size: The size of the qubit register.
+
+        Returns:
+            The DAG, with the nodes of the statements in program order.
+
+        """
+        from opensquirrel.ir.dag import DAG
+
+        dag, statements = self._dag, self._statements
+        if (
+            dag is None
+            or dag.qubit_register_size != qubit_register_size
+            or self._dag_statements is not statements
+            or dag.version != self._dag_version
+            or len(dag) > len(statements)
+        ):
+            dag = DAG.from_statements(statements, qubit_register_size)
+        else:
+            for statement in statements[len(dag) :]:
+                dag.add_statement(statement)
+        self._dag, self._dag_statements, self._dag_version = dag, statements, dag.version
+        return dag
 
     def accept(self, visitor: IRVisitor) -> None:
         """Accepts visitor and processes the IR nodes."""
-        for statement in self.statements:
+        for statement in self._statements:
             statement.accept(visitor)
 
     def add_asm_declaration(self, asm_declaration: AsmDeclaration) -> None:
@@ -151,14 +246,13 @@ class IR:
     def reverse(self) -> IR:
         """Reverses the order of statements in the IR."""
         ir = IR()
-        for statement in self.statements[::-1]:
-            ir.add_statement(statement)
+        ir.statements = self._statements[::-1]
         return ir
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, IR):
             return False
-        return self.statements == other.statements
+        return self._statements == other._statements
 
     def __repr__(self) -> str:
-        return f"IR: {self.statements}"
+        return f"IR: {self._statements}"
@@ -8,6 +8,7 @@ from opensquirrel.ir.semantics.bsr import (
 from opensquirrel.ir.semantics.canonical_gate import CanonicalAxis, CanonicalGateSemantic
 from opensquirrel.ir.semantics.controlled_gate import ControlledGateSemantic
 from opensquirrel.ir.semantics.matrix_gate import MatrixGateSemantic
+from opensquirrel.ir.semantics.parametric_gate import ParametricGateSemantic
 
 __all__ = [
     "BlochSphereRotation",
@@ -19,4 +20,5 @@ __all__ = [
     "CanonicalGateSemantic",
     "ControlledGateSemantic",
     "MatrixGateSemantic",
+    "ParametricGateSemantic",
 ]
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, SupportsFloat
+
+from opensquirrel.ir.expression import Expression, Float, ParameterExpression
+from opensquirrel.ir.semantics.gate_semantic import GateSemantic
+
+if TYPE_CHECKING:
+    from opensquirrel.ir import IRVisitor
+
+
+class ParametricGateSemantic(GateSemantic):
+    """The semantic of a gate with symbolic parameters, which is only known once its parameters are bound to values.
+
+    Args:
+        arguments: The (numeric and symbolic) arguments of the gate, in the order of the gate constructor.
+
+    """
+
+    def __init__(self, *arguments: SupportsFloat | ParameterExpression) -> None:
+        self.arguments: tuple[Expression, ...] = tuple(
+            argument if isinstance(argument, ParameterExpression) else Float(argument) for argument in arguments
+        )
+
+    @property
+    def parameters(self) -> tuple[str, ...]:
+        """The names of the parameters of the gate."""
+        return tuple(
+            dict.fromkeys(
+                name
+                for argument in self.arguments
+                if isinstance(argument, ParameterExpression)
+                for name in argument.parameters
+            )
+        )
+
+    def bind(self, values: Mapping[str, SupportsFloat]) -> tuple[float, ...]:
+        """Evaluate the arguments of the gate for the given parameter values.
+
+        Args:
+            values: The values of (at least) the parameters of the gate, keyed by the name of the parameter.
+
+        Returns:
+            The numeric arguments of the gate.
+
+        """
+        return tuple(
+            argument.evaluate(values) if isinstance(argument, ParameterExpression) else float(argument)  # ty: ignore[invalid-argument-type]
+            for argument in self.arguments
+        )
+
+    def accept(self, visitor: IRVisitor) -> Any:
+        """Accepts visitor and processes this IR node."""
+        return visitor.visit_parametric_gate_semantic(self)
+
+    def is_identity(self) -> bool:
+        """A parametric gate is not known to be an identity operation before its parameters are bound.
+
+        Returns:
+            False.
+
+        """
+        return False
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ParametricGateSemantic):
+            return False
+        return self.arguments == other.arguments
+
+    def __repr__(self) -> str:
+        return f"ParametricGateSemantic(arguments={self.arguments})"
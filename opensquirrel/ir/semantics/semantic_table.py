@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from typing import TypeVar
+
+from opensquirrel.ir.expression import Float
+from opensquirrel.ir.semantics.bsr import BlochSphereRotation
+from opensquirrel.ir.semantics.canonical_gate import CanonicalGateSemantic
+from opensquirrel.ir.semantics.controlled_gate import ControlledGateSemantic
+from opensquirrel.ir.semantics.gate_semantic import GateSemantic
+from opensquirrel.ir.semantics.matrix_gate import MatrixGateSemantic
+from opensquirrel.ir.semantics.parametric_gate import ParametricGateSemantic
+
+SemanticType = TypeVar("SemanticType", bound=GateSemantic)
+
+# The shared semantics, keyed by (the name and fixed arguments of) the gate they belong to
+_shared_semantics: dict[Hashable, GateSemantic] = {}
+_shared_semantic_ids: set[int] = set()
+
+# The data derived from shared semantics, keyed by the identity of the shared semantic and the kind of data
+_derived_semantics: dict[tuple[int, str], GateSemantic] = {}
+
+
+def shared_semantic(key: Hashable, factory: Callable[[], SemanticType]) -> SemanticType:
+    """Returns the shared semantic for the given key, which is created (once) by the factory.
+
+    Shared semantics are immutable: the arrays they hold are made read-only.
+
+    Args:
+        key: The key of the semantic, _e.g._, the name and fixed arguments of a default gate.
+        factory: Creates the semantic if it is not in the table yet.
+
+    Returns:
+        The shared semantic.
+
+    """
+    semantic = _shared_semantics.get(key)
+    if semantic is None:
+        semantic = _shared_semantics.setdefault(key, _freeze(factory()))
+        _shared_semantic_ids.add(id(semantic))
+    return semantic  # ty: ignore[invalid-return-type]
+
+
+def is_shared(semantic: GateSemantic) -> bool:
+    """Checks whether the semantic is a shared semantic.
+
+    Args:
+        semantic: The semantic to check.
+
+    Returns:
+        True if the semantic is in the shared semantic table, False otherwise.
+
+    """
+    return id(semantic) in _shared_semantic_ids
+
+
+def derived_semantic(semantic: GateSemantic, kind: str, derive: Callable[[], SemanticType]) -> SemanticType:
+    """Returns data derived from a semantic, _e.g._, its matrix or canonical form, which is computed once if the
+    semantic is shared, and every time otherwise.
+
+    Args:
+        semantic: The semantic the data is derived from.
+        kind: The kind of derived data, _e.g._, `"matrix"`.
+        derive: Computes the derived data.
+
+    Returns:
+        The derived data.
+
+    """
+    key = (id(semantic), kind)
+    derived = _derived_semantics.get(key)
+    if derived is not None:
+        return derived  # ty: ignore[invalid-return-type]
+    if not is_shared(semantic):
+        return derive()
+    return _derived_semantics.setdefault(key, _freeze(derive()))  # ty: ignore[invalid-return-type]
+
+
+def semantic_key(semantic: GateSemantic) -> Hashable:
+    """Returns a key that is equal for gate semantics of the same type with the same values, _e.g._, to deduplicate
+    gate semantics, or to look up data derived from their values.
+
+    Args:
+        semantic: The gate semantic.
+
+    Returns:
+        The key of the semantic.
+
+    """
+    if isinstance(semantic, BlochSphereRotation):
+        return type(semantic), tuple(semantic.axis.value.tolist()), semantic.angle, semantic.phase
+    if isinstance(semantic, MatrixGateSemantic):
+        return type(semantic), semantic.matrix.shape, semantic.matrix.tobytes()
+    if isinstance(semantic, ControlledGateSemantic):
+        return type(semantic), semantic_key(semantic.target_bsr)
+    if isinstance(semantic, CanonicalGateSemantic):
+        rotations = tuple(semantic_key(rotation) for rotation in semantic.rotations or ())
+        return type(semantic), tuple(semantic.axis.value.tolist()), rotations
+    if isinstance(semantic, ParametricGateSemantic):
+        return type(semantic), tuple(
+            argument.value if isinstance(argument, Float) else argument for argument in semantic.arguments
+        )
+    return type(semantic), id(semantic)
+
+
+def _freeze(semantic: SemanticType) -> SemanticType:
+    if isinstance(semantic, BlochSphereRotation):
+        semantic.axis.value.setflags(write=False)
+    elif isinstance(semantic, MatrixGateSemantic):
+        semantic.matrix.setflags(write=False)
+    elif isinstance(semantic, ControlledGateSemantic):
+        _freeze(semantic.target_bsr)
+    elif isinstance(semantic, CanonicalGateSemantic):
+        for rotation in semantic.rotations or ():
+            _freeze(rotation)
+    return semantic
@@ -4,7 +4,8 @@ from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 from opensquirrel.ir import Float, Gate, GateSemantic, Qubit, QubitLike
-from opensquirrel.ir.semantics import BlochSphereRotation, MatrixGateSemantic
+from opensquirrel.ir.semantics import BlochSphereRotation, MatrixGateSemantic, ParametricGateSemantic
+from opensquirrel.ir.semantics.semantic_table import derived_semantic
 
 if TYPE_CHECKING:
     from opensquirrel.ir.ir import IRVisitor
@@ -57,13 +58,18 @@ class SingleQubitGate(Gate):
 
         self._bsr = gate_semantic if isinstance(gate_semantic, BlochSphereRotation) else None
         self._matrix = gate_semantic if isinstance(gate_semantic, MatrixGateSemantic) else None
+        self._parametric = gate_semantic if isinstance(gate_semantic, ParametricGateSemantic) else None
 
     @cached_property
     def bsr(self) -> BlochSphereRotation:
+        if self._parametric is not None:
+            msg = f"gate {self.name!r} has unbound parameters: {', '.join(self.parameters)}"
+            raise ValueError(msg)
         if self._bsr is None:
             from opensquirrel.ir.semantics.bsr import bsr_from_matrix
 
-            self._bsr = bsr_from_matrix(self.matrix)
+            matrix = self.matrix
+            self._bsr = derived_semantic(matrix, "bsr", lambda: bsr_from_matrix(matrix))
         return self._bsr
 
     @cached_property
@@ -71,7 +77,10 @@ class SingleQubitGate(Gate):
         if self._matrix is None:
             from opensquirrel.utils import can1
 
-            self._matrix = MatrixGateSemantic(can1(self.bsr.axis, self.bsr.angle, self.bsr.phase))
+            bsr = self.bsr
+            self._matrix = derived_semantic(
+                bsr, "matrix", lambda: MatrixGateSemantic(can1(bsr.axis, bsr.angle, bsr.phase))
+            )
         return self._matrix
 
     @property
@@ -90,6 +99,8 @@ class SingleQubitGate(Gate):
             True if the single-qubit gate is an identity gate, False otherwise.
 
         """
+        if self._parametric is not None:
+            return False
         if self.bsr is not None:
             return self.bsr.is_identity()
         return self.matrix.is_identity() if self.matrix else False
@@ -101,6 +112,8 @@ class SingleQubitGate(Gate):
         if self.qubit != other.qubit:
             return False
 
+        if self.is_parametric or other.is_parametric:
+            return Gate.__eq__(self, other)
         return self.bsr == other.bsr
 
     def __mul__(self, other: SingleQubitGate) -> SingleQubitGate:
@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from copy import copy
 from typing import Any
 
+from typing_extensions import Self
+
 from opensquirrel.ir.expression import Bit, Expression, Qubit, String, SupportsStr
 from opensquirrel.ir.ir import IRNode, IRVisitor
 
@@ -30,6 +34,13 @@ class AsmDeclaration(Statement):
         visitor.visit_statement(self)
         return visitor.visit_asm_declaration(self)
 
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, AsmDeclaration)
+            and self.backend_name == other.backend_name
+            and self.backend_code == other.backend_code
+        )
+
 
 class Instruction(Statement, ABC):
     def __init__(self, name: str) -> None:
@@ -51,6 +62,35 @@ class Instruction(Statement, ABC):
     def qubit_indices(self) -> list[int]:
         return [qubit.index for qubit in self.qubit_operands]
 
+    def remap_qubits(self, mapping: Mapping[int, int]) -> None:
+        """Remaps the qubit operands of the instruction, in place.
+
+        Qubits are immutable and shared between instructions, so the qubits of the instruction are replaced by
+        the qubits with the mapped indices, instead of changing their indices.
+
+        Args:
+            mapping: The new qubit index for (at least) the qubit indices of the instruction.
+
+        """
+        for attribute, value in list(vars(self).items()):
+            if isinstance(value, Qubit):
+                setattr(self, attribute, Qubit(mapping[value.index]))
+
+    def with_remapped_qubits(self, mapping: Mapping[int, int]) -> Self:
+        """Returns a copy of the instruction with remapped qubit operands, leaving the instruction itself, which
+        may be shared between IRs (see `IR.snapshot`), unchanged.
+
+        Args:
+            mapping: The new qubit index for (at least) the qubit indices of the instruction.
+
+        Returns:
+            The remapped instruction.
+
+        """
+        instruction = copy(self)
+        instruction.remap_qubits(mapping)
+        return instruction
+
     def accept(self, visitor: IRVisitor) -> Any:
         """Accepts visitor and processes this IR node."""
         return visitor.visit_instruction(self)
@@ -1,12 +1,21 @@
+from collections.abc import Hashable, Iterable
 from functools import cached_property
 from typing import Any
 
 import numpy as np
+from numpy.typing import NDArray
 
 from opensquirrel.ir import Gate, IRVisitor, Qubit, QubitLike
-from opensquirrel.ir.semantics import CanonicalGateSemantic, ControlledGateSemantic, MatrixGateSemantic
+from opensquirrel.ir.semantics import (
+    CanonicalGateSemantic,
+    ControlledGateSemantic,
+    MatrixGateSemantic,
+    ParametricGateSemantic,
+)
 from opensquirrel.ir.semantics.bsr import bsr_from_matrix
+from opensquirrel.ir.semantics.canonical_gate import CanonicalAxis
 from opensquirrel.ir.semantics.gate_semantic import GateSemantic
+from opensquirrel.ir.semantics.semantic_table import derived_semantic, semantic_key
 
 
 class TwoQubitGate(Gate):
@@ -20,6 +29,7 @@ class TwoQubitGate(Gate):
         self._controlled = gate_semantic if isinstance(gate_semantic, ControlledGateSemantic) else None
         self._matrix = gate_semantic if isinstance(gate_semantic, MatrixGateSemantic) else None
         self._canonical = gate_semantic if isinstance(gate_semantic, CanonicalGateSemantic) else None
+        self._parametric = gate_semantic if isinstance(gate_semantic, ParametricGateSemantic) else None
         self.gate_semantic = gate_semantic
 
         if self._check_repeated_qubit_operands(self.qubit_operands):
@@ -28,6 +38,9 @@ class TwoQubitGate(Gate):
 
     @cached_property
     def matrix(self) -> MatrixGateSemantic:
+        if self._parametric is not None:
+            msg = f"gate {self.name!r} has unbound parameters: {', '.join(self.parameters)}"
+            raise ValueError(msg)
         if self._matrix:
             return self._matrix
 
@@ -35,10 +48,13 @@ class TwoQubitGate(Gate):
             from opensquirrel.utils.matrix_expander import can1
 
             target_bsr = self._controlled.target_bsr
-            u_target = can1(target_bsr.axis, target_bsr.angle, target_bsr.phase)
-            m = np.eye(4, dtype=np.complex128)
-            m[2:, 2:] = u_target
-            self._matrix = MatrixGateSemantic(m)
+
+            def controlled_matrix() -> MatrixGateSemantic:
+                m = np.eye(4, dtype=np.complex128)
+                m[2:, 2:] = can1(target_bsr.axis, target_bsr.angle, target_bsr.phase)
+                return MatrixGateSemantic(m)
+
+            self._matrix = derived_semantic(self._controlled, "matrix", controlled_matrix)
             return self._matrix
 
         if self._canonical:
@@ -59,13 +75,11 @@ class TwoQubitGate(Gate):
         if not self._canonical:
             from opensquirrel.utils.matrix_expander import canonical_decomposition
 
-            k1, k2, k3, k4, axis = canonical_decomposition(np.array(self.matrix))
+            def canonical_semantic() -> CanonicalGateSemantic:
+                k1, k2, k3, k4, axis = canonical_decomposition(np.array(self.matrix))
+                return _canonical_semantic(k1, k2, k3, k4, axis)
 
-            bsr1 = bsr_from_matrix(k1)
-            bsr2 = bsr_from_matrix(k2)
-            bsr3 = bsr_from_matrix(k3)
-            bsr4 = bsr_from_matrix(k4)
-            self._canonical = CanonicalGateSemantic(axis, [bsr1, bsr2, bsr3, bsr4])
+            self._canonical = derived_semantic(self.gate_semantic, "canonical", canonical_semantic)
         return self._canonical
 
     @cached_property
@@ -88,6 +102,8 @@ class TwoQubitGate(Gate):
             True if the two-qubit gate is an identity gate, False otherwise.
 
         """
+        if self._parametric is not None:
+            return False
         if self.controlled:
             return self.controlled.is_identity()
         if self.matrix:
@@ -98,3 +114,42 @@ class TwoQubitGate(Gate):
 
     def __repr__(self) -> str:
         return f"TwoQubitGate(qubits=[{self.qubit0, self.qubit1}], gate_semantic={self.gate_semantic})"
+
+
+def compute_canonical_semantics(gates: Iterable[TwoQubitGate]) -> None:
+    """Computes the canonical semantics of two-qubit gates at once, with a single batch canonical decomposition of the
+    distinct gate semantics of the gates that do not have a canonical semantic yet.
+
+    Args:
+        gates: The two-qubit gates.
+
+    """
+    from opensquirrel.utils.matrix_expander import batch_canonical_decomposition
+
+    gates_per_semantic: dict[Hashable, list[TwoQubitGate]] = {}
+    for gate in gates:
+        if gate._canonical is None and gate._parametric is None:  # noqa: SLF001
+            gates_per_semantic.setdefault(semantic_key(gate.gate_semantic), []).append(gate)
+    if not gates_per_semantic:
+        return
+
+    unitaries = np.array([np.array(semantic_gates[0].matrix) for semantic_gates in gates_per_semantic.values()])
+    k1, k2, k3, k4, axes = batch_canonical_decomposition(unitaries)
+    for i, semantic_gates in enumerate(gates_per_semantic.values()):
+        semantic = _canonical_semantic(k1[i], k2[i], k3[i], k4[i], CanonicalAxis(axes[i]))
+        for gate in semantic_gates:
+            gate._canonical = derived_semantic(gate.gate_semantic, "canonical", lambda semantic=semantic: semantic)  # noqa: SLF001
+
+
+def _canonical_semantic(
+    k1: NDArray[np.complex128],
+    k2: NDArray[np.complex128],
+    k3: NDArray[np.complex128],
+    k4: NDArray[np.complex128],
+    axis: CanonicalAxis,
+) -> CanonicalGateSemantic:
+    bsr1 = bsr_from_matrix(k1)
+    bsr2 = bsr_from_matrix(k2)
+    bsr3 = bsr_from_matrix(k3)
+    bsr4 = bsr_from_matrix(k4)
+    return CanonicalGateSemantic(axis, [bsr1, bsr2, bsr3, bsr4])
@@ -1,15 +1,28 @@
 from __future__ import annotations
 
+import cmath
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
-from typing import TYPE_CHECKING, Any
+from collections.abc import Mapping, Sequence
+from math import cos, sin
+from typing import TYPE_CHECKING, Any, SupportsFloat
 
-from opensquirrel.common import are_matrices_equivalent_up_to_global_phase
+import numpy as np
+
+from opensquirrel.common import ATOL, are_matrices_equivalent_up_to_global_phase
 from opensquirrel.ir.statement import Instruction
 
 if TYPE_CHECKING:
     from opensquirrel.ir import Bit, IRVisitor, Qubit
     from opensquirrel.ir.expression import Expression
+    from opensquirrel.ir.semantics import BlochSphereRotation, ParametricGateSemantic
+    from opensquirrel.ir.single_qubit_gate import SingleQubitGate
+    from opensquirrel.ir.two_qubit_gate import TwoQubitGate
+
+# Permutation of the basis states that swaps the qubit operands of a two-qubit gate
+_SWAP_PERMUTATION = [0, 2, 1, 3]
+
+# Relative tolerance of the closed-form comparisons, equal to that of the comparison of matrices (by np.allclose)
+_RTOL = 0.000_01
 
 
 class Unitary(Instruction, ABC):
@@ -18,9 +31,42 @@ class Unitary(Instruction, ABC):
 
 
 class Gate(Unitary, ABC):
+    # The semantic of a gate with symbolic parameters, which replaces its (numeric) semantic until it is bound.
+    _parametric: ParametricGateSemantic | None = None
+
     def __init__(self, name: str) -> None:
         Unitary.__init__(self, name)
 
+    @property
+    def is_parametric(self) -> bool:
+        """Whether the gate has symbolic parameters that are not bound to values yet."""
+        return self._parametric is not None
+
+    @property
+    def parametric(self) -> ParametricGateSemantic | None:
+        """The semantic of the gate if it has symbolic parameters, None otherwise."""
+        return self._parametric
+
+    @property
+    def parameters(self) -> tuple[str, ...]:
+        """The names of the symbolic parameters of the gate."""
+        return self._parametric.parameters if self._parametric is not None else ()
+
+    def bind(self, values: Mapping[str, SupportsFloat]) -> Gate:
+        """Bind the symbolic parameters of the gate to values.
+
+        Args:
+            values (Mapping[str, SupportsFloat]): The values of (at least) the parameters of the gate, keyed by the
+                name of the parameter.
+
+        Returns:
+            The gate with numeric arguments, or the gate itself if it has no symbolic parameters.
+
+        """
+        if self._parametric is None:
+            return self
+        return type(self)(*self.qubit_operands, *self._parametric.bind(values))  # ty: ignore[too-many-positional-arguments]
+
     @staticmethod
     def _check_repeated_qubit_operands(qubits: Sequence[Qubit]) -> bool:
         return len(qubits) != len(set(qubits))
@@ -43,12 +89,23 @@ class Gate(Unitary, ABC):
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Gate):
             return False
+        if self.is_parametric or other.is_parametric:
+            return (
+                type(self) is type(other)
+                and self.qubit_operands == other.qubit_operands
+                and self._parametric == other._parametric
+            )
         return compare_gates(self, other)
 
 
 def compare_gates(gate_1: Gate, gate_2: Gate) -> bool:
     """Checks if two gates are equivalent up to a global phase.
 
+    Gates on the same qubit(s) are compared on their semantics: Bloch sphere rotations on their axis and angle,
+    controlled gates on their target rotation, and canonical gates on their canonical axis and rotations. Other
+    two-qubit gates on the same qubits are compared on their $4\\times 4$ matrices. Only gates on different qubits are
+    compared on the matrices of the circuits of both gates.
+
     Args:
         gate_1 (Gate): The first gate to compare.
         gate_2 (Gate): The second gate to compare.
@@ -57,6 +114,18 @@ def compare_gates(gate_1: Gate, gate_2: Gate) -> bool:
         True if the two gates are equivalent up to a global phase, False otherwise.
 
     """
+    from opensquirrel.ir.single_qubit_gate import SingleQubitGate
+    from opensquirrel.ir.two_qubit_gate import TwoQubitGate
+
+    if isinstance(gate_1, SingleQubitGate) and isinstance(gate_2, SingleQubitGate):
+        return _compare_single_qubit_gates(gate_1, gate_2)
+    if (
+        isinstance(gate_1, TwoQubitGate)
+        and isinstance(gate_2, TwoQubitGate)
+        and set(gate_1.qubit_operands) == set(gate_2.qubit_operands)
+    ):
+        return _compare_two_qubit_gates(gate_1, gate_2)
+
     union_mapping = list(set(gate_1.qubit_indices) | set(gate_2.qubit_indices))
 
     from opensquirrel.circuit_matrix_calculator import get_circuit_matrix
@@ -66,3 +135,80 @@ def compare_gates(gate_1: Gate, gate_2: Gate) -> bool:
     matrix_gate_2 = get_circuit_matrix(get_reindexed_circuit([gate_2], union_mapping))
 
     return are_matrices_equivalent_up_to_global_phase(matrix_gate_1, matrix_gate_2)
+
+
+def _compare_single_qubit_gates(gate_1: SingleQubitGate, gate_2: SingleQubitGate) -> bool:
+    quaternion_1, quaternion_2 = _bsr_quaternion(gate_1.bsr), _bsr_quaternion(gate_2.bsr)
+    if gate_1.qubit != gate_2.qubit:
+        # Gates on different qubits are only equivalent if both are the identity (up to a global phase)
+        return abs(abs(quaternion_1[0]) - 1) < ATOL and abs(abs(quaternion_2[0]) - 1) < ATOL
+    return _are_close_up_to_sign(quaternion_1, quaternion_2)
+
+
+def _compare_two_qubit_gates(gate_1: TwoQubitGate, gate_2: TwoQubitGate) -> bool:
+    is_swapped = gate_1.qubit_operands != gate_2.qubit_operands
+    controlled_1, controlled_2 = gate_1.controlled, gate_2.controlled
+    if controlled_1 is not None and controlled_2 is not None:
+        if not is_swapped:
+            # The identity block of the control fixes the phase, so the target rotations must be equal
+            return _are_close(
+                _bsr_quaternion(controlled_1.target_bsr, with_phase=True),
+                _bsr_quaternion(controlled_2.target_bsr, with_phase=True),
+            )
+        # Controlled gates on swapped operands are only equivalent if both are the same controlled-phase gate
+        phase_1 = _controlled_phase(controlled_1.target_bsr)
+        phase_2 = _controlled_phase(controlled_2.target_bsr)
+        return phase_1 is not None and phase_2 is not None and abs(phase_1 - phase_2) < ATOL
+
+    canonical_1, canonical_2 = gate_1._canonical, gate_2._canonical  # noqa: SLF001
+    if canonical_1 is not None and canonical_2 is not None and not is_swapped:
+        axis_1, axis_2 = canonical_1.axis.value.tolist(), canonical_2.axis.value.tolist()
+        if _are_close(axis_1, axis_2):
+            if canonical_1.rotations is None and canonical_2.rotations is None:
+                return True
+            if (
+                canonical_1.rotations is not None
+                and canonical_2.rotations is not None
+                and all(
+                    _are_close_up_to_sign(_bsr_quaternion(rotation_1), _bsr_quaternion(rotation_2))
+                    for rotation_1, rotation_2 in zip(canonical_1.rotations, canonical_2.rotations, strict=True)
+                )
+            ):
+                return True
+        # The canonical axes in the Weyl chamber are unique, except on its base (where tz = 0)
+        elif axis_1[2] > ATOL and axis_2[2] > ATOL:
+            return False
+
+    matrix_1 = np.asarray(gate_1.matrix.matrix)
+    matrix_2 = np.asarray(gate_2.matrix.matrix)
+    if is_swapped:
+        matrix_2 = matrix_2[np.ix_(_SWAP_PERMUTATION, _SWAP_PERMUTATION)]
+    return are_matrices_equivalent_up_to_global_phase(matrix_1, matrix_2)
+
+
+def _bsr_quaternion(bsr: BlochSphereRotation, *, with_phase: bool = False) -> list[complex]:
+    """The coefficients $(c, s_x, s_y, s_z)$ of the rotation $cI - i(s_x X + s_y Y + s_z Z)$, multiplied by
+    $e^{i\\phi}$ if `with_phase`."""
+    half_angle = bsr.angle / 2
+    factor = cmath.exp(1j * bsr.phase) if with_phase else 1
+    sine = sin(half_angle) * factor
+    return [cos(half_angle) * factor, *(sine * component for component in bsr.axis.value.tolist())]
+
+
+def _are_close(values_1: list[Any], values_2: list[Any]) -> bool:
+    return all(
+        abs(value_1 - value_2) <= ATOL + _RTOL * abs(value_2)
+        for value_1, value_2 in zip(values_1, values_2, strict=True)
+    )
+
+
+def _are_close_up_to_sign(values_1: list[Any], values_2: list[Any]) -> bool:
+    return _are_close(values_1, values_2) or _are_close(values_1, [-value for value in values_2])
+
+
+def _controlled_phase(bsr: BlochSphereRotation) -> complex | None:
+    """The phase $e^{i\\lambda}$ if the rotation is $\\text{diag}(1, e^{i\\lambda})$, None otherwise."""
+    c, sx, sy, sz = _bsr_quaternion(bsr, with_phase=True)
+    if abs(sx) > ATOL or abs(sy) > ATOL or abs(c - 1j * sz - 1) > ATOL:
+        return None
+    return complex(c + 1j * sz)
@@ -13,9 +13,10 @@ from opensquirrel.ir.unitary import Gate
 from opensquirrel.passes.analyzer.general_analyzer import Analyzer
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
 
     from opensquirrel.circuit import Circuit
+    from opensquirrel.ir.dag import DAG
 
 
 class CircuitAnalyzer(Analyzer):
@@ -97,7 +98,7 @@ class CircuitAnalyzer(Analyzer):
 
         """
         self.circuit = circuit
-        self.gate_statements = [s for s in circuit.ir.statements if isinstance(s, Gate)]
+        self.gate_statements = [s for s in circuit.ir.statements_view if isinstance(s, Gate)]
         self._cache: dict[str, Any] = {}
 
         if self.timeout is None:
@@ -157,17 +158,10 @@ class CircuitAnalyzer(Analyzer):
 
     def _compute_depth(self) -> int:
         """ASAP-style circuit depth (longest dependency chain)."""
-        n_qubits = self.circuit.qubit_register_size
-        if n_qubits == 0 or not self.gate_statements:
+        if self.circuit.qubit_register_size == 0:
             return 0
-
-        layer = [0] * n_qubits
-        for gate_statement in self.gate_statements:
-            qubit_indices = list(gate_statement.qubit_indices)
-            new_layer = max(layer[qubit_index] for qubit_index in qubit_indices) + 1
-            for qubit_index in qubit_indices:
-                layer[qubit_index] = new_layer
-        return max(layer)
+        _, longest_to = self._longest_paths()
+        return max(longest_to.values(), default=-1) + 1
 
     # ------------------------------------------------------------------ #
     # Interaction graph metrics                                          #
@@ -247,21 +241,10 @@ class CircuitAnalyzer(Analyzer):
     # ------------------------------------------------------------------ #
     # Gate dependency graph metrics                                      #
     # ------------------------------------------------------------------ #
-    def _gate_dependency_graph(self) -> nx.DiGraph:
-        """The gate dependency graph as a networkx DiGraph, cached per analysis."""
-        return self._get_or_compute("gate_dependency_graph", self._build_gate_dependency_graph)
-
-    def _build_gate_dependency_graph(self) -> nx.DiGraph:
-        """Build a directed acyclic gate dependency graph where edge (i, j) means gate i must run before gate j."""
-        gate_dependency_graph: nx.DiGraph = nx.DiGraph()
-        last_gate_on_qubit: dict[int, int] = {}
-        for index, gate in enumerate(self.gate_statements):
-            gate_dependency_graph.add_node(index)
-            for qubit_index in gate.qubit_indices:
-                if qubit_index in last_gate_on_qubit:
-                    gate_dependency_graph.add_edge(last_gate_on_qubit[qubit_index], index)
-                last_gate_on_qubit[qubit_index] = index
-        return gate_dependency_graph
+    def _gate_dependency_graph(self) -> DAG:
+        """The dependency DAG of the statements of the circuit, which the IR maintains alongside its statements, such
+        that it is not rebuilt for every analysis."""
+        return self.circuit.ir.dag(self.circuit.qubit_register_size)
 
     def _longest_paths(self) -> tuple[dict[int, int], dict[int, int]]:
         """The (longest_from, longest_to) maps of the gate dependency graph, cached per analysis."""
@@ -270,7 +253,7 @@ class CircuitAnalyzer(Analyzer):
     def _metric_gdg_critical_path_length(self) -> int:
         if not self.gate_statements:
             return 0
-        return self._safe_critical_path_length(self._gate_dependency_graph())
+        return self._critical_path_length()
 
     def _metric_gdg_path_length_mean(self) -> float:
         if not self.gate_statements:
@@ -290,40 +273,51 @@ class CircuitAnalyzer(Analyzer):
         n_gates = len(self.gate_statements)
         if n_gates == 0:
             return 0.0
-        gate_dependency_graph = self._gate_dependency_graph()
-        critical_path_length = self._safe_critical_path_length(gate_dependency_graph)
+        critical_path_length = self._critical_path_length()
         longest_from, longest_to = self._longest_paths()
-        return self._critical_path_membership_fraction(
-            gate_dependency_graph, longest_to, longest_from, critical_path_length, n_gates
-        )
+        return self._critical_path_membership_fraction(longest_to, longest_from, critical_path_length, n_gates)
 
-    def _safe_critical_path_length(self, gate_dependency_graph: nx.DiGraph) -> int:
-        try:
-            return nx.dag_longest_path_length(gate_dependency_graph)
-        except nx.NetworkXError:
-            return 0
+    def _critical_path_length(self) -> int:
+        _, longest_to = self._longest_paths()
+        return max(longest_to.values(), default=0)
 
-    def _compute_longest_paths(self, gate_dependency_graph: nx.DiGraph) -> tuple[dict[int, int], dict[int, int]]:
-        """Return (longest_from, longest_to) for every node in the gate dependency graph.
+    def _compute_longest_paths(self, gate_dependency_graph: DAG) -> tuple[dict[int, int], dict[int, int]]:
+        """Return (longest_from, longest_to) for every gate node in the gate dependency graph.
 
         longest_to[n]   = length of the longest path ending at n
         longest_from[n] = length of the longest path starting at n
-        """
-        topo_order = list(nx.topological_sort(gate_dependency_graph))
-        longest_to: dict[int, int] = dict.fromkeys(gate_dependency_graph.nodes, 0)
-        for node in topo_order:
-            for successor in gate_dependency_graph.successors(node):
-                if longest_to[node] + 1 > longest_to[successor]:
-                    longest_to[successor] = longest_to[node] + 1
-
-        longest_from: dict[int, int] = dict.fromkeys(gate_dependency_graph.nodes, 0)
-        for node in reversed(topo_order):
-            for successor in gate_dependency_graph.successors(node):
-                if longest_from[successor] + 1 > longest_from[node]:
-                    longest_from[node] = longest_from[successor] + 1
 
+        Paths only count the gates: the other statements are passed through on each of their qubits.
+        """
+        longest_to = self._longest_gate_paths(
+            gate_dependency_graph, iter(gate_dependency_graph), gate_dependency_graph.predecessor
+        )
+        longest_from = self._longest_gate_paths(
+            gate_dependency_graph, reversed(gate_dependency_graph), gate_dependency_graph.successor
+        )
         return longest_from, longest_to
 
+    @staticmethod
+    def _longest_gate_paths(dag: DAG, nodes: Iterator[int], neighbor: Callable[[int, int], int]) -> dict[int, int]:
+        """The length of the longest path of gates that ends at each gate node, where the nodes are visited in
+        topological order, and `neighbor` gives the node that comes before a node on a qubit in that order."""
+        longest_paths: dict[int, int] = {}
+        # The length of the longest path that passes a statement (that is not a gate) on a qubit, up to the next gate
+        passing_paths: dict[tuple[int, int], int] = {}
+        for node in nodes:
+            incoming_paths: dict[int, int] = {}
+            for qubit in dag.wires(node):
+                neighbor_node = neighbor(node, qubit)
+                if neighbor_node in longest_paths:
+                    incoming_paths[qubit] = longest_paths[neighbor_node] + 1
+                elif (neighbor_node, qubit) in passing_paths:
+                    incoming_paths[qubit] = passing_paths[neighbor_node, qubit]
+            if isinstance(dag[node], Gate):
+                longest_paths[node] = max(incoming_paths.values(), default=0)
+            else:
+                passing_paths.update(((node, qubit), path) for qubit, path in incoming_paths.items())
+        return longest_paths
+
     def _path_length_stats(self, path_length_by_node: dict[int, int]) -> tuple[float, float]:
         path_lengths = list(path_length_by_node.values())
         if not path_lengths:
@@ -334,7 +328,6 @@ class CircuitAnalyzer(Analyzer):
 
     def _critical_path_membership_fraction(
         self,
-        gate_dependency_graph: nx.DiGraph,
         longest_to: dict[int, int],
         longest_from: dict[int, int],
         critical_path_length: int,
@@ -345,9 +338,7 @@ class CircuitAnalyzer(Analyzer):
         A node lies on a critical path iff the longest path through it
         (longest_to[n] + longest_from[n]) equals the overall critical path length.
         """
-        n_in_cp = sum(
-            1 for node in gate_dependency_graph.nodes if longest_to[node] + longest_from[node] == critical_path_length
-        )
+        n_in_cp = sum(1 for node in longest_to if longest_to[node] + longest_from[node] == critical_path_length)
         return round(n_in_cp / n_gates, 4)
 
     # ------------------------------------------------------------------ #
@@ -5,13 +5,17 @@ from __future__ import annotations
 
 import math
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import Any, ClassVar
 
+import numpy as np
+from numpy.typing import NDArray
+
 from opensquirrel import Rx, Ry, Rz
 from opensquirrel.common import ATOL
-from opensquirrel.ir import Axis, AxisLike, Gate
+from opensquirrel.ir import Axis, AxisLike, Gate, Qubit
 from opensquirrel.ir.single_qubit_gate import SingleQubitGate
+from opensquirrel.passes.decomposer.decomposition_memo import memoize_decomposition, memoize_decompositions
 from opensquirrel.passes.decomposer.general_decomposer import Decomposer
 from opensquirrel.utils.general_math import acos, are_axes_consecutive
 from opensquirrel.utils.identity_filter import filter_out_identities
@@ -33,6 +37,7 @@ class ABADecomposer(Decomposer, ABC):
     @abstractmethod
     def Rb(self) -> Callable[..., SingleQubitGate]: ...  # noqa: N802
 
+    @memoize_decomposition
     def decompose(self, instruction: Gate) -> list[Gate]:
         """Decomposes a single-qubit gate into (at most) three single-qubit gates following the
         R$a$-R$b$-R$a$ decomposition, where [$ab$] are in $\\{x,y,z\\}$ and $a$ is not equal to $b$.
@@ -52,11 +57,35 @@ class ABADecomposer(Decomposer, ABC):
         gate = instruction
 
         theta_a1, theta_b, theta_a2 = self._determine_rotation_angles(gate.bsr.axis, gate.bsr.angle)
+        return self._rotation_gates(gate.qubit, theta_a1, theta_b, theta_a2)
+
+    @memoize_decompositions
+    def decompose_gates(self, gates: Sequence[Gate]) -> list[list[Gate]]:
+        """Decomposes the single-qubit gates at once, of which the rotation angles are determined in a single
+        vectorized pass over the axes and angles of their Bloch sphere rotations.
+
+        Args:
+            gates: The gates to decompose, in order.
+
+        Returns:
+            The R$a$-R$b$-R$a$ decomposition of each single-qubit gate, and the other gates as they are.
+
+        """
+        bsrs = [gate.bsr for gate in gates if isinstance(gate, SingleQubitGate)]
+        axes = np.array([bsr.axis.value for bsr in bsrs], dtype=np.float64).reshape(-1, 3)
+        angles = np.array([bsr.angle for bsr in bsrs], dtype=np.float64)
+        rotation_angles = iter(self._determine_rotation_angles_batch(axes, angles).tolist())
+        return [
+            self._rotation_gates(gate.qubit, *next(rotation_angles)) if isinstance(gate, SingleQubitGate) else [gate]
+            for gate in gates
+        ]
+
+    def _rotation_gates(self, qubit: Qubit, theta_a1: float, theta_b: float, theta_a2: float) -> list[Gate]:
         return filter_out_identities(
             [
-                self.Ra(gate.qubit, theta_a1),
-                self.Rb(gate.qubit, theta_b),
-                self.Ra(gate.qubit, theta_a2),
+                self.Ra(qubit, theta_a1),
+                self.Rb(qubit, theta_b),
+                self.Ra(qubit, theta_a2),
             ]
         )
 
@@ -120,6 +149,61 @@ class ABADecomposer(Decomposer, ABC):
 
         return theta_a1, theta_b, theta_a2
 
+    def _determine_rotation_angles_batch(
+        self, axes: NDArray[np.float64], thetas: NDArray[np.float64]
+    ) -> NDArray[np.float64]:
+        """Determines the rotation angles for the R$a$-R$b$-R$a$ decompositions of multiple Bloch sphere rotations,
+        element-wise, as `_determine_rotation_angles`.
+
+        Args:
+            axes: The (normalized) axes of the Bloch sphere rotations, of shape (m, 3).
+            thetas: The angles $\\theta$ of the Bloch sphere rotations, of shape (m,).
+
+        Returns:
+            The rotation angles $\\theta_{a_1}$, $\\theta_b$, and $\\theta_{a_2}$ of each rotation, of shape (m, 3).
+
+        """
+        is_normalized = (-math.pi + ATOL < thetas) & (thetas <= math.pi + ATOL)
+        if not is_normalized.all():
+            msg = f"angle {float(thetas[~is_normalized][0])!r} is not normalized between -pi and pi"
+            raise ValueError(msg)
+
+        component_a = axes[:, self.index_a]
+        component_b = axes[:, self.index_b]
+        component_c = axes[:, self._find_unused_index()]
+        half_thetas = thetas / 2
+
+        theta_b = 2 * np.arccos(
+            np.clip(np.cos(half_thetas) * np.sqrt(1 + (component_a * np.tan(half_thetas)) ** 2), -1, 1)
+        )
+        theta_b = np.copysign(theta_b, thetas)
+
+        p = 2 * np.arctan2(component_a * np.sin(half_thetas), np.cos(half_thetas))
+        sin_half_theta_b = np.sin(theta_b / 2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            m = 2 * np.arccos(np.clip(component_b * np.sin(half_thetas) / sin_half_theta_b, -1, 1))
+        m = np.where(math.pi - np.abs(m) > ATOL, np.copysign(m, 2 * np.arctan2(component_c, component_a)), m)
+        m = np.where(np.abs(sin_half_theta_b) < ATOL, p, m)
+
+        if are_axes_consecutive(self.index_a, self.index_b):
+            m = -m
+
+        theta_a1 = (p + m) / 2
+        theta_a2 = p - theta_a1
+
+        b_is_zero, c_is_zero = np.abs(component_b) < ATOL, np.abs(component_c) < ATOL
+        in_negative_octant = (
+            ((component_b < 0) | b_is_zero) & ((component_c < 0) | c_is_zero) & ~(b_is_zero & c_is_zero)
+        )
+        return np.stack(
+            [
+                np.where(in_negative_octant, theta_a2, theta_a1),
+                theta_b,
+                np.where(in_negative_octant, theta_a1, theta_a2),
+            ],
+            axis=-1,
+        )
+
     def _find_unused_index(self) -> int:
         """Finds the index of the axis component that is not used in the decomposition.
         For example, for the Rz-Ry-Rz decomposition, the index returned is 0 (since it is x).
@@ -9,14 +9,32 @@ from opensquirrel import CNOT, CZ, X90, H, MinusX90, Ry, S, SDagger, Z
 from opensquirrel.ir.semantics.bsr import BlochSphereRotation
 from opensquirrel.ir.semantics.canonical_gate import CanonicalAxis
 from opensquirrel.ir.single_qubit_gate import SingleQubitGate
-from opensquirrel.ir.two_qubit_gate import TwoQubitGate
+from opensquirrel.ir.two_qubit_gate import TwoQubitGate, compute_canonical_semantics
+from opensquirrel.passes.decomposer.decomposition_memo import memoize_decomposition
 from opensquirrel.passes.decomposer.general_decomposer import Decomposer
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from opensquirrel.ir import Gate
 
 
 class Can2CZDecomposer(Decomposer):
+    def decompose_gates(self, gates: Sequence[Gate]) -> list[list[Gate]]:
+        """Decomposes the gates of an IR, after computing the canonical semantics of all two-qubit gates in a single
+        batch canonical decomposition.
+
+        Args:
+            gates: The gates to decompose, in order.
+
+        Returns:
+            The decomposition of each gate.
+
+        """
+        compute_canonical_semantics(gate for gate in gates if isinstance(gate, TwoQubitGate))
+        return super().decompose_gates(gates)
+
+    @memoize_decomposition
     def decompose(self, instruction: Gate) -> list[Gate]:
         """General decomposition of an arbitrary 2-qubit gate into (at most 3) CZ gate(s) with single-qubit rotations.
 
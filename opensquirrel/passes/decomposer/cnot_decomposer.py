@@ -8,6 +8,7 @@ from opensquirrel.common import ATOL
 from opensquirrel.ir.single_qubit_gate import SingleQubitGate
 from opensquirrel.ir.two_qubit_gate import TwoQubitGate
 from opensquirrel.passes.decomposer import ZYZDecomposer
+from opensquirrel.passes.decomposer.decomposition_memo import memoize_decomposition
 from opensquirrel.passes.decomposer.general_decomposer import Decomposer
 from opensquirrel.utils.identity_filter import filter_out_identities
 
@@ -24,6 +25,7 @@ class CNOTDecomposer(Decomposer):
     [Quantum Gates by G.E. Crooks (2024), Section 7.5](https://threeplusone.com/pubs/on_gates.pdf).
     """
 
+    @memoize_decomposition
     def decompose(self, instruction: Gate) -> list[Gate]:
         """Decomposes a controlled two-qubit gate into a sequence of (at most 2) CNOT gates and
         single-qubit gates. It decomposes the CR, CRk, and CZ controlled two-qubit gates.
@@ -8,6 +8,7 @@ from opensquirrel.common import ATOL
 from opensquirrel.ir.single_qubit_gate import SingleQubitGate
 from opensquirrel.ir.two_qubit_gate import TwoQubitGate
 from opensquirrel.passes.decomposer import XYXDecomposer
+from opensquirrel.passes.decomposer.decomposition_memo import memoize_decomposition
 from opensquirrel.passes.decomposer.general_decomposer import Decomposer
 from opensquirrel.utils.identity_filter import filter_out_identities
 
@@ -23,6 +24,7 @@ class CZDecomposer(Decomposer):
     Source of the math: https://threeplusone.com/pubs/on_gates.pdf, chapter 7.5 "ABC decomposition"
     """
 
+    @memoize_decomposition
     def decompose(self, instruction: Gate) -> list[Gate]:
         """Decomposes a controlled two-qubit gate into a sequence of (at most 2) CZ gates and
         single-qubit gates. It decomposes the CR, CRk, and CNOT controlled two-qubit gates.
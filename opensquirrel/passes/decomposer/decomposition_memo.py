@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Sequence
+from copy import copy
+from functools import wraps
+from typing import TYPE_CHECKING, TypeVar
+
+from opensquirrel.ir import Qubit
+from opensquirrel.passes.decomposer.general_decomposer import gate_signature
+
+if TYPE_CHECKING:
+    from opensquirrel.ir import Gate
+    from opensquirrel.passes.decomposer.general_decomposer import Decomposer
+
+DecomposerType = TypeVar("DecomposerType", bound="Decomposer")
+
+
+class DecompositionMemo:
+    """Least recently used (LRU) memo of gate decompositions, keyed by the type of the decomposer and the signature of
+    the gate, _i.e._, its type, name and the values of its semantic, rounded to `decimals` decimals.
+
+    A decomposition is stored as a template that acts on the operand positions of the gate, _i.e._, qubit 0 for the
+    first operand and qubit 1 for the second, and is retargeted to the qubit operands of the gate it is looked up for.
+
+    Args:
+        maxsize: The maximum number of decompositions that are stored, 0 disables the memo.
+        decimals: The number of decimals the values of gate semantics are rounded to.
+
+    """
+
+    def __init__(self, maxsize: int = 4096, decimals: int = 12) -> None:
+        self.maxsize = maxsize
+        self.decimals = decimals
+        self.hits = 0
+        self.misses = 0
+        self._templates: OrderedDict[Hashable, list[_TemplateGate]] = OrderedDict()
+        # The rounded key per exact key, such that the values of gate semantics are only rounded once
+        self._rounded_keys: dict[Hashable, Hashable] = {}
+
+    def decompose(self, decomposer: Decomposer, gate: Gate, decompose: Callable[[Gate], list[Gate]]) -> list[Gate]:
+        """Decomposes a gate, with the memoized decomposition if there is one.
+
+        Args:
+            decomposer: The decomposer, of which the decompositions only depend on its type and the gate signature.
+            gate: The gate to decompose.
+            decompose: Decomposes the gate if its decomposition is not memoized.
+
+        Returns:
+            The decomposition of the gate, on its qubit operands.
+
+        """
+        signature = gate_signature(gate) if self.maxsize > 0 else None
+        if signature is None or gate.is_parametric:
+            return decompose(gate)
+
+        key = self._key(decomposer, signature)
+        template = self._templates.get(key)
+        if template is not None:
+            self.hits += 1
+            self._templates.move_to_end(key)
+            return [template_gate.retarget(gate.qubit_operands) for template_gate in template]
+
+        self.misses += 1
+        decomposition = decompose(gate)
+        self._store(key, gate, decomposition)
+        return decomposition
+
+    def decompose_gates(
+        self,
+        decomposer: Decomposer,
+        gates: Sequence[Gate],
+        decompose_gates: Callable[[list[Gate]], list[list[Gate]]],
+    ) -> list[list[Gate]]:
+        """Decomposes gates at once, with the memoized decompositions where there are, such that the gates that are
+        decomposed in a batch are the gates of which the (rounded) signature is not memoized, once per signature.
+
+        Args:
+            decomposer: The decomposer, of which the decompositions only depend on its type and the gate signature.
+            gates: The gates to decompose, in order.
+            decompose_gates: Decomposes the gates of which the decompositions are not memoized, in a batch.
+
+        Returns:
+            The decomposition of each gate, on its qubit operands.
+
+        """
+        if self.maxsize <= 0:
+            return decompose_gates(list(gates))
+
+        decompositions: list[list[Gate]] = [[] for _ in gates]
+        # The indices of the gates per signature that is not memoized, of which the first gate is decomposed
+        missed_indices: dict[Hashable, list[int]] = {}
+        unmemoized_indices: list[int] = []
+        for index, gate in enumerate(gates):
+            signature = gate_signature(gate)
+            if signature is None or gate.is_parametric:
+                unmemoized_indices.append(index)
+                continue
+            key = self._key(decomposer, signature)
+            template = self._templates.get(key)
+            if template is not None:
+                self.hits += 1
+                self._templates.move_to_end(key)
+                decompositions[index] = [template_gate.retarget(gate.qubit_operands) for template_gate in template]
+            else:
+                missed_indices.setdefault(key, []).append(index)
+
+        _decompose_at(
+            gates,
+            [indices[0] for indices in missed_indices.values()] + unmemoized_indices,
+            decompose_gates,
+            decompositions,
+        )
+
+        # Gates with a decomposition that cannot be stored as a template are decomposed in another batch
+        undecomposed_indices: list[int] = []
+        for key, (index, *other_indices) in missed_indices.items():
+            self.misses += 1
+            template = self._store(key, gates[index], decompositions[index])
+            if template is None:
+                self.misses += len(other_indices)
+                undecomposed_indices.extend(other_indices)
+                continue
+            self.hits += len(other_indices)
+            for other_index in other_indices:
+                operands = gates[other_index].qubit_operands
+                decompositions[other_index] = [template_gate.retarget(operands) for template_gate in template]
+        if undecomposed_indices:
+            _decompose_at(gates, undecomposed_indices, decompose_gates, decompositions)
+        return decompositions
+
+    def _key(self, decomposer: Decomposer, signature: tuple[Hashable, ...]) -> Hashable:
+        key = self._rounded_keys.get((type(decomposer), signature))
+        if key is None:
+            if len(self._rounded_keys) >= self.maxsize:
+                self._rounded_keys.clear()
+            key = (type(decomposer), _round(signature, self.decimals))
+            self._rounded_keys[type(decomposer), signature] = key
+        return key
+
+    def _store(self, key: Hashable, gate: Gate, decomposition: list[Gate]) -> list[_TemplateGate] | None:
+        """Stores the decomposition of a gate as a template, if it only acts on the qubit operands of the gate."""
+        positions = {operand.index: position for position, operand in enumerate(gate.qubit_operands)}
+        if not all(
+            index in positions for decomposition_gate in decomposition for index in decomposition_gate.qubit_indices
+        ):
+            return None
+        template = [_TemplateGate(decomposition_gate, positions) for decomposition_gate in decomposition]
+        self._templates[key] = template
+        if len(self._templates) > self.maxsize:
+            self._templates.popitem(last=False)
+        return template
+
+    def clear(self) -> None:
+        """Removes all decompositions, and resets the hit and miss counts."""
+        self._templates.clear()
+        self._rounded_keys.clear()
+        self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def __repr__(self) -> str:
+        return f"DecompositionMemo(size={len(self)}, maxsize={self.maxsize}, hits={self.hits}, misses={self.misses})"
+
+
+class _TemplateGate:
+    """A gate of a memoized decomposition, of which the qubit operands are replaced by the operands of the gate that
+    is decomposed, without copying the gate through its constructor."""
+
+    __slots__ = ("gate", "qubit_attributes")
+
+    def __init__(self, gate: Gate, positions: dict[int, int]) -> None:
+        self.gate = copy(gate)
+        self.qubit_attributes = [
+            (attribute, positions[value.index]) for attribute, value in vars(gate).items() if isinstance(value, Qubit)
+        ]
+
+    def retarget(self, operands: Sequence[Qubit]) -> Gate:
+        gate = object.__new__(type(self.gate))
+        attributes = gate.__dict__
+        attributes.update(self.gate.__dict__)
+        for attribute, position in self.qubit_attributes:
+            attributes[attribute] = operands[position]
+        return gate
+
+
+# The memo of the decomposers that opt in through `memoize_decomposition`
+decomposition_memo = DecompositionMemo()
+
+
+def memoize_decomposition(
+    method: Callable[[DecomposerType, Gate], list[Gate]],
+) -> Callable[[DecomposerType, Gate], list[Gate]]:
+    """Decorates the `decompose` method of a decomposer, to look up the decompositions of gates in
+    `decomposition_memo`.
+
+    Only decomposers of which the decompositions depend on nothing but their type and the gate signature, _i.e._,
+    not on the qubit indices or on the configuration of the decomposer, can opt in.
+    """
+
+    @wraps(method)
+    def decompose(self: DecomposerType, instruction: Gate) -> list[Gate]:
+        return decomposition_memo.decompose(self, instruction, lambda gate: method(self, gate))
+
+    return decompose
+
+
+def memoize_decompositions(
+    method: Callable[[DecomposerType, Sequence[Gate]], list[list[Gate]]],
+) -> Callable[[DecomposerType, Sequence[Gate]], list[list[Gate]]]:
+    """Decorates the `decompose_gates` method of a decomposer, to look up the decompositions of gates in
+    `decomposition_memo`, such that the method only decomposes the gates of which the signature is not memoized.
+
+    The same conditions apply as for `memoize_decomposition`.
+    """
+
+    @wraps(method)
+    def decompose_gates(self: DecomposerType, gates: Sequence[Gate]) -> list[list[Gate]]:
+        return decomposition_memo.decompose_gates(self, gates, lambda missed_gates: method(self, missed_gates))
+
+    return decompose_gates
+
+
+def _decompose_at(
+    gates: Sequence[Gate],
+    indices: list[int],
+    decompose_gates: Callable[[list[Gate]], list[list[Gate]]],
+    decompositions: list[list[Gate]],
+) -> None:
+    """Decomposes the gates at the indices in a batch, and stores their decompositions at the same indices."""
+    for index, decomposition in zip(indices, decompose_gates([gates[index] for index in indices]), strict=True):
+        decompositions[index] = decomposition
+
+
+def _round(key: tuple[Hashable, ...], decimals: int) -> tuple[Hashable, ...]:
+    return tuple(
+        [
+            round(item, decimals)
+            if isinstance(item, float)
+            else _round(item, decimals)
+            if isinstance(item, tuple)
+            else item
+            for item in key
+        ]
+    )
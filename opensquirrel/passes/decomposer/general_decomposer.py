@@ -1,16 +1,27 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
-from typing import Any, TypeVar
+from collections import Counter
+from collections.abc import Hashable, Iterable, Sequence
+from typing import Any, ClassVar, Literal, TypeVar
+
+import numpy as np
 
 from opensquirrel.circuit_matrix_calculator import get_circuit_matrix
 from opensquirrel.common import are_matrices_equivalent_up_to_global_phase, is_identity_matrix_up_to_a_global_phase
-from opensquirrel.ir import IR, Gate, Instruction, Measure
+from opensquirrel.ir import IR, Gate, Instruction, Measure, Statement
+from opensquirrel.ir.semantics.semantic_table import semantic_key
+from opensquirrel.ir.single_qubit_gate import SingleQubitGate
+from opensquirrel.ir.two_qubit_gate import TwoQubitGate
 from opensquirrel.reindexer import get_reindexed_circuit
 
 InstructionType = TypeVar("InstructionType", bound=Instruction)
 
+# Generic value that parameters are bound to, to find out if a decomposer acts on a parametric gate
+_PROBE_PARAMETER_VALUE = 0.7390851332
+
+VerificationMode = Literal["always", "first", "sampled", "off"]
+
 
 class Decomposer(ABC):
     def __init__(self, **kwargs: Any) -> None: ...
@@ -18,33 +29,206 @@ class Decomposer(ABC):
     @abstractmethod
     def decompose(self, instruction: InstructionType) -> list[InstructionType]: ...
 
+    def decompose_gates(self, gates: Sequence[Gate]) -> list[list[Gate]]:
+        """Decomposes the (non-parametric) gates of an IR at once, which decomposers can override to process all
+        gates in a batch.
+
+        Args:
+            gates: The gates to decompose, in order.
+
+        Returns:
+            The decomposition of each gate.
+
+        """
+        return [self.decompose(gate) for gate in gates]
+
+
+class DecompositionVerifier:
+    """Decides which gate decompositions are checked by `check_gate_decomposition`, and keeps track of the checks
+    per (decomposer, gate signature), where the signature of a gate is its type, name and the values of its semantic.
+
+    The verification modes are:
+
+    - `"always"`: every decomposition is checked;
+    - `"first"`: the first `max_checks` decompositions per signature are checked;
+    - `"sampled"`: the first decomposition per signature is checked, and the others with probability
+      `sample_fraction`;
+    - `"off"`: no decomposition is checked.
+
+    A verifier can be passed to multiple `decompose` calls, to share the checks between them. Gates without a
+    signature, _e.g._, gates of other types than single- and two-qubit gates, are checked in all modes except `"off"`.
+
+    Args:
+        mode: The verification mode, `DecompositionVerifier.default_mode` if not given.
+        max_checks: The number of decompositions that are checked per signature in mode `"first"`.
+        sample_fraction: The fraction of decompositions that is checked in mode `"sampled"`.
+        seed: The seed of the random number generator of mode `"sampled"`.
+
+    """
+
+    # The mode of verifiers that are created without a mode, e.g., by `decompose`
+    default_mode: ClassVar[VerificationMode] = "always"
+
+    def __init__(
+        self,
+        mode: VerificationMode | None = None,
+        max_checks: int = 1,
+        sample_fraction: float = 0.1,
+        seed: int | None = None,
+    ) -> None:
+        mode = self.default_mode if mode is None else mode
+        if mode not in ("always", "first", "sampled", "off"):
+            msg = f"unknown verification mode {mode!r}"
+            raise ValueError(msg)
+        if max_checks < 1:
+            msg = f"max_checks should be at least 1, got {max_checks!r}"
+            raise ValueError(msg)
+        if not 0 <= sample_fraction <= 1:
+            msg = f"sample_fraction should be in [0, 1], got {sample_fraction!r}"
+            raise ValueError(msg)
+        self.mode = mode
+        self.max_checks = max_checks
+        self.sample_fraction = sample_fraction
+        self._rng = np.random.default_rng(seed)
+        self._number_of_checks: Counter[Hashable] = Counter()
+        self.checks = 0
+        self.skips = 0
+
+    def verify(self, decomposer: Decomposer, gate: Gate, decomposition_gates: Iterable[Gate]) -> None:
+        """Checks the decomposition of a gate with `check_gate_decomposition`, if the verification mode selects it.
+
+        Args:
+            decomposer: The decomposer that decomposed the gate.
+            gate: The gate that is decomposed.
+            decomposition_gates: The gate(s) that decompose the gate.
+
+        Raises:
+            ValueError: If the decomposition is checked and is not valid.
+
+        """
+        if not self._should_check(decomposer, gate):
+            self.skips += 1
+            return
+        self.checks += 1
+        check_gate_decomposition(gate, decomposition_gates)
+
+    def _should_check(self, decomposer: Decomposer, gate: Gate) -> bool:
+        if self.mode == "always":
+            return True
+        if self.mode == "off":
+            return False
+
+        signature = gate_signature(gate)
+        if signature is None:
+            return True
+        key = (decomposer, signature)
+        number_of_checks = self._number_of_checks[key]
+        if self.mode == "first":
+            should_check = number_of_checks < self.max_checks
+        else:
+            should_check = number_of_checks == 0 or self._rng.random() < self.sample_fraction
+        if should_check:
+            self._number_of_checks[key] += 1
+        return should_check
+
+
+def gate_signature(gate: Gate) -> tuple[Hashable, ...] | None:
+    """Returns the signature of a gate, _i.e._, its type, name and the values of its semantic, which is equal for gates
+    that only differ in their qubit operands.
+
+    Args:
+        gate: The gate.
+
+    Returns:
+        The signature of the gate, None if the gate is not a single- or two-qubit gate.
 
-def decompose(ir: IR, decomposer: Decomposer) -> None:
+    """
+    if isinstance(gate, SingleQubitGate):
+        semantic = gate.parametric if gate.parametric is not None else gate.bsr
+    elif isinstance(gate, TwoQubitGate):
+        semantic = gate.gate_semantic
+    else:
+        return None
+    return type(gate), gate.name, semantic_key(semantic)
+
+
+def decompose(ir: IR, decomposer: Decomposer, verifier: DecompositionVerifier | None = None) -> None:
     """Decomposes the statements in the circuit IR using the provided decomposer.
 
+    The (non-parametric) gates are decomposed at once by `Decomposer.decompose_gates`, after which the statements are
+    replaced in a single pass, which emits a new list of statements, such that splicing in a decomposition costs O(1)
+    per replacement gate.
+
     Args:
         ir (IR): The circuit IR to decompose.
         decomposer (Decomposer): The decomposer to use for decomposing the gates.
+        verifier (DecompositionVerifier | None): Decides which decompositions are checked, a verifier with the
+            default verification mode if not given.
 
     """
-    statement_index = 0
-    while statement_index < len(ir.statements):
-        statement = ir.statements[statement_index]
-
-        if isinstance(statement, Gate):
-            gate = statement
-            replacement_gates: list[Gate] = decomposer.decompose(statement)
-            check_gate_decomposition(gate, replacement_gates)
-
-            ir.statements[statement_index : statement_index + 1] = replacement_gates
-            statement_index += len(replacement_gates)
-
-        elif isinstance(statement, Measure):
-            measure_decomposition = decomposer.decompose(statement)
-            ir.statements[statement_index : statement_index + 1] = measure_decomposition
-            statement_index += len(measure_decomposition)
-        else:
-            statement_index += 1
+    verifier = DecompositionVerifier() if verifier is None else verifier
+    gates = [
+        statement for statement in ir.statements_view if isinstance(statement, Gate) and not statement.is_parametric
+    ]
+    decompositions = iter(decomposer.decompose_gates(gates))
+
+    statements: list[Statement] = []
+    for statement in ir.statements_view:
+        if isinstance(statement, Gate) and not statement.is_parametric:
+            replacement_gates = next(decompositions)
+            verifier.verify(decomposer, statement, replacement_gates)
+            statements.extend(replacement_gates)
+            continue
+
+        # Lowered parametric gates are decomposed in turn, in order, before the next statement
+        pending_statements: list[Statement] = [statement]
+        while pending_statements:
+            pending_statement = pending_statements.pop()
+
+            if isinstance(pending_statement, Gate) and pending_statement.is_parametric:
+                lowered_gates = _lower_parametric_gate(pending_statement, decomposer, verifier)
+                if lowered_gates is None:
+                    statements.append(pending_statement)
+                else:
+                    pending_statements.extend(reversed(lowered_gates))
+
+            elif isinstance(pending_statement, Gate):
+                replacement_gates = decomposer.decompose(pending_statement)
+                verifier.verify(decomposer, pending_statement, replacement_gates)
+                statements.extend(replacement_gates)
+
+            elif isinstance(pending_statement, Measure):
+                statements.extend(decomposer.decompose(pending_statement))
+            else:
+                statements.append(pending_statement)
+    ir.statements = statements
+
+
+def _lower_parametric_gate(gate: Gate, decomposer: Decomposer, verifier: DecompositionVerifier) -> list[Gate] | None:
+    """Lowers the parametric gate to fixed gates and symbolic Rz gates, if the decomposer would decompose the gate
+    for a (generic) binding of its parameters.
+
+    Returns:
+        The lowered gates, to be decomposed in turn, or None if the gate is kept.
+
+    """
+    from opensquirrel.passes.decomposer.parametric_decomposer import ParametricDecomposer
+
+    values = dict.fromkeys(gate.parameters, _PROBE_PARAMETER_VALUE)
+    bound_gate = gate.bind(values)
+    bound_decomposition = decomposer.decompose(bound_gate)
+    if (
+        len(bound_decomposition) == 1
+        and bound_decomposition[0].name == bound_gate.name
+        and bound_decomposition[0] == bound_gate
+    ):
+        return None
+
+    lowered_gates = ParametricDecomposer().decompose(gate)
+    if lowered_gates == [gate]:
+        return None
+    verifier.verify(decomposer, bound_gate, [lowered_gate.bind(values) for lowered_gate in lowered_gates])
+    return lowered_gates
 
 
 def check_gate_decomposition(gate: Gate, decomposition_gates: Iterable[Gate]) -> None:
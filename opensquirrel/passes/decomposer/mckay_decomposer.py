@@ -1,16 +1,25 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from math import atan2, cos, pi, sin, sqrt
 
+import numpy as np
+from numpy.typing import NDArray
+
 from opensquirrel import X90, I, Rz
-from opensquirrel.common import ATOL, normalize_angle
-from opensquirrel.ir import Axis, Gate
+from opensquirrel.common import ATOL, normalize_angle, normalize_angles
+from opensquirrel.ir import Axis, Gate, Qubit
 from opensquirrel.ir.single_qubit_gate import SingleQubitGate
 from opensquirrel.passes.decomposer import ZXZDecomposer
+from opensquirrel.passes.decomposer.decomposition_memo import memoize_decomposition, memoize_decompositions
 from opensquirrel.passes.decomposer.general_decomposer import Decomposer
 
+# The kinds of decompositions of single-qubit gates of `McKayDecomposer.decompose_gates`
+_KEEP, _IDENTITY, _Z_ROTATION, _ROTATION = range(4)
+
 
 class McKayDecomposer(Decomposer):
+    @memoize_decomposition
     def decompose(self, instruction: Gate) -> list[Gate]:
         """Decomposes a single-qubit gate using the McKay decomposition into a sequence of (at most)
         5 single-qubit gates; according tot the pattern Rz-Rx(pi/2)-Rz-Rx(pi/2)-Rz, where the angles
@@ -42,19 +51,8 @@ class McKayDecomposer(Decomposer):
             return [Rz(gate.qubit, rz_angle)]
 
         zxz_decomposition = ZXZDecomposer().decompose(gate)
-        zxz_angle = 0.0
-        if len(zxz_decomposition) >= 2:
-            zxz_angle = next(
-                gate.bsr.angle
-                for gate in zxz_decomposition
-                if isinstance(gate, SingleQubitGate) and gate.bsr.axis == Axis(1, 0, 0)
-            )
-
-        if abs(zxz_angle - pi / 2) < ATOL:
-            return [
-                X90(gate.qubit) if isinstance(gate, SingleQubitGate) and gate.bsr.axis == Axis(1, 0, 0) else gate
-                for gate in zxz_decomposition
-            ]
+        if _has_x90_rotation(zxz_decomposition):
+            return _with_x90_rotation(zxz_decomposition)
 
         # McKay decomposition
         za_mod = sqrt(cos(gate.bsr.angle / 2) ** 2 + (gate.bsr.axis[2] * sin(gate.bsr.angle / 2)) ** 2)
@@ -72,22 +70,136 @@ class McKayDecomposer(Decomposer):
         phi = normalize_angle(phi)
         theta = normalize_angle(theta)
 
-        decomposed_g: list[Gate] = []
+        return _mckay_gates(gate.qubit, lam, theta, phi)
+
+    @memoize_decompositions
+    def decompose_gates(self, gates: Sequence[Gate]) -> list[list[Gate]]:
+        """Decomposes the single-qubit gates at once, of which the angles of the Rz gates are determined in a single
+        vectorized pass over the axes and angles of their Bloch sphere rotations.
+
+        Args:
+            gates: The gates to decompose, in order.
+
+        Returns:
+            The McKay decomposition of each single-qubit gate, and the other gates as they are.
 
-        if abs(theta) < ATOL and lam == phi:
-            decomposed_g.extend((X90(gate.qubit), X90(gate.qubit)))
-            return decomposed_g
+        """
+        single_qubit_gates = [gate for gate in gates if isinstance(gate, SingleQubitGate)]
+        bsrs = [gate.bsr for gate in single_qubit_gates]
+        axes = np.array([bsr.axis.value for bsr in bsrs], dtype=np.float64).reshape(-1, 3)
+        angles = np.array([bsr.angle for bsr in bsrs], dtype=np.float64)
+        phases = np.array([bsr.phase for bsr in bsrs], dtype=np.float64)
+        # The kind of decomposition of each single-qubit gate: the gate itself, I, Rz, or a ZXZ or McKay decomposition
+        kinds = np.select(
+            [_are_x90(axes, angles, phases), np.abs(angles) < ATOL, (axes[:, 0] == 0) & (axes[:, 1] == 0)],
+            [_KEEP, _IDENTITY, _Z_ROTATION],
+            _ROTATION,
+        )
+        is_rotation = kinds == _ROTATION
+        rz_angles = (angles * axes[:, 2]).tolist()
+        mckay_angles = iter(_mckay_angles(axes[is_rotation], angles[is_rotation]).tolist())
+        rotation_gates = [gate for gate, rotation in zip(single_qubit_gates, is_rotation, strict=True) if rotation]
+        zxz_decompositions = iter(ZXZDecomposer().decompose_gates(rotation_gates))
+
+        decompositions: list[list[Gate]] = []
+        properties = iter(zip(kinds.tolist(), rz_angles, strict=True))
+        for gate in gates:
+            if not isinstance(gate, SingleQubitGate):
+                decompositions.append([gate])
+                continue
+            kind, rz_angle = next(properties)
+            if kind == _KEEP:
+                decompositions.append([gate])
+            elif kind == _IDENTITY:
+                decompositions.append([I(gate.qubit)])
+            elif kind == _Z_ROTATION:
+                decompositions.append([Rz(gate.qubit, rz_angle)])
+            else:
+                zxz_decomposition, (lam, theta, phi) = next(zxz_decompositions), next(mckay_angles)
+                if _has_x90_rotation(zxz_decomposition):
+                    decompositions.append(_with_x90_rotation(zxz_decomposition))
+                else:
+                    decompositions.append(_mckay_gates(gate.qubit, lam, theta, phi))
+        return decompositions
+
+
+def _are_x90(axes: NDArray[np.float64], angles: NDArray[np.float64], phases: NDArray[np.float64]) -> NDArray[np.bool_]:
+    """Checks which Bloch sphere rotations are equal to the rotation of the X90 gate, element-wise, as
+    `BlochSphereRotation.__eq__`."""
+    x90 = X90(0).bsr
+    has_same_axis = np.isclose(axes, x90.axis.value, atol=ATOL).all(axis=-1)
+    has_opposite_axis = np.isclose(axes, -x90.axis.value, atol=ATOL).all(axis=-1)
+    return np.where(
+        has_same_axis,
+        (np.abs(angles - x90.angle) < ATOL) & (np.abs(phases - x90.phase) < ATOL),
+        has_opposite_axis & (np.abs(angles + x90.angle) < ATOL) & (np.abs(phases + x90.phase) < ATOL),
+    )
+
+
+def _has_x90_rotation(zxz_decomposition: list[Gate]) -> bool:
+    """Checks whether the Rx rotation of a ZXZ decomposition is an X90 gate (up to a global phase)."""
+    zxz_angle = 0.0
+    if len(zxz_decomposition) >= 2:
+        zxz_angle = next(
+            gate.bsr.angle
+            for gate in zxz_decomposition
+            if isinstance(gate, SingleQubitGate) and gate.bsr.axis == Axis(1, 0, 0)
+        )
+    return abs(zxz_angle - pi / 2) < ATOL
+
+
+def _with_x90_rotation(zxz_decomposition: list[Gate]) -> list[Gate]:
+    return [
+        X90(gate.qubit) if isinstance(gate, SingleQubitGate) and gate.bsr.axis == Axis(1, 0, 0) else gate
+        for gate in zxz_decomposition
+    ]
+
+
+def _mckay_angles(axes: NDArray[np.float64], angles: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Determines the (normalized) angles $\\lambda$, $\\theta$ and $\\phi$ of the Rz gates of the McKay
+    decompositions of multiple Bloch sphere rotations, element-wise, as `McKayDecomposer.decompose`.
+
+    Args:
+        axes: The (normalized) axes of the Bloch sphere rotations, of shape (m, 3).
+        angles: The angles of the Bloch sphere rotations, of shape (m,).
+
+    Returns:
+        The angles $\\lambda$, $\\theta$ and $\\phi$ of each rotation, of shape (m, 3).
+
+    """
+    cos_half_angles, sin_half_angles = np.cos(angles / 2), np.sin(angles / 2)
+    za_mod = np.sqrt(cos_half_angles**2 + (axes[:, 2] * sin_half_angles) ** 2)
+    zb_mod = np.abs(sin_half_angles) * np.sqrt(axes[:, 0] ** 2 + axes[:, 1] ** 2)
+
+    theta = pi - 2 * np.arctan2(zb_mod, za_mod)
+
+    alpha = np.arctan2(-sin_half_angles * axes[:, 2], cos_half_angles)
+    beta = np.arctan2(-sin_half_angles * axes[:, 0], -sin_half_angles * axes[:, 1])
+
+    lam = beta - alpha
+    phi = -beta - alpha - pi
+    return np.stack([normalize_angles(lam), normalize_angles(theta), normalize_angles(phi)], axis=-1)
+
+
+def _mckay_gates(qubit: Qubit, lam: float, theta: float, phi: float) -> list[Gate]:
+    """The gates of the McKay decomposition Rz($\\lambda$)-X90-Rz($\\theta$)-X90-Rz($\\phi$), without the Rz gates
+    of which the angle is zero."""
+    decomposed_g: list[Gate] = []
+
+    if abs(theta) < ATOL and lam == phi:
+        decomposed_g.extend((X90(qubit), X90(qubit)))
+        return decomposed_g
 
-        if abs(lam) > ATOL:
-            decomposed_g.append(Rz(gate.qubit, lam))
-        decomposed_g.append(X90(gate.qubit))
+    if abs(lam) > ATOL:
+        decomposed_g.append(Rz(qubit, lam))
+    decomposed_g.append(X90(qubit))
 
-        if abs(theta) > ATOL:
-            decomposed_g.append(Rz(gate.qubit, theta))
+    if abs(theta) > ATOL:
+        decomposed_g.append(Rz(qubit, theta))
 
-        decomposed_g.append(X90(gate.qubit))
+    decomposed_g.append(X90(qubit))
 
-        if abs(phi) > ATOL:
-            decomposed_g.append(Rz(gate.qubit, phi))
+    if abs(phi) > ATOL:
+        decomposed_g.append(Rz(qubit, phi))
 
-        return decomposed_g
+    return decomposed_g
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from opensquirrel import CNOT, H, Rz, S, SDagger
+from opensquirrel.passes.decomposer.general_decomposer import Decomposer
+
+if TYPE_CHECKING:
+    from opensquirrel.ir import Gate
+
+
+class ParametricDecomposer(Decomposer):
+    def decompose(self, instruction: Gate) -> list[Gate]:
+        """Decomposes a gate with symbolic parameters into fixed (non-parametric) gates and Rz gates
+        whose angles are the parameter expressions of the original gate. Since the fixed gates are known
+        at compile time, they can be decomposed further by any other decomposer, whereas the symbolic
+        Rz gates are left untouched until the parameters are bound.
+
+        Note:
+            The decomposition of the CR gate follows the textbook definition of the controlled phase
+            gate, $\\text{diag}(1, 1, 1, e^{i\\theta})$. This equals the numeric CR gate, whose angle
+            and phase are normalized together, for any value of $\\theta$.
+
+        Args:
+            instruction: Parametric gate to decompose.
+
+        Returns:
+            A sequence of fixed gates and symbolic Rz gates, or the instruction itself if it is not parametric
+            or already a symbolic Rz gate.
+
+        """
+        if not instruction.is_parametric or instruction.name not in ("Rx", "Ry", "U", "CR"):
+            return [instruction]
+
+        gate = instruction
+        arguments = gate.parametric.arguments  # ty: ignore[possibly-missing-attribute]
+
+        if gate.name == "CR":
+            control_qubit, target_qubit = gate.qubit_operands
+            (theta,) = arguments
+            return [
+                Rz(target_qubit, theta / 2),  # ty: ignore[unsupported-operator]
+                CNOT(control_qubit, target_qubit),
+                Rz(target_qubit, -theta / 2),  # ty: ignore[unsupported-operator]
+                CNOT(control_qubit, target_qubit),
+                Rz(control_qubit, theta / 2),  # ty: ignore[unsupported-operator]
+            ]
+
+        qubit = gate.qubit_operands[0]
+        if gate.name == "Rx":
+            (theta,) = arguments
+            return [H(qubit), Rz(qubit, theta), H(qubit)]  # ty: ignore[invalid-argument-type]
+        if gate.name == "Ry":
+            (theta,) = arguments
+            return [SDagger(qubit), H(qubit), Rz(qubit, theta), H(qubit), S(qubit)]  # ty: ignore[invalid-argument-type]
+
+        theta, phi, lmbda = arguments
+        return [
+            Rz(qubit, lmbda),  # ty: ignore[invalid-argument-type]
+            SDagger(qubit),
+            H(qubit),
+            Rz(qubit, theta),  # ty: ignore[invalid-argument-type]
+            H(qubit),
+            S(qubit),
+            Rz(qubit, phi),  # ty: ignore[invalid-argument-type]
+        ]
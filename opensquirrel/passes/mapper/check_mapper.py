@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from collections import OrderedDict
-from copy import deepcopy
 
 from opensquirrel.circuit import Circuit
 from opensquirrel.ir import IR, Measure
@@ -29,7 +28,7 @@ def _check_scenario(circuit: Circuit, mapper: Mapper) -> None:
         mapper: Mapper to use.
 
     """
-    ir_copy = deepcopy(circuit.ir)
+    ir_copy = circuit.ir.snapshot()
     circuit.map(mapper)
     assert circuit.ir == ir_copy, "A Mapper pass should not change the IR"
 
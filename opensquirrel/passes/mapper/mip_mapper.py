@@ -139,7 +139,7 @@ class MIPMapper(Mapper):
     @staticmethod
     def _get_reference_counter(ir: IR, num_virtual_qubits: int) -> list[list[int]]:
         reference_counter = [[0 for _ in range(num_virtual_qubits)] for _ in range(num_virtual_qubits)]
-        for statement in ir.statements:
+        for statement in ir.statements_view:
             if isinstance(statement, TwoQubitGate):
                 qubit_operands = statement.qubit_operands
                 if len(qubit_operands) == 2:
@@ -129,7 +129,7 @@ class QGymMapper(Mapper):
             NetworkX graph representation of the quantum circuit, compatible with QGym.
         """
         interaction_graph = nx.Graph()
-        for statement in ir.statements:
+        for statement in ir.statements_view:
             if not isinstance(statement, Instruction):
                 continue
             qubit_indices = statement.qubit_indices
@@ -1,10 +1,14 @@
+from collections.abc import Iterable
+
 from opensquirrel.circuit import Circuit
 from opensquirrel.ir import (
     IR,
     Barrier,
+    Instruction,
     IRVisitor,
     NonUnitary,
     Qubit,
+    Statement,
     Wait,
 )
 from opensquirrel.ir.single_qubit_gate import SingleQubitGate
@@ -32,30 +36,32 @@ class _QubitRemapper(IRVisitor):
         self.mapping = mapping
 
     def visit_qubit(self, qubit: Qubit) -> Qubit:
-        qubit.index = self.mapping[qubit.index]
-        return qubit
+        return Qubit(self.mapping[qubit.index])
 
     def visit_non_unitary(self, non_unitary: NonUnitary) -> NonUnitary:
-        non_unitary.qubit.accept(self)
-        return non_unitary
+        return non_unitary.with_remapped_qubits(self.mapping.data)
 
     def visit_barrier(self, barrier: Barrier) -> Barrier:
-        barrier.qubit.accept(self)
-        return barrier
+        return barrier.with_remapped_qubits(self.mapping.data)
 
     def visit_wait(self, wait: Wait) -> Wait:
-        wait.qubit.accept(self)
-        return wait
+        return wait.with_remapped_qubits(self.mapping.data)
 
     def visit_single_qubit_gate(self, gate: SingleQubitGate) -> SingleQubitGate:
-        gate.qubit.accept(self)
-        return gate
+        return gate.with_remapped_qubits(self.mapping.data)
 
     def visit_two_qubit_gate(self, gate: TwoQubitGate) -> TwoQubitGate:
-        for operand in gate.qubit_operands:
-            operand.accept(self)
+        return gate.with_remapped_qubits(self.mapping.data)
+
 
-        return gate
+def _remap_statements(statements: Iterable[Statement], mapping: Mapping) -> list[Statement]:
+    """Remaps the statements, which are replaced by remapped copies, such that statements that are shared with
+    snapshots of the IR are left unchanged."""
+    qubit_remapper = _QubitRemapper(mapping)
+    return [
+        statement.accept(qubit_remapper) if isinstance(statement, Instruction) else statement
+        for statement in statements
+    ]
 
 
 def get_remapped_ir(circuit: Circuit, mapping: Mapping) -> IR:
@@ -74,10 +80,8 @@ def get_remapped_ir(circuit: Circuit, mapping: Mapping) -> IR:
             f"size of the mapping {len(mapping)!r} is larger than the number of qubits {circuit.qubit_register_size!r}"
         )
         raise ValueError(msg)
-    qubit_remapper = _QubitRemapper(mapping)
-    replacement_ir = circuit.ir
-    for statement in replacement_ir.statements:
-        statement.accept(qubit_remapper)
+    replacement_ir = IR()
+    replacement_ir.statements = _remap_statements(circuit.ir.statements_view, mapping)
     return replacement_ir
 
 
@@ -94,6 +98,4 @@ def remap_ir(circuit: Circuit, mapping: Mapping) -> None:
             f"size of the mapping {len(mapping)!r} is larger than the number of qubits {circuit.qubit_register_size!r}"
         )
         raise ValueError(msg)
-    qubit_remapper = _QubitRemapper(mapping)
-    for statement in circuit.ir.statements:
-        statement.accept(qubit_remapper)
+    circuit.ir.statements = _remap_statements(circuit.ir.statements_view, mapping)
@@ -14,7 +14,7 @@ def make_interaction_graph(ir: IR) -> nx.Graph:
 
     """
     interaction_graph = nx.Graph()
-    gates = (statement for statement in ir.statements if isinstance(statement, Gate))
+    gates = (statement for statement in ir.statements_view if isinstance(statement, Gate))
 
     for gate in gates:
         target_qubits = gate.qubit_operands
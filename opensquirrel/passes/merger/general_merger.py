@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from typing import Any, cast
 
 from opensquirrel.ir import IR, Barrier, Instruction, Statement
@@ -54,11 +55,11 @@ def can_move_before(statement: Statement, statement_group: list[Statement]) -> b
     return can_move_statement_before_barrier(instruction, cast("list[Instruction]", statement_group))
 
 
-def group_linked_barriers(statements: list[Statement]) -> list[list[Statement]]:
+def group_linked_barriers(statements: Iterable[Statement]) -> list[list[Statement]]:
     """Groups linked barriers in the input list of statements.
 
     Args:
-        statements (list[Statement]): The list of statements.
+        statements (Iterable[Statement]): The statements.
 
     Returns:
         A list of 'lists of statements', which are either single instructions or linked barriers.
@@ -89,7 +90,7 @@ def rearrange_barriers(ir: IR) -> None:
         ir (IR): The input IR to be modified.
 
     """
-    statements_groups = group_linked_barriers(ir.statements)
+    statements_groups = group_linked_barriers(ir.statements_view)
     for i, statement_group in enumerate(statements_groups):
         statement = statement_group[0]
         if not isinstance(statement, Barrier):
@@ -2,7 +2,7 @@ from collections.abc import Iterable
 from typing import cast
 
 from opensquirrel import I
-from opensquirrel.ir import IR, AsmDeclaration, Barrier, Instruction, Qubit
+from opensquirrel.ir import IR, AsmDeclaration, Barrier, Instruction, Qubit, Statement
 from opensquirrel.ir.single_qubit_gate import SingleQubitGate
 from opensquirrel.passes.merger.general_merger import Merger
 
@@ -11,45 +11,45 @@ class SingleQubitGatesMerger(Merger):
     def merge(self, ir: IR, qubit_register_size: int) -> None:
         """Merge all consecutive single-qubit gates in the circuit.
 
+        The statements are merged in a single pass, which emits a new list of statements, such that inserting an
+        accumulated Bloch sphere rotation costs O(1).
+
         Args:
             ir (IR): Intermediate representation of the circuit.
             qubit_register_size (int): Size of the qubit register
 
         """
-        accumulators_per_qubit: dict[Qubit, SingleQubitGate] = {
-            Qubit(qubit_index): I(qubit_index) for qubit_index in range(qubit_register_size)
-        }
-
-        statement_index = 0
-        while statement_index < len(ir.statements):
-            statement = ir.statements[statement_index]
-
-            # Accumulate consecutive Bloch sphere rotations
+        statements: list[Statement] = []
+        accumulators_per_qubit: dict[Qubit, SingleQubitGate] = {}
+
+        def insert_accumulated_bloch_sphere_rotations(qubits: Iterable[Qubit]) -> None:
+            for qubit in qubits:
+                accumulated_bloch_sphere_rotation = accumulators_per_qubit.pop(qubit, None)
+                if (
+                    accumulated_bloch_sphere_rotation is not None
+                    and not accumulated_bloch_sphere_rotation.is_identity()
+                ):
+                    statements.append(accumulated_bloch_sphere_rotation)
+
+        def insert_all_accumulated_bloch_sphere_rotations() -> None:
+            insert_accumulated_bloch_sphere_rotations(sorted(accumulators_per_qubit, key=lambda qubit: qubit.index))
+
+        for statement in ir.statements_view:
+            # Accumulate consecutive Bloch sphere rotations, parametric gates act as a boundary
             instruction: Instruction = cast("Instruction", statement)
-            if isinstance(instruction, SingleQubitGate):
-                already_accumulated = accumulators_per_qubit[instruction.qubit]
-                composed = already_accumulated * instruction
-                accumulators_per_qubit[instruction.qubit] = composed
-                del ir.statements[statement_index]
+            if isinstance(instruction, SingleQubitGate) and not instruction.is_parametric:
+                already_accumulated = accumulators_per_qubit.get(instruction.qubit) or I(instruction.qubit)
+                accumulators_per_qubit[instruction.qubit] = already_accumulated * instruction
                 continue
 
-            def insert_accumulated_bloch_sphere_rotations(qubits: Iterable[Qubit]) -> None:
-                nonlocal statement_index
-                for qubit in qubits:
-                    if not accumulators_per_qubit[qubit].is_identity():
-                        ir.statements.insert(statement_index, accumulators_per_qubit[qubit])
-                        accumulators_per_qubit[qubit] = I(qubit)
-                        statement_index += 1
-
             # For barrier directives, insert all accumulated Bloch sphere rotations
             # For other instructions, insert accumulated Bloch sphere rotations on qubits used by those instructions
-            # In any case, reset the dictionary entry for the inserted accumulated Bloch sphere rotations
+            # In any case, remove the dictionary entry for the inserted accumulated Bloch sphere rotations
             if isinstance(instruction, Barrier) or isinstance(statement, AsmDeclaration):
-                insert_accumulated_bloch_sphere_rotations([Qubit(i) for i in range(qubit_register_size)])
+                insert_all_accumulated_bloch_sphere_rotations()
             else:
                 insert_accumulated_bloch_sphere_rotations(instruction.qubit_operands)
-            statement_index += 1
+            statements.append(statement)
 
-        for accumulated_bloch_sphere_rotation in accumulators_per_qubit.values():
-            if not accumulated_bloch_sphere_rotation.is_identity():
-                ir.statements.append(accumulated_bloch_sphere_rotation)
+        insert_all_accumulated_bloch_sphere_rotations()
+        ir.statements = statements
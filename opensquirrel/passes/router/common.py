@@ -89,7 +89,7 @@ class ProcessSwaps:
         planned_swaps: dict[int, SWAP] = {}
         temp_mapping = initial_mapping.copy()
 
-        for statement_index, statement in enumerate(ir.statements):
+        for statement_index, statement in enumerate(ir.statements_view):
             if isinstance(statement, TwoQubitGate):
                 q0, q1 = statement.qubit_operands
                 physical_q0_index = temp_mapping[q0.index]
@@ -127,15 +127,14 @@ class ProcessSwaps:
         new_ir_statements: list[Statement] = []
         new_mapping = initial_mapping.copy()
 
-        for statement in ir.statements:
+        for statement in ir.statements_view:
             while len(new_ir_statements) in planned_swaps:
                 swap_gate = planned_swaps[len(new_ir_statements)]
                 ProcessSwaps._update_mapping_for_swap(new_mapping, swap_gate.qubit_indices)
                 new_ir_statements.append(swap_gate)
 
             if isinstance(statement, Instruction):
-                for qubit in statement.qubit_operands:
-                    qubit.index = new_mapping[qubit.index]
+                statement = statement.with_remapped_qubits(new_mapping)
 
             new_ir_statements.append(statement)
         return new_ir_statements
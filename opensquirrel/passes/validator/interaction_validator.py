@@ -22,7 +22,7 @@ class InteractionValidator(Validator):
 
         """
         non_executable_interactions = []
-        for statement in ir.statements:
+        for statement in ir.statements_view:
             if not isinstance(statement, TwoQubitGate):
                 continue
             qubit_index_pairs = itertools.pairwise(statement.qubit_indices)
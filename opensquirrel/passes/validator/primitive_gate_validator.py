@@ -21,7 +21,7 @@ class PrimitiveGateValidator(Validator):
         """
         gates_not_in_primitive_gate_set = [
             statement.name
-            for statement in ir.statements
+            for statement in ir.statements_view
             if isinstance(statement, Instruction) and statement.name not in self.primitive_gate_set
         ]
         if gates_not_in_primitive_gate_set:
@@ -0,0 +1,36 @@
+from opensquirrel.simulator.clifford_tableau import CliffordTableau
+from opensquirrel.simulator.density_matrix_simulator import (
+    DensityMatrixSimulator,
+    sample_density_matrix,
+    simulate_density_matrix,
+)
+from opensquirrel.simulator.mps_simulator import MPSSimulator, sample_mps, simulate_mps
+from opensquirrel.simulator.parameter_sweep import ParameterSweepSimulator, simulate_sweep
+from opensquirrel.simulator.stabilizer_simulator import (
+    StabilizerSimulator,
+    get_clifford_tableau,
+    is_clifford_circuit,
+    sample_stabilizer,
+    simulate_stabilizer,
+)
+from opensquirrel.simulator.statevector_simulator import StatevectorSimulator, sample, simulate
+
+__all__ = [
+    "CliffordTableau",
+    "DensityMatrixSimulator",
+    "MPSSimulator",
+    "ParameterSweepSimulator",
+    "StabilizerSimulator",
+    "StatevectorSimulator",
+    "get_clifford_tableau",
+    "is_clifford_circuit",
+    "sample",
+    "sample_density_matrix",
+    "sample_mps",
+    "sample_stabilizer",
+    "simulate",
+    "simulate_density_matrix",
+    "simulate_mps",
+    "simulate_stabilizer",
+    "simulate_sweep",
+]
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from opensquirrel.common import ATOL
+
+PAULI_IMAGES_CACHE_SIZE = 1024
+
+
+class PauliImages(NamedTuple):
+    """The images $C P C^\\dagger = i^e X^a Z^b$ of the generators $P = X_0, Z_0, X_1, Z_1, ...$ of the Pauli group of
+    $k$ qubits under conjugation by a Clifford unitary $C$. The generators are in the order of the qubit operands.
+
+    Attributes:
+        phases: The exponents $e$ of the phases $i^e$, with shape $(2k,)$.
+        x: The X-parts $a$ of the images, with shape $(2k, k)$.
+        z: The Z-parts $b$ of the images, with shape $(2k, k)$.
+    """
+
+    phases: NDArray[np.int64]
+    x: NDArray[np.bool_]
+    z: NDArray[np.bool_]
+
+
+@lru_cache(maxsize=4)
+def _get_pauli_basis(number_of_qubits: int) -> tuple[NDArray[np.complex128], NDArray[np.bool_], NDArray[np.bool_]]:
+    """Get the $4^k$ Pauli products $X^a Z^b$ on $k$ qubits, where the first qubit corresponds to the most
+    significant bit of the matrix indices (following the gate matrix convention).
+    """
+    single_qubit_paulis = {
+        (False, False): np.eye(2, dtype=np.complex128),
+        (True, False): np.array([[0, 1], [1, 0]], dtype=np.complex128),
+        (False, True): np.array([[1, 0], [0, -1]], dtype=np.complex128),
+        (True, True): np.array([[0, -1], [1, 0]], dtype=np.complex128),
+    }
+    matrices, xs, zs = [], [], []
+    for index in range(1 << (2 * number_of_qubits)):
+        x = tuple(bool((index >> (2 * j)) & 1) for j in range(number_of_qubits))
+        z = tuple(bool((index >> (2 * j + 1)) & 1) for j in range(number_of_qubits))
+        matrix = np.eye(1, dtype=np.complex128)
+        for x_j, z_j in zip(x, z, strict=True):
+            matrix = np.kron(matrix, single_qubit_paulis[x_j, z_j])
+        matrices.append(matrix)
+        xs.append(x)
+        zs.append(z)
+    return np.asarray(matrices), np.asarray(xs, dtype=np.bool_), np.asarray(zs, dtype=np.bool_)
+
+
+@lru_cache(maxsize=PAULI_IMAGES_CACHE_SIZE)
+def _get_pauli_images(matrix_bytes: bytes, dimension: int) -> PauliImages | None:
+    unitary = np.frombuffer(matrix_bytes, dtype=np.complex128).reshape(dimension, dimension)
+    number_of_qubits = dimension.bit_length() - 1
+    paulis, pauli_xs, pauli_zs = _get_pauli_basis(number_of_qubits)
+
+    phases = np.zeros(2 * number_of_qubits, dtype=np.int64)
+    xs = np.zeros((2 * number_of_qubits, number_of_qubits), dtype=np.bool_)
+    zs = np.zeros((2 * number_of_qubits, number_of_qubits), dtype=np.bool_)
+    for generator in range(2 * number_of_qubits):
+        qubit, is_z = divmod(generator, 2)
+        generator_index = 1 << (2 * qubit + is_z)
+        image = unitary @ paulis[generator_index] @ unitary.conj().T
+        coefficients = np.einsum("pij,ij->p", paulis.conj(), image) / dimension
+        pauli_index = int(np.argmax(np.abs(coefficients)))
+        coefficient = coefficients[pauli_index]
+        phase = round(np.angle(coefficient) / (np.pi / 2)) % 4
+        coefficients[pauli_index] -= 1j**phase
+        if np.linalg.norm(coefficients) > ATOL:
+            return None
+        phases[generator] = phase
+        xs[generator] = pauli_xs[pauli_index]
+        zs[generator] = pauli_zs[pauli_index]
+
+    for array in (phases, xs, zs):
+        array.setflags(write=False)
+    return PauliImages(phases, xs, zs)
+
+
+def get_pauli_images(matrix: ArrayLike) -> PauliImages | None:
+    """Get the images of the Pauli generators under conjugation by a unitary, if it is a Clifford unitary.
+
+    A unitary is a Clifford unitary if it maps every Pauli product to a Pauli product (up to a sign), under
+    conjugation. The results are cached per (rounded) matrix.
+
+    Args:
+        matrix (ArrayLike): A $2^k\\times 2^k$ unitary matrix, following the gate matrix convention, _i.e._, the
+            first qubit operand corresponds to the most significant bit.
+
+    Returns:
+        The images of the Pauli generators if the unitary is a Clifford unitary, None otherwise.
+
+    """
+    unitary = np.round(np.asarray(matrix, dtype=np.complex128), 12) + 0.0
+    return _get_pauli_images(unitary.tobytes(), unitary.shape[0])
+
+
+def _g(x1: NDArray[np.bool_], z1: NDArray[np.bool_], x2: NDArray[np.bool_], z2: NDArray[np.bool_]) -> NDArray[np.int64]:
+    """The exponent of $i$ that results from multiplying the Paulis $(x_1, z_1)$ and $(x_2, z_2)$, per qubit."""
+    x1, z1, x2, z2 = (np.asarray(a, dtype=np.int64) for a in (x1, z1, x2, z2))
+    return np.where(
+        (x1 == 1) & (z1 == 1),
+        z2 - x2,
+        np.where(x1 == 1, z2 * (2 * x2 - 1), np.where(z1 == 1, x2 * (1 - 2 * z2), 0)),
+    )
+
+
+def _rowsum(
+    x: NDArray[np.bool_], z: NDArray[np.bool_], r: NDArray[np.bool_], targets: NDArray[np.intp], source: int
+) -> None:
+    """Multiply, in place, the target rows by the source row, _i.e._, the rowsum operation of Aaronson and Gottesman."""
+    if len(targets) == 0:
+        return
+    # Only the qubits on which the source row is not the identity contribute, which are typically few.
+    support = np.flatnonzero(x[source] | z[source])
+    target_x, target_z = x[np.ix_(targets, support)], z[np.ix_(targets, support)]
+    exponents = np.sum(_g(x[source, support], z[source, support], target_x, target_z), axis=1)
+    total = 2 * r[targets].astype(np.int64) + 2 * int(r[source]) + exponents
+    r[targets] = total % 4 == 2
+    x[np.ix_(targets, support)] = target_x ^ x[source, support]
+    z[np.ix_(targets, support)] = target_z ^ z[source, support]
+
+
+class CliffordTableau:
+    """The stabilizer tableau of a stabilizer state of $n$ qubits, following Aaronson and Gottesman,
+    "Improved simulation of stabilizer circuits" (Phys. Rev. A 70, 052328, 2004).
+
+    Rows $0$ to $n - 1$ are the destabilizer generators and rows $n$ to $2n - 1$ the stabilizer generators. Every row
+    is a Hermitian Pauli product $(-1)^r \\prod_j i^{x_j z_j} X_j^{x_j} Z_j^{z_j}$. The initial tableau is the one of
+    the $|0\\dots 0\\rangle$ state, _i.e._, with destabilizers $X_j$ and stabilizers $Z_j$. Since the rows of this
+    tableau are the images of the generators $X_j$ and $Z_j$ under the applied Clifford unitary, two Clifford circuits
+    are equal up to a global phase if and only if they result in the same tableau.
+
+    Args:
+        qubit_register_size (int): The number of qubits $n$.
+
+    """
+
+    def __init__(self, qubit_register_size: int) -> None:
+        self.qubit_register_size = qubit_register_size
+        # Column-major, since gates act on (a few) columns of all rows.
+        self.x = np.zeros((2 * qubit_register_size, qubit_register_size), dtype=np.bool_, order="F")
+        self.z = np.zeros((2 * qubit_register_size, qubit_register_size), dtype=np.bool_, order="F")
+        self.r = np.zeros(2 * qubit_register_size, dtype=np.bool_)
+        self.x[range(qubit_register_size), range(qubit_register_size)] = True
+        self.z[range(qubit_register_size, 2 * qubit_register_size), range(qubit_register_size)] = True
+
+    def copy(self) -> CliffordTableau:
+        tableau = CliffordTableau(0)
+        tableau.qubit_register_size = self.qubit_register_size
+        tableau.x, tableau.z, tableau.r = self.x.copy(order="F"), self.z.copy(order="F"), self.r.copy()
+        return tableau
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CliffordTableau):
+            return False
+        return np.array_equal(self.x, other.x) and np.array_equal(self.z, other.z) and np.array_equal(self.r, other.r)
+
+    def apply(self, images: PauliImages, qubit_indices: Sequence[int]) -> None:
+        """Conjugate all rows of the tableau by a Clifford unitary acting on the given qubits.
+
+        Args:
+            images (PauliImages): The images of the Pauli generators under the Clifford unitary.
+            qubit_indices (Sequence[int]): The qubit operands of the Clifford unitary. Order matters.
+
+        """
+        # The columns of the operands, and the phase exponents (mod 4) of the rows, with uint8 arithmetic, which is
+        # exact modulo 4.
+        x = [self.x[:, qubit].copy() for qubit in qubit_indices]
+        z = [self.z[:, qubit].copy() for qubit in qubit_indices]
+        phases = 2 * self.r.view(np.uint8)
+        for x_j, z_j in zip(x, z, strict=True):
+            phases += x_j & z_j
+
+        image_x = [np.zeros_like(x_j) for x_j in x]
+        image_z = [np.zeros_like(z_j) for z_j in z]
+        for generator, (generator_phase, generator_x, generator_z) in enumerate(zip(*images, strict=True)):
+            operand, is_z = divmod(generator, 2)
+            rows = z[operand] if is_z else x[operand]
+            sign = np.zeros_like(rows)
+            for image_z_j in (image_z_j for image_z_j, x_j in zip(image_z, generator_x, strict=True) if x_j):
+                sign ^= image_z_j
+            phases += np.uint8(generator_phase) * rows.view(np.uint8)
+            phases += np.uint8(2) * (sign & rows).view(np.uint8)
+            for image_x_j in (image_x_j for image_x_j, x_j in zip(image_x, generator_x, strict=True) if x_j):
+                image_x_j ^= rows
+            for image_z_j in (image_z_j for image_z_j, z_j in zip(image_z, generator_z, strict=True) if z_j):
+                image_z_j ^= rows
+
+        for qubit, image_x_j, image_z_j in zip(qubit_indices, image_x, image_z, strict=True):
+            phases -= image_x_j & image_z_j
+            self.x[:, qubit] = image_x_j
+            self.z[:, qubit] = image_z_j
+        self.r = (phases & 2) != 0
+
+    def is_deterministic(self, qubit: int) -> bool:
+        """Whether the outcome of a measurement of the qubit along the Z axis is deterministic."""
+        return not np.any(self.x[self.qubit_register_size :, qubit])
+
+    def measure(self, qubit: int, rng: np.random.Generator, outcome: int | None = None) -> int:
+        """Measure the qubit along the Z axis, and collapse the state accordingly.
+
+        Args:
+            qubit (int): The index of the qubit to measure.
+            rng (np.random.Generator): The random number generator to sample a random outcome with.
+            outcome (int | None): The outcome to collapse to if the outcome is random, instead of sampling it.
+                Default is `None`.
+
+        Returns:
+            The measurement outcome.
+
+        """
+        n = self.qubit_register_size
+        (stabilizers,) = np.nonzero(self.x[n:, qubit])
+        if len(stabilizers) > 0:
+            pivot = n + int(stabilizers[0])
+            targets = np.flatnonzero(self.x[:, qubit])
+            _rowsum(self.x, self.z, self.r, targets[targets != pivot], pivot)
+            self.x[pivot - n], self.z[pivot - n], self.r[pivot - n] = self.x[pivot], self.z[pivot], self.r[pivot]
+            self.x[pivot], self.z[pivot] = False, False
+            self.z[pivot, qubit] = True
+            self.r[pivot] = bool(rng.integers(2)) if outcome is None else bool(outcome)
+            return int(self.r[pivot])
+
+        # Deterministic outcome: the sign of the product of the stabilizers that make up Z_qubit.
+        x, z, phase = np.zeros(n, dtype=np.bool_), np.zeros(n, dtype=np.bool_), 0
+        for stabilizer in n + np.flatnonzero(self.x[:n, qubit]):
+            phase += 2 * int(self.r[stabilizer]) + int(np.sum(_g(self.x[stabilizer], self.z[stabilizer], x, z)))
+            x ^= self.x[stabilizer]
+            z ^= self.z[stabilizer]
+        return int(phase % 4 == 2)
+
+    def get_z_outcomes_affine_space(self) -> tuple[NDArray[np.bool_], NDArray[np.bool_]]:
+        """Get the outcomes of a measurement of all qubits along the Z axis, which are uniformly distributed over an
+        affine subspace of $\\mathbb{F}_2^n$.
+
+        Returns:
+            A particular outcome (of shape $(n,)$) and a basis of the linear subspace (of shape $(f, n)$), such that
+            the possible outcomes are the particular outcome plus any combination of the basis vectors.
+
+        """
+        n = self.qubit_register_size
+        x, z, r = self.x[n:].copy(), self.z[n:].copy(), self.r[n:].copy()
+
+        # Eliminate the X-parts, the remaining Z-only stabilizers (-1)^r Z^z impose the parity constraints z.s = r.
+        used = np.zeros(n, dtype=np.bool_)
+        for column in range(n):
+            candidates = np.flatnonzero(x[:, column] & ~used)
+            if len(candidates) == 0:
+                continue
+            pivot = int(candidates[0])
+            used[pivot] = True
+            targets = np.flatnonzero(x[:, column])
+            _rowsum(x, z, r, targets[targets != pivot], pivot)
+
+        return solve_gf2(z[~used], r[~used])
+
+
+def solve_gf2(a: NDArray[np.bool_], b: NDArray[np.bool_]) -> tuple[NDArray[np.bool_], NDArray[np.bool_]]:
+    """Solve the (consistent) linear system $a s = b$ over $\\mathbb{F}_2$.
+
+    Args:
+        a (NDArray[np.bool_]): The coefficient matrix, of shape $(m, n)$.
+        b (NDArray[np.bool_]): The right-hand side, of shape $(m,)$.
+
+    Returns:
+        A particular solution (of shape $(n,)$) and a basis of the null space of $a$ (of shape $(f, n)$).
+
+    """
+    a, b = a.copy(), b.copy()
+    number_of_rows, number_of_columns = a.shape
+    pivot_columns: list[int] = []
+    row = 0
+    for column in range(number_of_columns):
+        candidates = np.flatnonzero(a[row:, column]) + row if row < number_of_rows else np.array([], dtype=np.intp)
+        if len(candidates) == 0:
+            continue
+        pivot = int(candidates[0])
+        a[[row, pivot]], b[[row, pivot]] = a[[pivot, row]], b[[pivot, row]]
+        targets = np.flatnonzero(a[:, column])
+        targets = targets[targets != row]
+        a[targets] ^= a[row]
+        b[targets] ^= b[row]
+        pivot_columns.append(column)
+        row += 1
+
+    solution = np.zeros(number_of_columns, dtype=np.bool_)
+    solution[pivot_columns] = b[: len(pivot_columns)]
+    free_columns = [column for column in range(number_of_columns) if column not in set(pivot_columns)]
+    null_space = np.zeros((len(free_columns), number_of_columns), dtype=np.bool_)
+    for i, free_column in enumerate(free_columns):
+        null_space[i, free_column] = True
+        null_space[i, pivot_columns] = a[: len(pivot_columns), free_column]
+    return solution, null_space
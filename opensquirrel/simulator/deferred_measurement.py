@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import TYPE_CHECKING, TypeVar
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from opensquirrel.common import ATOL
+from opensquirrel.ir import Axis, IRVisitor
+from opensquirrel.utils.matrix_expander import can1
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from opensquirrel.ir import Init, Measure, Reset
+
+Z_AXIS = Axis(0, 0, 1)
+PAULI_X = np.array([[0, 1], [1, 0]], dtype=np.complex128)
+
+
+def get_measurement_basis_change(axis: Axis) -> NDArray[np.complex128]:
+    """Get the single-qubit unitary that maps the eigenstates of a measurement along the given axis to the
+    eigenstates of a measurement along the +Z axis, _i.e._, $U^\\dagger = R_y(-\\theta) R_z(-\\phi)$ with
+    $\\theta = \\arccos(n_z)$ and $\\phi = \\arctan2(n_y, n_x)$ (see the `MeasureDecomposer`).
+
+    Args:
+        axis (Axis): The measurement axis.
+
+    Returns:
+        The $2\\times 2$ basis change matrix.
+
+    """
+    n_x, n_y, n_z = axis
+    theta = math.acos(max(min(n_z, 1.0), -1.0))
+    phi = math.atan2(n_y, n_x)
+    return can1((0, 1, 0), -theta) @ can1((0, 0, 1), -phi)
+
+
+class DeferredMeasurementSimulator(IRVisitor, ABC):
+    """Base class of the simulators that defer measurements: a measured qubit is not collapsed, but the bits it is
+    measured to are read out from the final state. A measured qubit is only collapsed, by `_measure_qubit`, when it is
+    operated on after the measurement (mid-circuit measurement), or when it is measured again along another axis.
+    Reset and init instructions first collapse the qubit, and are then applied by `_reset_qubit`.
+
+    Args:
+        qubit_register_size (int): The size of the qubit register.
+        bit_register_size (int): The size of the bit register.
+
+    """
+
+    def __init__(self, qubit_register_size: int, bit_register_size: int = 0) -> None:
+        self.qubit_register_size = qubit_register_size
+        self.bit_register_size = bit_register_size
+
+        # Bits that are read out from the final state, and the qubits they are measured from.
+        self.deferred_bits: dict[int, int] = {}
+        # Qubits with a deferred measurement, and the axis they are measured along.
+        self.measurement_axes: dict[int, Axis] = {}
+
+    def visit_measure(self, measure: Measure) -> None:
+        qubit, bit = measure.qubit.index, measure.bit.index
+        if qubit in self.measurement_axes and self.measurement_axes[qubit] != measure.axis:
+            self._collapse_deferred_measurements([qubit])
+        self.measurement_axes[qubit] = measure.axis
+        self._discard_bit(bit)
+        self.deferred_bits[bit] = qubit
+
+    def visit_init(self, init: Init) -> None:
+        self._collapse_deferred_measurements([init.qubit.index])
+        self._reset_qubit(init.qubit.index)
+
+    def visit_reset(self, reset: Reset) -> None:
+        self._collapse_deferred_measurements([reset.qubit.index])
+        self._reset_qubit(reset.qubit.index)
+
+    def _collapse_deferred_measurements(self, qubits: list[int]) -> None:
+        for qubit in qubits:
+            axis = self.measurement_axes.pop(qubit, None)
+            if axis is None:
+                continue
+
+            bits = [bit for bit, deferred_qubit in self.deferred_bits.items() if deferred_qubit == qubit]
+            for bit in bits:
+                del self.deferred_bits[bit]
+            self._measure_qubit(qubit, axis, bits)
+
+    def _to_bit_string(self, value: int) -> str:
+        return format(int(value), f"0{self.bit_register_size}b")
+
+    @abstractmethod
+    def _measure_qubit(self, qubit: int, axis: Axis, bits: list[int]) -> None:
+        """Apply the measurement of the qubit along the axis, whose outcome is stored in the given bits."""
+
+    @abstractmethod
+    def _reset_qubit(self, qubit: int) -> None:
+        """Bring the qubit, which has no deferred measurement, to the $|0\\rangle$ state."""
+
+    @abstractmethod
+    def _discard_bit(self, bit: int) -> None:
+        """Discard the value of the bit, which is about to be overwritten by a deferred measurement."""
+
+
+class TrajectorySimulator(DeferredMeasurementSimulator, ABC):
+    """Base class of the simulators that collapse a measured qubit by sampling the outcome of its measurement, with
+    the random number generator of the simulator. Hence, the simulation of a circuit with mid-circuit measurements or
+    resets is one of its possible trajectories.
+
+    A trajectory is followed by a number of shots, `shots`, which is 1 by default. At a measurement with a random
+    outcome, the number of shots with outcome 1 is drawn from a binomial distribution. If the shots are split over
+    both outcomes, the trajectory continues with the shots of outcome 0, and the shots of outcome 1 are set apart in
+    `split_trajectories`, to be simulated again with their random outcomes so far given by `forced_outcomes` (see
+    `sample_trajectories`).
+
+    Args:
+        qubit_register_size (int): The size of the qubit register.
+        bit_register_size (int): The size of the bit register.
+        seed (int | np.random.Generator | None): Seed for, or, the random number generator. Default is `None`.
+
+    """
+
+    def __init__(
+        self, qubit_register_size: int, bit_register_size: int = 0, seed: int | np.random.Generator | None = None
+    ) -> None:
+        super().__init__(qubit_register_size, bit_register_size)
+        self.rng = np.random.default_rng(seed)
+
+        # Bits whose value is known, i.e., bits from measurements whose outcome has been sampled.
+        self.bit_values: dict[int, int] = {}
+        # Whether the state depends on sampled outcomes, i.e., whether it is one of multiple possible trajectories.
+        self.is_trajectory = False
+
+        # The number of shots that follow the trajectory, and the given outcomes of its first random measurements.
+        self.shots = 1
+        self.forced_outcomes: tuple[int, ...] = ()
+        # The trajectories that are split off, as the outcomes of their random measurements and their number of shots.
+        self.split_trajectories: list[tuple[tuple[int, ...], int]] = []
+        # The outcomes of the random measurements of the trajectory so far.
+        self._outcomes: list[int] = []
+
+    @abstractmethod
+    def sample(self, shots: int, seed: int | np.random.Generator | None = None) -> dict[str, int]:
+        """Sample the values of the bit register at the end of the circuit."""
+
+    @abstractmethod
+    def _apply_single_qubit_matrix(self, matrix: ArrayLike, qubit: int) -> None:
+        """Apply a single-qubit unitary to the qubit."""
+
+    @abstractmethod
+    def _collapse(self, qubit: int) -> int:
+        """Samples the outcome of a measurement of the qubit along the Z axis, and collapses the state accordingly."""
+
+    def _sample_outcome(self, probability_one: float) -> int:
+        """Sample the outcome of a measurement, with the given probability of outcome 1, for all shots of the
+        trajectory.
+        """
+        if not ATOL < probability_one < 1 - ATOL:
+            return int(self.rng.random() < probability_one)
+
+        self.is_trajectory = True
+        if len(self._outcomes) < len(self.forced_outcomes):
+            outcome = self.forced_outcomes[len(self._outcomes)]
+        else:
+            shots_one = int(self.rng.binomial(self.shots, probability_one))
+            outcome = int(shots_one == self.shots > 0)
+            if 0 < shots_one < self.shots:
+                self.split_trajectories.append(((*self._outcomes, 1), shots_one))
+                self.shots -= shots_one
+        self._outcomes.append(outcome)
+        return outcome
+
+    def _measure_qubit(self, qubit: int, axis: Axis, bits: list[int]) -> None:
+        basis_change = get_measurement_basis_change(axis) if axis != Z_AXIS else None
+        if basis_change is not None:
+            self._apply_single_qubit_matrix(basis_change, qubit)
+        outcome = self._collapse(qubit)
+        if basis_change is not None:
+            self._apply_single_qubit_matrix(basis_change.conj().T, qubit)
+        for bit in bits:
+            self.bit_values[bit] = outcome
+
+    def _reset_qubit(self, qubit: int) -> None:
+        if self._collapse(qubit) == 1:
+            self._apply_single_qubit_matrix(PAULI_X, qubit)
+
+    def _discard_bit(self, bit: int) -> None:
+        self.bit_values.pop(bit, None)
+
+    def _count_bit_registers(self, deferred_outcomes: NDArray[np.bool_]) -> dict[str, int]:
+        """Count the sampled values of the bit register, given the sampled outcomes of the deferred bits, as an array
+        of shape (shots, number of deferred bits), in the order of `deferred_bits`.
+        """
+        bit_registers = np.zeros((len(deferred_outcomes), self.bit_register_size), dtype=np.bool_)
+        for bit, value in self.bit_values.items():
+            bit_registers[:, bit] = bool(value)
+        bit_registers[:, list(self.deferred_bits)] = deferred_outcomes
+
+        values, counts = np.unique(bit_registers, axis=0, return_counts=True)
+        return {
+            "".join("1" if bit else "0" for bit in value[::-1]): int(count)
+            for value, count in zip(values, counts, strict=True)
+        }
+
+
+TrajectorySimulatorT = TypeVar("TrajectorySimulatorT", bound=TrajectorySimulator)
+
+
+def sample_trajectories(
+    create_simulator: Callable[[], TrajectorySimulatorT],
+    simulate: Callable[[TrajectorySimulatorT], object],
+    shots: int,
+    rng: np.random.Generator,
+) -> dict[str, int]:
+    """Sample the values of the bit register at the end of a circuit, for shots that may follow different
+    trajectories of its simulation.
+
+    All shots start out on a single trajectory, which is split at every measurement with a random outcome (see
+    `TrajectorySimulator`). Hence, the circuit is simulated once per distinct trajectory that is followed by at least
+    one shot, rather than once per shot, and the shots of a trajectory are drawn at once from its final state.
+
+    Args:
+        create_simulator (Callable[[], TrajectorySimulatorT]): Creates a simulator for a trajectory.
+        simulate (Callable[[TrajectorySimulatorT], object]): Simulates the circuit with the simulator.
+        shots (int): The number of shots.
+        rng (np.random.Generator): The random number generator to split the shots and to draw them with.
+
+    Returns:
+        The number of occurrences of the sampled bit register values, keyed by the bit string of the bit register,
+        where bit #0 is the rightmost character.
+
+    """
+    if shots < 0:
+        msg = f"number of shots must be non-negative, got {shots!r}"
+        raise ValueError(msg)
+
+    counts: Counter[str] = Counter()
+    trajectories: list[tuple[tuple[int, ...], int]] = [((), shots)]
+    while trajectories:
+        forced_outcomes, trajectory_shots = trajectories.pop()
+        simulator = create_simulator()
+        simulator.shots, simulator.forced_outcomes = trajectory_shots, forced_outcomes
+        simulate(simulator)
+        trajectories.extend(simulator.split_trajectories)
+        counts.update(simulator.sample(simulator.shots, rng))
+    return dict(counts)
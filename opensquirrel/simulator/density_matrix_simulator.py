@@ -0,0 +1,384 @@
+from __future__ import annotations
+
+import warnings
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from opensquirrel.common import ATOL
+from opensquirrel.simulator.deferred_measurement import (
+    Z_AXIS,
+    DeferredMeasurementSimulator,
+    get_measurement_basis_change,
+)
+from opensquirrel.utils.gate_fusion import accept_fused
+from opensquirrel.utils.tensor_contraction import apply_matrix_to_tensor_in_place, get_qubit_axes
+
+if TYPE_CHECKING:
+    from opensquirrel.circuit import Circuit
+    from opensquirrel.ir import Axis
+    from opensquirrel.ir.single_qubit_gate import SingleQubitGate
+    from opensquirrel.ir.two_qubit_gate import TwoQubitGate
+    from opensquirrel.utils.gate_fusion import FusedGate, FusionStatistics
+
+# The maximum number of qubits of a gate U for which U (x) U* is applied in a single pass over the density matrix.
+MAX_SINGLE_PASS_SIZE = 2
+
+
+class DensityMatrixSimulator(DeferredMeasurementSimulator):
+    """Simulates a circuit by applying its gates and non-unitary instructions to a density matrix of
+    $2^n\\times 2^n$ entries, where $n$ is the number of qubits.
+
+    The density matrix $\\rho$ is stored as a tensor with $2n$ axes of dimension 2: the first $n$ axes are the row
+    axes, and the last $n$ axes the column axes, of the qubits. A gate $U$ is applied as $U\\rho U^\\dagger$, by
+    contracting $U$ with the row axes and $U^*$ with the column axes of the qubits it acts on only (in a single pass
+    for single- and two-qubit gates). Reset and init
+    instructions are applied as the local channel $\\rho\\mapsto |0\\rangle\\langle 0|\\rho|0\\rangle\\langle 0| +
+    |0\\rangle\\langle 1|\\rho|1\\rangle\\langle 0|$, which does not sample an outcome.
+
+    Measurements are deferred, as in the `StatevectorSimulator`. When a measured qubit is operated on after the
+    measurement (mid-circuit measurement), the measurement is applied as a projective channel that splits the state
+    into one branch per outcome. The branches are kept apart, keyed by the values of the measured bits, such that the
+    outcome remains correlated with the final state. Branches with the same bit values are added, and the measurement
+    of a qubit whose bits are all measured to again is applied as a dephasing channel, which does not split the state.
+    The simulation is deterministic, and all shots can be sampled from the final state.
+
+    Every branch is a density matrix of $2^n\times 2^n$ entries. If `max_branches` is given, at most that many
+    branches are kept: if a measurement would split the state into more branches, the branches are merged into a single
+    branch first, and the probabilities of their bit values are kept in `bit_value_probabilities`, independently of the
+    merged branch. The final state is still exact, but correlations between the bits of merged branches and later
+    outcomes are dropped, so a warning is issued. By default, the number of branches is not bounded, and the simulation
+    is exact.
+
+    Args:
+        qubit_register_size (int): The size of the qubit register.
+        bit_register_size (int): The size of the bit register.
+        max_branches (int | None): The maximum number of branches, or `None` for no maximum. Default is `None`.
+
+    """
+
+    def __init__(self, qubit_register_size: int, bit_register_size: int = 0, max_branches: int | None = None) -> None:
+        if max_branches is not None and max_branches < 1:
+            msg = f"maximum number of branches must be positive, got {max_branches!r}"
+            raise ValueError(msg)
+        super().__init__(qubit_register_size, bit_register_size)
+        self.max_branches = max_branches
+
+        state = np.zeros((2,) * (2 * self.qubit_register_size), dtype=np.complex128)
+        state[(0,) * (2 * self.qubit_register_size)] = 1
+        # The (unnormalized) density matrices of the branches, keyed by the values of the bits from mid-circuit
+        # measurements, where bits that are not measured to are 0. The trace of a branch is its probability.
+        self.branches: dict[int, NDArray[np.complex128]] = {0: state}
+        # The probability distribution of the values of the bits of merged branches, which is independent of the
+        # branches, where the other bits are 0.
+        self.bit_value_probabilities: dict[int, float] = {0: 1.0}
+
+        # Statistics of the gate fusion, if the gates of the simulated circuit are fused.
+        self.fusion_statistics: FusionStatistics | None = None
+
+    @property
+    def density_matrix(self) -> NDArray[np.complex128]:
+        """The density matrix of $2^n\\times 2^n$ entries, summed over all branches. By convention, qubit #0
+        corresponds to the least significant bit of the row and column indices.
+        """
+        dimension = 1 << self.qubit_register_size
+        return sum(
+            (state.reshape(dimension, dimension) for state in self.branches.values()),
+            start=np.zeros((dimension, dimension), dtype=np.complex128),
+        )
+
+    @property
+    def probabilities(self) -> NDArray[np.float64]:
+        """The probabilities of the $2^n$ computational basis states, before any deferred measurement."""
+        return np.real(np.diagonal(self.density_matrix)).copy()
+
+    @property
+    def purity(self) -> float:
+        """The purity $\\mathrm{Tr}(\\rho^2)$ of the density matrix."""
+        density_matrix = self.density_matrix
+        return float(np.real(np.vdot(density_matrix, density_matrix)))
+
+    def get_bit_register_probabilities(self) -> dict[str, float]:
+        """Get the probability distribution of the values of the bit register at the end of the circuit.
+
+        Returns:
+            The probabilities of the bit register values that can occur, keyed by the bit string of the bit register,
+            where bit #0 is the rightmost character. Bits that are never measured to are 0.
+
+        """
+        values, probabilities = self._get_bit_register_distribution()
+        return {
+            self._to_bit_string(value): float(probability)
+            for value, probability in zip(values, probabilities, strict=True)
+        }
+
+    def sample(self, shots: int, seed: int | np.random.Generator | None = None) -> dict[str, int]:
+        """Sample the values of the bit register at the end of the circuit.
+
+        Args:
+            shots (int): The number of shots.
+            seed (int | np.random.Generator | None): Seed or random number generator to draw the shots with.
+                Default is `None`.
+
+        Returns:
+            The number of occurrences of the sampled bit register values, keyed by the bit string of the bit register,
+            where bit #0 is the rightmost character.
+
+        """
+        if shots < 0:
+            msg = f"number of shots must be non-negative, got {shots!r}"
+            raise ValueError(msg)
+
+        values, probabilities = self._get_bit_register_distribution()
+        counts = np.random.default_rng(seed).multinomial(shots, probabilities / np.sum(probabilities))
+        return {self._to_bit_string(value): int(count) for value, count in zip(values, counts, strict=True) if count}
+
+    def _get_bit_register_distribution(self) -> tuple[NDArray[np.int64], NDArray[np.float64]]:
+        all_values = []
+        all_probabilities = []
+        for branch_value, state in self.branches.items():
+            probabilities = self._get_measurement_probabilities(state)
+            kets = np.flatnonzero(probabilities > ATOL**2)
+            values = np.full(kets.shape, branch_value, dtype=np.int64)
+            for bit, qubit in self.deferred_bits.items():
+                values |= ((kets >> qubit) & 1).astype(np.int64) << bit
+            all_values.append(values)
+            all_probabilities.append(probabilities[kets])
+
+        bit_values = np.fromiter(self.bit_value_probabilities.keys(), dtype=np.int64)
+        bit_value_probabilities = np.fromiter(self.bit_value_probabilities.values(), dtype=np.float64)
+        values, inverse = np.unique(np.bitwise_or.outer(np.concatenate(all_values), bit_values), return_inverse=True)
+        probabilities = np.outer(np.concatenate(all_probabilities), bit_value_probabilities)
+        return values, np.bincount(inverse.reshape(-1), weights=probabilities.reshape(-1), minlength=len(values))
+
+    def _get_measurement_probabilities(self, state: NDArray[np.complex128]) -> NDArray[np.float64]:
+        rotated_axes = {qubit: axis for qubit, axis in self.measurement_axes.items() if axis != Z_AXIS}
+        if rotated_axes:
+            state = state.copy()
+            for qubit, axis in rotated_axes.items():
+                self._apply_matrix(state, get_measurement_basis_change(axis), [qubit])
+        dimension = 1 << self.qubit_register_size
+        return np.real(np.diagonal(state.reshape(dimension, dimension))).copy()
+
+    def visit_single_qubit_gate(self, gate: SingleQubitGate) -> None:
+        self._collapse_deferred_measurements(gate.qubit_indices)
+        for state in self.branches.values():
+            self._apply_matrix(state, gate.matrix, gate.qubit_indices)
+
+    def visit_two_qubit_gate(self, gate: TwoQubitGate) -> None:
+        self._collapse_deferred_measurements(gate.qubit_indices)
+        for state in self.branches.values():
+            self._apply_matrix(state, gate.matrix, gate.qubit_indices)
+
+    def visit_fused_gate(self, fused_gate: FusedGate) -> None:
+        self._collapse_deferred_measurements(fused_gate.qubit_indices)
+        for state in self.branches.values():
+            self._apply_matrix(state, fused_gate.matrix, fused_gate.qubit_indices)
+
+    def _apply_matrix(self, state: NDArray[np.complex128], matrix: ArrayLike, qubit_indices: list[int]) -> None:
+        """Apply $U\\rho U^\\dagger$ in place. As a tensor of $2n$ axes, the row axis of qubit $q$ is the axis of
+        qubit $q + n$, and the column axis of qubit $q$ is the axis of qubit $q$, of a register of $2n$ qubits.
+        """
+        matrix = np.asarray(matrix, dtype=np.complex128)
+        n = self.qubit_register_size
+        row_qubits = [qubit + n for qubit in qubit_indices]
+        if len(qubit_indices) <= MAX_SINGLE_PASS_SIZE:
+            # Apply U and U* in a single pass over the density matrix, as U (x) U* on the row and column axes.
+            apply_matrix_to_tensor_in_place(state, np.kron(matrix, matrix.conj()), row_qubits + qubit_indices, 2 * n)
+        else:
+            apply_matrix_to_tensor_in_place(state, matrix, row_qubits, 2 * n)
+            apply_matrix_to_tensor_in_place(state, matrix.conj(), qubit_indices, 2 * n)
+
+    def _get_local_view(self, state: NDArray[np.complex128], qubit: int) -> NDArray[np.complex128]:
+        """Get a view of the state, with the row and column axes of the qubit as its first two axes."""
+        row_axis, column_axis = get_qubit_axes([qubit + self.qubit_register_size, qubit], 2 * self.qubit_register_size)
+        return np.moveaxis(state, (row_axis, column_axis), (0, 1))
+
+    def _reset_qubit(self, qubit: int) -> None:
+        for state in self.branches.values():
+            view = self._get_local_view(state, qubit)
+            view[0, 0] += view[1, 1]
+            view[0, 1] = view[1, 0] = view[1, 1] = 0
+
+    def _measure_qubit(self, qubit: int, axis: Axis, bits: list[int]) -> None:
+        """Apply the projective measurement of the qubit along the axis as a channel, which splits every branch into
+        one branch per outcome, with the given bits set to the outcome.
+        """
+        basis_change = get_measurement_basis_change(axis) if axis != Z_AXIS else None
+        if basis_change is not None:
+            for state in self.branches.values():
+                self._apply_matrix(state, basis_change, [qubit])
+
+        bits_mask = sum(1 << bit for bit in bits)
+        if bits_mask == 0:
+            for state in self.branches.values():
+                self._project(state, qubit, None)
+        else:
+            if self.max_branches is not None and self._count_outcomes(qubit) > self.max_branches:
+                warnings.warn(
+                    f"number of branches exceeds the maximum of {self.max_branches}: branches are merged, which drops "
+                    "the correlations between their measurement outcomes and later outcomes",
+                    UserWarning,
+                    stacklevel=2,
+                )
+                self._merge_all_branches()
+            if self.max_branches is not None and self._count_outcomes(qubit) > self.max_branches:
+                # A single branch with two possible outcomes, of which the probabilities are kept apart.
+                ((branch_value, state),) = self.branches.items()
+                probability_one = self._get_probability_one(state, qubit)
+                self._project(state, qubit, None)
+                self.branches = {branch_value: state}
+                self.bit_value_probabilities = _combine_bit_value_probabilities(
+                    self.bit_value_probabilities, {0: 1 - probability_one, bits_mask: probability_one}
+                )
+            else:
+                self._split_branches(qubit, bits_mask)
+
+        if basis_change is not None:
+            for state in self.branches.values():
+                self._apply_matrix(state, basis_change.conj().T, [qubit])
+
+    def _split_branches(self, qubit: int, bits_mask: int) -> None:
+        """Split every branch into one branch per outcome of a measurement of the qubit along the Z axis, with the
+        masked bits set to the outcome. The branch of outcome 0 reuses the density matrix of the branch.
+        """
+        branches: dict[int, NDArray[np.complex128]] = {}
+        for branch_value, state in self.branches.items():
+            probability_one = self._get_probability_one(state, qubit)
+            probability_zero = self._get_trace(state) - probability_one
+            if probability_one > ATOL**2:
+                state_one = state.copy() if probability_zero > ATOL**2 else state
+                self._project(state_one, qubit, 1)
+                branches[branch_value | bits_mask] = state_one
+            if probability_zero > ATOL**2:
+                self._project(state, qubit, 0)
+                branches[branch_value & ~bits_mask] = state
+        self.branches = branches
+
+    def _count_outcomes(self, qubit: int) -> int:
+        """Count the outcomes of a measurement of the qubit along the Z axis with a nonzero probability, over all
+        branches.
+        """
+        number_of_outcomes = 0
+        for state in self.branches.values():
+            probability_one = self._get_probability_one(state, qubit)
+            number_of_outcomes += int(probability_one > ATOL**2) + int(
+                self._get_trace(state) - probability_one > ATOL**2
+            )
+        return number_of_outcomes
+
+    def _merge_all_branches(self) -> None:
+        """Merge all branches into a single branch, and keep the probabilities of their bit values apart."""
+        branch_probabilities = {branch_value: self._get_trace(state) for branch_value, state in self.branches.items()}
+        self.bit_value_probabilities = _combine_bit_value_probabilities(
+            self.bit_value_probabilities, branch_probabilities
+        )
+        states = iter(self.branches.values())
+        merged_state = next(states)
+        for state in states:
+            merged_state += state
+        self.branches = {0: merged_state}
+
+    def _project(self, state: NDArray[np.complex128], qubit: int, outcome: int | None) -> None:
+        """Project the qubit on the outcome of a measurement along the Z axis in place, or dephase it if the outcome
+        is `None`.
+        """
+        view = self._get_local_view(state, qubit)
+        view[0, 1] = view[1, 0] = 0
+        if outcome is not None:
+            view[1 - outcome, 1 - outcome] = 0
+
+    def _get_probability_one(self, state: NDArray[np.complex128], qubit: int) -> float:
+        dimension = 1 << self.qubit_register_size
+        diagonal = np.real(np.diagonal(state.reshape(dimension, dimension)))
+        return float(np.sum(diagonal[(np.arange(dimension) >> qubit) & 1 == 1]))
+
+    def _discard_bit(self, bit: int) -> None:
+        self._merge_branches(~(1 << bit))
+        if any(value & (1 << bit) for value in self.bit_value_probabilities):
+            bit_value_probabilities: defaultdict[int, float] = defaultdict(float)
+            for value, probability in self.bit_value_probabilities.items():
+                bit_value_probabilities[value & ~(1 << bit)] += probability
+            self.bit_value_probabilities = dict(bit_value_probabilities)
+
+    def _merge_branches(self, mask: int) -> None:
+        """Add the branches whose values are equal after masking them."""
+        if all(branch_value & mask == branch_value for branch_value in self.branches):
+            return
+        branches: dict[int, NDArray[np.complex128]] = {}
+        for branch_value, state in self.branches.items():
+            if branch_value & mask in branches:
+                branches[branch_value & mask] += state
+            else:
+                branches[branch_value & mask] = state
+        self.branches = branches
+
+    def _get_trace(self, state: NDArray[np.complex128]) -> float:
+        dimension = 1 << self.qubit_register_size
+        return float(np.real(np.trace(state.reshape(dimension, dimension))))
+
+
+def _combine_bit_value_probabilities(
+    bit_value_probabilities: dict[int, float], other_bit_value_probabilities: dict[int, float]
+) -> dict[int, float]:
+    """Combine two independent probability distributions of the values of disjoint sets of bits."""
+    combined: defaultdict[int, float] = defaultdict(float)
+    for value, probability in bit_value_probabilities.items():
+        for other_value, other_probability in other_bit_value_probabilities.items():
+            if probability * other_probability > ATOL**2:
+                combined[value | other_value] += probability * other_probability
+    return dict(combined)
+
+
+def simulate_density_matrix(
+    circuit: Circuit, fusion_size: int | None = None, max_branches: int | None = None
+) -> DensityMatrixSimulator:
+    """Simulate the circuit with a density matrix simulator.
+
+    Args:
+        circuit (Circuit): The circuit to simulate.
+        fusion_size (int | None): If given, consecutive gates are fused into dense blocks acting on at most this many
+            qubits (see `opensquirrel.utils.gate_fusion.fuse_gates`) before they are applied to the density matrix.
+            Default is `None`.
+        max_branches (int | None): The maximum number of branches of the simulator, see `DensityMatrixSimulator`.
+            Default is `None`.
+
+    Returns:
+        The density matrix simulator, holding the final (mixed) state of the circuit.
+
+    """
+    simulator = DensityMatrixSimulator(circuit.qubit_register_size, circuit.bit_register_size, max_branches)
+    if fusion_size is None:
+        circuit.ir.accept(simulator)
+    else:
+        simulator.fusion_statistics = accept_fused(circuit.ir, simulator, fusion_size)
+    return simulator
+
+
+def sample_density_matrix(
+    circuit: Circuit,
+    shots: int,
+    seed: int | np.random.Generator | None = None,
+    fusion_size: int | None = None,
+    max_branches: int | None = None,
+) -> dict[str, int]:
+    """Simulate the circuit with a density matrix simulator and sample the values of its bit register at the end of
+    the circuit. Unlike `sample`, all shots are drawn from a single simulation, also for circuits with mid-circuit
+    measurements and resets.
+
+    Args:
+        circuit (Circuit): The circuit to sample.
+        shots (int): The number of shots.
+        seed (int | np.random.Generator | None): Seed for, or, the random number generator. Default is `None`.
+        fusion_size (int | None): The maximum number of qubits of a fused gate, see `simulate_density_matrix`.
+            Default is `None`.
+        max_branches (int | None): The maximum number of branches, see `DensityMatrixSimulator`. Default is `None`.
+
+    Returns:
+        The number of occurrences of the sampled bit register values, keyed by the bit string of the bit register,
+        where bit #0 is the rightmost character.
+
+    """
+    return simulate_density_matrix(circuit, fusion_size, max_branches).sample(shots, seed)
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from opensquirrel.simulator.deferred_measurement import (
+    Z_AXIS,
+    TrajectorySimulator,
+    get_measurement_basis_change,
+    sample_trajectories,
+)
+
+if TYPE_CHECKING:
+    from opensquirrel.circuit import Circuit
+    from opensquirrel.ir.single_qubit_gate import SingleQubitGate
+    from opensquirrel.ir.two_qubit_gate import TwoQubitGate
+
+DEFAULT_MAX_BOND_DIMENSION = 64
+SINGULAR_VALUE_CUTOFF = 1e-12
+SWAP_MATRIX = np.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]], dtype=np.complex128)
+
+
+class MPSSimulator(TrajectorySimulator):
+    """Simulates a circuit with a matrix product state (MPS), which is efficient for wide circuits with little
+    entanglement, _e.g._, shallow circuits or circuits with mostly nearest-neighbour interactions.
+
+    The state of $n$ qubits is stored as a chain of $n$ tensors of shape $(\\chi_l, 2, \\chi_r)$, one per qubit, where
+    qubit #0 is the first site of the chain. A two-qubit gate on neighbouring sites is applied by contracting it with
+    both tensors, after which they are split again with a singular value decomposition. At most
+    `max_bond_dimension` singular values are kept: the discarded weight, _i.e._, the sum of the squares of the
+    discarded (normalized) singular values, is accumulated in `truncation_error`, which bounds the infidelity of the
+    final state. A two-qubit gate on non-neighbouring qubits is applied by first moving one of the qubits next to the
+    other with SWAP gates, and moving it back afterwards.
+
+    The simulator has the same interface and measurement semantics as the `StatevectorSimulator`: measurements are
+    deferred until the measured qubit is operated on again, and reset and init instructions collapse the qubit and
+    bring it to the $|0\\rangle$ state.
+
+    Args:
+        qubit_register_size (int): The size of the qubit register.
+        bit_register_size (int): The size of the bit register.
+        seed (int | np.random.Generator | None): Seed for, or, the random number generator. Default is `None`.
+        max_bond_dimension (int): The maximum bond dimension $\\chi$. Default is `DEFAULT_MAX_BOND_DIMENSION`.
+
+    """
+
+    def __init__(
+        self,
+        qubit_register_size: int,
+        bit_register_size: int = 0,
+        seed: int | np.random.Generator | None = None,
+        max_bond_dimension: int = DEFAULT_MAX_BOND_DIMENSION,
+    ) -> None:
+        if max_bond_dimension < 1:
+            msg = f"maximum bond dimension must be positive, got {max_bond_dimension!r}"
+            raise ValueError(msg)
+        super().__init__(qubit_register_size, bit_register_size, seed)
+        self.max_bond_dimension = max_bond_dimension
+
+        zero_state = np.array([1, 0], dtype=np.complex128).reshape(1, 2, 1)
+        self.tensors = [zero_state.copy() for _ in range(qubit_register_size)]
+        # The site of the orthogonality center: the tensors to its left (right) are left (right) isometries.
+        self.center = 0
+        # The accumulated discarded weight of all truncations.
+        self.truncation_error = 0.0
+
+    @property
+    def bond_dimensions(self) -> list[int]:
+        """The dimensions of the $n - 1$ bonds between neighbouring sites."""
+        return [tensor.shape[2] for tensor in self.tensors[:-1]]
+
+    def get_amplitude(self, ket: int) -> complex:
+        """Get the amplitude of a computational basis state.
+
+        Args:
+            ket (int): A quantum ket, represented by its corresponding non-negative integer.
+                By convention, qubit #0 corresponds to the least significant bit.
+
+        Returns:
+            The amplitude of the computational basis state.
+
+        """
+        vector = np.ones(1, dtype=np.complex128)
+        for qubit, tensor in enumerate(self.tensors):
+            vector = vector @ tensor[:, (ket >> qubit) & 1, :]
+        return complex(vector[0])
+
+    def sample(self, shots: int, seed: int | np.random.Generator | None = None) -> dict[str, int]:
+        """Sample the values of the bit register at the end of the circuit.
+
+        The outcomes of all qubits are sampled site by site, from their probabilities conditioned on the outcomes of
+        the previous sites, for all shots at once.
+
+        Args:
+            shots (int): The number of shots.
+            seed (int | np.random.Generator | None): Seed or random number generator to draw the shots with.
+                Default is `None`.
+
+        Returns:
+            The number of occurrences of the sampled bit register values, keyed by the bit string of the bit register,
+            where bit #0 is the rightmost character.
+
+        """
+        if shots < 0:
+            msg = f"number of shots must be non-negative, got {shots!r}"
+            raise ValueError(msg)
+        if shots == 0:
+            return {}
+
+        self._move_center(0)
+        tensors = list(self.tensors)
+        for qubit, axis in self.measurement_axes.items():
+            if axis != Z_AXIS:
+                tensors[qubit] = np.einsum("ab,lbr->lar", get_measurement_basis_change(axis), tensors[qubit])
+
+        # With the orthogonality center at site 0, the probability of an outcome of a site, conditioned on the
+        # outcomes of the previous sites, is the squared norm of the contraction of the previous sites with it.
+        rng = np.random.default_rng(seed)
+        outcomes = np.zeros((shots, self.qubit_register_size), dtype=np.bool_)
+        environments = np.ones((shots, 1), dtype=np.complex128)
+        for qubit, tensor in enumerate(tensors):
+            vectors = np.einsum("sl,lbr->sbr", environments, tensor)
+            weights = np.sum(np.abs(vectors) ** 2, axis=2)
+            probabilities_one = weights[:, 1] / np.sum(weights, axis=1)
+            outcomes[:, qubit] = rng.random(shots) < probabilities_one
+            environments = vectors[np.arange(shots), outcomes[:, qubit].astype(np.intp)]
+            environments /= np.linalg.norm(environments, axis=1, keepdims=True)
+
+        return self._count_bit_registers(outcomes[:, list(self.deferred_bits.values())])
+
+    def visit_single_qubit_gate(self, gate: SingleQubitGate) -> None:
+        self._collapse_deferred_measurements(gate.qubit_indices)
+        self._apply_single_qubit_matrix(gate.matrix, gate.qubit_indices[0])
+
+    def visit_two_qubit_gate(self, gate: TwoQubitGate) -> None:
+        self._collapse_deferred_measurements(gate.qubit_indices)
+        qubit_0, qubit_1 = gate.qubit_indices
+        matrix = np.asarray(gate.matrix, dtype=np.complex128)
+        left, right = sorted((qubit_0, qubit_1))
+
+        # Move the left qubit next to the right qubit, apply the gate, and move it back.
+        for site in range(left, right - 1):
+            self._apply_neighbouring_matrix(SWAP_MATRIX, site)
+        if qubit_0 > qubit_1:
+            # Reorder the operands, such that the first operand is on the left site.
+            matrix = matrix.reshape(2, 2, 2, 2).transpose(1, 0, 3, 2).reshape(4, 4)
+        self._apply_neighbouring_matrix(matrix, right - 1)
+        for site in reversed(range(left, right - 1)):
+            self._apply_neighbouring_matrix(SWAP_MATRIX, site)
+
+    def _apply_single_qubit_matrix(self, matrix: ArrayLike, qubit: int) -> None:
+        self.tensors[qubit] = np.einsum("ab,lbr->lar", np.asarray(matrix, dtype=np.complex128), self.tensors[qubit])
+
+    def _apply_neighbouring_matrix(self, matrix: NDArray[np.complex128], site: int) -> None:
+        """Apply a two-qubit matrix to the sites `site` (first operand) and `site + 1` (second operand), and split the
+        result with a truncated singular value decomposition.
+        """
+        self._move_center(site)
+        left_tensor, right_tensor = self.tensors[site], self.tensors[site + 1]
+        theta = np.einsum("lar,rbs->labs", left_tensor, right_tensor)
+        theta = np.einsum("abcd,lcds->labs", matrix.reshape(2, 2, 2, 2), theta)
+        left_dimension, right_dimension = left_tensor.shape[0], right_tensor.shape[2]
+
+        u, singular_values, vh = np.linalg.svd(
+            theta.reshape(2 * left_dimension, 2 * right_dimension), full_matrices=False
+        )
+        weights = singular_values**2
+        total_weight = np.sum(weights)
+        bond_dimension = min(
+            self.max_bond_dimension, max(1, int(np.sum(singular_values > SINGULAR_VALUE_CUTOFF * singular_values[0])))
+        )
+        self.truncation_error += float(np.sum(weights[bond_dimension:]) / total_weight)
+
+        singular_values = singular_values[:bond_dimension] / math.sqrt(np.sum(weights[:bond_dimension]))
+        self.tensors[site] = u[:, :bond_dimension].reshape(left_dimension, 2, bond_dimension)
+        self.tensors[site + 1] = (singular_values[:, np.newaxis] * vh[:bond_dimension]).reshape(
+            bond_dimension, 2, right_dimension
+        )
+        self.center = site + 1
+
+    def _move_center(self, site: int) -> None:
+        """Move the orthogonality center to the given site, with QR decompositions."""
+        while self.center < site:
+            tensor = self.tensors[self.center]
+            left_dimension, _, right_dimension = tensor.shape
+            q, r = np.linalg.qr(tensor.reshape(2 * left_dimension, right_dimension))
+            self.tensors[self.center] = q.reshape(left_dimension, 2, -1)
+            self.tensors[self.center + 1] = np.einsum("ab,bcd->acd", r, self.tensors[self.center + 1])
+            self.center += 1
+        while self.center > site:
+            tensor = self.tensors[self.center]
+            left_dimension, _, right_dimension = tensor.shape
+            q, r = np.linalg.qr(tensor.reshape(left_dimension, 2 * right_dimension).T)
+            self.tensors[self.center] = q.T.reshape(-1, 2, right_dimension)
+            self.tensors[self.center - 1] = np.einsum("abc,cd->abd", self.tensors[self.center - 1], r.T)
+            self.center -= 1
+
+    def _collapse(self, qubit: int) -> int:
+        """Samples the outcome of a measurement of the qubit along the Z axis, and collapses the state accordingly."""
+        self._move_center(qubit)
+        tensor = self.tensors[qubit]
+        weights = np.sum(np.abs(tensor) ** 2, axis=(0, 2))
+        probability_one = min(float(weights[1] / np.sum(weights)), 1.0)
+        outcome = self._sample_outcome(probability_one)
+        tensor[:, 1 - outcome, :] = 0
+        tensor /= np.linalg.norm(tensor)
+        return outcome
+
+
+def simulate_mps(
+    circuit: Circuit,
+    seed: int | np.random.Generator | None = None,
+    max_bond_dimension: int = DEFAULT_MAX_BOND_DIMENSION,
+) -> MPSSimulator:
+    """Simulate the circuit with a matrix product state simulator.
+
+    Args:
+        circuit (Circuit): The circuit to simulate.
+        seed (int | np.random.Generator | None): Seed for, or, the random number generator, which is used to sample
+            the outcomes of mid-circuit measurements and resets. Default is `None`.
+        max_bond_dimension (int): The maximum bond dimension. Default is `DEFAULT_MAX_BOND_DIMENSION`.
+
+    Returns:
+        The MPS simulator, holding the final state of the circuit and its truncation error.
+
+    """
+    simulator = MPSSimulator(circuit.qubit_register_size, circuit.bit_register_size, seed, max_bond_dimension)
+    circuit.ir.accept(simulator)
+    return simulator
+
+
+def sample_mps(
+    circuit: Circuit,
+    shots: int,
+    seed: int | np.random.Generator | None = None,
+    max_bond_dimension: int = DEFAULT_MAX_BOND_DIMENSION,
+) -> dict[str, int]:
+    """Simulate the circuit with a matrix product state simulator and sample the values of its bit register at the
+    end of the circuit.
+
+    Args:
+        circuit (Circuit): The circuit to sample.
+        shots (int): The number of shots.
+        seed (int | np.random.Generator | None): Seed for, or, the random number generator. Default is `None`.
+        max_bond_dimension (int): The maximum bond dimension. Default is `DEFAULT_MAX_BOND_DIMENSION`.
+
+    Returns:
+        The number of occurrences of the sampled bit register values, keyed by the bit string of the bit register,
+        where bit #0 is the rightmost character.
+
+    """
+    rng = np.random.default_rng(seed)
+    return sample_trajectories(
+        lambda: MPSSimulator(circuit.qubit_register_size, circuit.bit_register_size, rng, max_bond_dimension),
+        circuit.ir.accept,
+        shots,
+        rng,
+    )
@@ -0,0 +1,335 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping, Sequence
+from math import tau
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from opensquirrel.common import ATOL
+from opensquirrel.ir import Gate, IRVisitor, ParameterExpression
+from opensquirrel.simulator.deferred_measurement import Z_AXIS, get_measurement_basis_change
+from opensquirrel.utils.tensor_contraction import apply_matrix_stack_to_tensor, apply_matrix_to_tensor
+
+if TYPE_CHECKING:
+    from opensquirrel.circuit import Circuit
+    from opensquirrel.ir import Axis, Init, Measure, Reset
+    from opensquirrel.ir.semantics import ParametricGateSemantic
+    from opensquirrel.ir.single_qubit_gate import SingleQubitGate
+    from opensquirrel.ir.two_qubit_gate import TwoQubitGate
+
+ParameterValues = Mapping[str, ArrayLike]
+ParametricGates = Mapping[int, int | Sequence[int]]
+
+
+def _normalize_angles(angles: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Vectorized `normalize_angle`, such that the matrices of the swept gates are equal to those of the gates."""
+    normalized_angles = angles - tau * (np.floor_divide(angles, tau) + 1)
+    normalized_angles[normalized_angles < -tau / 2 + ATOL] += tau
+    normalized_angles[normalized_angles > tau / 2] -= tau
+    return normalized_angles
+
+
+def _get_rotation_matrices(
+    axis: tuple[float, float, float], angles: NDArray[np.float64], phases: NDArray[np.float64] | None = None
+) -> NDArray[np.complex128]:
+    """Vectorized `can1`: the matrices $e^{i\\phi}(\\cos(\\theta/2) I - i\\sin(\\theta/2)\\hat{n}\\cdot\\vec{\\sigma})$
+    for arrays of angles $\\theta$ and phases $\\phi$, which are normalized as in a `BlochSphereRotation`.
+    """
+    nx, ny, nz = axis
+    angles = _normalize_angles(angles)
+    cos, sin = np.cos(angles / 2), np.sin(angles / 2)
+    matrices = np.empty((len(angles), 2, 2), dtype=np.complex128)
+    matrices[:, 0, 0] = cos - 1j * nz * sin
+    matrices[:, 0, 1] = (-1j * nx - ny) * sin
+    matrices[:, 1, 0] = (-1j * nx + ny) * sin
+    matrices[:, 1, 1] = cos + 1j * nz * sin
+    if phases is not None:
+        matrices *= np.exp(1j * _normalize_angles(phases))[:, np.newaxis, np.newaxis]
+    return matrices
+
+
+def _get_u_matrices(parameters: NDArray[np.float64]) -> NDArray[np.complex128]:
+    """See `BsrUnitaryParams.get_bsr`."""
+    theta, phi, lmbda = parameters.T
+    return (
+        _get_rotation_matrices((0, 0, 1), phi, (phi + lmbda) / 2)
+        @ _get_rotation_matrices((0, 1, 0), theta)
+        @ _get_rotation_matrices((0, 0, 1), lmbda)
+    )
+
+
+def _get_cr_matrices(parameters: NDArray[np.float64]) -> NDArray[np.complex128]:
+    theta = _normalize_angles(parameters[:, 0])
+    matrices = np.zeros((len(parameters), 4, 4), dtype=np.complex128)
+    matrices[:, [0, 1], [0, 1]] = 1
+    matrices[:, 2:, 2:] = _get_rotation_matrices((0, 0, 1), theta, theta / 2)
+    return matrices
+
+
+# The gates that can be swept, by name, with their number of parameters and the function that computes the stack of
+# their matrices from an (m, number of parameters) array of parameter values.
+SWEEPABLE_GATES: dict[str, tuple[int, Callable[[NDArray[np.float64]], NDArray[np.complex128]]]] = {
+    "Rx": (1, lambda parameters: _get_rotation_matrices((1, 0, 0), parameters[:, 0])),
+    "Ry": (1, lambda parameters: _get_rotation_matrices((0, 1, 0), parameters[:, 0])),
+    "Rz": (1, lambda parameters: _get_rotation_matrices((0, 0, 1), parameters[:, 0])),
+    "U": (3, _get_u_matrices),
+    "CR": (1, _get_cr_matrices),
+}
+
+
+class ParameterSweepSimulator(IRVisitor):
+    """Simulates $m$ instances of a circuit at once, which differ in the parameters of their parametric gates only.
+
+    The $m$ statevectors are stored as a single tensor with $n$ axes of dimension 2, one for each qubit, and a
+    trailing batch axis of size $m$. A fixed gate is applied to all instances with a single contraction. A parametric
+    gate is applied as a stack of $m$ matrices, _e.g._, of shape $(m, 2, 2)$ for a single-qubit gate, which is
+    computed at once from the parameter values.
+
+    Measurements are deferred and read out from the final states. Since the instances are not collapsed, mid-circuit
+    measurements are not supported. Reset and init instructions are only supported on qubits that have not been
+    operated on yet (for which they have no effect).
+
+    Args:
+        qubit_register_size (int): The size of the qubit register.
+        bit_register_size (int): The size of the bit register.
+        batch_size (int): The number of instances, $m$.
+
+    """
+
+    def __init__(self, qubit_register_size: int, bit_register_size: int, batch_size: int) -> None:
+        self.qubit_register_size = qubit_register_size
+        self.bit_register_size = bit_register_size
+        self.batch_size = batch_size
+
+        self.state = np.zeros((2,) * self.qubit_register_size + (batch_size,), dtype=np.complex128)
+        self.state[(0,) * self.qubit_register_size] = 1
+
+        # Bits that are read out from the final states, and the qubits they are measured from.
+        self.deferred_bits: dict[int, int] = {}
+        # Qubits with a deferred measurement, and the axis they are measured along.
+        self.measurement_axes: dict[int, Axis] = {}
+        # Qubits that have been operated on.
+        self._used_qubits: set[int] = set()
+
+    @property
+    def statevectors(self) -> NDArray[np.complex128]:
+        """The $m$ statevectors, as an array of shape $(m, 2^n)$. By convention, qubit #0 corresponds to the least
+        significant bit of the index of an amplitude.
+        """
+        return self.state.reshape(-1, self.batch_size).T
+
+    @property
+    def probabilities(self) -> NDArray[np.float64]:
+        """The probabilities of the $2^n$ computational basis states of the $m$ instances, as an array of shape
+        $(m, 2^n)$, before any deferred measurement.
+        """
+        return np.abs(self.statevectors) ** 2
+
+    def get_bit_register_probabilities(self) -> dict[str, NDArray[np.float64]]:
+        """Get the probability distributions of the values of the bit register at the end of the circuit.
+
+        Returns:
+            The probabilities of the $m$ instances, as arrays of shape $(m,)$, keyed by the bit string of the bit
+            register, where bit #0 is the rightmost character. Bits that are never measured to are 0.
+
+        """
+        state = self.state
+        for qubit, axis in self.measurement_axes.items():
+            if axis != Z_AXIS:
+                state = apply_matrix_to_tensor(
+                    state, get_measurement_basis_change(axis), [qubit], self.qubit_register_size
+                )
+        probabilities = np.abs(state.reshape(-1, self.batch_size)) ** 2
+
+        kets = np.flatnonzero(np.max(probabilities, axis=1) > ATOL**2)
+        values = np.zeros(kets.shape, dtype=np.int64)
+        for bit, qubit in self.deferred_bits.items():
+            values |= ((kets >> qubit) & 1).astype(np.int64) << bit
+        unique_values, inverse = np.unique(values, return_inverse=True)
+        bit_register_probabilities = np.zeros((len(unique_values), self.batch_size))
+        np.add.at(bit_register_probabilities, inverse, probabilities[kets])
+        return {
+            format(int(value), f"0{self.bit_register_size}b"): probabilities
+            for value, probabilities in zip(unique_values, bit_register_probabilities, strict=True)
+        }
+
+    def apply_parametric_gate(self, gate: Gate, parameters: NDArray[np.float64]) -> None:
+        """Apply a parametric gate, with different parameter values for each instance.
+
+        Args:
+            gate (Gate): The parametric gate, whose name is one of `SWEEPABLE_GATES`.
+            parameters (NDArray[np.float64]): The parameter values of the gate, of shape (m, number of parameters).
+
+        """
+        number_of_parameters, get_matrices = SWEEPABLE_GATES[gate.name]
+        if parameters.shape != (self.batch_size, number_of_parameters):
+            msg = (
+                f"gate {gate.name} expects {number_of_parameters} parameter(s) per instance,"
+                f" got an array of shape {parameters.shape!r}"
+            )
+            raise ValueError(msg)
+        self._use_qubits(gate.qubit_indices)
+        self.state = apply_matrix_stack_to_tensor(
+            self.state, get_matrices(parameters), gate.qubit_indices, self.qubit_register_size
+        )
+
+    def visit_single_qubit_gate(self, gate: SingleQubitGate) -> None:
+        self._use_qubits(gate.qubit_indices)
+        self.state = apply_matrix_to_tensor(self.state, gate.matrix, gate.qubit_indices, self.qubit_register_size)
+
+    def visit_two_qubit_gate(self, gate: TwoQubitGate) -> None:
+        self._use_qubits(gate.qubit_indices)
+        self.state = apply_matrix_to_tensor(self.state, gate.matrix, gate.qubit_indices, self.qubit_register_size)
+
+    def visit_measure(self, measure: Measure) -> None:
+        qubit, bit = measure.qubit.index, measure.bit.index
+        if qubit in self.measurement_axes and self.measurement_axes[qubit] != measure.axis:
+            self._use_qubits([qubit])
+        self.measurement_axes[qubit] = measure.axis
+        self.deferred_bits[bit] = qubit
+
+    def visit_init(self, init: Init) -> None:
+        self._check_unused(init.qubit.index, "init")
+
+    def visit_reset(self, reset: Reset) -> None:
+        self._check_unused(reset.qubit.index, "reset")
+
+    def _use_qubits(self, qubits: list[int]) -> None:
+        for qubit in qubits:
+            if qubit in self.measurement_axes:
+                msg = f"mid-circuit measurements are not supported in a parameter sweep, qubit {qubit} is measured"
+                raise ValueError(msg)
+        self._used_qubits.update(qubits)
+
+    def _check_unused(self, qubit: int, name: str) -> None:
+        if qubit in self._used_qubits or qubit in self.measurement_axes:
+            msg = (
+                f"{name} of a qubit that has been operated on is not supported in a parameter sweep, got qubit {qubit}"
+            )
+            raise ValueError(msg)
+
+
+def _get_parameter_columns(parametric_gates: ParametricGates, number_of_parameters: int) -> dict[int, list[int]]:
+    parameter_columns = {
+        index: [columns] if isinstance(columns, int) else list(columns) for index, columns in parametric_gates.items()
+    }
+    for columns in parameter_columns.values():
+        for column in columns:
+            if not 0 <= column < number_of_parameters:
+                msg = f"parameter index {column!r} out of range {number_of_parameters!r}"
+                raise IndexError(msg)
+    return parameter_columns
+
+
+def _get_batch_size(parameter_values: Mapping[str, NDArray[np.float64]]) -> int:
+    batch_sizes = {values.shape for values in parameter_values.values()}
+    if len(batch_sizes) != 1 or len(shape := batch_sizes.pop()) != 1:
+        msg = "parameter values must be one-dimensional arrays of equal length"
+        raise ValueError(msg)
+    return shape[0]
+
+
+def _evaluate_arguments(
+    parametric: ParametricGateSemantic, parameter_values: Mapping[str, NDArray[np.float64]], batch_size: int
+) -> NDArray[np.float64]:
+    """Vectorized `ParametricGateSemantic.bind`: the arguments of a parametric gate, as an array of shape
+    (m, number of arguments).
+    """
+    arguments = np.empty((batch_size, len(parametric.arguments)))
+    for column, argument in enumerate(parametric.arguments):
+        if not isinstance(argument, ParameterExpression):
+            arguments[:, column] = float(argument)  # ty: ignore[invalid-argument-type]
+            continue
+        arguments[:, column] = argument.constant
+        for name, coefficient in argument.coefficients.items():
+            if name not in parameter_values:
+                msg = f"no value for parameter {name!r}"
+                raise ValueError(msg)
+            arguments[:, column] += coefficient * parameter_values[name]
+    return arguments
+
+
+def _simulate_sweep_by_name(circuit: Circuit, parameter_values: ParameterValues) -> ParameterSweepSimulator:
+    values = {name: np.asarray(values, dtype=np.float64) for name, values in parameter_values.items()}
+    simulator = ParameterSweepSimulator(circuit.qubit_register_size, circuit.bit_register_size, _get_batch_size(values))
+    for statement in circuit.ir.statements_view:
+        parametric = statement.parametric if isinstance(statement, Gate) else None
+        if parametric is None:
+            statement.accept(simulator)
+            continue
+        if statement.name not in SWEEPABLE_GATES:
+            msg = f"gate cannot be swept: {statement!r}"
+            raise ValueError(msg)
+        simulator.apply_parametric_gate(statement, _evaluate_arguments(parametric, values, simulator.batch_size))
+    return simulator
+
+
+def simulate_sweep(
+    circuit: Circuit,
+    parameter_values: ParameterValues | ArrayLike,
+    parametric_gates: ParametricGates | None = None,
+) -> ParameterSweepSimulator:
+    """Simulate $m$ instances of a circuit at once, one for each set of parameter values.
+
+    The swept gates are the parametric gates of the circuit, _i.e._, the gates with symbolic parameters (see
+    `Circuit.parameters`), of which the values are given by name. Since the parameters are kept by the decomposer and
+    merger passes, a compiled circuit is swept in the same way as the circuit it is compiled from.
+
+    Alternatively, gates with numeric parameters can be swept by their index in the statements of the IR, with the
+    columns of an array of parameter values. Note that the indices of the gates change when the circuit is compiled.
+
+    Example:
+        ```python
+        >>> circuit = CircuitBuilder(2, 2).H(0).Ry(1, Parameter("a")).CR(0, 1, Parameter("a") / 2).to_circuit()
+        >>> angles = np.linspace(0, np.pi, 1000)
+        >>> simulate_sweep(circuit, {"a": angles}).statevectors.shape
+        (1000, 4)
+        >>> circuit = CircuitBuilder(2, 2).H(0).Ry(1, 0).CR(0, 1, 0).to_circuit()
+        >>> simulate_sweep(circuit, np.stack([angles, angles / 2], axis=1), {1: 0, 2: 1}).statevectors.shape
+        (1000, 4)
+        ```
+
+    Note:
+        See `SWEEPABLE_GATES` for the gates that can be swept. The matrices of the swept gates are equal to those of
+        the gates, except for a global phase for the `U` gate.
+
+    Args:
+        circuit (Circuit): The circuit, whose parametric gates are swept.
+        parameter_values (ParameterValues | ArrayLike): The values of the parameters, as arrays of shape $(m,)$ keyed
+            by the name of the parameter. Or, if `parametric_gates` is given, an array of shape $(m, p)$.
+        parametric_gates (ParametricGates | None): The gates to sweep by index, keyed by their index in the
+            statements of the IR of the circuit, and the index of the column of `parameter_values` that holds their
+            parameter (or, the indices of the columns that hold their parameters, _e.g._, $\\theta$, $\\phi$ and
+            $\\lambda$ of the `U` gate). The parameters of these gates in the circuit itself are ignored. Default is
+            `None`, in which case the parametric gates are swept by the names of their parameters.
+
+    Returns:
+        The parameter sweep simulator, holding the final states of the $m$ instances.
+
+    """
+    if parametric_gates is None:
+        if not isinstance(parameter_values, Mapping):
+            msg = "parameter values must be keyed by the name of the parameter, if the gates are not given by index"
+            raise TypeError(msg)
+        return _simulate_sweep_by_name(circuit, parameter_values)
+
+    parameter_values = np.asarray(parameter_values, dtype=np.float64)
+    if parameter_values.ndim != 2:
+        msg = f"parameter values must be a two-dimensional array, got shape {parameter_values.shape!r}"
+        raise ValueError(msg)
+    parameter_columns = _get_parameter_columns(parametric_gates, parameter_values.shape[1])
+
+    simulator = ParameterSweepSimulator(
+        circuit.qubit_register_size, circuit.bit_register_size, parameter_values.shape[0]
+    )
+    for index, statement in enumerate(circuit.ir.statements_view):
+        if index not in parameter_columns:
+            statement.accept(simulator)
+            continue
+        if not isinstance(statement, Gate) or statement.name not in SWEEPABLE_GATES:
+            msg = f"statement {index} cannot be swept: {statement!r}"
+            raise ValueError(msg)
+        simulator.apply_parametric_gate(statement, parameter_values[:, parameter_columns[index]])
+    return simulator
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from opensquirrel.ir import IRVisitor
+from opensquirrel.simulator.clifford_tableau import CliffordTableau, PauliImages, get_pauli_images
+from opensquirrel.simulator.deferred_measurement import (
+    Z_AXIS,
+    TrajectorySimulator,
+    get_measurement_basis_change,
+    sample_trajectories,
+)
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike
+
+    from opensquirrel.circuit import Circuit
+    from opensquirrel.ir import Axis, Measure
+    from opensquirrel.ir.single_qubit_gate import SingleQubitGate
+    from opensquirrel.ir.two_qubit_gate import TwoQubitGate
+
+
+class _CliffordChecker(IRVisitor):
+    def __init__(self) -> None:
+        self.is_clifford = True
+
+    def visit_single_qubit_gate(self, gate: SingleQubitGate) -> None:
+        if get_pauli_images(gate.matrix) is None:
+            self.is_clifford = False
+
+    def visit_two_qubit_gate(self, gate: TwoQubitGate) -> None:
+        if get_pauli_images(gate.matrix) is None:
+            self.is_clifford = False
+
+    def visit_measure(self, measure: Measure) -> None:
+        if get_pauli_images(get_measurement_basis_change(measure.axis)) is None:
+            self.is_clifford = False
+
+
+def is_clifford_circuit(circuit: Circuit) -> bool:
+    """Check whether a circuit is a stabilizer circuit, _i.e._, whether all its gates are Clifford gates and all its
+    measurements are along the X, Y, or Z axis.
+
+    A gate is a Clifford gate if it maps every Pauli product to a Pauli product under conjugation, which is checked on
+    its (small) matrix. This covers, _e.g._, the H, S, Sdag, X, Y, Z, X90, CNOT, CZ, and SWAP gates, as well as
+    rotations over multiples of $\\pi/2$ around the X, Y, or Z axis.
+
+    Args:
+        circuit (Circuit): The circuit to check.
+
+    Returns:
+        True if the circuit is a stabilizer circuit, False otherwise.
+
+    """
+    checker = _CliffordChecker()
+    circuit.ir.accept(checker)
+    return checker.is_clifford
+
+
+def _get_gate_pauli_images(gate: SingleQubitGate | TwoQubitGate) -> PauliImages:
+    images = get_pauli_images(gate.matrix)
+    if images is None:
+        msg = f"gate is not a Clifford gate: {gate!r}"
+        raise ValueError(msg)
+    return images
+
+
+def _get_matrix_pauli_images(matrix: ArrayLike) -> PauliImages:
+    images = get_pauli_images(matrix)
+    if images is None:
+        msg = f"matrix is not a Clifford matrix: {matrix!r}"
+        raise ValueError(msg)
+    return images
+
+
+def _get_basis_change_pauli_images(axis: Axis) -> PauliImages | None:
+    if axis == Z_AXIS:
+        return None
+    images = get_pauli_images(get_measurement_basis_change(axis))
+    if images is None:
+        msg = f"measurement axis is not the X, Y, or Z axis: {axis!r}"
+        raise ValueError(msg)
+    return images
+
+
+class _TableauBuilder(IRVisitor):
+    def __init__(self, qubit_register_size: int) -> None:
+        self.tableau = CliffordTableau(qubit_register_size)
+
+    def visit_single_qubit_gate(self, gate: SingleQubitGate) -> None:
+        self.tableau.apply(_get_gate_pauli_images(gate), gate.qubit_indices)
+
+    def visit_two_qubit_gate(self, gate: TwoQubitGate) -> None:
+        self.tableau.apply(_get_gate_pauli_images(gate), gate.qubit_indices)
+
+
+class StabilizerSimulator(TrajectorySimulator):
+    """Simulates a stabilizer circuit, _i.e._, a circuit of Clifford gates only, with a stabilizer tableau of
+    $O(n^2)$ bits, where $n$ is the number of qubits.
+
+    Every gate conjugates the rows of the tableau in $O(n)$ time, and a measurement takes $O(n^2)$ time. Hence,
+    circuits of thousands of qubits, such as surface code circuits, can be simulated in polynomial time.
+
+    The simulator has the same interface and measurement semantics as the `StatevectorSimulator`: measurements are
+    deferred until the measured qubit is operated on again, and reset and init instructions collapse the qubit and
+    bring it to the $|0\\rangle$ state. The outcomes of the deferred measurements are uniformly distributed over an
+    affine subspace, from which all shots are drawn at once.
+
+    Args:
+        qubit_register_size (int): The size of the qubit register.
+        bit_register_size (int): The size of the bit register.
+        seed (int | np.random.Generator | None): Seed for, or, the random number generator. Default is `None`.
+
+    """
+
+    def __init__(
+        self, qubit_register_size: int, bit_register_size: int = 0, seed: int | np.random.Generator | None = None
+    ) -> None:
+        super().__init__(qubit_register_size, bit_register_size, seed)
+
+        self.tableau = CliffordTableau(qubit_register_size)
+
+    def sample(self, shots: int, seed: int | np.random.Generator | None = None) -> dict[str, int]:
+        """Sample the values of the bit register at the end of the circuit.
+
+        Args:
+            shots (int): The number of shots.
+            seed (int | np.random.Generator | None): Seed or random number generator to draw the shots with.
+                Default is `None`.
+
+        Returns:
+            The number of occurrences of the sampled bit register values, keyed by the bit string of the bit register,
+            where bit #0 is the rightmost character.
+
+        """
+        if shots < 0:
+            msg = f"number of shots must be non-negative, got {shots!r}"
+            raise ValueError(msg)
+        if shots == 0:
+            return {}
+
+        tableau = self.tableau
+        rotated_axes = {qubit: axis for qubit, axis in self.measurement_axes.items() if axis != Z_AXIS}
+        if rotated_axes:
+            tableau = tableau.copy()
+            for qubit, axis in rotated_axes.items():
+                tableau.apply(_get_basis_change_pauli_images(axis), [qubit])  # ty: ignore[invalid-argument-type]
+        particular_outcome, basis = tableau.get_z_outcomes_affine_space()
+
+        qubits = list(self.deferred_bits.values())
+        coefficients = np.random.default_rng(seed).integers(2, size=(shots, len(basis)), dtype=np.uint8)
+        outcomes = (coefficients @ basis[:, qubits].astype(np.uint8)) % 2 != 0
+        outcomes ^= particular_outcome[qubits]
+
+        return self._count_bit_registers(outcomes)
+
+    def visit_single_qubit_gate(self, gate: SingleQubitGate) -> None:
+        self._collapse_deferred_measurements(gate.qubit_indices)
+        self.tableau.apply(_get_gate_pauli_images(gate), gate.qubit_indices)
+
+    def visit_two_qubit_gate(self, gate: TwoQubitGate) -> None:
+        self._collapse_deferred_measurements(gate.qubit_indices)
+        self.tableau.apply(_get_gate_pauli_images(gate), gate.qubit_indices)
+
+    def visit_measure(self, measure: Measure) -> None:
+        _get_basis_change_pauli_images(measure.axis)
+        super().visit_measure(measure)
+
+    def _apply_single_qubit_matrix(self, matrix: ArrayLike, qubit: int) -> None:
+        self.tableau.apply(_get_matrix_pauli_images(matrix), [qubit])
+
+    def _collapse(self, qubit: int) -> int:
+        """Samples the outcome of a measurement of the qubit along the Z axis, and collapses the state accordingly."""
+        if self.tableau.is_deterministic(qubit):
+            return self.tableau.measure(qubit, self.rng)
+        return self.tableau.measure(qubit, self.rng, outcome=self._sample_outcome(0.5))
+
+
+def simulate_stabilizer(circuit: Circuit, seed: int | np.random.Generator | None = None) -> StabilizerSimulator:
+    """Simulate the stabilizer circuit with a stabilizer simulator.
+
+    Args:
+        circuit (Circuit): The stabilizer circuit to simulate.
+        seed (int | np.random.Generator | None): Seed for, or, the random number generator, which is used to sample
+            the outcomes of mid-circuit measurements and resets. Default is `None`.
+
+    Returns:
+        The stabilizer simulator, holding the final tableau of the circuit.
+
+    Raises:
+        ValueError: If the circuit contains a gate that is not a Clifford gate.
+
+    """
+    simulator = StabilizerSimulator(circuit.qubit_register_size, circuit.bit_register_size, seed)
+    circuit.ir.accept(simulator)
+    return simulator
+
+
+def get_clifford_tableau(circuit: Circuit) -> CliffordTableau:
+    """Get the Clifford tableau of a stabilizer circuit, _i.e._, the images of the Pauli generators $X_j$ and $Z_j$
+    under conjugation by the unitary of the circuit. Non-unitary instructions are ignored.
+
+    Args:
+        circuit (Circuit): The stabilizer circuit.
+
+    Returns:
+        The Clifford tableau, which determines the unitary of the circuit up to a global phase.
+
+    Raises:
+        ValueError: If the circuit contains a gate that is not a Clifford gate.
+
+    """
+    builder = _TableauBuilder(circuit.qubit_register_size)
+    circuit.ir.accept(builder)
+    return builder.tableau
+
+
+def sample_stabilizer(circuit: Circuit, shots: int, seed: int | np.random.Generator | None = None) -> dict[str, int]:
+    """Simulate the stabilizer circuit and sample the values of its bit register at the end of the circuit.
+
+    Args:
+        circuit (Circuit): The stabilizer circuit to sample.
+        shots (int): The number of shots.
+        seed (int | np.random.Generator | None): Seed for, or, the random number generator. Default is `None`.
+
+    Returns:
+        The number of occurrences of the sampled bit register values, keyed by the bit string of the bit register,
+        where bit #0 is the rightmost character.
+
+    """
+    rng = np.random.default_rng(seed)
+    return sample_trajectories(
+        lambda: StabilizerSimulator(circuit.qubit_register_size, circuit.bit_register_size, rng),
+        circuit.ir.accept,
+        shots,
+        rng,
+    )
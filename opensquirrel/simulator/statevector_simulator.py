@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from opensquirrel.common import ATOL
+from opensquirrel.simulator.deferred_measurement import (
+    Z_AXIS,
+    TrajectorySimulator,
+    get_measurement_basis_change,
+    sample_trajectories,
+)
+from opensquirrel.utils.gate_fusion import accept_fused
+from opensquirrel.utils.tensor_contraction import apply_matrix_to_tensor_in_place, get_qubit_axes
+
+if TYPE_CHECKING:
+    from opensquirrel.circuit import Circuit
+    from opensquirrel.ir.single_qubit_gate import SingleQubitGate
+    from opensquirrel.ir.two_qubit_gate import TwoQubitGate
+    from opensquirrel.utils.gate_fusion import FusedGate, FusionStatistics
+
+
+class StatevectorSimulator(TrajectorySimulator):
+    """Simulates a circuit by applying its gates to a statevector of $2^n$ amplitudes, where $n$ is the number of
+    qubits.
+
+    The statevector is stored as a tensor with $n$ axes of dimension 2, and each gate is applied in place by
+    contracting its (small) matrix with the axes of the qubits it acts on only.
+
+    Measurements are deferred: a measured qubit is not collapsed, but the bits it is measured to are read out from
+    the final state, _e.g._, through `get_bit_register_probabilities`. A measured qubit is only collapsed, by sampling
+    the measurement outcome, when it is operated on after the measurement (mid-circuit measurement). Reset and init
+    instructions collapse the qubit and bring it to the $|0\\rangle$ state. Sampled outcomes use the random number
+    generator of the simulator, so the simulation of a circuit with mid-circuit measurements or resets is one of its
+    possible trajectories.
+
+    Args:
+        qubit_register_size (int): The size of the qubit register.
+        bit_register_size (int): The size of the bit register.
+        seed (int | np.random.Generator | None): Seed for, or, the random number generator. Default is `None`.
+
+    """
+
+    def __init__(
+        self, qubit_register_size: int, bit_register_size: int = 0, seed: int | np.random.Generator | None = None
+    ) -> None:
+        super().__init__(qubit_register_size, bit_register_size, seed)
+
+        self.state = np.zeros((2,) * self.qubit_register_size, dtype=np.complex128)
+        self.state[(0,) * self.qubit_register_size] = 1
+
+        # Statistics of the gate fusion, if the gates of the simulated circuit are fused.
+        self.fusion_statistics: FusionStatistics | None = None
+
+    @property
+    def statevector(self) -> NDArray[np.complex128]:
+        """The statevector of $2^n$ amplitudes. By convention, qubit #0 corresponds to the least significant bit of
+        the index of an amplitude.
+        """
+        return self.state.reshape(-1)
+
+    @property
+    def probabilities(self) -> NDArray[np.float64]:
+        """The probabilities of the $2^n$ computational basis states, before any deferred measurement."""
+        return np.abs(self.statevector) ** 2
+
+    def get_amplitude(self, ket: int) -> complex:
+        """Get the amplitude of a computational basis state.
+
+        Args:
+            ket (int): A quantum ket, represented by its corresponding non-negative integer.
+                By convention, qubit #0 corresponds to the least significant bit.
+
+        Returns:
+            The amplitude of the computational basis state.
+
+        """
+        return complex(self.statevector[ket])
+
+    def get_measurement_probabilities(self) -> NDArray[np.float64]:
+        """Get the probabilities of the $2^n$ outcomes of the deferred measurements, in which the qubits with a
+        deferred measurement are measured along their measurement axis.
+
+        Returns:
+            The probabilities, indexed by the ket of the measurement outcomes (qubit #0 is the least significant bit).
+
+        """
+        rotated_axes = {qubit: axis for qubit, axis in self.measurement_axes.items() if axis != Z_AXIS}
+        if not rotated_axes:
+            return self.probabilities
+
+        state = self.state.copy()
+        for qubit, axis in rotated_axes.items():
+            apply_matrix_to_tensor_in_place(
+                state, get_measurement_basis_change(axis), [qubit], self.qubit_register_size
+            )
+        return np.abs(state.reshape(-1)) ** 2
+
+    def get_bit_register_probabilities(self) -> dict[str, float]:
+        """Get the probability distribution of the values of the bit register at the end of the circuit.
+
+        Returns:
+            The probabilities of the bit register values that can occur, keyed by the bit string of the bit register,
+            where bit #0 is the rightmost character. Bits that are never measured to are 0.
+
+        """
+        values, probabilities = self._get_bit_register_distribution()
+        return {
+            self._to_bit_string(value): float(probability)
+            for value, probability in zip(values, probabilities, strict=True)
+        }
+
+    def sample(self, shots: int, seed: int | np.random.Generator | None = None) -> dict[str, int]:
+        """Sample the values of the bit register at the end of the circuit.
+
+        All shots are drawn at once, with a single search in the cumulative probability distribution of the bit
+        register values.
+
+        Args:
+            shots (int): The number of shots.
+            seed (int | np.random.Generator | None): Seed or random number generator to draw the shots with.
+                Default is `None`.
+
+        Returns:
+            The number of occurrences of the sampled bit register values, keyed by the bit string of the bit register,
+            where bit #0 is the rightmost character.
+
+        """
+        if shots < 0:
+            msg = f"number of shots must be non-negative, got {shots!r}"
+            raise ValueError(msg)
+
+        values, probabilities = self._get_bit_register_distribution()
+        cumulative_probabilities = np.cumsum(probabilities)
+        cumulative_probabilities /= cumulative_probabilities[-1]
+        random_numbers = np.random.default_rng(seed).random(shots)
+        indices = np.searchsorted(cumulative_probabilities, random_numbers, side="right")
+        counts = np.bincount(np.minimum(indices, len(values) - 1), minlength=len(values))
+        return {self._to_bit_string(value): int(count) for value, count in zip(values, counts, strict=True) if count}
+
+    def _get_bit_register_distribution(self) -> tuple[NDArray[np.int64], NDArray[np.float64]]:
+        probabilities = self.get_measurement_probabilities()
+        kets = np.flatnonzero(probabilities > ATOL**2)
+        bit_register_values = self._get_bit_register_values(kets)
+        values, inverse = np.unique(bit_register_values, return_inverse=True)
+        return values, np.bincount(inverse, weights=probabilities[kets], minlength=len(values))
+
+    def _get_bit_register_values(self, kets: NDArray[np.intp]) -> NDArray[np.int64]:
+        values = np.full(kets.shape, sum(value << bit for bit, value in self.bit_values.items()), dtype=np.int64)
+        for bit, qubit in self.deferred_bits.items():
+            values |= ((kets >> qubit) & 1).astype(np.int64) << bit
+        return values
+
+    def visit_single_qubit_gate(self, gate: SingleQubitGate) -> None:
+        self._collapse_deferred_measurements(gate.qubit_indices)
+        apply_matrix_to_tensor_in_place(self.state, gate.matrix, gate.qubit_indices, self.qubit_register_size)
+
+    def visit_two_qubit_gate(self, gate: TwoQubitGate) -> None:
+        self._collapse_deferred_measurements(gate.qubit_indices)
+        apply_matrix_to_tensor_in_place(self.state, gate.matrix, gate.qubit_indices, self.qubit_register_size)
+
+    def visit_fused_gate(self, fused_gate: FusedGate) -> None:
+        self._collapse_deferred_measurements(fused_gate.qubit_indices)
+        apply_matrix_to_tensor_in_place(
+            self.state, fused_gate.matrix, fused_gate.qubit_indices, self.qubit_register_size
+        )
+
+    def _apply_single_qubit_matrix(self, matrix: ArrayLike, qubit: int) -> None:
+        apply_matrix_to_tensor_in_place(self.state, matrix, [qubit], self.qubit_register_size)
+
+    def _collapse(self, qubit: int) -> int:
+        """Samples the outcome of a measurement of the qubit along the Z axis, and collapses the state accordingly."""
+        (axis,) = get_qubit_axes([qubit], self.qubit_register_size)
+        view = np.moveaxis(self.state, axis, 0)
+        probability_one = min(float(np.sum(np.abs(view[1]) ** 2)), 1.0)
+        outcome = self._sample_outcome(probability_one)
+        view[1 - outcome] = 0
+        view[outcome] /= math.sqrt(probability_one if outcome == 1 else 1 - probability_one)
+        return outcome
+
+
+def simulate(
+    circuit: Circuit, seed: int | np.random.Generator | None = None, fusion_size: int | None = None
+) -> StatevectorSimulator:
+    """Simulate the circuit with a statevector simulator.
+
+    Args:
+        circuit (Circuit): The circuit to simulate.
+        seed (int | np.random.Generator | None): Seed for, or, the random number generator, which is used to sample
+            the outcomes of mid-circuit measurements and resets. Default is `None`.
+        fusion_size (int | None): If given, consecutive gates are fused into dense blocks acting on at most this many
+            qubits (see `opensquirrel.utils.gate_fusion.fuse_gates`) before they are applied to the state, and the
+            statistics of the fusion are stored in the `fusion_statistics` of the simulator. Default is `None`.
+
+    Returns:
+        The statevector simulator, holding the final state of the circuit.
+
+    """
+    simulator = StatevectorSimulator(circuit.qubit_register_size, circuit.bit_register_size, seed)
+    _accept(circuit, simulator, fusion_size)
+    return simulator
+
+
+def _accept(circuit: Circuit, simulator: StatevectorSimulator, fusion_size: int | None) -> None:
+    if fusion_size is None:
+        circuit.ir.accept(simulator)
+    else:
+        simulator.fusion_statistics = accept_fused(circuit.ir, simulator, fusion_size)
+
+
+def sample(
+    circuit: Circuit, shots: int, seed: int | np.random.Generator | None = None, fusion_size: int | None = None
+) -> dict[str, int]:
+    """Simulate the circuit and sample the values of its bit register at the end of the circuit.
+
+    Note:
+        If the final state depends on sampled outcomes of mid-circuit measurements or resets, the shots are split over
+        the trajectories of the circuit, and the circuit is simulated once for every trajectory that is followed by at
+        least one shot (see `sample_trajectories`).
+
+    Args:
+        circuit (Circuit): The circuit to sample.
+        shots (int): The number of shots.
+        seed (int | np.random.Generator | None): Seed for, or, the random number generator. Default is `None`.
+        fusion_size (int | None): The maximum number of qubits of a fused gate, see `simulate`. Default is `None`.
+
+    Returns:
+        The number of occurrences of the sampled bit register values, keyed by the bit string of the bit register,
+        where bit #0 is the rightmost character.
+
+    """
+    rng = np.random.default_rng(seed)
+    return sample_trajectories(
+        lambda: StatevectorSimulator(circuit.qubit_register_size, circuit.bit_register_size, rng),
+        lambda simulator: _accept(circuit, simulator, fusion_size),
+        shots,
+        rng,
+    )
@@ -2,9 +2,12 @@ from opensquirrel.utils.general_math import acos, are_axes_consecutive
 from opensquirrel.utils.identity_filter import filter_out_identities
 from opensquirrel.utils.list import flatten_list
 from opensquirrel.utils.matrix_expander import can1, expand_ket, get_matrix, get_reduced_ket
+from opensquirrel.utils.tensor_contraction import apply_matrix_stack_to_tensor, apply_matrix_to_tensor
 
 __all__ = [
     "acos",
+    "apply_matrix_stack_to_tensor",
+    "apply_matrix_to_tensor",
     "are_axes_consecutive",
     "can1",
     "expand_ket",
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, NamedTuple, Protocol
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from opensquirrel.ir import IRVisitor
+from opensquirrel.utils.tensor_contraction import apply_matrix_to_tensor
+
+if TYPE_CHECKING:
+    from opensquirrel.ir import IR, ControlInstruction, NonUnitary, Statement
+    from opensquirrel.ir.single_qubit_gate import SingleQubitGate
+    from opensquirrel.ir.two_qubit_gate import TwoQubitGate
+
+DEFAULT_FUSION_SIZE = 4
+
+
+class FusedGate(NamedTuple):
+    """A dense block of consecutive gates.
+
+    Attributes:
+        matrix: The $2^k\\times 2^k$ matrix of the block, following the gate matrix convention, _i.e._, the first
+            qubit operand corresponds to the most significant bit.
+        qubit_indices: The $k$ qubit operands of the block.
+        number_of_gates: The number of gates that are fused into the block.
+    """
+
+    matrix: NDArray[np.complex128]
+    qubit_indices: list[int]
+    number_of_gates: int
+
+
+@dataclass
+class FusionStatistics:
+    """Statistics of a gate fusion.
+
+    Attributes:
+        number_of_gates: The number of gates before fusion.
+        number_of_fused_gates: The number of fused gates, _i.e._, dense blocks, after fusion.
+        fused_gate_sizes: The number of fused gates per number of qubits they act on.
+    """
+
+    number_of_gates: int = 0
+    number_of_fused_gates: int = 0
+    fused_gate_sizes: Counter[int] = field(default_factory=Counter)
+
+    @property
+    def gates_per_fused_gate(self) -> float:
+        """The average number of gates per fused gate."""
+        return self.number_of_gates / self.number_of_fused_gates if self.number_of_fused_gates else 0.0
+
+
+class FusedGateVisitor(Protocol):
+    """An IR visitor that can apply fused gates."""
+
+    def visit_fused_gate(self, fused_gate: FusedGate) -> None: ...
+
+
+class _GateFuser(IRVisitor):
+    """Greedily fuses consecutive gates into a dense block, as long as the block acts on at most `max_fusion_size`
+    qubits. Non-unitary instructions end the current block and are kept, in order, in between the fused gates.
+    """
+
+    def __init__(self, max_fusion_size: int) -> None:
+        self.max_fusion_size = max_fusion_size
+        self.statistics = FusionStatistics()
+        self.statements: list[Statement | FusedGate] = []
+
+        self._qubit_indices: list[int] = []
+        self._matrix = np.eye(1, dtype=np.complex128)
+        self._number_of_gates = 0
+
+    def flush(self) -> None:
+        if self._number_of_gates == 0:
+            return
+        self.statements.append(FusedGate(self._matrix, self._qubit_indices, self._number_of_gates))
+        self.statistics.number_of_fused_gates += 1
+        self.statistics.fused_gate_sizes[len(self._qubit_indices)] += 1
+
+        self._qubit_indices = []
+        self._matrix = np.eye(1, dtype=np.complex128)
+        self._number_of_gates = 0
+
+    def add_gate(self, matrix: ArrayLike, qubit_indices: list[int]) -> None:
+        new_qubit_indices = [qubit for qubit in qubit_indices if qubit not in self._qubit_indices]
+        if len(self._qubit_indices) + len(new_qubit_indices) > self.max_fusion_size:
+            self.flush()
+            new_qubit_indices = list(qubit_indices)
+
+        # The new qubits become the least significant bits of the block.
+        self._matrix = np.kron(self._matrix, np.eye(1 << len(new_qubit_indices), dtype=np.complex128))
+        self._qubit_indices = self._qubit_indices + new_qubit_indices
+
+        # Apply the gate to the rows of the block, whose qubit axes are ordered as the qubit operands of the block.
+        block_size = len(self._qubit_indices)
+        local_indices = [block_size - 1 - self._qubit_indices.index(qubit) for qubit in qubit_indices]
+        tensor = self._matrix.reshape((2,) * block_size + (1 << block_size,))
+        self._matrix = apply_matrix_to_tensor(tensor, matrix, local_indices, block_size).reshape(
+            1 << block_size, 1 << block_size
+        )
+        self._number_of_gates += 1
+        self.statistics.number_of_gates += 1
+
+    def visit_single_qubit_gate(self, gate: SingleQubitGate) -> None:
+        self.add_gate(gate.matrix, gate.qubit_indices)
+
+    def visit_two_qubit_gate(self, gate: TwoQubitGate) -> None:
+        self.add_gate(gate.matrix, gate.qubit_indices)
+
+    def visit_non_unitary(self, non_unitary: NonUnitary) -> None:
+        self.flush()
+        self.statements.append(non_unitary)
+
+    def visit_control_instruction(self, control_instruction: ControlInstruction) -> None:
+        self.statements.append(control_instruction)
+
+
+def fuse_gates(
+    ir: IR, max_fusion_size: int = DEFAULT_FUSION_SIZE
+) -> tuple[list[Statement | FusedGate], FusionStatistics]:
+    """Fuse consecutive gates into dense blocks that act on at most `max_fusion_size` qubits.
+
+    Gates are fused greedily, in order: a gate is added to the current block if the block then still acts on at most
+    `max_fusion_size` qubits, and starts a new block otherwise. Applying a fused gate to a state (or unitary) of $n$
+    qubits takes a single pass over its $2^n$ amplitudes, instead of one pass per gate. Non-unitary instructions
+    (measure, reset, init) end the current block.
+
+    Args:
+        ir (IR): The IR of the circuit.
+        max_fusion_size (int): The maximum number of qubits a fused gate acts on, at least 2. Default is
+            `DEFAULT_FUSION_SIZE`.
+
+    Returns:
+        The fused gates and the (non-unitary and control) instructions in between them, in order, and the statistics
+        of the fusion.
+
+    """
+    if max_fusion_size < 2:
+        msg = f"maximum fusion size must be at least 2, got {max_fusion_size!r}"
+        raise ValueError(msg)
+
+    fuser = _GateFuser(max_fusion_size)
+    ir.accept(fuser)
+    fuser.flush()
+    return fuser.statements, fuser.statistics
+
+
+def accept_fused(ir: IR, visitor: FusedGateVisitor, max_fusion_size: int = DEFAULT_FUSION_SIZE) -> FusionStatistics:
+    """Let the visitor visit the IR with its gates fused into dense blocks (see `fuse_gates`): every fused gate is
+    passed to `visitor.visit_fused_gate`, and every other statement accepts the visitor as usual.
+
+    Args:
+        ir (IR): The IR of the circuit.
+        visitor (FusedGateVisitor): The IR visitor that applies the fused gates.
+        max_fusion_size (int): The maximum number of qubits a fused gate acts on, at least 2. Default is
+            `DEFAULT_FUSION_SIZE`.
+
+    Returns:
+        The statistics of the fusion.
+
+    """
+    statements, statistics = fuse_gates(ir, max_fusion_size)
+    for statement in statements:
+        if isinstance(statement, FusedGate):
+            visitor.visit_fused_gate(statement)
+        else:
+            statement.accept(visitor)  # ty: ignore[invalid-argument-type]
+    return statistics
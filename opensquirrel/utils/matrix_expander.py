@@ -4,11 +4,13 @@ import cmath
 import itertools
 import math
 from collections.abc import Iterable
+from functools import lru_cache
 from math import pi
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal, overload
 
 import numpy as np
 from numpy.typing import NDArray
+from scipy.sparse import coo_array
 
 from opensquirrel.common import ATOL
 from opensquirrel.ir import (
@@ -21,6 +23,8 @@ from opensquirrel.ir import (
 from opensquirrel.ir.semantics.canonical_gate import CanonicalAxis
 
 if TYPE_CHECKING:
+    from scipy.sparse import csr_array
+
     from opensquirrel.ir import Gate
     from opensquirrel.ir.single_qubit_gate import SingleQubitGate
     from opensquirrel.ir.two_qubit_gate import TwoQubitGate
@@ -111,6 +115,60 @@ def expand_ket(base_ket: int, reduced_ket: int, qubits: Iterable[QubitLike]) ->
     return expanded_ket
 
 
+EXPANSION_INDICES_CACHE_SIZE = 64
+
+
+@lru_cache(maxsize=EXPANSION_INDICES_CACHE_SIZE)
+def get_expansion_indices(
+    qubit_register_size: int, qubit_indices: tuple[int, ...]
+) -> tuple[NDArray[np.intp], NDArray[np.intp]]:
+    """Compute, for all kets of the register at once, the index arrays needed to expand a small matrix acting on
+    the given qubits to the full register. This is the vectorized equivalent of calling `get_reduced_ket` and
+    `expand_ket` for every column of the expanded matrix.
+
+    The results are cached (in a bounded LRU cache) per register size and qubit operands, so they are reused across
+    gates. The returned arrays are read-only.
+
+    Args:
+        qubit_register_size (int): The size of the qubit register.
+        qubit_indices (tuple[int, ...]): The indices of the qubits the small matrix acts on. Order matters.
+
+    Returns:
+        A tuple with:
+
+        - the reduced kets, i.e., the column of the small matrix, for every column of the expanded matrix, and
+        - the expanded kets, i.e., the row of the expanded matrix, for every row of the small matrix (first axis)
+          and every column of the expanded matrix (second axis).
+
+    """
+    kets = np.arange(1 << qubit_register_size, dtype=np.intp)
+    reduced_kets = np.zeros_like(kets)
+    operands_mask = 0
+    for i, qubit_index in enumerate(qubit_indices):
+        reduced_kets |= ((kets >> qubit_index) & 1) << i
+        operands_mask |= 1 << qubit_index
+
+    small_kets = np.arange(1 << len(qubit_indices), dtype=np.intp)
+    deposited_kets = np.zeros_like(small_kets)
+    for i, qubit_index in enumerate(qubit_indices):
+        deposited_kets |= ((small_kets >> i) & 1) << qubit_index
+    expanded_kets = (kets & ~operands_mask)[np.newaxis, :] | deposited_kets[:, np.newaxis]
+
+    reduced_kets.setflags(write=False)
+    expanded_kets.setflags(write=False)
+    return reduced_kets, expanded_kets
+
+
+def _expand_matrix(
+    matrix: NDArray[np.complex128], qubit_indices: Iterable[int], qubit_register_size: int
+) -> NDArray[np.complex128]:
+    reduced_kets, expanded_kets = get_expansion_indices(qubit_register_size, tuple(qubit_indices))
+    expanded_matrix = np.zeros((1 << qubit_register_size, 1 << qubit_register_size), dtype=matrix.dtype)
+    columns = np.arange(1 << qubit_register_size, dtype=np.intp)
+    expanded_matrix[expanded_kets, columns[np.newaxis, :]] = matrix[:, reduced_kets]
+    return expanded_matrix
+
+
 class _MatrixExpander(IRVisitor):
     def __init__(self, qubit_register_size: int) -> None:
         self.qubit_register_size = qubit_register_size
@@ -196,14 +254,7 @@ class _MatrixExpander(IRVisitor):
             )
             raise ValueError(msg)
 
-        expanded_matrix = np.zeros((1 << self.qubit_register_size, 1 << self.qubit_register_size), dtype=m.dtype)
-
-        for expanded_matrix_column in range(expanded_matrix.shape[1]):
-            small_matrix_col = get_reduced_ket(expanded_matrix_column, qubit_operands)
-
-            for small_matrix_row, value in enumerate(m[:, small_matrix_col]):
-                expanded_matrix_row = expand_ket(expanded_matrix_column, small_matrix_row, qubit_operands)
-                expanded_matrix[expanded_matrix_row][expanded_matrix_column] = value
+        expanded_matrix = _expand_matrix(m, (q.index for q in qubit_operands), self.qubit_register_size)
 
         if expanded_matrix.shape != (1 << self.qubit_register_size, 1 << self.qubit_register_size):
             msg = f"expended matrix has incorrect shape {expanded_matrix.shape!r}:"
@@ -224,14 +275,7 @@ class _MatrixExpander(IRVisitor):
 
         m = np.array(gate.matrix)
 
-        expanded_matrix = np.zeros((1 << self.qubit_register_size, 1 << self.qubit_register_size), dtype=m.dtype)
-
-        for expanded_matrix_column in range(expanded_matrix.shape[1]):
-            small_matrix_col = get_reduced_ket(expanded_matrix_column, qubit_operands)
-
-            for small_matrix_row, value in enumerate(m[:, small_matrix_col]):
-                expanded_matrix_row = expand_ket(expanded_matrix_column, small_matrix_row, qubit_operands)
-                expanded_matrix[expanded_matrix_row][expanded_matrix_column] = value
+        expanded_matrix = _expand_matrix(m, (q.index for q in qubit_operands), self.qubit_register_size)
 
         if expanded_matrix.shape != (1 << self.qubit_register_size, 1 << self.qubit_register_size):
             msg = (
@@ -323,77 +367,212 @@ def nearest_kronecker_product(c: NDArray[np.complex128]) -> tuple[NDArray[np.com
     return a, b
 
 
-def global_phase_and_su4(unitary: NDArray[np.complex128]) -> tuple[float, NDArray[np.complex128]]:
-    """Extract global phase so that det(u_su) = 1.  U = e^{i alpha} u_su."""
+def global_phase_and_su4(
+    unitary: NDArray[np.complex128],
+) -> tuple[float | NDArray[np.float64], NDArray[np.complex128]]:
+    """Extract global phase so that det(u_su) = 1.  U = e^{i alpha} u_su.
+
+    Also applies to a stack of unitaries, of which the global phases are returned as an array.
+    """
     d = np.linalg.det(unitary)
     alpha = np.angle(d) / 4.0
-    u_su = unitary * np.exp(-1j * alpha)
+    u_su = unitary * np.exp(-1j * alpha)[..., np.newaxis, np.newaxis]
     return alpha, u_su
 
 
-def _orthogonal_diagonalization(
-    matrix: NDArray[np.complex128],
+# Weights of the real and imaginary part of a complex symmetric matrix, which are diagonalized in turn until the
+# eigenvectors of a weighted sum diagonalize the matrix itself. Fixed (irrational) weights keep the decomposition
+# deterministic, while avoiding the degeneracies of weights like 1/2 for the eigenvalues of Clifford gates.
+_DIAGONALIZATION_WEIGHTS = tuple((0.3819660112501051 + k * 0.6180339887498949) % 1 for k in range(16))
+
+# The magic basis, in which local two-qubit gates are real orthogonal matrices
+_MAGIC_BASIS = (1 / np.sqrt(2)) * np.array(
+    [[1, 0, 0, 1j], [0, 1j, 1, 0], [0, 1j, -1, 0], [1, 0, 0, -1j]], dtype=np.complex128
+)
+
+# The permutations and sign patterns of the eigenvalues that are tried (in order) to put the canonical axis in the
+# Weyl chamber
+_WEYL_SIGN_PATTERNS = np.array([[1, 1, 1, 1], [1, 1, -1, -1], [-1, 1, -1, 1], [1, -1, -1, 1]])
+_WEYL_PERMUTATIONS = np.repeat(np.array(list(itertools.permutations(range(4)))), len(_WEYL_SIGN_PATTERNS), axis=0)
+_WEYL_SIGNS = np.tile(_WEYL_SIGN_PATTERNS, (24, 1))
+
+
+def _orthogonal_diagonalizations(
+    matrices: NDArray[np.complex128],
 ) -> tuple[NDArray[np.complex128], NDArray[np.complex128]]:
-    """
+    """Diagonalizes a stack of complex symmetric (unitary) matrices $M = O D O^T$ with real orthogonal $O$.
+
     Adapted from: https://github.com/gecrooks/quantumflow/blob/master/quantumflow/decompositions.py#L324
+
+    Args:
+        matrices: The $(m, n, n)$ stack of matrices.
+
+    Returns:
+        The $(m, n)$ eigenvalues and $(m, n, n)$ eigenvectors (as columns) of the matrices.
+
     """
-    rng = np.random.default_rng()
-    max_attempts = 16
-    for _ in range(max_attempts):
-        c = rng.uniform(0, 1)
-        m = c * matrix.real + (1 - c) * matrix.imag
-        _, eigvecs = np.linalg.eigh(m)
-        eigvecs = np.array(eigvecs, dtype=complex)
-        eigvals = np.diag(eigvecs.transpose() @ matrix @ eigvecs)
-
-        # Finish if we got a correct answer.
-        reconstructed = eigvecs @ np.diag(eigvals) @ eigvecs.transpose()
-        if np.allclose(matrix, reconstructed):
-            return eigvals, eigvecs
+    eigenvalues = np.empty(matrices.shape[:-1], dtype=np.complex128)
+    eigenvectors = np.empty(matrices.shape, dtype=np.complex128)
+    remaining = np.arange(len(matrices))
+    for weight in _DIAGONALIZATION_WEIGHTS:
+        remaining_matrices = matrices[remaining]
+        _, vectors = np.linalg.eigh(weight * remaining_matrices.real + (1 - weight) * remaining_matrices.imag)
+        values = np.einsum("mji,mjk,mki->mi", vectors, remaining_matrices, vectors)
+
+        # Keep the matrices that are diagonalized, and retry the others with the next weight
+        reconstructed = (vectors * values[:, np.newaxis, :]) @ vectors.transpose(0, 2, 1)
+        is_diagonalized = np.isclose(reconstructed, remaining_matrices).all(axis=(1, 2))
+        eigenvalues[remaining[is_diagonalized]] = values[is_diagonalized]
+        eigenvectors[remaining[is_diagonalized]] = vectors[is_diagonalized]
+        remaining = remaining[~is_diagonalized]
+        if not remaining.size:
+            return eigenvalues, eigenvectors
 
     msg = "matrix is not orthogonally diagonalizable"
     raise np.linalg.LinAlgError(msg)
 
 
-def lambdas_to_coords(lambdas: NDArray[np.complex128]) -> tuple[float, float, float]:
-    l1, l2, _, l4 = lambdas
-    c1 = np.real(1j * np.log(l1 * l2))
-    c2 = np.real(1j * np.log(l2 * l4))
-    c3 = np.real(1j * np.log(l1 * l4))
-    coords = np.asarray((c1, c2, c3)) / np.pi
+def _lambdas_to_coords(lambdas: NDArray[np.complex128]) -> NDArray[np.float64]:
+    """Vectorized `lambdas_to_coords`, over the leading axes of an $(..., 4)$ array of eigenvalues.
 
-    coords[np.abs(coords - 1) < ATOL] = -1
-    if all(coords < 0):
-        coords += 1
-
-    if np.abs(coords[0] - coords[1]) < ATOL:
-        coords[1] = coords[0]
+    Round-off around 0 and 1/2 is removed first, such that it is not taken to be negative or to cross the boundary of
+    the Weyl chamber.
+    """
+    l1, l2, l4 = lambdas[..., 0], lambdas[..., 1], lambdas[..., 3]
+    coords = -np.angle(np.stack((l1 * l2, l2 * l4, l1 * l4), axis=-1)) / np.pi
 
-    if np.abs(coords[1] - coords[2]) < ATOL:
-        coords[2] = coords[1]
+    coords[np.abs(coords - 1) < ATOL] = -1
+    coords[np.abs(coords) < ATOL] = 0
+    is_half = np.abs(np.abs(coords) - 1 / 2) < ATOL
+    coords[is_half] = np.copysign(1 / 2, coords[is_half])
+    coords[(coords < 0).all(axis=-1)] += 1
 
-    if np.abs(coords[0] - coords[1] - 1 / 2) < ATOL:
-        coords[1] = coords[0] - 1 / 2
+    c0 = coords[..., 0]
+    coords[..., 1] = np.where(np.abs(c0 - coords[..., 1]) < ATOL, c0, coords[..., 1])
+    coords[..., 2] = np.where(np.abs(coords[..., 1] - coords[..., 2]) < ATOL, coords[..., 1], coords[..., 2])
+    coords[..., 1] = np.where(np.abs(c0 - coords[..., 1] - 1 / 2) < ATOL, c0 - 1 / 2, coords[..., 1])
 
     coords[np.abs(coords) < ATOL] = 0
     return coords
 
 
+def _constrain_to_weyl_chamber(
+    lambdas: NDArray[np.complex128],
+) -> tuple[NDArray[np.float64], NDArray[np.int_], NDArray[np.int_]]:
+    """Vectorized `constrain_to_weyl_chamber`, over an $(m, 4)$ array of eigenvalues, which tries all permutations and
+    sign patterns at once.
+
+    Args:
+        lambdas: The $(m, 4)$ eigenvalues.
+
+    Returns:
+        The $(m, 3)$ canonical axes, and the $(m, 4)$ sign patterns and permutations of the eigenvalues.
+
+    """
+    candidate_lambdas = np.take_along_axis(
+        lambdas[:, np.newaxis, :] * _WEYL_SIGNS, _WEYL_PERMUTATIONS[np.newaxis], axis=2
+    )
+    candidate_coords = _lambdas_to_coords(candidate_lambdas)
+    tx, ty, tz = np.moveaxis(candidate_coords, -1, 0)
+    in_weyl_chamber = ((tx <= 1 / 2) & (tx >= ty) & (ty >= tz) & (tz >= 0)) | (
+        (1 - tx <= 1 / 2) & (1 - tx >= ty) & (ty >= tz) & (tz > 0)
+    )
+    if not in_weyl_chamber.any(axis=1).all():
+        msg = "could not find a permutation and signs to put lambdas in the Weyl chamber."
+        raise ValueError(msg)
+
+    candidate = in_weyl_chamber.argmax(axis=1)
+    coords = candidate_coords[np.arange(len(lambdas)), candidate]
+    return coords, _WEYL_SIGNS[candidate], _WEYL_PERMUTATIONS[candidate]
+
+
+def _nearest_kronecker_products(
+    matrices: NDArray[np.complex128],
+) -> tuple[NDArray[np.complex128], NDArray[np.complex128]]:
+    """Vectorized `nearest_kronecker_product`, over an $(m, 4, 4)$ stack of matrices."""
+    rearranged = matrices.reshape(-1, 2, 2, 2, 2).swapaxes(2, 3).reshape(-1, 4, 4)
+    u, sv, vh = np.linalg.svd(rearranged)
+    scale = np.sqrt(sv[:, 0])[:, np.newaxis, np.newaxis]
+    return scale * u[:, :, 0].reshape(-1, 2, 2), scale * vh[:, 0, :].reshape(-1, 2, 2)
+
+
+def batch_canonical_decomposition(
+    unitaries: NDArray[np.complex128],
+) -> tuple[
+    NDArray[np.complex128],
+    NDArray[np.complex128],
+    NDArray[np.complex128],
+    NDArray[np.complex128],
+    NDArray[np.float64],
+]:
+    """Canonical (KAK) decomposition of a stack of two-qubit unitaries, vectorized over the stack, such that
+    $U_i = e^{i\\alpha_i} (k_{3,i} \\otimes k_{4,i}) \\mathrm{Can}(t_i) (k_{1,i} \\otimes k_{2,i})$.
+
+    The decomposition is deterministic: it gives the same result for the same unitary, also within different stacks.
+
+    Args:
+        unitaries: The $(m, 4, 4)$ stack of unitaries.
+
+    Returns:
+        The $(m, 2, 2)$ local operators $k_1$, $k_2$, $k_3$ and $k_4$, and the $(m, 3)$ canonical axes $t$, in the
+        Weyl chamber.
+
+    """
+    unitaries = np.asarray(unitaries, dtype=np.complex128).reshape(-1, 4, 4)
+    _, unitaries_su = global_phase_and_su4(unitaries)
+
+    magic_dagger = _MAGIC_BASIS.conj().T
+    u_m = magic_dagger @ unitaries_su @ _MAGIC_BASIS
+    q = u_m.transpose(0, 2, 1) @ u_m
+
+    eigenvalues, eigenvectors = _orthogonal_diagonalizations(q)
+    lambdas = np.sqrt(eigenvalues)
+    lambdas[np.prod(lambdas, axis=1).real < 0, 0] *= -1
+
+    axes, signs, permutations = _constrain_to_weyl_chamber(lambdas)
+    lambdas = np.take_along_axis(signs * lambdas, permutations, axis=1)
+    o2 = np.take_along_axis(
+        signs[:, :, np.newaxis] * eigenvectors.transpose(0, 2, 1), permutations[:, :, np.newaxis], axis=1
+    )
+    o1 = (u_m @ o2.transpose(0, 2, 1)) * lambdas.conj()[:, np.newaxis, :]
+
+    is_reflection = np.linalg.det(o2).real < 0
+    o2[is_reflection, 0, :] *= -1
+    o1[is_reflection, :, 0] *= -1
+
+    k1, k2 = _nearest_kronecker_products(_MAGIC_BASIS @ o2 @ magic_dagger)
+    k3, k4 = _nearest_kronecker_products(_MAGIC_BASIS @ o1 @ magic_dagger)
+    return k1, k2, k3, k4, axes
+
+
+def lambdas_to_coords(lambdas: NDArray[np.complex128]) -> NDArray[np.float64]:
+    """The canonical coordinates of the eigenvalues of a two-qubit unitary in the magic basis.
+
+    Args:
+        lambdas: The 4 eigenvalues.
+
+    Returns:
+        The 3 canonical coordinates.
+
+    """
+    return _lambdas_to_coords(np.asarray(lambdas, dtype=np.complex128))
+
+
 def constrain_to_weyl_chamber(
     lambdas: NDArray[np.complex128],
-) -> tuple[tuple[float, float, float], NDArray[np.int8], NDArray[np.int8]]:
-    for permutation in itertools.permutations(range(4)):
-        for signs in ([1, 1, 1, 1], [1, 1, -1, -1], [-1, 1, -1, 1], [1, -1, -1, 1]):
-            signed_lambdas = lambdas * np.asarray(signs)
-            lambdas_perm = signed_lambdas[list(permutation)]
+) -> tuple[NDArray[np.float64], NDArray[np.int_], NDArray[np.int_]]:
+    """Finds the (first) permutation and sign pattern of the eigenvalues that puts the canonical axis in the Weyl
+    chamber.
 
-            coords = lambdas_to_coords(lambdas_perm)
+    Args:
+        lambdas: The 4 eigenvalues.
 
-            if CanonicalAxis.in_weyl_chamber(*coords):
-                return coords, np.asarray(signs), np.asarray(permutation)
+    Returns:
+        The canonical axis, and the sign pattern and permutation of the eigenvalues.
 
-    msg = "could not find a permutation and signs to put lambdas in the Weyl chamber."
-    raise ValueError(msg)
+    """
+    coords, signs, permutations = _constrain_to_weyl_chamber(np.asarray(lambdas, dtype=np.complex128)[np.newaxis])
+    return coords[0], signs[0], permutations[0]
 
 
 def canonical_decomposition(
@@ -408,42 +587,59 @@ def canonical_decomposition(
     """
     This implentation of the canonical decomposition is heavily based on:
     https://github.com/gecrooks/quantumflow/blob/master/quantumflow/decompositions.py
+
+    The unitary is decomposed as a stack of one, see `batch_canonical_decomposition`.
     """
+    k1, k2, k3, k4, axes = batch_canonical_decomposition(unitary[np.newaxis])
+    tx, ty, tz = axes[0]
+    return k1[0], k2[0], k3[0], k4[0], CanonicalAxis(tx, ty, tz)
+
+
+def get_sparse_matrix(gate: Gate, qubit_register_size: int) -> csr_array:
+    """Compute the unitary matrix corresponding to the gate applied to those qubit operands, as a sparse (CSR)
+    matrix.
+
+    The sparse matrix is built directly from the index permutation of the expansion, without materializing the dense
+    matrix. A $k$-qubit gate has at most $2^k$ non-zero elements per column, and (numerical) zeros of the gate matrix,
+    _i.e._, elements with an absolute value below `ATOL`, are not stored. For instance, a CNOT or a CZ gate has exactly
+    one non-zero element per column.
 
-    _, u_su = global_phase_and_su4(unitary)
+    Args:
+        gate (Gate): The gate, including the qubits on which it is operated on.
+        qubit_register_size (int): The size of the qubit register.
 
-    m = (1 / np.sqrt(2)) * np.array([[1, 0, 0, 1j], [0, 1j, 1, 0], [0, 1j, -1, 0], [1, 0, 0, -1j]], dtype=np.complex128)
-    m_dag = m.conj().T
+    Returns:
+        The sparse unitary matrix corresponding to the gate applied to the qubit operands.
+
+    """
+    # The gate matrix convention has the operands reversed, see _MatrixExpander._matrix_gate.
+    qubit_indices = tuple(reversed(gate.qubit_indices))
+    if any(qubit_index >= qubit_register_size for qubit_index in qubit_indices):
+        msg = f"index out of range for gate {gate!r}"
+        raise IndexError(msg)
 
-    u_m = m_dag @ u_su @ m
-    q = u_m.T @ u_m
+    m = np.asarray(gate.matrix, dtype=np.complex128)  # ty: ignore[unresolved-attribute]
+    reduced_kets, expanded_kets = get_expansion_indices(qubit_register_size, qubit_indices)
+    data = m[:, reduced_kets]
+    columns = np.broadcast_to(np.arange(1 << qubit_register_size, dtype=np.intp), data.shape)
+    non_zero = np.abs(data) > ATOL
+    size = 1 << qubit_register_size
+    return coo_array((data[non_zero], (expanded_kets[non_zero], columns[non_zero])), shape=(size, size)).tocsr()
 
-    eig_vals, eig_vecs = _orthogonal_diagonalization(q)
-    lambdas = np.sqrt(eig_vals)
-    det_d = np.prod(lambdas)
-    if det_d.real < 0:
-        lambdas[0] = -lambdas[0]
 
-    (tx, ty, tz), signs, perm = constrain_to_weyl_chamber(lambdas)
-    lambdas = (signs * lambdas)[perm]
-    o2 = (np.diag(signs) @ eig_vecs.T)[perm]
-    d = np.diag(lambdas)
-    o1 = u_m @ o2.T @ d.conj()
+@overload
+def get_matrix(gate: Gate, qubit_register_size: int) -> NDArray[np.complex128]: ...
 
-    if np.linalg.det(o2).real < 0:
-        o2[0, :] *= -1
-        o1[:, 0] *= -1
 
-    q1 = m @ o1 @ m_dag
-    q2 = m @ o2 @ m_dag
+@overload
+def get_matrix(gate: Gate, qubit_register_size: int, *, sparse: Literal[False]) -> NDArray[np.complex128]: ...
 
-    k1, k2 = nearest_kronecker_product(q2)
-    k3, k4 = nearest_kronecker_product(q1)
 
-    return k1, k2, k3, k4, CanonicalAxis(tx, ty, tz)
+@overload
+def get_matrix(gate: Gate, qubit_register_size: int, *, sparse: Literal[True]) -> csr_array: ...
 
 
-def get_matrix(gate: Gate, qubit_register_size: int) -> NDArray[np.complex128]:
+def get_matrix(gate: Gate, qubit_register_size: int, *, sparse: bool = False) -> NDArray[np.complex128] | csr_array:
     """Compute the unitary matrix corresponding to the gate applied to those qubit operands, taken
     among any number of qubits. This can be used for, e.g.,
 
@@ -454,6 +650,7 @@ def get_matrix(gate: Gate, qubit_register_size: int) -> NDArray[np.complex128]:
     Args:
         gate (Gate): The gate, including the qubits on which it is operated on.
         qubit_register_size (int): The size of the qubit register.
+        sparse (bool): Whether to return a sparse (CSR) matrix instead of a dense one, see `get_sparse_matrix`.
 
     Returns:
         The unitary matrix corresponding to the gate applied to the qubit operands.
@@ -486,5 +683,7 @@ def get_matrix(gate: Gate, qubit_register_size: int) -> NDArray[np.complex128]:
                [0, 0, 0, 1, 0, 0, 0, 0]])
 
     """
+    if sparse:
+        return get_sparse_matrix(gate, qubit_register_size)
     expander = _MatrixExpander(qubit_register_size)
     return np.asarray(gate.accept(expander), dtype=np.complex128)
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+DEFAULT_CHUNK_SIZE = 1 << 18
+
+
+def get_qubit_axes(qubit_indices: Sequence[int], qubit_register_size: int) -> list[int]:
+    """Get the tensor axes corresponding to the given qubits.
+
+    A register of $n$ qubits is represented by a tensor with $n$ leading axes of dimension 2. By convention,
+    qubit #0 corresponds to the least significant bit, i.e., the last of these $n$ axes.
+
+    Args:
+        qubit_indices (Sequence[int]): The indices of the qubits.
+        qubit_register_size (int): The size of the qubit register.
+
+    Returns:
+        The tensor axes corresponding to the qubits, in the same order.
+
+    Example:
+        >>> get_qubit_axes([0, 2], 3)
+        [2, 0]
+
+    """
+    for qubit_index in qubit_indices:
+        if not 0 <= qubit_index < qubit_register_size:
+            msg = f"index {qubit_index!r} out of range {qubit_register_size!r}"
+            raise IndexError(msg)
+    return [qubit_register_size - 1 - qubit_index for qubit_index in qubit_indices]
+
+
+def apply_matrix_to_tensor(
+    tensor: NDArray[Any],
+    matrix: ArrayLike,
+    qubit_indices: Sequence[int],
+    qubit_register_size: int,
+) -> NDArray[Any]:
+    """Apply a small (gate) matrix to the qubit axes of a tensor, by contracting only the axes it acts on.
+
+    The tensor has $n$ leading axes of dimension 2, one for each qubit, followed by any number of trailing axes
+    (e.g., the columns of a unitary matrix), which are left untouched. Applying a $k$-qubit matrix costs
+    $O(2^k)$ operations per tensor element, instead of expanding the matrix to the full register.
+
+    The matrix follows the gate matrix convention: the first qubit operand corresponds to the most significant bit
+    of the row and column indices of the matrix. The matrix is applied in the (complex) precision of the tensor.
+
+    Args:
+        tensor (NDArray[Any]): The tensor, of shape $(2,)^n + \\text{trailing shape}$.
+        matrix (ArrayLike): The $2^k\\times 2^k$ matrix to apply.
+        qubit_indices (Sequence[int]): The $k$ qubit operands of the matrix. Order matters.
+        qubit_register_size (int): The size of the qubit register, $n$.
+
+    Returns:
+        The resulting tensor, with the same shape as the input tensor.
+
+    """
+    number_of_operands = len(qubit_indices)
+    small_tensor = _get_small_tensor(matrix, number_of_operands, tensor.dtype)
+    axes = get_qubit_axes(qubit_indices, qubit_register_size)
+    result = np.tensordot(small_tensor, tensor, axes=(list(range(number_of_operands, 2 * number_of_operands)), axes))
+    return np.moveaxis(result, list(range(number_of_operands)), axes)
+
+
+def apply_matrix_to_tensor_in_place(
+    tensor: NDArray[Any],
+    matrix: ArrayLike,
+    qubit_indices: Sequence[int],
+    qubit_register_size: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> None:
+    """Apply a small (gate) matrix to the qubit axes of a tensor, in place.
+
+    Same as `apply_matrix_to_tensor`, but the tensor is updated block by block, so that the additional memory that
+    is needed is bounded by the chunk size, instead of being of the same size as the tensor.
+
+    Args:
+        tensor (NDArray[Any]): The tensor, of shape $(2,)^n + \\text{trailing shape}$.
+        matrix (ArrayLike): The $2^k\\times 2^k$ matrix to apply.
+        qubit_indices (Sequence[int]): The $k$ qubit operands of the matrix. Order matters.
+        qubit_register_size (int): The size of the qubit register, $n$.
+        chunk_size (int): The (approximate) maximum number of tensor elements that are updated at once.
+
+    """
+    number_of_operands = len(qubit_indices)
+    small_tensor = _get_small_tensor(matrix, number_of_operands, tensor.dtype)
+    axes = get_qubit_axes(qubit_indices, qubit_register_size)
+    other_axes = [axis for axis in range(tensor.ndim) if axis not in axes]
+
+    # View of the tensor with the axes that are not acted on first, and the qubit operand axes last.
+    view = tensor.transpose(other_axes + axes)
+    number_of_loop_axes = 0
+    block_size = tensor.size
+    while number_of_loop_axes < len(other_axes) and block_size > chunk_size:
+        block_size //= view.shape[number_of_loop_axes]
+        number_of_loop_axes += 1
+
+    contracted_axes = (list(range(-number_of_operands, 0)), list(range(number_of_operands, 2 * number_of_operands)))
+    for index in np.ndindex(view.shape[:number_of_loop_axes]):
+        block = view[index]
+        block[...] = np.tensordot(block, small_tensor, axes=contracted_axes)
+
+
+def apply_matrix_stack_to_tensor(
+    tensor: NDArray[Any],
+    matrices: ArrayLike,
+    qubit_indices: Sequence[int],
+    qubit_register_size: int,
+) -> NDArray[Any]:
+    """Apply a stack of $m$ small (gate) matrices to the qubit axes of a batch of $m$ tensors.
+
+    The tensor has $n$ leading axes of dimension 2, one for each qubit, followed by any number of trailing axes, of
+    which the last one is the batch axis of size $m$. The $i$-th matrix of the stack is applied to the $i$-th tensor of
+    the batch, following the same conventions as `apply_matrix_to_tensor`.
+
+    Args:
+        tensor (NDArray[Any]): The batch of tensors, of shape $(2,)^n + \\text{trailing shape} + (m,)$.
+        matrices (ArrayLike): The stack of $2^k\\times 2^k$ matrices to apply, of shape $(m, 2^k, 2^k)$.
+        qubit_indices (Sequence[int]): The $k$ qubit operands of the matrices. Order matters.
+        qubit_register_size (int): The size of the qubit register, $n$.
+
+    Returns:
+        The resulting batch of tensors, with the same shape as the input tensor.
+
+    """
+    dimension = 1 << len(qubit_indices)
+    batch_size = tensor.shape[-1]
+    matrix_stack = np.asarray(matrices, dtype=np.result_type(tensor.dtype, np.complex64))
+    if matrix_stack.shape != (batch_size, dimension, dimension):
+        msg = (
+            f"matrix stack has incorrect shape {matrix_stack.shape!r}:"
+            f" expected shape {(batch_size, dimension, dimension)}"
+        )
+        raise ValueError(msg)
+
+    axes = get_qubit_axes(qubit_indices, qubit_register_size)
+    view = np.moveaxis(tensor, axes, list(range(len(axes))))
+    # Multiply the (d, d) matrices with the (d, r) slices of the batch, with the batch axis as the leading axis.
+    result = np.matmul(matrix_stack, view.reshape(dimension, -1, batch_size).transpose(2, 0, 1))
+    return np.moveaxis(result.transpose(1, 2, 0).reshape(view.shape), list(range(len(axes))), axes)
+
+
+def _get_small_tensor(matrix: ArrayLike, number_of_operands: int, tensor_dtype: np.dtype[Any]) -> NDArray[Any]:
+    # The matrix is cast to the (complex) precision of the tensor, such that, e.g., a complex64 tensor stays complex64.
+    small_matrix = np.asarray(matrix, dtype=np.result_type(tensor_dtype, np.complex64))
+    if small_matrix.shape != (1 << number_of_operands, 1 << number_of_operands):
+        msg = (
+            f"matrix has incorrect shape {small_matrix.shape!r}:"
+            f" expected shape {(1 << number_of_operands, 1 << number_of_operands)}"
+        )
+        raise ValueError(msg)
+    return small_matrix.reshape((2,) * (2 * number_of_operands))
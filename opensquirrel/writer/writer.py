@@ -14,6 +14,7 @@ from opensquirrel.ir import (
     Int,
     IRVisitor,
     Measure,
+    ParameterExpression,
     Qubit,
     Reset,
     String,
@@ -26,6 +27,7 @@ from opensquirrel.ir.semantics import (
     BsrFullParams,
     BsrNoParams,
     BsrUnitaryParams,
+    ParametricGateSemantic,
 )
 from opensquirrel.ir.single_qubit_gate import SingleQubitGate, try_match_replace_with_default_gate
 from opensquirrel.ir.two_qubit_gate import TwoQubitGate
@@ -58,6 +60,9 @@ class _WriterImpl(IRVisitor):
         f = Float(f)
         return f"{f.value:.{self.FLOAT_PRECISION}}"
 
+    def visit_parameter_expression(self, expression: ParameterExpression) -> str:
+        return f"{expression}"
+
     def visit_int(self, i: SupportsInt) -> str:
         i = Int(i)
         return f"{i.value}"
@@ -82,7 +87,7 @@ class _WriterImpl(IRVisitor):
     def visit_single_qubit_gate(self, gate: SingleQubitGate) -> None:
         if isinstance(gate, SingleQubitGate) and type(gate) is SingleQubitGate:
             gate = try_match_replace_with_default_gate(gate)
-        bsr_parameters = gate.bsr.accept(self)
+        bsr_parameters = gate.bsr.accept(self) if gate.parametric is None else gate.parametric.accept(self)
         qubit_operand = gate.qubit.accept(self)
         self.output += f"{gate.name}{bsr_parameters} {qubit_operand}\n"
 
@@ -119,6 +124,10 @@ class _WriterImpl(IRVisitor):
         lmbda_argument = gate.lmbda.accept(self)
         return f"({theta_argument}, {phi_argument}, {lmbda_argument})"
 
+    def visit_parametric_gate_semantic(self, gate: ParametricGateSemantic) -> str:
+        arguments = ", ".join(argument.accept(self) for argument in gate.arguments)
+        return f"({arguments})"
+
     def visit_measure(self, measure: Measure) -> None:
         qubit_operand = measure.qubit.accept(self)
         bit_operand = measure.bit.accept(self)
@@ -150,6 +159,10 @@ def circuit_to_string(circuit: Circuit) -> str:
     """Convert a circuit to its [cQASM](https://qutech-delft.github.io/cQASM-spec/)
     string representation.
 
+    Note:
+        Symbolic parameters are written as their expressions, _e.g._, `Rz(0.5*t)`, which is not valid cQASM. Bind the
+        circuit to values first, with `Circuit.bind`, to get a valid cQASM string.
+
     Args:
         circuit (Circuit): The circuit to convert.
 
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from opensquirrel.ir.default_gates import CNOT, CRk, H, Rx, X
+from opensquirrel.ir.semantics import BlochSphereRotation, MatrixGateSemantic
+from opensquirrel.ir.semantics.semantic_table import derived_semantic, is_shared, shared_semantic
+from opensquirrel.ir.single_qubit_gate import SingleQubitGate
+
+
+def test_default_gates_share_semantic() -> None:
+    assert H(0).bsr is H(1).bsr
+    assert CNOT(0, 1).gate_semantic is CNOT(2, 1).gate_semantic
+    assert CRk(0, 1, 2).gate_semantic is CRk(1, 0, 2).gate_semantic
+    assert CRk(0, 1, 2).gate_semantic is not CRk(0, 1, 3).gate_semantic
+    assert is_shared(X(0).bsr)
+    assert not is_shared(Rx(0, 0.5).bsr)
+
+
+def test_shared_semantic_is_read_only() -> None:
+    bsr = H(0).bsr
+    with pytest.raises(ValueError, match="read-only"):
+        bsr.axis.value[0] = 0.0
+    with pytest.raises(ValueError, match="read-only"):
+        H(0).matrix.matrix[0, 0] = 0.0
+    with pytest.raises(ValueError, match="read-only"):
+        CNOT(0, 1).matrix.matrix[0, 0] = 0.0
+
+
+def test_derived_semantics_are_computed_once() -> None:
+    assert H(0).matrix is H(1).matrix
+    assert CNOT(0, 1).matrix is CNOT(1, 0).matrix
+    assert CNOT(0, 1).canonical is CNOT(1, 2).canonical
+    assert Rx(0, 0.5).matrix is not Rx(0, 0.5).matrix
+
+
+def test_derived_semantic_of_unshared_semantic() -> None:
+    semantic = MatrixGateSemantic(np.eye(2))
+    first = derived_semantic(semantic, "test", lambda: BlochSphereRotation((0, 0, 1), angle=0, phase=0))
+    second = derived_semantic(semantic, "test", lambda: BlochSphereRotation((0, 0, 1), angle=0, phase=0))
+    assert first == second
+    assert first is not second
+
+
+def test_shared_semantic_created_once() -> None:
+    calls: list[int] = []
+
+    def factory() -> MatrixGateSemantic:
+        calls.append(1)
+        return MatrixGateSemantic(np.eye(2))
+
+    semantic = shared_semantic("test_shared_semantic_created_once", factory)
+    assert shared_semantic("test_shared_semantic_created_once", factory) is semantic
+    assert len(calls) == 1
+    assert SingleQubitGate(0, semantic).matrix is semantic
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pytest
+
+from opensquirrel import CircuitBuilder
+from opensquirrel.ir import IR, AsmDeclaration, IRVisitor, Parameter
+from opensquirrel.ir.compact_ir import NO_INDEX, CompactIR
+from opensquirrel.ir.default_gates.two_qubit_gates import R
+from opensquirrel.ir.semantics import BlochSphereRotation, MatrixGateSemantic
+from opensquirrel.ir.single_qubit_gate import SingleQubitGate
+from opensquirrel.ir.two_qubit_gate import TwoQubitGate
+
+
+@pytest.fixture
+def ir() -> IR:
+    builder = CircuitBuilder(3, 2)
+    builder.H(0).CNOT(0, 1).Rx(1, 0.3).U(2, 0.1, 0.2, 0.3).Rn(0, 1, 1, 0, 0.5, 0.1).CRk(1, 2, 3)
+    builder.CR(0, 2, Parameter("theta")).Rz(0, 2 * Parameter("theta") + 1)
+    builder.measure(0, 1).reset(1).barrier(2).wait(0, 5).init(2).H(1).H(2)
+    ir = builder.to_circuit().ir
+    ir.add_gate(SingleQubitGate(0, BlochSphereRotation((0, 1, 0), angle=0.4, phase=0.1), name="custom"))
+    ir.add_gate(TwoQubitGate(0, 1, MatrixGateSemantic(np.eye(4))))
+    ir.add_gate(R(1, 0.3))
+    return ir
+
+
+def test_lossless_conversion(ir: IR) -> None:
+    converted_ir = CompactIR.from_ir(ir).to_ir()
+    assert converted_ir == ir
+    for statement, converted_statement in zip(ir.statements, converted_ir.statements, strict=True):
+        assert type(converted_statement) is type(statement)
+        assert getattr(converted_statement, "name", None) == getattr(statement, "name", None)
+
+
+def test_columns(ir: IR) -> None:
+    compact_ir = CompactIR.from_ir(ir)
+    assert len(compact_ir) == len(ir.statements)
+    assert compact_ir.opcode.dtype == np.int16
+    assert compact_ir.nbytes == 18 * len(compact_ir)
+
+    # The H gates share their opcode and semantic, the measure holds its bit as second operand
+    assert compact_ir.opcode[0] == compact_ir.opcode[13] == compact_ir.opcode[14]
+    assert compact_ir.semantic_id[0] == compact_ir.semantic_id[13] == compact_ir.semantic_id[14]
+    assert (compact_ir.operand0[8], compact_ir.operand1[8]) == (0, 1)
+    assert compact_ir.operand1[0] == compact_ir.semantic_id[8] == NO_INDEX
+
+    # The R gate is no default gate and is kept as object
+    assert compact_ir.object_table == [ir.statements[-1]]
+    np.testing.assert_array_equal(compact_ir.indices_on_qubit(2), [3, 5, 6, 10, 12, 14])
+
+
+def test_asm_declaration() -> None:
+    ir = IR()
+    ir.add_asm_declaration(AsmDeclaration("backend", "code"))
+    compact_ir = CompactIR.from_ir(ir)
+    (asm_declaration,) = compact_ir
+    assert isinstance(asm_declaration, AsmDeclaration)
+    assert (asm_declaration.backend_name.value, asm_declaration.backend_code.value) == ("backend", "code")
+    assert compact_ir.to_ir() == ir
+
+
+def test_accept(ir: IR) -> None:
+    class NameCollector(IRVisitor):
+        def __init__(self) -> None:
+            self.names: list[str] = []
+
+        def visit_gate(self, gate: Any) -> None:
+            self.names.append(gate.name)
+
+    collector, compact_collector = NameCollector(), NameCollector()
+    ir.accept(collector)
+    CompactIR.from_ir(ir).accept(compact_collector)
+    assert compact_collector.names == collector.names
+
+
+def test_empty() -> None:
+    compact_ir = CompactIR.from_ir(IR())
+    assert len(compact_ir) == 0
+    assert compact_ir.to_ir() == IR()
+    assert compact_ir.indices_on_qubit(0).size == 0
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import pytest
+
+from opensquirrel import CNOT, CZ, H, X, Y, Z
+from opensquirrel.ir import IR, AsmDeclaration, Barrier, Measure
+from opensquirrel.ir.dag import DAG, NO_NODE
+
+
+@pytest.fixture
+def ir() -> IR:
+    ir = IR()
+    for statement in (H(0), CNOT(0, 1), X(2), CZ(1, 2), Barrier(0), Measure(2, 0), Y(0)):
+        ir.add_statement(statement)
+    return ir
+
+
+@pytest.fixture
+def dag(ir: IR) -> DAG:
+    return DAG.from_ir(ir, 3)
+
+
+def test_links(dag: DAG) -> None:
+    assert dag.predecessor(1, 0) == 0
+    assert dag.predecessor(1, 1) == NO_NODE
+    assert dag.successor(1, 1) == 3
+    assert dag.predecessors(3) == [1, 2]
+    assert dag.successors(3) == [5]
+    assert list(dag.nodes_on_qubit(0)) == [0, 1, 4, 6]
+    assert (dag.first(2), dag.last(2)) == (2, 5)
+
+
+def test_layers(dag: DAG, ir: IR) -> None:
+    assert dag.front_layer() == [0, 2]
+    assert dag.layers() == [[0, 2], [1], [3, 4], [5, 6]]
+    assert dag.depth == 4
+    assert dag.to_ir() == ir
+
+
+def test_front_layer_iteration(dag: DAG) -> None:
+    executed: list[int] = []
+    while front_layer := dag.front_layer():
+        executed.extend(front_layer)
+        for node in front_layer:
+            dag.remove(node)
+    assert executed == [0, 2, 1, 4, 3, 6, 5]
+    assert len(dag) == 0
+    assert dag.depth == 0
+
+
+def test_remove(dag: DAG) -> None:
+    assert dag.remove(1) == CNOT(0, 1)
+    assert 1 not in dag
+    assert dag.successors(0) == [4]
+    assert dag.predecessors(3) == [2]
+    assert dag.first(1) == 3
+    with pytest.raises(KeyError, match="removed"):
+        dag[1]
+
+
+def test_insert(dag: DAG) -> None:
+    z_node = dag.insert_before(3, Z(1))
+    assert dag.predecessor(z_node, 1) == 1
+    assert dag.successor(z_node, 1) == 3
+
+    # Qubit 2 is not an operand of the neighbouring nodes of the insert position
+    x_node = dag.insert_after(0, X(2))
+    assert dag.predecessor(x_node, 2) == NO_NODE
+    assert dag.successor(x_node, 2) == 2
+    assert dag.first(2) == x_node
+
+    assert dag.to_ir().statements == [H(0), X(2), CNOT(0, 1), X(2), Z(1), CZ(1, 2), Barrier(0), Measure(2, 0), Y(0)]
+
+
+def test_replace(dag: DAG) -> None:
+    assert dag.replace(1, CNOT(1, 0)) == 1
+    assert dag.predecessor(1, 0) == 0
+    assert dag.successor(1, 1) == 3
+
+    node = dag.replace(0, CZ(0, 2))
+    assert node != 0
+    assert dag.successor(node, 2) == 2
+    assert dag.to_ir().statements[0] == CZ(0, 2)
+
+
+def test_asm_declaration_acts_on_all_qubits() -> None:
+    dag = DAG.from_statements([H(0), X(1), AsmDeclaration("backend", "code"), H(2)], 3)
+    assert dag.predecessors(2) == [0, 1]
+    assert dag.successors(2) == [3]
+    assert dag.layers() == [[0, 1], [2], [3]]
+
+
+def test_ir_dag(ir: IR) -> None:
+    dag = ir.dag(3)
+    assert dag.to_ir() == ir
+
+    # Appended statements are added to the DAG of the IR, also after a snapshot copied the statements on write
+    ir.snapshot()
+    ir.add_gate(Z(1))
+    assert ir.dag(3) is dag
+    assert (len(dag), dag.last(1)) == (8, 7)
+
+    # The DAG is rebuilt if it was changed, or if the statements were replaced
+    dag.remove(7)
+    assert len(ir.dag(3)) == 8
+    ir.statements = ir.statements[:3]
+    assert ir.dag(3).to_ir() == ir
+    assert ir.dag(4).qubit_register_size == 4
@@ -1,3 +1,5 @@
+import copy
+import pickle  # noqa: S403
 import re
 from typing import Any, SupportsInt
 
@@ -6,8 +8,8 @@ import pytest
 from numpy.typing import NDArray
 
 from opensquirrel.common import ATOL
-from opensquirrel.ir import Axis, AxisLike, Bit, Float, Int, Qubit
-from opensquirrel.ir.expression import Expression
+from opensquirrel.ir import Axis, AxisLike, Bit, Float, Int, Parameter, ParameterExpression, Qubit
+from opensquirrel.ir.expression import Expression, is_parametric
 
 
 class TestFloat:
@@ -31,6 +33,37 @@ class TestInt:
         assert Int(value).value == 1
 
 
+class TestParameterExpression:
+    def test_arithmetic(self) -> None:
+        theta, phi = Parameter("theta"), Parameter("phi")
+        expression = 2 * theta - phi / 2 + 1
+        assert expression == ParameterExpression({"theta": 2, "phi": -0.5}, 1)
+        assert expression.parameters == ("theta", "phi")
+        assert str(expression) == "2.0*theta - 0.5*phi + 1.0"
+        assert str(-theta) == "-theta"
+        assert str(theta - theta) == "0.0"
+        assert (1 - theta) == -theta + 1
+
+    def test_evaluate(self) -> None:
+        theta, phi = Parameter("theta"), Parameter("phi")
+        assert (2 * theta - phi + 0.5).evaluate({"theta": 1.0, "phi": 0.25, "lambda": 3}) == pytest.approx(2.25)
+
+    def test_evaluate_missing_value(self) -> None:
+        with pytest.raises(ValueError, match="no value for parameter 'phi'"):
+            (Parameter("theta") + Parameter("phi")).evaluate({"theta": 1.0})
+
+    def test_hash_of_equal_expressions(self) -> None:
+        expression = Parameter("theta") + 0.12345674999
+        other_expression = Parameter("theta") + 0.12345675001
+        assert expression == other_expression
+        assert hash(expression) == hash(other_expression)
+        assert len({expression, other_expression}) == 1
+
+    def test_is_parametric(self) -> None:
+        assert is_parametric(0.1, Parameter("theta"))
+        assert not is_parametric(0.1, Float(0.2))
+
+
 class TestBit:
     def test_type_error(self) -> None:
         with pytest.raises(TypeError, match="index 'f' must be a BitLike"):
@@ -48,6 +81,22 @@ class TestQubit:
     def test_init(self) -> None:
         assert str(Qubit(1)) == "Qubit[1]"
 
+    def test_interning(self) -> None:
+        qubit = Qubit(5)
+        assert Qubit(5) is qubit
+        assert Qubit(np.int64(5)) is qubit
+        assert Qubit(qubit) is qubit
+        assert copy.deepcopy(qubit) is qubit
+        assert pickle.loads(pickle.dumps(qubit)) is qubit  # noqa: S301
+        assert Qubit(5) != Bit(5)
+        assert hash(Qubit(5)) != hash(Bit(5))
+
+    def test_immutable(self) -> None:
+        qubit = Qubit(1)
+        with pytest.raises(AttributeError, match="cannot assign to 'index': Qubit is immutable"):
+            qubit.index = 2  # type: ignore[misc]
+        assert not hasattr(qubit, "__dict__")
+
 
 class TestAxis:
     @pytest.fixture
@@ -2,7 +2,9 @@ from math import pi
 
 import numpy as np
 
+from opensquirrel import CNOT, H, X
 from opensquirrel.ir import (
+    IR,
     Bit,
     Qubit,
 )
@@ -100,3 +102,28 @@ class TestIR:
 
     def test_hash_difference_bit_qubit(self) -> None:
         assert hash(Qubit(1)) != hash(Bit(1))
+
+    def test_snapshot(self) -> None:
+        ir = IR()
+        ir.add_gate(H(0))
+        snapshot = ir.snapshot()
+        ir.add_gate(CNOT(0, 1))
+        snapshot.add_gate(X(1))
+
+        assert ir.statements == [H(0), CNOT(0, 1)]
+        assert snapshot.statements == [H(0), X(1)]
+        assert ir.statements[0] is snapshot.statements[0]
+
+    def test_statements_view_of_snapshot(self) -> None:
+        ir = IR()
+        ir.add_gate(H(0))
+        dag = ir.dag(2)
+        snapshot = ir.snapshot()
+
+        assert ir.statements_view is snapshot.statements_view
+        assert ir.statements_view == [H(0)]
+        assert ir.dag(2) is dag
+
+        ir.add_gate(CNOT(0, 1))
+        assert ir.statements_view is not snapshot.statements_view
+        assert snapshot.statements_view == [H(0)]
@@ -7,6 +7,7 @@ import pytest
 
 from opensquirrel import X90, H, MinusX90, Rn, Rx, Ry, Rz, TDagger, X, Y, Z
 from opensquirrel.common import ATOL
+from opensquirrel.ir import Parameter
 from opensquirrel.ir.semantics import BlochSphereRotation, MatrixGateSemantic
 from opensquirrel.ir.single_qubit_gate import SingleQubitGate, try_match_replace_with_default_gate
 from opensquirrel.utils import can1
@@ -77,6 +78,17 @@ class TestSingleQubitGate:
         assert isinstance(matrix, MatrixGateSemantic)
         assert np.allclose(matrix, can1(bsr.axis, bsr.angle, bsr.phase), atol=ATOL)
 
+    def test_parametric(self) -> None:
+        gate = Rx(0, 2 * Parameter("theta"))
+        assert gate.is_parametric
+        assert gate.parameters == ("theta",)
+        assert not gate.is_identity()
+        assert gate == Rx(0, 2 * Parameter("theta"))
+        assert gate != Rx(0, Parameter("theta"))
+        assert gate.bind({"theta": 0.25}) == Rx(0, 0.5)
+        with pytest.raises(ValueError, match="gate 'Rx' has unbound parameters: theta"):
+            _ = gate.matrix
+
     def test_init_with_matrix(self) -> None:
         matrix = MatrixGateSemantic((1 / np.sqrt(2)) * np.array([[1, 1], [1, -1]]))
         gate = SingleQubitGate(0, gate_semantic=matrix)
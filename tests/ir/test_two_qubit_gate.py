@@ -1,10 +1,11 @@
 import numpy as np
 import pytest
 
-from opensquirrel.ir import Qubit
+from opensquirrel import CNOT, CR, CZ, SWAP, H, Rx, Ry
+from opensquirrel.ir import Gate, Qubit, compare_gates
 from opensquirrel.ir.semantics import BlochSphereRotation, CanonicalGateSemantic, MatrixGateSemantic
-from opensquirrel.ir.two_qubit_gate import TwoQubitGate
-from opensquirrel.utils.matrix_expander import can2
+from opensquirrel.ir.two_qubit_gate import TwoQubitGate, compute_canonical_semantics
+from opensquirrel.utils.matrix_expander import can2, canonical_decomposition
 
 
 class TestTwoQubitGate:
@@ -21,6 +22,12 @@ class TestTwoQubitGate:
     def test_qubit_operands(self, gate: TwoQubitGate) -> None:
         assert gate.qubit_operands == (Qubit(42), Qubit(100))
 
+    def test_remap_qubits(self) -> None:
+        gate = CNOT(0, 1)
+        gate.remap_qubits({0: 2, 1: 0})
+        assert gate.qubit_operands == (Qubit(2), Qubit(0))
+        assert (gate.control_qubit, gate.target_qubit) == (Qubit(2), Qubit(0))
+
     def test_same_qubits(self) -> None:
         with pytest.raises(ValueError, match="qubit operands cannot be the same qubit"):
             TwoQubitGate(0, 0, gate_semantic=MatrixGateSemantic(np.eye(4, dtype=np.complex128)))
@@ -87,3 +94,38 @@ class TestTwoQubitGate:
         gate = TwoQubitGate(0, 1, gate_semantic=canonical_semantic)
 
         assert gate.is_identity()
+
+    @pytest.mark.parametrize(
+        ("gate_1", "gate_2", "expected"),
+        [
+            (CNOT(0, 1), TwoQubitGate(0, 1, MatrixGateSemantic(np.asarray(CNOT(0, 1).matrix))), True),
+            (CNOT(0, 1), CNOT(1, 0), False),
+            (CZ(0, 1), CZ(1, 0), True),
+            (CR(0, 1, 0.5), CR(1, 0, 0.5), True),
+            (CR(0, 1, 0.5), CR(1, 0, -0.5), False),
+            (SWAP(0, 1), SWAP(1, 0), True),
+            (TwoQubitGate(0, 1, CNOT(0, 1).canonical), CNOT(0, 1), True),
+            (TwoQubitGate(0, 1, CanonicalGateSemantic((0.3, 0.2, 0.1))), CZ(0, 1), False),
+            (H(0), Ry(0, np.pi / 2) * Rx(0, np.pi), True),
+            (Rx(0, np.pi), Rx(0, -np.pi), True),
+            (Rx(0, 0), Rx(1, 0), True),
+            (H(0), H(1), False),
+            (H(0), CNOT(0, 1), False),
+        ],
+    )
+    def test_compare_gates(self, gate_1: Gate, gate_2: Gate, expected: bool) -> None:
+        assert compare_gates(gate_1, gate_2) is expected
+        assert compare_gates(gate_2, gate_1) is expected
+
+
+def test_compute_canonical_semantics() -> None:
+    gates = [CR(0, 1, 0.3), CR(2, 1, 0.3), CR(0, 1, 1.2), CNOT(0, 1), TwoQubitGate(0, 1, MatrixGateSemantic(np.eye(4)))]
+    compute_canonical_semantics(gates)
+
+    # Gates with the same semantic share their canonical semantic, which is the one of a single decomposition
+    assert gates[0].canonical is gates[1].canonical
+    for gate in gates:
+        *_, axis = canonical_decomposition(np.array(gate.matrix))
+        np.testing.assert_allclose(gate.canonical.axis.value, axis.value)
+        assert gate.canonical.rotations is not None
+        assert TwoQubitGate(0, 1, gate.canonical) == TwoQubitGate(0, 1, gate.matrix)
@@ -4,10 +4,11 @@ from collections.abc import Callable
 import numpy as np
 import pytest
 
-from opensquirrel import U
+from opensquirrel import CNOT, U
 from opensquirrel.ir.semantics import BlochSphereRotation
 from opensquirrel.ir.single_qubit_gate import SingleQubitGate
-from opensquirrel.passes.decomposer import aba_decomposer as aba
+from opensquirrel.passes.decomposer import aba_decomposer as aba, decomposition_memo
+from opensquirrel.passes.decomposer.decomposition_memo import DecompositionMemo
 from opensquirrel.passes.decomposer.general_decomposer import Decomposer, check_gate_decomposition
 
 ABA_DECOMPOSER_LIST = [
@@ -54,3 +55,20 @@ def test_all_octants_of_bloch_sphere_rotation(aba_decomposer: Callable[..., Deco
                 )
                 decomposed_arbitrary_operation = decomposer.decompose(arbitrary_operation)
                 check_gate_decomposition(arbitrary_operation, decomposed_arbitrary_operation)
+
+
+@pytest.mark.parametrize("aba_decomposer", ABA_DECOMPOSER_LIST)
+def test_decompose_gates(aba_decomposer: Callable[..., Decomposer], monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(decomposition_memo, "decomposition_memo", DecompositionMemo(maxsize=0))
+    decomposer = aba_decomposer()
+    coordinates = np.linspace(-1, 1, num=5)
+    angles = [-np.pi / 2, 0, 1, np.pi / 2, np.pi]
+    axes = [axis for axis in itertools.permutations(coordinates, 3) if axis != (0, 0, 0)]
+    gates = [
+        SingleQubitGate(qubit=index % 3, gate_semantic=BlochSphereRotation(axis=axis, angle=angle, phase=0.5))
+        for index, (axis, angle) in enumerate(itertools.product(axes, angles))
+    ]
+    gates.append(CNOT(0, 1))
+
+    decompositions = decomposer.decompose_gates(gates)
+    assert decompositions == [decomposer.decompose(gate) for gate in gates]
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from opensquirrel import CNOT, CR, CircuitBuilder, Measure, Rx, Ry
+from opensquirrel.ir import Parameter
+from opensquirrel.passes.decomposer import (
+    CNOTDecomposer,
+    McKayDecomposer,
+    ZYZDecomposer,
+    decomposition_memo as decomposition_memo_module,
+)
+from opensquirrel.passes.decomposer.decomposition_memo import DecompositionMemo
+
+if TYPE_CHECKING:
+    from opensquirrel.ir import Gate
+
+
+def _decompose(memo: DecompositionMemo, gate: Gate, decomposer: ZYZDecomposer | CNOTDecomposer) -> list[Gate]:
+    unmemoized_decompose = type(decomposer).decompose.__wrapped__  # ty: ignore[unresolved-attribute]
+    return memo.decompose(decomposer, gate, lambda gate: unmemoized_decompose(decomposer, gate))
+
+
+def test_retarget_single_qubit_gate() -> None:
+    memo, decomposer = DecompositionMemo(), ZYZDecomposer()
+    _decompose(memo, Rx(0, 0.3), decomposer)
+
+    decomposition = _decompose(memo, Rx(3, 0.3), decomposer)
+    assert (memo.hits, memo.misses) == (1, 1)
+    assert decomposition == _decompose(DecompositionMemo(maxsize=0), Rx(3, 0.3), decomposer)
+    assert {gate.qubit.index for gate in decomposition} == {3}
+
+
+@pytest.mark.parametrize("qubits", [(2, 5), (5, 2)])
+def test_retarget_two_qubit_gate(qubits: tuple[int, int]) -> None:
+    memo, decomposer = DecompositionMemo(), CNOTDecomposer()
+    _decompose(memo, CR(0, 1, 0.4), decomposer)
+
+    decomposition = _decompose(memo, CR(*qubits, 0.4), decomposer)
+    assert (memo.hits, memo.misses) == (1, 1)
+    assert decomposition == _decompose(DecompositionMemo(maxsize=0), CR(*qubits, 0.4), decomposer)
+
+
+def test_keys() -> None:
+    memo = DecompositionMemo(decimals=9)
+    _decompose(memo, Rx(0, 0.3), ZYZDecomposer())
+    _decompose(memo, Rx(1, 0.3 + 1e-12), ZYZDecomposer())
+    assert (memo.hits, memo.misses) == (1, 1)
+
+    # Gates with other values, and decomposers of other types, have their own decompositions
+    _decompose(memo, Rx(0, 0.4), ZYZDecomposer())
+    _decompose(memo, Ry(0, 0.3), ZYZDecomposer())
+    _decompose(memo, Rx(0, 0.3), CNOTDecomposer())
+    assert (memo.hits, memo.misses, len(memo)) == (1, 4, 4)
+
+
+def test_least_recently_used() -> None:
+    memo = DecompositionMemo(maxsize=2)
+    for angle in (0.1, 0.2, 0.1, 0.3):
+        _decompose(memo, Rx(0, angle), ZYZDecomposer())
+    assert (memo.hits, memo.misses, len(memo)) == (1, 3, 2)
+
+    _decompose(memo, Rx(0, 0.1), ZYZDecomposer())
+    _decompose(memo, Rx(0, 0.2), ZYZDecomposer())
+    assert (memo.hits, memo.misses) == (2, 4)
+
+    memo.clear()
+    assert (memo.hits, memo.misses, len(memo)) == (0, 0, 0)
+
+
+@pytest.mark.parametrize(
+    ("memo", "instruction"),
+    [
+        (DecompositionMemo(), Measure(0, 0)),
+        (DecompositionMemo(), Rx(0, Parameter("theta"))),
+        (DecompositionMemo(maxsize=0), Rx(0, 0.3)),
+    ],
+)
+def test_not_memoized(memo: DecompositionMemo, instruction: Gate) -> None:
+    for _ in range(2):
+        assert memo.decompose(ZYZDecomposer(), instruction, lambda gate: [gate]) == [instruction]
+    assert (memo.hits, memo.misses, len(memo)) == (0, 0, 0)
+
+
+def test_decompose_gates() -> None:
+    memo, decomposer = DecompositionMemo(), ZYZDecomposer()
+    unmemoized_decompose_gates = type(decomposer).decompose_gates.__wrapped__  # ty: ignore[unresolved-attribute]
+    batches: list[list[Gate]] = []
+
+    def decompose_gates(gates: list[Gate]) -> list[list[Gate]]:
+        batches.append(gates)
+        return unmemoized_decompose_gates(decomposer, gates)
+
+    gates = [Rx(0, 0.3), Rx(1, 0.3), Ry(0, 0.3), CNOT(0, 1), Rx(2, 0.3)]
+    decompositions = memo.decompose_gates(decomposer, gates, decompose_gates)
+    assert decompositions == [decomposer.decompose(gate) for gate in gates]
+    assert batches == [[Rx(0, 0.3), Ry(0, 0.3), CNOT(0, 1)]]
+    assert (memo.hits, memo.misses) == (2, 3)
+
+    # Gates of which the decompositions are memoized are not decomposed again
+    memo.decompose_gates(decomposer, [Ry(3, 0.3), Rx(3, 0.4)], decompose_gates)
+    assert batches[1:] == [[Rx(3, 0.4)]]
+    assert (memo.hits, memo.misses) == (3, 4)
+
+
+def test_decomposer(monkeypatch: pytest.MonkeyPatch) -> None:
+    memo = DecompositionMemo()
+    monkeypatch.setattr(decomposition_memo_module, "decomposition_memo", memo)
+    builder = CircuitBuilder(4)
+    for qubit in range(4):
+        builder.Rx(qubit, 0.3).Ry(qubit, 0.3)
+    circuit = builder.to_circuit()
+
+    circuit.decompose(McKayDecomposer())
+
+    # The McKay decompositions of the Rx and Ry gates (and their inner ZXZ decompositions) are computed once
+    assert (memo.hits, memo.misses) == (6, 4)
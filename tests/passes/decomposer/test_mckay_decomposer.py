@@ -9,7 +9,8 @@ import pytest
 from opensquirrel import CNOT, CR, X90, Y90, H, I, MinusX90, MinusY90, Rz, S, SDagger, U, X, Y, Z
 from opensquirrel.ir.semantics import BlochSphereRotation
 from opensquirrel.ir.single_qubit_gate import SingleQubitGate
-from opensquirrel.passes.decomposer import McKayDecomposer
+from opensquirrel.passes.decomposer import McKayDecomposer, decomposition_memo
+from opensquirrel.passes.decomposer.decomposition_memo import DecompositionMemo
 from opensquirrel.passes.decomposer.general_decomposer import check_gate_decomposition
 
 if TYPE_CHECKING:
@@ -206,3 +207,21 @@ def test_single_qubit_clifford_gates(decomposer: McKayDecomposer, gate: Gate, ex
     decomposed_gates = decomposer.decompose(gate)
     check_gate_decomposition(gate, decomposed_gates)
     assert decomposed_gates == expected_result
+
+
+def test_decompose_gates(decomposer: McKayDecomposer, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(decomposition_memo, "decomposition_memo", DecompositionMemo(maxsize=0))
+    coordinates = np.linspace(-1, 1, num=5)
+    angles = [-pi / 2, 0, 1, pi / 2, pi]
+    axes = [[i, j, z] for i in coordinates for j in coordinates for z in coordinates if [i, j, z] != [0, 0, 0]]
+    gates: list[Gate] = [
+        SingleQubitGate(qubit=index % 3, gate_semantic=BlochSphereRotation(axis=axis, angle=angle, phase=0.5))
+        for index, (axis, angle) in enumerate((axis, angle) for axis in axes for angle in angles)
+    ]
+    gates.extend([I(0), X90(1), MinusX90(2), Rz(0, 0.3), H(1), CNOT(0, 1)])
+
+    decompositions = decomposer.decompose_gates(gates)
+    assert decompositions == [decomposer.decompose(gate) for gate in gates]
+    assert [[gate.name for gate in decomposition] for decomposition in decompositions] == [
+        [gate.name for gate in decomposer.decompose(gate)] for gate in gates
+    ]
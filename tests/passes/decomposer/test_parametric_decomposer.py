@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from opensquirrel import CNOT, CR, SWAP, Rx, Ry, Rz, U
+from opensquirrel.ir import IR, Parameter
+from opensquirrel.passes.decomposer import McKayDecomposer, SWAP2CNOTDecomposer
+from opensquirrel.passes.decomposer.general_decomposer import check_gate_decomposition, decompose
+from opensquirrel.passes.decomposer.parametric_decomposer import ParametricDecomposer
+
+if TYPE_CHECKING:
+    from opensquirrel.ir import Gate
+
+THETA, PHI = Parameter("theta"), Parameter("phi")
+
+
+@pytest.fixture
+def decomposer() -> ParametricDecomposer:
+    return ParametricDecomposer()
+
+
+@pytest.mark.parametrize(
+    "gate",
+    [Rx(0, THETA), Ry(1, 2 * THETA - 0.3), U(0, THETA, -PHI, 0.4), U(1, 1.2, PHI, THETA + PHI), CR(0, 1, THETA - PHI)],
+    ids=["Rx", "Ry", "U", "U-mixed", "CR"],
+)
+@pytest.mark.parametrize("values", [{"theta": 0.7, "phi": -1.3}, {"theta": -2.1, "phi": 0.4}])
+def test_decomposition(decomposer: ParametricDecomposer, gate: Gate, values: dict[str, float]) -> None:
+    decomposed_gates = decomposer.decompose(gate)
+    assert all(
+        not decomposed_gate.is_parametric or decomposed_gate.name == "Rz" for decomposed_gate in decomposed_gates
+    )
+    check_gate_decomposition(gate.bind(values), [decomposed_gate.bind(values) for decomposed_gate in decomposed_gates])
+
+
+@pytest.mark.parametrize("gate", [Rz(0, THETA), Rx(0, 0.5), CNOT(0, 1), CR(0, 1, 0.5)], ids=["Rz", "Rx", "CNOT", "CR"])
+def test_ignores_non_parametric_gates_and_rz(decomposer: ParametricDecomposer, gate: Gate) -> None:
+    assert decomposer.decompose(gate) == [gate]
+
+
+def test_decompose_keeps_parametric_gates_that_are_not_decomposed() -> None:
+    ir = IR()
+    for gate in [Rx(0, THETA), SWAP(0, 1)]:
+        ir.add_gate(gate)
+    decompose(ir, SWAP2CNOTDecomposer())
+    assert ir.statements == [Rx(0, THETA), CNOT(0, 1), CNOT(1, 0), CNOT(0, 1)]
+
+
+def test_decompose_lowers_parametric_gates() -> None:
+    ir = IR()
+    ir.add_gate(Rx(0, THETA))
+    decompose(ir, McKayDecomposer())
+    assert {gate.name for gate in ir.statements} == {"Rz", "X90"}
+    assert [gate for gate in ir.statements if gate.is_parametric] == [Rz(0, THETA)]  # ty: ignore
+    check_gate_decomposition(Rx(0, 0.9), [gate.bind({"theta": 0.9}) for gate in ir.statements])  # ty: ignore
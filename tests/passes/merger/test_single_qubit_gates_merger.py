@@ -3,11 +3,13 @@ from math import pi
 import pytest
 
 from opensquirrel import Circuit, CircuitBuilder, Rn
+from opensquirrel.circuit_matrix_calculator import get_circuit_matrix
+from opensquirrel.ir import Parameter
 from opensquirrel.ir.semantics import BlochSphereRotation
 from opensquirrel.ir.single_qubit_gate import SingleQubitGate
 from opensquirrel.passes.merger import SingleQubitGatesMerger
 from opensquirrel.passes.merger.general_merger import rearrange_barriers
-from tests.ir.ir_equality_test_base import modify_circuit_and_check
+from tests.ir.ir_equality_test_base import check_equivalence_up_to_global_phase, modify_circuit_and_check
 
 
 @pytest.fixture
@@ -156,6 +158,29 @@ def test_no_merge_across_reset(merger: SingleQubitGatesMerger) -> None:
     modify_circuit_and_check(circuit, merger.merge, expected_circuit)
 
 
+def test_no_merge_across_parametric_gate(merger: SingleQubitGatesMerger) -> None:
+    theta = Parameter("theta")
+    builder = CircuitBuilder(1)
+    builder.H(0)
+    builder.H(0)
+    builder.X(0)
+    builder.Rz(0, theta)
+    builder.Rz(0, 0.5)
+    builder.Rz(0, 0.25)
+    circuit = builder.to_circuit()
+
+    builder2 = CircuitBuilder(1)
+    builder2.X(0)
+    builder2.Rz(0, theta)
+    builder2.Rz(0, 0.75)
+    expected_circuit = builder2.to_circuit()
+
+    expected_matrix = get_circuit_matrix(circuit.bind({"theta": 0.3}))
+    merger.merge(circuit.ir, circuit.qubit_register_size)
+    assert circuit == expected_circuit
+    check_equivalence_up_to_global_phase(get_circuit_matrix(circuit.bind({"theta": 0.3})), expected_matrix)
+
+
 def test_no_merge_across_wait(merger: SingleQubitGatesMerger) -> None:
     builder = CircuitBuilder(2)
     builder.H(0)
@@ -0,0 +1,111 @@
+import math
+
+import numpy as np
+import pytest
+
+from opensquirrel import CircuitBuilder
+from opensquirrel.circuit_matrix_calculator import get_circuit_matrix
+from opensquirrel.simulator import CliffordTableau, get_clifford_tableau
+from opensquirrel.simulator.clifford_tableau import get_pauli_images, solve_gf2
+from opensquirrel.utils.matrix_expander import can1
+
+PAULIS = {
+    (False, False): np.eye(2),
+    (True, False): np.array([[0, 1], [1, 0]]),
+    (False, True): np.diag([1, -1]),
+    (True, True): np.array([[0, -1j], [1j, 0]]),
+}
+HADAMARD = np.array([[1, 1], [1, -1]]) / math.sqrt(2)
+CNOT = np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]])
+
+
+def get_row_matrix(tableau: CliffordTableau, row: int) -> np.typing.NDArray[np.complex128]:
+    matrix = np.eye(1)
+    for qubit in reversed(range(tableau.qubit_register_size)):
+        matrix = np.kron(matrix, PAULIS[bool(tableau.x[row, qubit]), bool(tableau.z[row, qubit])])
+    return (-1) ** int(tableau.r[row]) * matrix
+
+
+@pytest.mark.parametrize(
+    "matrix",
+    [HADAMARD, np.diag([1, 1j]), can1((1, 0, 0), math.pi / 2), can1((1, 1, 1), 2 * math.pi / 3), CNOT, np.eye(4)],
+)
+def test_get_pauli_images_of_clifford_gates(matrix: np.typing.NDArray[np.complex128]) -> None:
+    assert get_pauli_images(matrix) is not None
+
+
+@pytest.mark.parametrize("matrix", [np.diag([1, np.exp(1j * math.pi / 4)]), can1((0, 0, 1), 1e-4)])
+def test_get_pauli_images_of_non_clifford_gates(matrix: np.typing.NDArray[np.complex128]) -> None:
+    assert get_pauli_images(matrix) is None
+
+
+def test_get_pauli_images_of_hadamard() -> None:
+    images = get_pauli_images(HADAMARD)
+    assert images is not None
+    np.testing.assert_array_equal(images.phases, [0, 0])
+    np.testing.assert_array_equal(images.x, [[False], [True]])
+    np.testing.assert_array_equal(images.z, [[True], [False]])
+
+
+def test_initial_tableau() -> None:
+    tableau = CliffordTableau(2)
+    np.testing.assert_array_equal(tableau.x, [[1, 0], [0, 1], [0, 0], [0, 0]])
+    np.testing.assert_array_equal(tableau.z, [[0, 0], [0, 0], [1, 0], [0, 1]])
+    np.testing.assert_array_equal(tableau.r, [0, 0, 0, 0])
+
+
+def test_apply_conjugates_the_rows() -> None:
+    circuit = CircuitBuilder(3).H(2).S(0).CNOT(2, 0).SWAP(1, 2).CZ(0, 1).X90(1).to_circuit()
+    tableau = get_clifford_tableau(circuit)
+    unitary = get_circuit_matrix(circuit)
+    for row, generator in enumerate([(True, False)] * 3 + [(False, True)] * 3):
+        pauli = np.eye(1)
+        for qubit in reversed(range(3)):
+            pauli = np.kron(pauli, PAULIS[generator] if qubit == row % 3 else np.eye(2))
+        np.testing.assert_almost_equal(unitary @ pauli @ unitary.conj().T, get_row_matrix(tableau, row))
+
+
+def test_measure_random_outcome() -> None:
+    tableau = CliffordTableau(2)
+    tableau.apply(get_pauli_images(HADAMARD), [1])
+    tableau.apply(get_pauli_images(CNOT), [1, 0])
+    assert not tableau.is_deterministic(0)
+    outcome = tableau.measure(0, np.random.default_rng(3))
+    assert tableau.is_deterministic(1)
+    assert tableau.measure(1, np.random.default_rng(4)) == outcome
+
+
+def test_measure_deterministic_outcome() -> None:
+    tableau = CliffordTableau(3)
+    tableau.apply(get_pauli_images(PAULIS[True, False]), [1])
+    assert tableau.is_deterministic(1)
+    assert tableau.measure(1, np.random.default_rng()) == 1
+    assert tableau.measure(0, np.random.default_rng()) == 0
+
+
+def test_get_z_outcomes_affine_space() -> None:
+    tableau = CliffordTableau(3)
+    tableau.apply(get_pauli_images(HADAMARD), [0])
+    tableau.apply(get_pauli_images(CNOT), [0, 1])
+    tableau.apply(get_pauli_images(PAULIS[True, False]), [2])
+    particular_outcome, basis = tableau.get_z_outcomes_affine_space()
+    assert particular_outcome[2]
+    assert particular_outcome[0] == particular_outcome[1]
+    np.testing.assert_array_equal(basis, [[True, True, False]])
+
+
+def test_copy_and_equality() -> None:
+    tableau = CliffordTableau(2)
+    copy = tableau.copy()
+    assert copy == tableau
+    copy.apply(get_pauli_images(HADAMARD), [0])
+    assert copy != tableau
+
+
+def test_solve_gf2() -> None:
+    a = np.array([[1, 1, 0, 0], [0, 1, 1, 0]], dtype=np.bool_)
+    b = np.array([1, 0], dtype=np.bool_)
+    solution, null_space = solve_gf2(a, b)
+    np.testing.assert_array_equal(a.astype(int) @ solution % 2, b)
+    assert null_space.shape == (2, 4)
+    np.testing.assert_array_equal(a.astype(int) @ null_space.T.astype(int) % 2, np.zeros((2, 2)))
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from opensquirrel import CircuitBuilder
+from opensquirrel.ir import Axis, Bit, Measure, Qubit
+from opensquirrel.simulator import DensityMatrixSimulator, MPSSimulator, StabilizerSimulator, StatevectorSimulator
+from opensquirrel.simulator.deferred_measurement import (
+    Z_AXIS,
+    DeferredMeasurementSimulator,
+    TrajectorySimulator,
+    get_measurement_basis_change,
+    sample_trajectories,
+)
+
+
+@pytest.mark.parametrize("simulator_class", [StatevectorSimulator, StabilizerSimulator, MPSSimulator])
+def test_trajectory_simulators(simulator_class: type[TrajectorySimulator]) -> None:
+    circuit = CircuitBuilder(3, 3).X(0).measure(0, 0).measure(1, 1).CNOT(0, 2).measure(2, 1).to_circuit()
+    simulator = simulator_class(3, 3, seed=1)
+    circuit.ir.accept(simulator)
+    assert simulator.bit_values == {0: 1}
+    assert simulator.deferred_bits == {1: 2}
+    assert simulator.measurement_axes == {1: Z_AXIS, 2: Z_AXIS}
+    assert not simulator.is_trajectory
+    assert simulator.sample(10, seed=2) == {"011": 10}
+
+
+@pytest.mark.parametrize("simulator_class", [StatevectorSimulator, StabilizerSimulator, MPSSimulator])
+def test_measurement_along_another_axis_collapses(simulator_class: type[TrajectorySimulator]) -> None:
+    simulator = simulator_class(1, 2, seed=3)
+    CircuitBuilder(1, 2).H(0).measure(0, 0).to_circuit().ir.accept(simulator)
+    Measure(Qubit(0), Bit(1), axis=Axis(1, 0, 0)).accept(simulator)
+    assert simulator.bit_values in ({0: 0}, {0: 1})
+    assert simulator.deferred_bits == {1: 0}
+    assert simulator.measurement_axes == {0: Axis(1, 0, 0)}
+    assert simulator.is_trajectory
+
+
+def test_density_matrix_simulator() -> None:
+    simulator = DensityMatrixSimulator(2, 2)
+    CircuitBuilder(2, 2).H(0).measure(0, 0).reset(0).measure(1, 1).to_circuit().ir.accept(simulator)
+    assert isinstance(simulator, DeferredMeasurementSimulator)
+    assert simulator.deferred_bits == {1: 1}
+    assert simulator.measurement_axes == {1: Z_AXIS}
+    assert simulator.get_bit_register_probabilities() == pytest.approx({"00": 0.5, "01": 0.5})
+
+
+def test_get_measurement_basis_change() -> None:
+    basis_change = get_measurement_basis_change(Axis(0, 1, 0))
+    np.testing.assert_almost_equal(np.abs(basis_change @ [1, 1j]) / np.sqrt(2), [1, 0])
+
+
+def test_sample_trajectories() -> None:
+    circuit = CircuitBuilder(3, 3).H(0).H(1).measure(0, 0).measure(1, 1).reset(0).reset(1).CNOT(1, 2).measure(2, 2)
+    circuit = circuit.to_circuit()
+    simulators: list[StatevectorSimulator] = []
+
+    def create_simulator() -> StatevectorSimulator:
+        simulators.append(StatevectorSimulator(3, 3, rng))
+        return simulators[-1]
+
+    rng = np.random.default_rng(4)
+    counts = sample_trajectories(create_simulator, circuit.ir.accept, 100_000, rng)
+    assert len(simulators) == 4
+    assert sum(simulator.shots for simulator in simulators) == 100_000
+    assert set(counts) == {"000", "001", "010", "011"}
+    for count in counts.values():
+        assert count == pytest.approx(25_000, abs=1000)
+
+
+def test_sample_trajectories_single_shot() -> None:
+    circuit = CircuitBuilder(1, 1).H(0).measure(0, 0).reset(0).to_circuit()
+    rng = np.random.default_rng(5)
+    counts = sample_trajectories(lambda: StatevectorSimulator(1, 1, rng), circuit.ir.accept, 1, rng)
+    assert counts in ({"0": 1}, {"1": 1})
+    assert sample_trajectories(lambda: StatevectorSimulator(1, 1, rng), circuit.ir.accept, 0, rng) == {}
+    with pytest.raises(ValueError, match="number of shots must be non-negative"):
+        sample_trajectories(lambda: StatevectorSimulator(1, 1, rng), circuit.ir.accept, -1, rng)
@@ -0,0 +1,145 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from opensquirrel import Circuit, CircuitBuilder
+from opensquirrel.simulator import DensityMatrixSimulator, sample_density_matrix, simulate, simulate_density_matrix
+
+
+def get_circuit() -> Circuit:
+    return (
+        CircuitBuilder(4).H(0).CNOT(0, 3).Ry(2, 0.3).SWAP(1, 3).CR(2, 0, 1.1).U(1, 0.4, 0.5, 0.6).CZ(3, 1).to_circuit()
+    )
+
+
+def test_initial_state() -> None:
+    simulator = DensityMatrixSimulator(2)
+    np.testing.assert_array_equal(simulator.density_matrix, np.diag([1, 0, 0, 0]))
+
+
+@pytest.mark.parametrize("fusion_size", [None, 3])
+def test_pure_state(fusion_size: int | None) -> None:
+    simulator = simulate_density_matrix(get_circuit(), fusion_size)
+    statevector = simulate(get_circuit()).statevector
+    np.testing.assert_almost_equal(simulator.density_matrix, np.outer(statevector, statevector.conj()))
+    assert simulator.purity == pytest.approx(1)
+
+
+def test_reset_is_a_channel() -> None:
+    circuit = CircuitBuilder(2, 2).H(0).CNOT(0, 1).reset(0).measure(0, 0).measure(1, 1).to_circuit()
+    simulator = simulate_density_matrix(circuit)
+    np.testing.assert_almost_equal(simulator.density_matrix, np.diag([0.5, 0, 0.5, 0]))
+    assert simulator.purity == pytest.approx(0.5)
+    assert simulator.get_bit_register_probabilities() == pytest.approx({"00": 0.5, "10": 0.5})
+
+
+def test_init() -> None:
+    circuit = CircuitBuilder(1, 1).init(0).X(0).init(0).measure(0, 0).to_circuit()
+    assert simulate_density_matrix(circuit).get_bit_register_probabilities() == pytest.approx({"0": 1})
+
+
+def test_mid_circuit_measurement_is_correlated_with_the_final_state() -> None:
+    circuit = CircuitBuilder(2, 2).H(0).measure(0, 0).CNOT(0, 1).reset(0).measure(1, 1).to_circuit()
+    simulator = simulate_density_matrix(circuit)
+    assert set(simulator.branches) == {0b00, 0b01}
+    assert simulator.get_bit_register_probabilities() == pytest.approx({"00": 0.5, "11": 0.5})
+
+
+def test_mid_circuit_measurement_along_axis() -> None:
+    circuit = Circuit.from_string(
+        """
+        version 3.0
+
+        qubit[2] q
+        bit[2] b
+
+        Ry(0.7) q[0]
+        b[0] = measureX q[0]
+        CNOT q[0], q[1]
+        b[1] = measure q[1]
+        """
+    )
+    probability_one = (1 - np.sin(0.7)) / 2
+    assert simulate_density_matrix(circuit).get_bit_register_probabilities() == pytest.approx(
+        {
+            "00": (1 - probability_one) / 2,
+            "10": (1 - probability_one) / 2,
+            "01": probability_one / 2,
+            "11": probability_one / 2,
+        }
+    )
+
+
+def test_max_branches() -> None:
+    circuit = CircuitBuilder(2, 2).H(0).measure(0, 0).CNOT(0, 1).reset(0).measure(1, 1).to_circuit()
+    with pytest.warns(UserWarning, match="number of branches exceeds the maximum of 1"):
+        simulator = simulate_density_matrix(circuit, max_branches=1)
+    assert list(simulator.branches) == [0]
+    assert simulator.bit_value_probabilities == pytest.approx({0b00: 0.5, 0b01: 0.5})
+    np.testing.assert_almost_equal(simulator.density_matrix, simulate_density_matrix(circuit).density_matrix)
+    assert simulator.get_bit_register_probabilities() == pytest.approx({"00": 0.25, "01": 0.25, "10": 0.25, "11": 0.25})
+
+
+def test_max_branches_bounds_memory() -> None:
+    qubit_register_size = 10
+    builder = CircuitBuilder(qubit_register_size, qubit_register_size)
+    for qubit in range(qubit_register_size):
+        builder.H(qubit)
+    for qubit in range(qubit_register_size):
+        builder.measure(qubit, qubit).reset(qubit).CNOT(qubit, (qubit + 1) % qubit_register_size)
+    circuit = builder.to_circuit()
+
+    tracemalloc.start()
+    try:
+        with pytest.warns(UserWarning, match="branches are merged"):
+            simulator = simulate_density_matrix(circuit, max_branches=2)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(simulator.branches) <= 2
+    assert peak < 3 * 16 * 4**qubit_register_size
+    assert sum(simulator.get_bit_register_probabilities().values()) == pytest.approx(1)
+    assert np.trace(simulator.density_matrix) == pytest.approx(1)
+
+
+def test_mid_circuit_measurement_correlations_are_exact() -> None:
+    builder = CircuitBuilder(4, 4)
+    for qubit in range(3):
+        builder.H(qubit).measure(qubit, qubit).H(qubit).H(qubit)
+    for qubit in range(3):
+        builder.CNOT(qubit, 3)
+    circuit = builder.measure(3, 3).to_circuit()
+
+    probabilities = simulate_density_matrix(circuit).get_bit_register_probabilities()
+    assert probabilities == pytest.approx({f"{value.bit_count() % 2}{value:03b}": 0.125 for value in range(8)})
+    counts = sample_density_matrix(circuit, 1000, seed=6)
+    assert all(bit_string[0] == str(bit_string[1:].count("1") % 2) for bit_string in counts)
+
+
+def test_invalid_max_branches() -> None:
+    with pytest.raises(ValueError, match="maximum number of branches must be positive"):
+        DensityMatrixSimulator(1, max_branches=0)
+
+
+def test_remeasured_bit_merges_branches() -> None:
+    circuit = CircuitBuilder(2, 1).H(0).measure(0, 0).X(0).measure(1, 0).to_circuit()
+    simulator = simulate_density_matrix(circuit)
+    assert list(simulator.branches) == [0]
+    np.testing.assert_almost_equal(simulator.density_matrix, np.diag([0.5, 0.5, 0, 0]))
+
+
+def test_active_reset_matches_statevector_sampling() -> None:
+    circuit = CircuitBuilder(3, 3).H(0).CNOT(0, 1).Ry(2, 1.1).measure(0, 0).reset(0).CNOT(2, 0)
+    circuit = circuit.measure(0, 1).measure(1, 2).to_circuit()
+    probabilities = simulate_density_matrix(circuit).get_bit_register_probabilities()
+    counts = sample_density_matrix(circuit, 10_000, seed=1)
+    assert set(counts) == set(probabilities)
+    assert sum(counts.values()) == 10_000
+    for value, count in circuit.sample(10_000, seed=2).items():
+        assert count == pytest.approx(10_000 * probabilities[value], abs=300)
+
+
+def test_sample_negative_number_of_shots() -> None:
+    with pytest.raises(ValueError, match="number of shots must be non-negative"):
+        sample_density_matrix(CircuitBuilder(1, 1).measure(0, 0).to_circuit(), -1)
@@ -0,0 +1,105 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from opensquirrel import Circuit, CircuitBuilder
+from opensquirrel.simulator import MPSSimulator, sample_mps, simulate, simulate_mps
+
+EXAMPLE_DIR = Path(__file__).parents[2] / "example" / "algorithms"
+
+
+def get_circuit() -> Circuit:
+    return (
+        CircuitBuilder(5)
+        .H(0)
+        .CNOT(0, 4)
+        .Ry(2, 0.3)
+        .SWAP(1, 3)
+        .CR(4, 1, 1.1)
+        .U(1, 0.4, 0.5, 0.6)
+        .CZ(3, 0)
+        .Rx(3, 0.7)
+        .CNOT(2, 1)
+        .to_circuit()
+    )
+
+
+def test_initial_state() -> None:
+    simulator = MPSSimulator(3)
+    assert simulator.get_amplitude(0) == 1
+    assert simulator.bond_dimensions == [1, 1]
+    assert simulator.truncation_error == 0
+
+
+def test_amplitudes_equal_statevector() -> None:
+    simulator = simulate_mps(get_circuit())
+    amplitudes = [simulator.get_amplitude(ket) for ket in range(1 << 5)]
+    np.testing.assert_almost_equal(amplitudes, simulate(get_circuit()).statevector)
+    assert simulator.truncation_error == pytest.approx(0)
+
+
+def test_truncation_error() -> None:
+    circuit = CircuitBuilder(6)
+    for qubit in range(6):
+        circuit.H(qubit)
+    for qubit in range(3):
+        circuit.CNOT(qubit, qubit + 3).CR(qubit + 3, qubit, 0.5)
+    simulator = simulate_mps(circuit.to_circuit(), max_bond_dimension=2)
+    assert max(simulator.bond_dimensions) == 2
+    assert 0 < simulator.truncation_error < 1
+
+    amplitudes = [simulator.get_amplitude(ket) for ket in range(1 << 6)]
+    fidelity = abs(np.vdot(amplitudes, simulate(circuit.to_circuit()).statevector)) ** 2
+    assert np.linalg.norm(amplitudes) == pytest.approx(1)
+    assert fidelity == pytest.approx(1 - simulator.truncation_error, abs=0.1)
+
+
+def test_example_circuit() -> None:
+    circuit = Circuit.from_string((EXAMPLE_DIR / "16QBT_10CYC_TFL_1.cq").read_text())
+    simulator = simulate_mps(circuit, max_bond_dimension=4)
+    kets = range(0, 1 << 16, 997)
+    np.testing.assert_almost_equal(
+        [simulator.get_amplitude(ket) for ket in kets], simulate(circuit).statevector[list(kets)]
+    )
+
+
+def test_sample() -> None:
+    circuit = CircuitBuilder(3, 3).H(0).CNOT(0, 2).X(1).measure(0, 0).measure(1, 1).measure(2, 2).to_circuit()
+    counts = simulate_mps(circuit).sample(10_000, seed=42)
+    assert set(counts) == {"010", "111"}
+    assert sum(counts.values()) == 10_000
+    assert counts["111"] == pytest.approx(5_000, rel=0.05)
+
+
+def test_sample_along_axis() -> None:
+    circuit = Circuit.from_string(
+        """
+        version 3.0
+
+        qubit[2] q
+        bit[2] b
+
+        H q[0]
+        b[0] = measureX q[0]
+        b[1] = measureY q[1]
+        """
+    )
+    counts = sample_mps(circuit, 1000, seed=1)
+    assert set(counts) == {"00", "10"}
+
+
+def test_sample_mid_circuit_measurement() -> None:
+    circuit = CircuitBuilder(2, 2).H(0).measure(0, 0).CNOT(0, 1).reset(0).measure(1, 1).to_circuit()
+    counts = sample_mps(circuit, 200, seed=5)
+    assert set(counts) == {"00", "11"}
+    assert sum(counts.values()) == 200
+
+
+def test_sample_no_shots() -> None:
+    assert sample_mps(CircuitBuilder(1, 1).measure(0, 0).to_circuit(), 0) == {}
+
+
+def test_invalid_max_bond_dimension() -> None:
+    with pytest.raises(ValueError, match="maximum bond dimension must be positive"):
+        MPSSimulator(2, max_bond_dimension=0)
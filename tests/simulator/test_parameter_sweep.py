@@ -0,0 +1,143 @@
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+
+from opensquirrel import Circuit, CircuitBuilder
+from opensquirrel.ir import Parameter
+from opensquirrel.passes.decomposer import CNOTDecomposer, McKayDecomposer
+from opensquirrel.passes.merger import SingleQubitGatesMerger
+from opensquirrel.simulator import simulate, simulate_sweep
+from opensquirrel.simulator.parameter_sweep import SWEEPABLE_GATES
+
+
+def get_circuit(parameters: NDArray[np.float64]) -> Circuit:
+    return (
+        CircuitBuilder(3, 3)
+        .H(0)
+        .Rx(1, parameters[0])
+        .CR(0, 2, parameters[1])
+        .U(2, parameters[2], parameters[3], parameters[4])
+        .CNOT(2, 1)
+        .Rz(1, parameters[0])
+        .Ry(0, parameters[1])
+        .measure(0, 0)
+        .measure(1, 1)
+        .to_circuit()
+    )
+
+
+PARAMETRIC_GATES = {1: 0, 2: 1, 3: [2, 3, 4], 5: 0, 6: 1}
+PARAMETER_VALUES = np.random.default_rng(seed=42).uniform(-2 * np.pi, 2 * np.pi, (6, 5))
+
+
+@pytest.mark.parametrize(
+    ("name", "parameters"), [("Rx", [5.0]), ("Ry", [-4.0]), ("Rz", [1.0]), ("CR", [5.0]), ("CR", [-4.0])]
+)
+def test_swept_gate_matrices(name: str, parameters: list[float]) -> None:
+    qubits = (0, 1) if name == "CR" else (0,)
+    gate = getattr(CircuitBuilder(2), name)(*qubits, *parameters)
+    (matrix,) = SWEEPABLE_GATES[name][1](np.array([parameters]))
+    np.testing.assert_almost_equal(matrix, gate.ir.statements[-1].matrix)
+
+
+def test_statevectors() -> None:
+    simulator = simulate_sweep(get_circuit(np.zeros(5)), PARAMETER_VALUES, PARAMETRIC_GATES)
+    assert simulator.statevectors.shape == (6, 8)
+    for statevector, parameters in zip(simulator.statevectors, PARAMETER_VALUES, strict=True):
+        # Equal up to the global phase of the U gate.
+        assert abs(np.vdot(statevector, simulate(get_circuit(parameters)).statevector)) == pytest.approx(1)
+
+
+def test_bit_register_probabilities() -> None:
+    probabilities = simulate_sweep(
+        get_circuit(np.zeros(5)), PARAMETER_VALUES, PARAMETRIC_GATES
+    ).get_bit_register_probabilities()
+    for index, parameters in enumerate(PARAMETER_VALUES):
+        expected_probabilities = simulate(get_circuit(parameters)).get_bit_register_probabilities()
+        assert {value: probabilities[value][index] for value in expected_probabilities} == pytest.approx(
+            expected_probabilities
+        )
+        assert sum(probabilities[value][index] for value in probabilities) == pytest.approx(1)
+
+
+def test_sweep_by_parameter_name() -> None:
+    theta, phi = Parameter("theta"), Parameter("phi")
+    circuit = get_circuit(np.array([theta, 2 * phi, theta - phi, 0.3, phi / 2, theta]))
+    circuit.decompose(CNOTDecomposer())
+    circuit.merge(SingleQubitGatesMerger())
+    circuit.decompose(McKayDecomposer())
+    values = {"theta": PARAMETER_VALUES[:, 0], "phi": PARAMETER_VALUES[:, 1]}
+    simulator = simulate_sweep(circuit, values)
+    for index, statevector in enumerate(simulator.statevectors):
+        bound_circuit = circuit.bind({name: name_values[index] for name, name_values in values.items()})
+        assert abs(np.vdot(statevector, simulate(bound_circuit).statevector)) == pytest.approx(1)
+
+
+@pytest.mark.parametrize(
+    ("parameter_values", "error", "match"),
+    [
+        ({"theta": [0.1]}, ValueError, "no value for parameter 'phi'"),
+        ({"theta": [0.1], "phi": [0.1, 0.2]}, ValueError, "one-dimensional arrays of equal length"),
+        ({"theta": [[0.1]], "phi": [[0.1]]}, ValueError, "one-dimensional arrays of equal length"),
+        ({}, ValueError, "one-dimensional arrays of equal length"),
+        ([[0.1, 0.2]], TypeError, "must be keyed by the name of the parameter"),
+    ],
+)
+def test_invalid_sweep_by_parameter_name(
+    parameter_values: dict[str, list[float]] | list[list[float]], error: type[Exception], match: str
+) -> None:
+    circuit = CircuitBuilder(2).Rx(0, Parameter("theta")).CR(0, 1, Parameter("phi")).to_circuit()
+    with pytest.raises(error, match=match):
+        simulate_sweep(circuit, parameter_values)
+
+
+def test_measurement_along_axis() -> None:
+    circuit = Circuit.from_string(
+        """
+        version 3.0
+
+        qubit[1] q
+        bit[1] b
+
+        Ry(0) q[0]
+        b[0] = measureX q[0]
+        """
+    )
+    probabilities = simulate_sweep(circuit, [[np.pi / 2], [-np.pi / 2]], {0: 0}).get_bit_register_probabilities()
+    np.testing.assert_almost_equal(probabilities["0"], [1, 0])
+    np.testing.assert_almost_equal(probabilities["1"], [0, 1])
+
+
+def test_init_of_unused_qubit() -> None:
+    circuit = CircuitBuilder(2).init(0).init(1).Rx(0, 0).to_circuit()
+    simulator = simulate_sweep(circuit, [[np.pi], [0]], {2: 0})
+    np.testing.assert_almost_equal(simulator.probabilities, [[0, 1, 0, 0], [1, 0, 0, 0]])
+
+
+def test_mid_circuit_measurement() -> None:
+    circuit = CircuitBuilder(1, 1).Rx(0, 0).measure(0, 0).H(0).to_circuit()
+    with pytest.raises(ValueError, match="mid-circuit measurements are not supported"):
+        simulate_sweep(circuit, [[0.1]], {0: 0})
+
+
+def test_reset_of_used_qubit() -> None:
+    circuit = CircuitBuilder(1).Rx(0, 0).reset(0).to_circuit()
+    with pytest.raises(ValueError, match="reset of a qubit that has been operated on is not supported"):
+        simulate_sweep(circuit, [[0.1]], {0: 0})
+
+
+@pytest.mark.parametrize(
+    ("parametric_gates", "parameter_values", "error", "match"),
+    [
+        ({0: 0}, [0.1, 0.2], ValueError, "parameter values must be a two-dimensional array"),
+        ({0: 1}, [[0.1]], IndexError, "parameter index 1 out of range 1"),
+        ({1: 0}, [[0.1]], ValueError, "statement 1 cannot be swept"),
+        ({0: [0, 0]}, [[0.1]], ValueError, "gate Rx expects 1 parameter"),
+    ],
+)
+def test_invalid_sweep(
+    parametric_gates: dict[int, int | list[int]], parameter_values: list[float], error: type[Exception], match: str
+) -> None:
+    circuit = CircuitBuilder(2).Rx(0, 0).CNOT(0, 1).to_circuit()
+    with pytest.raises(error, match=match):
+        simulate_sweep(circuit, parameter_values, parametric_gates)
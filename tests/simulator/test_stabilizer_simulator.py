@@ -0,0 +1,126 @@
+import math
+
+import numpy as np
+import pytest
+
+from opensquirrel import Circuit, CircuitBuilder
+from opensquirrel.simulator import (
+    StabilizerSimulator,
+    get_clifford_tableau,
+    is_clifford_circuit,
+    sample_stabilizer,
+    simulate,
+    simulate_stabilizer,
+)
+
+
+def test_is_clifford_circuit() -> None:
+    circuit = CircuitBuilder(3, 3).H(0).S(1).Sdag(2).X90(0).CNOT(0, 1).CZ(1, 2).SWAP(0, 2).Rz(1, math.pi / 2)
+    assert is_clifford_circuit(circuit.measure(0, 0).reset(1).to_circuit())
+    assert not is_clifford_circuit(CircuitBuilder(1).T(0).to_circuit())
+    assert not is_clifford_circuit(CircuitBuilder(2).CR(0, 1, 0.1).to_circuit())
+
+
+def test_non_clifford_gate() -> None:
+    with pytest.raises(ValueError, match="gate is not a Clifford gate"):
+        simulate_stabilizer(CircuitBuilder(1).Ry(0, 0.3).to_circuit())
+
+
+def test_ghz_state() -> None:
+    builder = CircuitBuilder(50, 50).H(0)
+    for qubit in range(49):
+        builder.CNOT(qubit, qubit + 1)
+    for qubit in range(50):
+        builder.measure(qubit, qubit)
+    counts = simulate_stabilizer(builder.to_circuit()).sample(1000, seed=42)
+    assert set(counts) == {"0" * 50, "1" * 50}
+    assert counts["1" * 50] == pytest.approx(500, rel=0.15)
+
+
+def test_sample_matches_statevector_simulator() -> None:
+    circuit = (
+        CircuitBuilder(4, 4)
+        .H(0)
+        .CNOT(0, 2)
+        .S(2)
+        .H(2)
+        .X(3)
+        .CZ(3, 1)
+        .H(1)
+        .SWAP(1, 0)
+        .measure(0, 0)
+        .measure(1, 1)
+        .measure(2, 2)
+        .measure(3, 3)
+        .to_circuit()
+    )
+    probabilities = simulate(circuit).get_bit_register_probabilities()
+    counts = simulate_stabilizer(circuit).sample(10_000, seed=1)
+    assert set(counts) == set(probabilities)
+    for value, count in counts.items():
+        assert count / 10_000 == pytest.approx(probabilities[value], abs=0.03)
+
+
+def test_measurement_along_axis() -> None:
+    circuit = Circuit.from_string(
+        """
+        version 3.0
+
+        qubit[2] q
+        bit[2] b
+
+        H q[0]
+        b[0] = measureX q[0]
+        b[1] = measureX q[1]
+        """
+    )
+    assert set(sample_stabilizer(circuit, 1000, seed=3)) == {"00", "10"}
+
+
+def test_non_clifford_measurement_axis() -> None:
+    circuit = Circuit.from_string("version 3.0; qubit[1] q; bit[1] b; b[0] = measure q[0]")
+    circuit.ir.statements[-1].axis = (1, 1, 1)
+    assert not is_clifford_circuit(circuit)
+    with pytest.raises(ValueError, match="measurement axis is not the X, Y, or Z axis"):
+        simulate_stabilizer(circuit)
+
+
+def test_mid_circuit_measurement_and_reset() -> None:
+    circuit = CircuitBuilder(2, 2).H(0).measure(0, 0).CNOT(0, 1).reset(0).measure(1, 1).to_circuit()
+    simulator = simulate_stabilizer(circuit, seed=5)
+    assert simulator.is_trajectory
+    counts = sample_stabilizer(circuit, 200, seed=5)
+    assert set(counts) == {"00", "11"}
+    assert sum(counts.values()) == 200
+
+
+def test_deterministic_mid_circuit_measurement() -> None:
+    circuit = CircuitBuilder(2, 2).X(0).measure(0, 0).CNOT(0, 1).init(0).measure(0, 1).to_circuit()
+    simulator = simulate_stabilizer(circuit)
+    assert not simulator.is_trajectory
+    assert simulator.bit_values == {0: 1}
+    assert simulator.sample(10) == {"01": 10}
+
+
+def test_circuit_sample_uses_stabilizer_simulator() -> None:
+    builder = CircuitBuilder(1000, 2).H(0)
+    for qubit in range(999):
+        builder.CNOT(qubit, qubit + 1)
+    counts = builder.measure(0, 0).measure(999, 1).to_circuit().sample(1000, seed=7)
+    assert set(counts) == {"00", "11"}
+
+
+def test_sample_no_shots() -> None:
+    assert StabilizerSimulator(1, 1).sample(0) == {}
+
+
+def test_sample_negative_number_of_shots() -> None:
+    with pytest.raises(ValueError, match="number of shots must be non-negative"):
+        StabilizerSimulator(1, 1).sample(-1)
+
+
+def test_get_clifford_tableau_ignores_non_unitaries() -> None:
+    circuit_a = CircuitBuilder(2, 2).H(0).measure(0, 0).CNOT(0, 1).reset(1).to_circuit()
+    circuit_b = CircuitBuilder(2).H(0).CNOT(0, 1).to_circuit()
+    assert get_clifford_tableau(circuit_a) == get_clifford_tableau(circuit_b)
+    np.testing.assert_array_equal(get_clifford_tableau(circuit_a).r, [0, 0, 0, 0])
@@ -0,0 +1,187 @@
+import math
+
+import numpy as np
+import pytest
+
+from opensquirrel import Circuit, CircuitBuilder
+from opensquirrel.circuit_matrix_calculator import get_circuit_matrix
+from opensquirrel.ir import Axis
+from opensquirrel.simulator import StatevectorSimulator, simulate
+from opensquirrel.simulator.statevector_simulator import get_measurement_basis_change
+
+
+def test_initial_state() -> None:
+    simulator = StatevectorSimulator(3)
+    np.testing.assert_array_equal(simulator.statevector, [1, 0, 0, 0, 0, 0, 0, 0])
+
+
+def test_final_state_equals_first_column_of_circuit_matrix() -> None:
+    circuit = (
+        CircuitBuilder(4).H(0).CNOT(0, 3).Ry(2, 0.3).SWAP(1, 3).CR(2, 0, 1.1).U(1, 0.4, 0.5, 0.6).CZ(3, 1).to_circuit()
+    )
+    simulator = simulate(circuit)
+    np.testing.assert_almost_equal(simulator.statevector, get_circuit_matrix(circuit)[:, 0])
+    assert simulator.get_amplitude(0) == pytest.approx(get_circuit_matrix(circuit)[0, 0])
+
+
+def test_bell_state_bit_register_probabilities() -> None:
+    circuit = CircuitBuilder(2, 2).H(0).CNOT(0, 1).measure(0, 0).measure(1, 1).to_circuit()
+    probabilities = simulate(circuit).get_bit_register_probabilities()
+    assert probabilities == pytest.approx({"00": 0.5, "11": 0.5})
+
+
+def test_unmeasured_bits_are_zero() -> None:
+    circuit = CircuitBuilder(2, 3).X(0).X(1).measure(1, 2).to_circuit()
+    assert simulate(circuit).get_bit_register_probabilities() == pytest.approx({"100": 1})
+
+
+def test_multiple_measurements_to_the_same_bit() -> None:
+    circuit = Circuit.from_string(
+        """
+        version 3.0
+
+        qubit[2] q
+        bit[1] b
+
+        X q[1]
+        b[0] = measure q[0]
+        b[0] = measure q[1]
+        """
+    )
+    assert circuit.measurement_to_bit_map == {"0": [0], "1": [0]}
+    assert simulate(circuit).get_bit_register_probabilities() == pytest.approx({"1": 1})
+
+
+def test_measurement_along_axis() -> None:
+    circuit = Circuit.from_string(
+        """
+        version 3.0
+
+        qubit[2] q
+        bit[2] b
+
+        H q[0]
+        b[0] = measureX q[0]
+        b[1] = measureX q[1]
+        """
+    )
+    assert simulate(circuit).get_bit_register_probabilities() == pytest.approx({"00": 0.5, "10": 0.5})
+
+
+@pytest.mark.parametrize("axis", [(1, 0, 0), (0, 1, 0), (0, 0, -1), (1, 1, 1)])
+def test_get_measurement_basis_change(axis: tuple[float, float, float]) -> None:
+    n_x, n_y, n_z = Axis(axis)
+    observable = n_x * np.array([[0, 1], [1, 0]]) + n_y * np.array([[0, -1j], [1j, 0]]) + n_z * np.diag([1, -1])
+    basis_change = get_measurement_basis_change(Axis(axis))
+    np.testing.assert_almost_equal(basis_change @ observable @ basis_change.conj().T, np.diag([1, -1]))
+
+
+def test_mid_circuit_measurement_collapses_the_state() -> None:
+    circuit = CircuitBuilder(2, 2).H(0).CNOT(0, 1).measure(0, 0).H(0).measure(1, 1).to_circuit()
+    simulator = simulate(circuit, seed=42)
+    (outcome,) = simulator.bit_values.values()
+    assert simulator.get_bit_register_probabilities() == pytest.approx({f"{outcome}{outcome}": 1})
+    expected_state = np.zeros(4)
+    expected_state[2 * outcome] = math.sqrt(0.5)
+    expected_state[2 * outcome + 1] = (-1) ** outcome * math.sqrt(0.5)
+    np.testing.assert_almost_equal(simulator.statevector, expected_state)
+
+
+def test_mid_circuit_measurement_along_axis() -> None:
+    circuit = Circuit.from_string(
+        """
+        version 3.0
+
+        qubit[1] q
+        bit[1] b
+
+        H q[0]
+        b[0] = measureX q[0]
+        H q[0]
+        """
+    )
+    simulator = simulate(circuit)
+    assert simulator.bit_values == {0: 0}
+    np.testing.assert_almost_equal(simulator.statevector, [1, 0])
+
+
+def test_reset() -> None:
+    circuit = CircuitBuilder(2, 2).H(0).CNOT(0, 1).reset(0).measure(0, 0).measure(1, 1).to_circuit()
+    simulator = simulate(circuit, seed=1)
+    probabilities = simulator.get_bit_register_probabilities()
+    assert probabilities in (pytest.approx({"00": 1}), pytest.approx({"10": 1}))
+    assert np.sum(simulator.probabilities[1::2]) == pytest.approx(0)
+
+
+def test_init() -> None:
+    circuit = CircuitBuilder(1, 1).init(0).X(0).init(0).measure(0, 0).to_circuit()
+    assert simulate(circuit).get_bit_register_probabilities() == pytest.approx({"0": 1})
+
+
+def test_sampled_outcomes_are_reproducible() -> None:
+    circuit = CircuitBuilder(6, 6).H(0).H(1).H(2).H(3).H(4).H(5)
+    for qubit in range(6):
+        circuit.measure(qubit, qubit).X(qubit)
+    assert simulate(circuit.to_circuit(), seed=7).bit_values == simulate(circuit.to_circuit(), seed=7).bit_values
+
+
+def test_sample() -> None:
+    circuit = CircuitBuilder(3, 3).H(0).CNOT(0, 1).X(2).measure(0, 0).measure(1, 1).measure(2, 2).to_circuit()
+    counts = simulate(circuit).sample(10_000, seed=42)
+    assert set(counts) == {"100", "111"}
+    assert sum(counts.values()) == 10_000
+    assert counts["111"] == pytest.approx(5_000, rel=0.05)
+
+
+def test_sample_is_reproducible() -> None:
+    circuit = CircuitBuilder(4, 4).H(0).H(1).H(2).H(3).measure(0, 0).measure(1, 1).measure(2, 2).to_circuit()
+    assert circuit.sample(1000, seed=1) == circuit.sample(1000, seed=1)
+
+
+def test_sample_multiple_measurements_to_the_same_bit() -> None:
+    circuit = CircuitBuilder(2, 2).H(0).X(1).measure(0, 0).measure(1, 0).measure(0, 1).to_circuit()
+    counts = circuit.sample(1000, seed=3)
+    assert set(counts) == {"01", "11"}
+
+
+def test_sample_mid_circuit_measurement() -> None:
+    circuit = CircuitBuilder(2, 2).H(0).measure(0, 0).CNOT(0, 1).reset(0).measure(1, 1).to_circuit()
+    counts = circuit.sample(200, seed=5)
+    assert set(counts) == {"00", "11"}
+    assert sum(counts.values()) == 200
+
+
+def test_sample_no_shots() -> None:
+    assert CircuitBuilder(1, 1).measure(0, 0).to_circuit().sample(0) == {}
+
+
+def test_sample_negative_number_of_shots() -> None:
+    with pytest.raises(ValueError, match="number of shots must be non-negative"):
+        CircuitBuilder(1, 1).measure(0, 0).to_circuit().sample(-1)
+
+
+def test_simulate_with_gate_fusion() -> None:
+    circuit = (
+        CircuitBuilder(4, 4)
+        .H(0)
+        .CNOT(0, 3)
+        .Ry(2, 0.3)
+        .measure(2, 2)
+        .SWAP(1, 3)
+        .CR(2, 0, 1.1)
+        .U(1, 0.4, 0.5, 0.6)
+        .CZ(3, 1)
+        .measure(0, 0)
+        .measure(3, 3)
+        .to_circuit()
+    )
+    simulator = simulate(circuit, seed=2, fusion_size=3)
+    assert simulator.fusion_statistics is not None
+    assert simulator.fusion_statistics.number_of_gates == 7
+    assert simulator.fusion_statistics.number_of_fused_gates < 7
+    expected_simulator = simulate(circuit, seed=2)
+    assert expected_simulator.fusion_statistics is None
+    np.testing.assert_almost_equal(simulator.statevector, expected_simulator.statevector)
+    assert simulator.get_bit_register_probabilities() == pytest.approx(
+        expected_simulator.get_bit_register_probabilities()
+    )
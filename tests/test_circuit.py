@@ -1,10 +1,16 @@
+import numpy as np
 import pytest
 
 from opensquirrel import Circuit, CircuitBuilder
 from opensquirrel.circuit import MeasurementToBitMap
-from opensquirrel.ir import AsmDeclaration
+from opensquirrel.circuit_matrix_calculator import get_circuit_matrix
+from opensquirrel.common import are_matrices_equivalent_up_to_global_phase
+from opensquirrel.ir import AsmDeclaration, Parameter
+from opensquirrel.ir.default_gates import CR
+from opensquirrel.passes.decomposer import CNOTDecomposer, McKayDecomposer
 from opensquirrel.passes.mapper import HardcodedMapper, IdentityMapper
 from opensquirrel.passes.mapper.mapping import Mapping
+from opensquirrel.passes.merger import SingleQubitGatesMerger
 
 
 def test_asm_filter() -> None:
@@ -187,3 +193,84 @@ def test_mapping_attribute_from_string() -> None:
     assert hasattr(circuit, "mapping")
     assert isinstance(circuit.mapping, Mapping)
     assert circuit.mapping == Mapping([0, 1, 2, 3])
+
+
+def _build_parametric_circuit(theta: float | Parameter, phi: float | Parameter) -> Circuit:
+    builder = CircuitBuilder(3, 3)
+    builder.H(0).Rx(0, theta).Ry(1, 2 * phi).CNOT(1, 2).CR(0, 1, theta - phi)
+    builder.U(2, theta, 0.3, -phi).Rz(2, theta / 2).X(1).measure(0, 0)
+    return builder.to_circuit()
+
+
+def test_parameters() -> None:
+    circuit = _build_parametric_circuit(Parameter("theta"), Parameter("phi"))
+    assert circuit.parameters == ("theta", "phi")
+    assert _build_parametric_circuit(0.1, 0.2).parameters == ()
+
+
+@pytest.mark.parametrize("values", [{"theta": 0.7, "phi": -1.3}, {"theta": -2.1, "phi": 0.4}])
+def test_bind_compiled_parametric_circuit(values: dict[str, float]) -> None:
+    circuit = _build_parametric_circuit(Parameter("theta"), Parameter("phi"))
+    circuit.decompose(CNOTDecomposer())
+    circuit.merge(SingleQubitGatesMerger())
+    circuit.decompose(McKayDecomposer())
+    compiled_circuit = str(circuit)
+
+    bound_circuit = circuit.bind(values)
+    assert bound_circuit.parameters == ()
+    assert str(circuit) == compiled_circuit
+    assert are_matrices_equivalent_up_to_global_phase(
+        get_circuit_matrix(bound_circuit), get_circuit_matrix(_build_parametric_circuit(**values))
+    )
+
+
+def _compile(circuit: Circuit) -> Circuit:
+    circuit.decompose(CNOTDecomposer())
+    circuit.merge(SingleQubitGatesMerger())
+    circuit.decompose(McKayDecomposer())
+    return circuit
+
+
+@pytest.mark.parametrize("theta", [3.5, 4.0, -4.0, 5.0, 6.0, 7.0, -7.0])
+def test_bind_compiled_cr_gate_with_angle_beyond_pi(theta: float) -> None:
+    def build_circuit() -> Circuit:
+        return CircuitBuilder(2).H(0).H(1).CR(0, 1, Parameter("theta")).to_circuit()
+
+    compiled_then_bound = _compile(build_circuit()).bind({"theta": theta})
+    bound_then_compiled = _compile(build_circuit().bind({"theta": theta}))
+    assert are_matrices_equivalent_up_to_global_phase(
+        get_circuit_matrix(compiled_then_bound), get_circuit_matrix(bound_then_compiled)
+    )
+
+
+@pytest.mark.parametrize("theta", [3.5, 5.0, 7.0, -7.0])
+def test_bound_cr_gate_equals_numeric_cr_gate(theta: float) -> None:
+    bound_gate = CR(0, 1, Parameter("theta")).bind({"theta": theta})
+    numeric_gate = CR(0, 1, theta)
+    assert bound_gate == numeric_gate
+    np.testing.assert_allclose(bound_gate.matrix, numeric_gate.matrix, atol=1e-12)
+    np.testing.assert_allclose(
+        get_circuit_matrix(CircuitBuilder(2).CR(0, 1, theta).to_circuit()), np.diag([1, 1, 1, np.exp(1j * theta)])
+    )
+
+
+def test_bind_missing_value() -> None:
+    circuit = _build_parametric_circuit(Parameter("theta"), Parameter("phi"))
+    with pytest.raises(ValueError, match="no value for parameter 'phi'"):
+        circuit.bind({"theta": 0.1})
+
+
+def test_copy() -> None:
+    builder = CircuitBuilder(3)
+    builder.H(0).CNOT(0, 1).Ry(2, 0.3)
+    circuit = builder.to_circuit()
+    original = str(circuit)
+
+    circuit_copy = circuit.copy()
+    circuit_copy.map(HardcodedMapper(Mapping([2, 0, 1])))
+    circuit_copy.decompose(McKayDecomposer())
+
+    assert str(circuit) == original
+    assert circuit.mapping == Mapping([0, 1, 2])
+    assert circuit_copy.mapping == Mapping([2, 0, 1])
+    assert str(circuit_copy) != original
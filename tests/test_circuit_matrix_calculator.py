@@ -1,12 +1,16 @@
+import gc
 from math import pi
+from pathlib import Path
 from typing import Any
 
 import numpy as np
 import pytest
 from numpy.typing import NDArray
+from scipy.sparse import issparse
 
 from opensquirrel import CircuitBuilder
-from opensquirrel.circuit_matrix_calculator import get_circuit_matrix
+from opensquirrel.circuit_matrix_calculator import SparseFormat, get_circuit_matrix
+from opensquirrel.utils import get_matrix
 
 
 @pytest.mark.parametrize(
@@ -67,3 +71,123 @@ def test_get_circuit_matrix(builder: CircuitBuilder, expected_matrix: NDArray[An
     circuit = builder.to_circuit()
     matrix = get_circuit_matrix(circuit)
     np.testing.assert_almost_equal(matrix, expected_matrix)
+
+
+def test_get_circuit_matrix_equals_product_of_expanded_gate_matrices() -> None:
+    circuit = (
+        CircuitBuilder(4).H(0).CNOT(0, 3).Ry(2, 0.3).SWAP(1, 3).CR(2, 0, 1.1).U(1, 0.4, 0.5, 0.6).CZ(3, 1).to_circuit()
+    )
+    expected_matrix = np.eye(16, dtype=np.complex128)
+    for gate in circuit.ir.statements:
+        expected_matrix = get_matrix(gate, 4) @ expected_matrix  # ty: ignore[invalid-argument-type]
+    np.testing.assert_almost_equal(get_circuit_matrix(circuit), expected_matrix)
+
+
+def test_get_circuit_matrix_ignores_non_unitaries() -> None:
+    circuit = CircuitBuilder(2, 2).init(0).H(0).barrier(0).CNOT(0, 1).measure(1, 1).to_circuit()
+    expected_circuit = CircuitBuilder(2).H(0).CNOT(0, 1).to_circuit()
+    np.testing.assert_almost_equal(get_circuit_matrix(circuit), get_circuit_matrix(expected_circuit))
+
+
+@pytest.mark.parametrize("sparse_format", ["csr", "csc", "coo"])
+def test_get_circuit_matrix_sparse(sparse_format: SparseFormat) -> None:
+    circuit = CircuitBuilder(3).H(0).CNOT(0, 2).CR(1, 2, 0.4).SWAP(0, 1).to_circuit()
+    matrix = get_circuit_matrix(circuit, format=sparse_format)
+    assert issparse(matrix)
+    assert matrix.format == sparse_format
+    np.testing.assert_almost_equal(matrix.toarray(), get_circuit_matrix(circuit))
+
+
+def test_get_circuit_matrix_sparse_permutation_network() -> None:
+    builder = CircuitBuilder(12)
+    for qubit in range(11):
+        builder.CNOT(qubit, qubit + 1).CZ(qubit + 1, qubit).SWAP(qubit, (qubit + 5) % 12)
+    matrix = get_circuit_matrix(builder.to_circuit(), format="csr")
+    assert matrix.nnz == 1 << 12
+
+
+def test_get_circuit_matrix_unsupported_sparse_format() -> None:
+    with pytest.raises(ValueError, match="unsupported sparse format"):
+        get_circuit_matrix(CircuitBuilder(1).H(0).to_circuit(), format="dia")  # ty: ignore[no-matching-overload]
+
+
+def test_get_circuit_matrix_sparse_format_with_gate_fusion() -> None:
+    with pytest.raises(ValueError, match="not supported for sparse matrices"):
+        get_circuit_matrix(CircuitBuilder(1).H(0).to_circuit(), format="csr", fusion_size=3)  # ty: ignore[no-matching-overload]
+
+
+def get_circuit_builder() -> CircuitBuilder:
+    return CircuitBuilder(5).H(0).CNOT(0, 3).Ry(2, 0.3).SWAP(1, 4).CR(2, 0, 1.1).U(4, 0.4, 0.5, 0.6).CZ(3, 1)
+
+
+def test_get_circuit_matrix_complex64() -> None:
+    circuit = get_circuit_builder().to_circuit()
+    matrix = get_circuit_matrix(circuit, dtype=np.complex64)
+    assert matrix.dtype == np.complex64
+    np.testing.assert_allclose(matrix, get_circuit_matrix(circuit), atol=1e-6)
+    sparse_matrix = get_circuit_matrix(circuit, format="csr", dtype=np.complex64)
+    assert sparse_matrix.dtype == np.complex64
+
+
+@pytest.mark.parametrize("column_block_size", [1, 7, 32, None])
+def test_get_circuit_matrix_column_blocks(column_block_size: int | None) -> None:
+    circuit = get_circuit_builder().to_circuit()
+    out = np.zeros((32, 32), dtype=np.complex128)
+    matrix = get_circuit_matrix(circuit, out=out, column_block_size=column_block_size, fusion_size=3)
+    assert matrix is out
+    np.testing.assert_almost_equal(out, get_circuit_matrix(circuit))
+    np.testing.assert_almost_equal(get_circuit_matrix(circuit, column_block_size=5), get_circuit_matrix(circuit))
+
+
+def test_get_circuit_matrix_memmap(tmp_path: Path) -> None:
+    circuit = get_circuit_builder().to_circuit()
+    out = np.memmap(tmp_path / "unitary.dat", dtype=np.complex64, mode="w+", shape=(32, 32))
+    get_circuit_matrix(circuit, out=out, column_block_size=8)
+    del out
+    matrix = np.memmap(tmp_path / "unitary.dat", dtype=np.complex64, mode="r", shape=(32, 32))
+    np.testing.assert_allclose(matrix, get_circuit_matrix(circuit), atol=1e-6)
+
+
+@pytest.mark.parametrize("fusion_size", [None, 3])
+def test_get_circuit_matrix_workers(fusion_size: int | None) -> None:
+    circuit = get_circuit_builder().to_circuit()
+    matrix = get_circuit_matrix(circuit, workers=2, column_block_size=5, fusion_size=fusion_size)
+    np.testing.assert_almost_equal(matrix, get_circuit_matrix(circuit))
+    out = np.zeros((32, 32), dtype=np.complex64)
+    assert get_circuit_matrix(circuit, out=out, workers=2) is out
+    np.testing.assert_allclose(out, get_circuit_matrix(circuit), atol=1e-6)
+
+
+def test_get_circuit_matrix_workers_shared_memory() -> None:
+    circuit = get_circuit_builder().to_circuit()
+    expected = get_circuit_matrix(circuit)
+    matrix = get_circuit_matrix(circuit, workers=2)
+    assert not matrix.flags.owndata
+    view = matrix[:4]
+    del matrix
+    gc.collect()
+    np.testing.assert_almost_equal(view, expected[:4])
+
+
+def test_get_circuit_matrix_workers_memmap(tmp_path: Path) -> None:
+    circuit = get_circuit_builder().to_circuit()
+    out = np.memmap(tmp_path / "unitary.dat", dtype=np.complex128, mode="w+", shape=(32, 32))
+    get_circuit_matrix(circuit, out=out, column_block_size=8, workers=2)
+    np.testing.assert_almost_equal(out, get_circuit_matrix(circuit))
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"dtype": np.float64}, "data type must be complex"),
+        ({"dtype": np.complex64, "out": np.zeros((2, 2), dtype=np.complex128)}, "does not match the data type"),
+        ({"out": np.zeros((4, 4), dtype=np.complex128)}, "output array has incorrect shape"),
+        ({"column_block_size": 0}, "column block size must be positive"),
+        ({"workers": 0}, "number of workers must be positive"),
+        ({"format": "csr", "workers": 2}, "not supported for sparse matrices"),
+        ({"format": "csr", "column_block_size": 1}, "not supported for sparse matrices"),
+    ],
+)
+def test_get_circuit_matrix_invalid_arguments(kwargs: dict[str, Any], message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        get_circuit_matrix(CircuitBuilder(1).H(0).to_circuit(), **kwargs)
@@ -0,0 +1,156 @@
+import numpy as np
+import pytest
+
+from opensquirrel import Circuit, CircuitBuilder
+from opensquirrel.equivalence import EquivalenceMethod, check
+from opensquirrel.passes.decomposer import CNOTDecomposer, McKayDecomposer
+from opensquirrel.passes.mapper import HardcodedMapper
+from opensquirrel.passes.mapper.mapping import Mapping
+from opensquirrel.passes.merger import SingleQubitGatesMerger
+from opensquirrel.passes.router import ShortestPathRouter
+
+
+def get_circuit() -> Circuit:
+    return CircuitBuilder(4, 4).H(0).CNOT(0, 3).Ry(2, 0.3).CR(2, 0, 1.1).CZ(3, 1).measure(3, 0).to_circuit()
+
+
+@pytest.mark.parametrize("method", ["random_states", "matrix"])
+def test_equivalent_circuits(method: EquivalenceMethod) -> None:
+    compiled_circuit = get_circuit()
+    compiled_circuit.decompose(CNOTDecomposer())
+    compiled_circuit.decompose(McKayDecomposer())
+    assert check(get_circuit(), compiled_circuit, method=method)
+
+
+@pytest.mark.parametrize("method", ["random_states", "matrix"])
+def test_inequivalent_circuits(method: EquivalenceMethod) -> None:
+    other_circuit = CircuitBuilder(4, 4).H(0).CNOT(0, 3).Ry(2, 0.3).CR(2, 0, 1.1).CZ(3, 2).to_circuit()
+    assert not check(get_circuit(), other_circuit, method=method)
+
+
+def get_random_circuit(seed: int) -> Circuit:
+    rng = np.random.default_rng(seed)
+    builder = CircuitBuilder(3)
+    for _ in range(20):
+        qubit = int(rng.integers(3))
+        kind = rng.integers(3)
+        if kind == 0:
+            builder.U(qubit, *rng.uniform(-np.pi, np.pi, 3))
+        elif kind == 1:
+            builder.Rx(qubit, rng.uniform(-np.pi, np.pi))
+        else:
+            builder.CNOT(qubit, (qubit + 1) % 3)
+    return builder.to_circuit()
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_decomposed_and_merged_circuits_are_equivalent(seed: int) -> None:
+    compiled_circuit = get_random_circuit(seed)
+    compiled_circuit.decompose(McKayDecomposer())
+    compiled_circuit.merge(SingleQubitGatesMerger())
+    compiled_circuit.decompose(McKayDecomposer())
+    assert check(get_random_circuit(seed), compiled_circuit, seed=seed)
+
+
+def test_circuits_differing_in_relative_phase_are_not_equivalent() -> None:
+    circuit_a = CircuitBuilder(2).H(0).H(1).to_circuit()
+    circuit_b = CircuitBuilder(2).H(0).H(1).Rz(1, 1e-3).to_circuit()
+    assert not check(circuit_a, circuit_b, seed=1)
+
+
+def test_circuits_differing_in_global_phase_are_equivalent() -> None:
+    circuit_a = CircuitBuilder(1).Rz(0, 0.5).to_circuit()
+    circuit_b = CircuitBuilder(1).Rn(0, 0, 0, 1, 0.5, 1.2).to_circuit()
+    assert check(circuit_a, circuit_b, seed=1)
+
+
+def test_different_qubit_register_sizes() -> None:
+    assert not check(CircuitBuilder(2).H(0).to_circuit(), CircuitBuilder(3).H(0).to_circuit())
+
+
+def test_mapped_circuit() -> None:
+    mapped_circuit = get_circuit()
+    mapped_circuit.map(HardcodedMapper(Mapping([2, 0, 3, 1])))
+    assert mapped_circuit != get_circuit()
+    assert check(get_circuit(), mapped_circuit, seed=2)
+    assert check(mapped_circuit, get_circuit(), seed=2)
+
+
+def test_routed_circuit() -> None:
+    circuit = CircuitBuilder(3).H(0).CNOT(0, 2).Rx(0, 0.2).to_circuit()
+    routed_circuit = CircuitBuilder(3).H(0).CNOT(0, 2).Rx(0, 0.2).to_circuit()
+    routed_circuit.route(ShortestPathRouter(connectivity={"0": [1], "1": [0, 2], "2": [1]}))
+    assert routed_circuit.instruction_count["SWAP"] == 1
+    assert not check(circuit, routed_circuit, seed=3)
+    assert check(circuit, routed_circuit, seed=3, output_mapping_b=Mapping([1, 0, 2]))
+
+
+def test_unknown_method() -> None:
+    with pytest.raises(ValueError, match="unknown equivalence method"):
+        check(get_circuit(), get_circuit(), method="unitary")  # ty: ignore[invalid-argument-type]
+
+
+def test_invalid_number_of_trials() -> None:
+    with pytest.raises(ValueError, match="number of trials must be positive"):
+        check(get_circuit(), get_circuit(), trials=0)
+
+
+def get_clifford_circuit(qubit_register_size: int) -> Circuit:
+    builder = CircuitBuilder(qubit_register_size)
+    for qubit in range(0, qubit_register_size - 1, 2):
+        builder.H(qubit).CNOT(qubit, qubit + 1).S(qubit + 1).CZ(qubit + 1, (qubit + 2) % qubit_register_size)
+    return builder.to_circuit()
+
+
+def test_equivalent_clifford_circuits() -> None:
+    compiled_circuit = get_clifford_circuit(6)
+    compiled_circuit.decompose(CNOTDecomposer())
+    compiled_circuit.decompose(McKayDecomposer())
+    assert compiled_circuit != get_clifford_circuit(6)
+    assert check(get_clifford_circuit(6), compiled_circuit, method="tableau")
+    assert check(get_clifford_circuit(6), compiled_circuit, method="matrix")
+
+
+def test_inequivalent_clifford_circuits() -> None:
+    circuit_a = CircuitBuilder(2).H(0).S(0).H(0).to_circuit()
+    circuit_b = CircuitBuilder(2).Sdag(0).H(0).Sdag(0).to_circuit()
+    circuit_c = CircuitBuilder(2).Sdag(0).H(0).S(0).to_circuit()
+    assert check(circuit_a, circuit_b, method="tableau")
+    assert not check(circuit_a, circuit_c, method="tableau")
+    assert not check(circuit_a, circuit_c, method="matrix")
+
+
+def test_large_clifford_circuits() -> None:
+    circuit_a = get_clifford_circuit(1000)
+    circuit_b = get_clifford_circuit(1000)
+    assert check(circuit_a, circuit_b)
+    circuit_b.ir.statements.pop()
+    assert not check(circuit_a, circuit_b)
+
+
+def test_mapped_clifford_circuit() -> None:
+    mapped_circuit = get_clifford_circuit(4)
+    mapped_circuit.map(HardcodedMapper(Mapping([2, 0, 3, 1])))
+    assert check(get_clifford_circuit(4), mapped_circuit, method="tableau")
+    assert check(mapped_circuit, get_clifford_circuit(4), method="tableau")
+
+
+def test_routed_clifford_circuit() -> None:
+    circuit = CircuitBuilder(3).H(0).CNOT(0, 2).S(0).to_circuit()
+    routed_circuit = CircuitBuilder(3).H(0).CNOT(0, 2).S(0).to_circuit()
+    routed_circuit.route(ShortestPathRouter(connectivity={"0": [1], "1": [0, 2], "2": [1]}))
+    assert not check(circuit, routed_circuit, method="tableau")
+    assert check(circuit, routed_circuit, method="tableau", output_mapping_b=Mapping([1, 0, 2]))
+
+
+def test_tableau_method_for_non_clifford_circuit() -> None:
+    with pytest.raises(ValueError, match="gate is not a Clifford gate"):
+        check(get_circuit(), get_circuit(), method="tableau")
+
+
+def test_equivalent_circuits_with_gate_fusion() -> None:
+    compiled_circuit = get_circuit()
+    compiled_circuit.decompose(CNOTDecomposer())
+    compiled_circuit.decompose(McKayDecomposer())
+    assert check(get_circuit(), compiled_circuit, seed=4, fusion_size=3)
+    assert not check(get_circuit(), get_clifford_circuit(4), seed=4, fusion_size=3)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from math import pi
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
@@ -9,7 +9,12 @@ from opensquirrel import CNOT, Y90, CircuitBuilder, H, I, U, X
 from opensquirrel.ir.semantics import BlochSphereRotation
 from opensquirrel.ir.single_qubit_gate import SingleQubitGate
 from opensquirrel.passes.decomposer.gate_replacer import replace
-from opensquirrel.passes.decomposer.general_decomposer import Decomposer, check_gate_decomposition, decompose
+from opensquirrel.passes.decomposer.general_decomposer import (
+    Decomposer,
+    DecompositionVerifier,
+    check_gate_decomposition,
+    decompose,
+)
 
 if TYPE_CHECKING:
     from opensquirrel.ir import Gate
@@ -57,6 +62,83 @@ class TestCheckGateReplacement:
             check_gate_decomposition(H(9234687), [Y90(9234687), X(9234687), X(9234687)])
 
 
+class _IdentityPaddingDecomposer(Decomposer):
+    """Adds identities before and after single-qubit gates."""
+
+    def decompose(self, instruction: Gate) -> list[Gate]:
+        if isinstance(instruction, SingleQubitGate):
+            return [I(instruction.qubit), instruction, I(instruction.qubit)]
+        return [instruction]
+
+
+class _WrongHDecomposer(Decomposer):
+    """Decomposes H gates to X gates, which is not a valid decomposition."""
+
+    def decompose(self, instruction: Gate) -> list[Gate]:
+        if instruction.name == "H":
+            return [X(*instruction.qubit_operands)]
+        return [instruction]
+
+
+class TestDecompositionVerifier:
+    @pytest.fixture
+    def builder(self) -> CircuitBuilder:
+        builder = CircuitBuilder(3)
+        builder.H(0).H(1).H(2).H(0).CNOT(0, 1).CNOT(1, 2)
+        return builder
+
+    @pytest.mark.parametrize(
+        ("verifier", "expected_checks"),
+        [
+            (DecompositionVerifier("always"), 6),
+            (DecompositionVerifier("first"), 2),
+            (DecompositionVerifier("first", max_checks=3), 5),
+            (DecompositionVerifier("sampled", sample_fraction=0), 2),
+            (DecompositionVerifier("sampled", sample_fraction=1), 6),
+            (DecompositionVerifier("off"), 0),
+        ],
+    )
+    def test_checks(self, builder: CircuitBuilder, verifier: DecompositionVerifier, expected_checks: int) -> None:
+        builder.to_circuit().decompose(_IdentityPaddingDecomposer(), verifier)
+        assert verifier.checks == expected_checks
+        assert verifier.checks + verifier.skips == 6
+
+    def test_shared_checks(self, builder: CircuitBuilder) -> None:
+        decomposer, verifier = _IdentityPaddingDecomposer(), DecompositionVerifier("first")
+        decompose(builder.to_circuit().ir, decomposer, verifier)
+        decompose(builder.to_circuit().ir, decomposer, verifier)
+        assert (verifier.checks, verifier.skips) == (2, 10)
+
+        # The checks are kept per decomposer
+        decompose(builder.to_circuit().ir, _IdentityPaddingDecomposer(), verifier)
+        assert verifier.checks == 4
+
+    def test_invalid_decomposition(self, builder: CircuitBuilder) -> None:
+        with pytest.raises(ValueError, match="decomposition for gate 'H' does not preserve the quantum state"):
+            builder.to_circuit().decompose(_WrongHDecomposer(), DecompositionVerifier("first"))
+
+        circuit = builder.to_circuit()
+        circuit.decompose(_WrongHDecomposer(), DecompositionVerifier("off"))
+        assert circuit.instruction_count["X"] == 4
+
+    def test_default_mode(self, builder: CircuitBuilder, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(DecompositionVerifier, "default_mode", "off")
+        assert DecompositionVerifier().mode == "off"
+        builder.to_circuit().decompose(_WrongHDecomposer())
+
+    @pytest.mark.parametrize(
+        ("kwargs", "error_msg"),
+        [
+            ({"mode": "never"}, "unknown verification mode 'never'"),
+            ({"max_checks": 0}, "max_checks should be at least 1"),
+            ({"sample_fraction": 1.5}, r"sample_fraction should be in \[0, 1\]"),
+        ],
+    )
+    def test_invalid_arguments(self, kwargs: dict[str, Any], error_msg: str) -> None:
+        with pytest.raises(ValueError, match=error_msg):
+            DecompositionVerifier(**kwargs)
+
+
 class TestReplacer:
     def test_replace_generic(self) -> None:
         builder1 = CircuitBuilder(3)
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from opensquirrel import Circuit, CircuitBuilder
+from opensquirrel.circuit_matrix_calculator import get_circuit_matrix
+from opensquirrel.ir import Barrier, Measure
+from opensquirrel.utils.gate_fusion import FusedGate, FusionStatistics, fuse_gates
+
+
+def get_circuit() -> Circuit:
+    builder = CircuitBuilder(5)
+    for layer in range(3):
+        for qubit in range(5):
+            builder.Ry(qubit, 0.1 * (layer + qubit)).H(qubit)
+        for qubit in range(layer % 2, 4, 2):
+            builder.CNOT(qubit, qubit + 1).CR(qubit + 1, qubit, 0.4)
+    return builder.SWAP(4, 0).CZ(2, 1).to_circuit()
+
+
+def test_fused_gate() -> None:
+    circuit = CircuitBuilder(3).H(2).CNOT(2, 0).Ry(0, 0.3).CZ(0, 2).to_circuit()
+    (fused_gate,), statistics = fuse_gates(circuit.ir, 2)
+    assert isinstance(fused_gate, FusedGate)
+    assert fused_gate.qubit_indices == [2, 0]
+    assert fused_gate.number_of_gates == 4
+    assert statistics == FusionStatistics(4, 1, {2: 1})
+    assert statistics.gates_per_fused_gate == 4
+
+    expected_circuit = CircuitBuilder(2).H(1).CNOT(1, 0).Ry(0, 0.3).CZ(0, 1).to_circuit()
+    np.testing.assert_almost_equal(fused_gate.matrix, get_circuit_matrix(expected_circuit))
+
+
+@pytest.mark.parametrize("max_fusion_size", [2, 3, 4, 5])
+def test_fused_gates_act_on_at_most_max_fusion_size_qubits(max_fusion_size: int) -> None:
+    fused_gates, statistics = fuse_gates(get_circuit().ir, max_fusion_size)
+    assert all(len(fused_gate.qubit_indices) <= max_fusion_size for fused_gate in fused_gates)
+    assert sum(fused_gate.number_of_gates for fused_gate in fused_gates) == statistics.number_of_gates == 44
+    assert statistics.number_of_fused_gates == len(fused_gates) < 44
+    assert sum(statistics.fused_gate_sizes.values()) == len(fused_gates)
+
+
+@pytest.mark.parametrize("max_fusion_size", [2, 3, 4, 5])
+def test_fused_circuit_matrix(max_fusion_size: int) -> None:
+    np.testing.assert_almost_equal(
+        get_circuit_matrix(get_circuit(), fusion_size=max_fusion_size), get_circuit_matrix(get_circuit())
+    )
+
+
+def test_non_unitary_instructions_end_the_fused_gate() -> None:
+    circuit = CircuitBuilder(2, 1).H(0).measure(0, 0).barrier(1).X(1).CNOT(0, 1).to_circuit()
+    statements, statistics = fuse_gates(circuit.ir)
+    assert [type(statement) for statement in statements] == [FusedGate, Measure, Barrier, FusedGate]
+    assert statistics.number_of_fused_gates == 2
+
+
+def test_invalid_max_fusion_size() -> None:
+    with pytest.raises(ValueError, match="maximum fusion size must be at least 2"):
+        fuse_gates(get_circuit().ir, 1)
@@ -18,8 +18,15 @@ from opensquirrel.ir.semantics import (
 from opensquirrel.ir.semantics.canonical_gate import CanonicalAxis
 from opensquirrel.ir.single_qubit_gate import SingleQubitGate
 from opensquirrel.ir.two_qubit_gate import TwoQubitGate
-from opensquirrel.utils import get_matrix
-from opensquirrel.utils.matrix_expander import can2, canonical_decomposition, nearest_kronecker_product
+from opensquirrel.utils import expand_ket, get_matrix, get_reduced_ket
+from opensquirrel.utils.matrix_expander import (
+    batch_canonical_decomposition,
+    can2,
+    canonical_decomposition,
+    constrain_to_weyl_chamber,
+    get_expansion_indices,
+    nearest_kronecker_product,
+)
 
 
 def random_2x2_unitary() -> NDArray[np.complex128]:
@@ -178,3 +185,84 @@ def test_canonical_decomposition_nontrivial_local_operators() -> None:
 
         y = np.kron(k3, k4) @ can2(axis_recov) @ np.kron(k1, k2)
         assert are_matrices_equivalent_up_to_global_phase(x, y)
+
+
+def test_batch_canonical_decomposition() -> None:
+    axes = [(0, 0, 0), (1 / 2, 1 / 2, 1 / 2), (1 / 4, 1 / 4, 0), *(random_canonical_axis() for _ in range(61))]
+    unitaries = np.array(
+        [
+            np.kron(random_2x2_unitary(), random_2x2_unitary())
+            @ can2(axis)
+            @ np.kron(random_2x2_unitary(), random_2x2_unitary())
+            for axis in axes
+        ]
+    )
+
+    k1, k2, k3, k4, axes_recov = batch_canonical_decomposition(unitaries)
+    assert axes_recov.shape == (len(axes), 3)
+    for i, unitary in enumerate(unitaries):
+        np.testing.assert_allclose(axes_recov[i], CanonicalAxis(axes[i]).value, atol=1e-7)
+        y = np.kron(k3[i], k4[i]) @ can2(axes_recov[i]) @ np.kron(k1[i], k2[i])
+        assert are_matrices_equivalent_up_to_global_phase(unitary, y)
+
+    # The decomposition of a unitary does not depend on the other unitaries of the stack
+    for batch_result, single_result in zip(
+        batch_canonical_decomposition(unitaries), batch_canonical_decomposition(unitaries[5:6]), strict=True
+    ):
+        np.testing.assert_array_equal(batch_result[5], single_result[0])
+
+
+@pytest.mark.parametrize("axis", [(0, 0, 0), (1 / 2, 1 / 2, 0), (1 / 2, 1 / 2, 1 / 2)])
+def test_constrain_to_weyl_chamber_with_round_off(axis: tuple[float, float, float]) -> None:
+    # Eigenvalues of which the canonical coordinates are the axis, up to round-off around 0 and 1/2
+    phases = np.linalg.solve([[1, 1, 0], [0, 1, 1], [1, 0, 1]], -pi * np.array(axis))
+    round_off = np.array([-7e-13, 4e-13, -2e-13, -9e-13])
+    lambdas = np.exp(1j * (np.array([phases[0], phases[1], -phases.sum(), phases[2]]) + round_off))
+
+    coords, signs, permutation = constrain_to_weyl_chamber(lambdas)
+    np.testing.assert_allclose(coords, axis, atol=1e-7)
+    assert sorted(permutation) == [0, 1, 2, 3]
+    assert set(signs) <= {-1, 1}
+
+
+@pytest.mark.parametrize("qubit_indices", [(0,), (2,), (1, 0), (0, 3), (3, 1)])
+def test_get_expansion_indices(qubit_indices: tuple[int, ...]) -> None:
+    reduced_kets, expanded_kets = get_expansion_indices(4, qubit_indices)
+    for ket in range(1 << 4):
+        assert reduced_kets[ket] == get_reduced_ket(ket, qubit_indices)
+        for small_ket in range(1 << len(qubit_indices)):
+            assert expanded_kets[small_ket, ket] == expand_ket(ket, small_ket, qubit_indices)
+
+
+def test_get_expansion_indices_is_cached() -> None:
+    indices = get_expansion_indices(3, (2, 0))
+    assert get_expansion_indices(3, (2, 0)) is indices
+    assert not indices[0].flags.writeable
+    assert not indices[1].flags.writeable
+
+
+@pytest.mark.parametrize(
+    "gate",
+    [
+        SingleQubitGate(1, BlochSphereRotation(axis=(0.8, -0.3, 1.5), angle=0.9468, phase=2.533)),
+        TwoQubitGate(2, 0, ControlledGateSemantic(BlochSphereRotation(axis=(1, 0, 0), angle=pi, phase=pi / 2))),
+        TwoQubitGate(0, 2, MatrixGateSemantic(random_2x2_unitary().repeat(2, axis=0).repeat(2, axis=1) / 2)),
+        TwoQubitGate(1, 0, CanonicalGateSemantic((0.3, 0.2, 0.1))),
+    ],
+    ids=["bsr", "controlled", "matrix", "canonical"],
+)
+def test_get_sparse_matrix(gate: SingleQubitGate | TwoQubitGate) -> None:
+    sparse_matrix = get_matrix(gate, 3, sparse=True)
+    assert sparse_matrix.format == "csr"
+    np.testing.assert_almost_equal(sparse_matrix.toarray(), get_matrix(gate, 3))
+
+
+def test_get_sparse_matrix_does_not_store_zeros() -> None:
+    gate = TwoQubitGate(0, 3, ControlledGateSemantic(BlochSphereRotation(axis=(1, 0, 0), angle=pi, phase=pi / 2)))
+    assert get_matrix(gate, 4, sparse=True).nnz == 1 << 4
+
+
+def test_get_sparse_matrix_index_out_of_range() -> None:
+    gate = SingleQubitGate(3, BlochSphereRotation(axis=(1, 0, 0), angle=pi, phase=0))
+    with pytest.raises(IndexError, match="index out of range"):
+        get_matrix(gate, 3, sparse=True)
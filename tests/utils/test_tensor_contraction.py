@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from opensquirrel.ir import Gate
+from opensquirrel.ir.default_gates import CNOT, H, Ry
+from opensquirrel.utils import apply_matrix_stack_to_tensor, apply_matrix_to_tensor, get_matrix
+from opensquirrel.utils.tensor_contraction import get_qubit_axes
+
+
+def test_get_qubit_axes() -> None:
+    assert get_qubit_axes([0, 2], 3) == [2, 0]
+    assert get_qubit_axes([1], 2) == [0]
+
+
+def test_get_qubit_axes_out_of_range() -> None:
+    with pytest.raises(IndexError, match="index 3 out of range 3"):
+        get_qubit_axes([3], 3)
+
+
+@pytest.mark.parametrize("gate", [H(1), Ry(2, 0.7), CNOT(0, 2), CNOT(2, 1)], ids=["H", "Ry", "CNOT02", "CNOT21"])
+def test_apply_matrix_to_tensor(gate: Gate) -> None:
+    rng = np.random.default_rng(seed=42)
+    state = rng.standard_normal(8) + 1j * rng.standard_normal(8)
+    tensor = apply_matrix_to_tensor(state.reshape(2, 2, 2), gate.matrix, gate.qubit_indices, 3)
+    np.testing.assert_almost_equal(tensor.reshape(8), get_matrix(gate, 3) @ state)
+
+
+def test_apply_matrix_to_tensor_keeps_trailing_axes() -> None:
+    gate = CNOT(1, 0)
+    tensor = apply_matrix_to_tensor(np.eye(4, dtype=np.complex128).reshape(2, 2, 4), gate.matrix, [1, 0], 2)
+    np.testing.assert_almost_equal(tensor.reshape(4, 4), get_matrix(gate, 2))
+
+
+def test_apply_matrix_to_tensor_incorrect_shape() -> None:
+    with pytest.raises(ValueError, match="matrix has incorrect shape"):
+        apply_matrix_to_tensor(np.zeros((2, 2)), np.eye(2), [0, 1], 2)
+
+
+def test_apply_matrix_stack_to_tensor() -> None:
+    gates = [CNOT(2, 0), Ry(1, 0.7), CNOT(0, 2)]
+    rng = np.random.default_rng(seed=42)
+    states = rng.standard_normal((8, 3)) + 1j * rng.standard_normal((8, 3))
+    matrices = [get_matrix(gate, 3) for gate in gates]
+    tensor = apply_matrix_stack_to_tensor(states.reshape(2, 2, 2, 3), matrices, [2, 1, 0], 3)
+    for index, matrix in enumerate(matrices):
+        np.testing.assert_almost_equal(tensor.reshape(8, 3)[:, index], matrix @ states[:, index])
+
+
+def test_apply_matrix_stack_to_tensor_incorrect_shape() -> None:
+    with pytest.raises(ValueError, match="matrix stack has incorrect shape"):
+        apply_matrix_stack_to_tensor(np.zeros((2, 2, 3)), np.zeros((2, 2, 2)), [0], 2)
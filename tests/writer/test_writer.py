@@ -1,6 +1,7 @@
 from math import sqrt
 
 from opensquirrel import CircuitBuilder
+from opensquirrel.ir import Parameter
 from opensquirrel.ir.expression import Axis
 from opensquirrel.ir.semantics import BlochSphereRotation, ControlledGateSemantic, MatrixGateSemantic
 from opensquirrel.ir.single_qubit_gate import SingleQubitGate
@@ -74,6 +75,26 @@ CR(1.6546515) q[0], q[1]
     )
 
 
+def test_parametric_gates() -> None:
+    theta, phi = Parameter("theta"), Parameter("phi")
+    builder = CircuitBuilder(2)
+    builder.Rx(0, theta)
+    builder.U(1, theta, 0.5, -phi)
+    builder.CR(0, 1, 2 * theta - phi + 1)
+    circuit = builder.to_circuit()
+    assert (
+        writer.circuit_to_string(circuit)
+        == """version 3.0
+
+qubit[2] q
+
+Rx(theta) q[0]
+U(theta, 0.5, -phi) q[1]
+CR(2.0*theta - phi + 1.0) q[0], q[1]
+"""
+    )
+
+
 def test_measure() -> None:
     builder = CircuitBuilder(1, 1)
     builder.H(0)